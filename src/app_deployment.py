@@ -44,9 +44,7 @@ try:
     
     # Import calculation engine
     from calculations import (
-        calculate_npv_comparison,
-        calculate_ownership_cash_flows,
-        calculate_rental_cash_flows,
+        calculate_analysis_bundle,
         calculate_break_even_analysis,
         calculate_sensitivity_analysis
     )
@@ -127,42 +125,15 @@ def run_financial_analysis(session_manager) -> tuple[Optional[Dict], Optional[Li
                 else:
                     raise ValueError(f"Critical parameter '{param}' is missing or zero. Please complete all required inputs.")
         
-        # Run NPV analysis
-        analysis_results = calculate_npv_comparison(**analysis_params)
-        
-        # Calculate detailed cash flows
-        ownership_flows = calculate_ownership_cash_flows(
-            purchase_price=analysis_params['purchase_price'],
-            down_payment_pct=analysis_params['down_payment_pct'],
-            interest_rate=analysis_params['interest_rate'],
-            loan_term=analysis_params['loan_term'],
-            analysis_period=analysis_params['analysis_period'],
-            property_tax_rate=analysis_params['property_tax_rate'],
-            property_tax_escalation=analysis_params['property_tax_escalation'],
-            insurance_cost=analysis_params['insurance_cost'],
-            annual_maintenance=analysis_params['annual_maintenance'],
-            property_management=analysis_params['property_management'],
-            capex_reserve_rate=analysis_params['capex_reserve_rate'],
-            obsolescence_risk_rate=analysis_params['obsolescence_risk_rate'],
-            inflation_rate=analysis_params['inflation_rate'],
-            land_value_pct=analysis_params['land_value_pct'],
-            market_appreciation_rate=analysis_params['market_appreciation_rate'],
-            depreciation_period=analysis_params['depreciation_period'],
-            corporate_tax_rate=analysis_params['corporate_tax_rate'],
-            interest_deductible=analysis_params['interest_deductible'],
-            property_tax_deductible=analysis_params['property_tax_deductible'],
-            transaction_costs=analysis_params['transaction_costs']
-        )
+        # Run NPV analysis; the bundle carries the cash flows it discounted
+        analysis_bundle = calculate_analysis_bundle(**analysis_params)
         
-        rental_flows = calculate_rental_cash_flows(
-            current_annual_rent=analysis_params['current_annual_rent'],
-            rent_increase_rate=analysis_params['rent_increase_rate'],
-            analysis_period=analysis_params['analysis_period'],
-            corporate_tax_rate=analysis_params['corporate_tax_rate']
+        return (
+            analysis_bundle['npv_analysis'],
+            analysis_bundle['ownership_flows'],
+            analysis_bundle['rental_flows']
         )
         
-        return analysis_results, ownership_flows, rental_flows
-        
     except Exception as e:
         st.error(f"Error running financial analysis: {str(e)}")
         # Add debugging information
@@ -228,25 +199,27 @@ def render_dashboard_tab():
         with col2:
             if st.button("🚀 **Run Financial Analysis**", type="primary", use_container_width=True):
                 with st.spinner("Running comprehensive financial analysis..."):
-                    # Store analysis results in session state
+                    # Session state keeps only a handle into the shared result store
                     analysis_results, ownership_flows, rental_flows = run_financial_analysis(session_manager)
                     if analysis_results:
-                        st.session_state['analysis_results'] = analysis_results
-                        st.session_state['ownership_flows'] = ownership_flows
-                        st.session_state['rental_flows'] = rental_flows
                         # Clear demo data flag to ensure we're showing real data
-                        if 'using_demo_data' in st.session_state:
-                            del st.session_state['using_demo_data']
+                        session_manager.clear_analysis_results()
+                        session_manager.store_analysis_bundle({
+                            'npv_analysis': analysis_results,
+                            'ownership_flows': ownership_flows,
+                            'rental_flows': rental_flows
+                        })
                         # Mark that analysis has been run with current inputs
                         session_manager.mark_analysis_run()
                         st.success("✅ Analysis completed successfully!")
                         st.rerun()
         
         # Show analysis results if available
-        if 'analysis_results' in st.session_state:
+        analysis_data = session_manager.get_analysis_data()
+        if analysis_data:
             st.markdown("---")
             st.markdown("### 📈 Analysis Results Preview")
-            create_results_summary_section(st.session_state['analysis_results'])
+            create_results_summary_section(analysis_data[0])
             
             st.info("📊 **Go to the 'Analysis Results' tab to view detailed visualizations and charts.**")
         
@@ -308,7 +281,8 @@ def render_analysis_tab():
         st.info("🔄 **Analysis results have been refreshed** because your inputs have changed. Please re-run the analysis to see updated results.")
     
     # Check if we have real analysis results
-    if 'analysis_results' not in st.session_state:
+    analysis_data = session_manager.get_analysis_data()
+    if analysis_data is None:
         st.warning("⚠️ **No analysis results available.** Please complete the input sections in the Dashboard tab and run the analysis.")
         
         # Check if inputs are ready for analysis
@@ -366,9 +340,11 @@ def render_analysis_tab():
                         'net_cash_flow': -(18000 * (1.03 ** (year-1)))
                     })
                 
-                st.session_state['analysis_results'] = demo_results
-                st.session_state['ownership_flows'] = demo_ownership_flows
-                st.session_state['rental_flows'] = demo_rental_flows
+                session_manager.store_analysis_bundle({
+                    'npv_analysis': demo_results,
+                    'ownership_flows': demo_ownership_flows,
+                    'rental_flows': demo_rental_flows
+                })
                 st.session_state['using_demo_data'] = True
                 
                 st.success("✅ Demo data loaded! View the analysis below.")
@@ -380,24 +356,18 @@ def render_analysis_tab():
         st.warning("⚠️ **Currently displaying demo data for testing.** To see real analysis results, complete your inputs in the Dashboard tab and run the analysis.")
         if st.button("🔄 Clear Demo Data and Use Real Analysis", type="primary"):
             # Clear demo data flags
-            if 'using_demo_data' in st.session_state:
-                del st.session_state['using_demo_data']
-            if 'analysis_results' in st.session_state:
-                del st.session_state['analysis_results']
-            if 'ownership_flows' in st.session_state:
-                del st.session_state['ownership_flows']
-            if 'rental_flows' in st.session_state:
-                del st.session_state['rental_flows']
+            session_manager.clear_analysis_results()
             st.rerun()
     else:
         # Display marker for real data
         st.success("✅ **Displaying Real Analysis Results** based on your input data.")
     
     # Render full analysis results dashboard
+    analysis_results, ownership_flows, rental_flows = analysis_data
     render_analysis_results_tab(
-        st.session_state['analysis_results'],
-        st.session_state['ownership_flows'],
-        st.session_state['rental_flows'],
+        analysis_results,
+        ownership_flows,
+        rental_flows,
         session_manager
     )
 
@@ -413,15 +383,12 @@ def render_comparison_tab():
     if cleared_stale:
         st.info("🔄 **Analysis results have been refreshed** because your inputs have changed. Please re-run the analysis to see updated results.")
     
-    if 'analysis_results' not in st.session_state:
+    analysis_data = session_manager.get_analysis_data()
+    if analysis_data is None:
         st.warning("⚠️ **No analysis results available for comparison.** Please run the analysis first in the Dashboard tab.")
         return
     
-    render_detailed_comparison_tab(
-        st.session_state['analysis_results'],
-        st.session_state['ownership_flows'],
-        st.session_state['rental_flows']
-    )
+    render_detailed_comparison_tab(*analysis_data)
 
 
 def render_export_tab():
@@ -455,9 +422,10 @@ def render_export_tab():
         )
         
         # Export analysis results if available
-        if 'analysis_results' in st.session_state:
+        analysis_data = session_manager.get_analysis_data()
+        if analysis_data:
             results_data = {
-                'analysis_results': st.session_state['analysis_results'],
+                'analysis_results': analysis_data[0],
                 'input_parameters': export_data,
                 'generated_date': datetime.now().isoformat()
             }
@@ -482,12 +450,7 @@ def render_export_tab():
         if st.button("🔄 Reset All Inputs", type="secondary"):
             session_manager.reset_session()
             # Clear analysis results
-            if 'analysis_results' in st.session_state:
-                del st.session_state['analysis_results']
-            if 'ownership_flows' in st.session_state:
-                del st.session_state['ownership_flows']
-            if 'rental_flows' in st.session_state:
-                del st.session_state['rental_flows']
+            session_manager.clear_analysis_results()
             st.success("✅ All inputs and results have been reset")
             st.rerun()
         
@@ -37,75 +37,20 @@ try:
         initialize_session,
         get_session_manager,
         create_info_box,
-        render_footer,
-        # Visualization components
-        render_executive_summary_dashboard,
-        render_analysis_results_tab,
-        render_detailed_comparison_tab,
-        create_decision_recommendation_card,
-        create_results_summary_section
+        render_lazy_tabs,
+        render_footer
     )
+    # Visualization components (and Plotly) are imported in the tabs that use them
     
     # Import calculation engine
-    from calculations import (
-        calculate_npv_comparison,
-        calculate_ownership_cash_flows,
-        calculate_rental_cash_flows,
-        calculate_break_even_analysis,
-        calculate_sensitivity_analysis
-    )
-    
-    # Import new 2D sensitivity analysis
-    from calculations.two_dimensional_sensitivity import (
-        calculate_2d_sensitivity_analysis,
-        format_2d_sensitivity_for_streamlit,
-        get_available_sensitivity_metrics
-    )
+    from calculations import calculate_analysis_bundle
     
 except ImportError as e:
     st.error(f"Error importing components: {e}")
     st.stop()
 
 
-def _safe_get_rent_increase_rate(priority_manager, inputs):
-    """
-    Safely extract rent_increase_rate with extensive error handling
-    """
-    try:
-        # Method 1: Try priority manager first
-        if priority_manager:
-            try:
-                rent_rate = priority_manager.get_value_only('rent_increase_rate', None)
-                if rent_rate is not None and isinstance(rent_rate, (int, float)) and rent_rate >= 0:
-                    return rent_rate
-            except Exception as e:
-                logger.warning(f"Priority manager failed for rent_increase_rate: {e}")
-        
-        # Method 2: Try direct session input
-        rent_rate = inputs.get('rent_increase_rate', None)
-        if rent_rate is not None and isinstance(rent_rate, (int, float)) and rent_rate >= 0:
-            return rent_rate
-        
-        # Method 3: Try string conversion (in case it's stored as string)
-        rent_rate_str = inputs.get('rent_increase_rate', '3.0')
-        if isinstance(rent_rate_str, str) and rent_rate_str.strip():
-            try:
-                rent_rate = float(rent_rate_str.strip())
-                if rent_rate >= 0:
-                    return rent_rate
-            except (ValueError, TypeError):
-                pass
-        
-        # Method 4: Final fallback
-        logger.warning("All rent_increase_rate extraction methods failed, using default: 3.0")
-        return 3.0
-        
-    except Exception as e:
-        logger.error(f"Critical error in _safe_get_rent_increase_rate: {e}")
-        return 3.0
-
-
-def run_financial_analysis(session_manager) -> tuple[Optional[Dict], Optional[List], Optional[List]]:
+def run_financial_analysis(session_manager) -> Optional[Dict[str, Any]]:
     """
     Run the complete financial analysis using session data with data priority management
     
@@ -113,95 +58,25 @@ def run_financial_analysis(session_manager) -> tuple[Optional[Dict], Optional[Li
         session_manager: Session manager instance with input data
         
     Returns:
-        Tuple of (analysis_results, ownership_flows, rental_flows)
+        Analysis bundle from calculate_analysis_bundle() (NPV summary, cash flows,
+        amortization schedule and terminal values), or None if the analysis failed
     """
+    analysis_params = None
     try:
         # Extract parameters from session
         if not session_manager.is_ready_for_analysis():
-            return None, None, None
+            return None
         
-        # Get all session data for analysis
-        session_data = session_manager.export_session_data()
-        
-        # Initialize data priority manager with user inputs, API data, and defaults
         from data.data_priority_manager import get_data_priority_manager
         priority_manager = get_data_priority_manager()
         
-        # Update with user inputs (highest priority)
-        priority_manager.bulk_update_from_session(session_data)
+        # Apply the latest background-refreshed API rates - will not override user inputs
+        # (before the first refresh completes this falls back to defaults via priority manager)
+        priority_manager.apply_api_rates()
         
-        # Fetch and apply API data (if available) - will not override user inputs
-        try:
-            from data.interest_rate_feeds import create_interest_rate_feeds
-            import asyncio
-            
-            # Get current rates from API
-            rate_feeds = create_interest_rate_feeds()
-            current_rates = asyncio.run(rate_feeds.get_current_rates(['30_year_fixed', '15_year_fixed', 'federal_funds_rate']))
-            priority_manager.apply_api_rates(current_rates)
-            
-        except Exception as e:
-            logger.warning(f"Could not fetch API rates: {e}")
-            # API failure - will fall back to defaults via priority manager
-        
-        # Extract all required parameters using priority manager (User > API > Default)
-        inputs = session_data.get('inputs', {})
-        
-        analysis_params = {
-            # Purchase scenario parameters - use user inputs directly for main parameters
-            'purchase_price': inputs.get('purchase_price'),
-            'down_payment_pct': inputs.get('down_payment_percent', 30.0),
-            'interest_rate': priority_manager.get_value_only('interest_rate', inputs.get('interest_rate', 7.0)),
-            'loan_term': inputs.get('loan_term', 20),
-            'transaction_costs': inputs.get('transaction_costs_percent', 5.0) * inputs.get('purchase_price', 0) / 100,
-            
-            # Rental scenario parameters  
-            'current_annual_rent': inputs.get('current_annual_rent'),
-            'rent_increase_rate': _safe_get_rent_increase_rate(priority_manager, inputs),
-            'moving_costs': inputs.get('moving_costs', 0.0),
-            
-            # Common parameters
-            'analysis_period': inputs.get('analysis_period', 25),
-            'cost_of_capital': priority_manager.get_value_only('cost_of_capital', inputs.get('cost_of_capital', 8.0)),
-            
-            # Property parameters
-            'property_tax_rate': priority_manager.get_value_only('property_tax_rate', inputs.get('property_tax_rate', 1.2)),
-            'property_tax_escalation': inputs.get('property_tax_escalation_rate', 2.0),
-            'insurance_cost': inputs.get('insurance_cost', 5000),
-            'annual_maintenance': inputs.get('annual_maintenance_percent', 2.0) * inputs.get('purchase_price', 0) / 100,
-            'property_management': inputs.get('property_management', 0),
-            
-            # Advanced parameters
-            'capex_reserve_rate': inputs.get('longterm_capex_reserve', 1.5),
-            'obsolescence_risk_rate': inputs.get('obsolescence_risk_factor', 0.5),
-            'inflation_rate': priority_manager.get_value_only('inflation_rate', inputs.get('inflation_rate', 3.0)),
-            'land_value_pct': inputs.get('land_value_percent', 25.0),
-            'market_appreciation_rate': priority_manager.get_value_only('market_appreciation_rate', inputs.get('market_appreciation_rate', 3.0)),
-            'depreciation_period': inputs.get('depreciation_period', 39),
-            
-            # Tax parameters
-            'corporate_tax_rate': inputs.get('corporate_tax_rate', 25.0),
-            'interest_deductible': inputs.get('interest_deductible', True),
-            'property_tax_deductible': inputs.get('property_tax_deductible', True),
-            
-            # Space improvement costs
-            'space_improvement_cost': inputs.get('space_improvement_cost', 0.0),
-            
-            # Expansion parameters
-            'future_expansion_year': inputs.get('future_expansion_year', 'Never'),
-            'additional_space_needed': inputs.get('additional_space_needed', 0),
-            'current_space_needed': inputs.get('current_space_needed', 0),
-            'ownership_property_size': inputs.get('ownership_property_size', 0),
-            'rental_property_size': inputs.get('rental_property_size', 0),
-            
-            # Subletting parameters
-            'subletting_potential': inputs.get('subletting_potential', False),
-            'subletting_rate': inputs.get('subletting_rate', 0),
-            'subletting_space_sqm': inputs.get('subletting_space_sqm', 0),
-            
-            # Property upgrade parameters
-            'property_upgrade_cycle': inputs.get('property_upgrade_cycle', 30)
-        }
+        # Parameters resolved by priority manager (User > API > Default), rebuilt only
+        # when the inputs or the priority manager data have changed
+        analysis_params = session_manager.get_analysis_parameters()
         
         # Validate critical parameters before analysis
         critical_params = ['purchase_price', 'current_annual_rent', 'rent_increase_rate']
@@ -229,11 +104,12 @@ def run_financial_analysis(session_manager) -> tuple[Optional[Dict], Optional[Li
             if 'rent_increase_rate' not in analysis_params:
                 st.error("🚨 CRITICAL: rent_increase_rate missing from analysis_params!")
                 st.json(analysis_params)
-                return None, None, None
+                return None
             
             st.info(f"🔍 Running NPV analysis with rent_increase_rate: {analysis_params['rent_increase_rate']}")
             
-            analysis_results = calculate_npv_comparison(**analysis_params)
+            # NPV summary, cash flows and terminal values from a single pass
+            analysis_bundle = calculate_analysis_bundle(**analysis_params)
             
             st.success("✅ NPV analysis completed successfully")
             
@@ -247,79 +123,40 @@ def run_financial_analysis(session_manager) -> tuple[Optional[Dict], Optional[Li
             st.error(f"🚨 Unexpected error in NPV analysis: {e}")
             raise e
         
-        # Calculate detailed cash flows
-        ownership_flows = calculate_ownership_cash_flows(
-            purchase_price=analysis_params['purchase_price'],
-            down_payment_pct=analysis_params['down_payment_pct'],
-            interest_rate=analysis_params['interest_rate'],
-            loan_term=analysis_params['loan_term'],
-            analysis_period=analysis_params['analysis_period'],
-            property_tax_rate=analysis_params['property_tax_rate'],
-            property_tax_escalation=analysis_params['property_tax_escalation'],
-            insurance_cost=analysis_params['insurance_cost'],
-            annual_maintenance=analysis_params['annual_maintenance'],
-            property_management=analysis_params['property_management'],
-            capex_reserve_rate=analysis_params['capex_reserve_rate'],
-            obsolescence_risk_rate=analysis_params['obsolescence_risk_rate'],
-            inflation_rate=analysis_params['inflation_rate'],
-            land_value_pct=analysis_params['land_value_pct'],
-            market_appreciation_rate=analysis_params['market_appreciation_rate'],
-            depreciation_period=analysis_params['depreciation_period'],
-            corporate_tax_rate=analysis_params['corporate_tax_rate'],
-            interest_deductible=analysis_params['interest_deductible'],
-            property_tax_deductible=analysis_params['property_tax_deductible'],
-            transaction_costs=analysis_params['transaction_costs'],
-            # New expansion and subletting parameters
-            future_expansion_year=analysis_params['future_expansion_year'],
-            additional_space_needed=analysis_params['additional_space_needed'],
-            current_space_needed=analysis_params['current_space_needed'],
-            ownership_property_size=analysis_params['ownership_property_size'],
-            subletting_potential=analysis_params['subletting_potential'],
-            subletting_rate=analysis_params['subletting_rate'],
-            subletting_space_sqm=analysis_params['subletting_space_sqm'],
-            # Rental rate parameters for subletting calculations
-            rent_increase_rate=analysis_params['rent_increase_rate'],
-            # Property upgrade parameters
-            property_upgrade_cycle=analysis_params['property_upgrade_cycle']
-        )
-        
-        rental_flows = calculate_rental_cash_flows(
-            current_annual_rent=analysis_params['current_annual_rent'],
-            rent_increase_rate=analysis_params['rent_increase_rate'],
-            analysis_period=analysis_params['analysis_period'],
-            corporate_tax_rate=analysis_params['corporate_tax_rate'],
-            # New expansion parameters for rental
-            future_expansion_year=analysis_params['future_expansion_year'],
-            additional_space_needed=analysis_params['additional_space_needed'],
-            current_space_needed=analysis_params['current_space_needed'],
-            rental_property_size=analysis_params['rental_property_size']
-        )
-        
-        return analysis_results, ownership_flows, rental_flows
+        return analysis_bundle
         
     except Exception as e:
         st.error(f"Error running financial analysis: {str(e)}")
         # Add debugging information
-        st.error(f"Session data keys: {list(session_data.keys()) if session_data else 'No session data'}")
         st.error(f"Analysis params: {analysis_params}")
-        return None, None, None
+        return None
 
 
-def render_dashboard_tab():
-    """Render the main dashboard with input forms"""
-    st.markdown("## 📊 Input Dashboard")
-    st.markdown("*Complete all input sections below to enable financial analysis*")
+def render_sidebar_inputs() -> bool:
+    """
+    Render the input forms in the sidebar
     
-    # Instructions for sidebar access
-    st.info("👈 **Use the sidebar on the left** to input your property and financial data.")
+    The forms are rendered on every run, whichever tab is open, so input
+    widget state is never dropped.
     
-    # Render input forms in sidebar
+    Returns:
+        True if all inputs are valid
+    """
     with st.sidebar:
         try:
-            inputs_valid = render_all_input_forms()
+            return render_all_input_forms()
         except Exception as e:
             st.error("⚠️ **Loading Error** - Please refresh the page")
-            inputs_valid = False
+            return False
+
+
+def render_dashboard_tab(inputs_valid: bool):
+    """Render the main dashboard for the sidebar input forms"""
+    st.markdown("## 📊 Input Dashboard")
+    st.markdown("*Complete all input sections below to enable financial analysis*")
+    
+    # Instructions for sidebar access
+    st.info("👈 **Use the sidebar on the left** to input your property and financial data.")
     
     # Main dashboard area
     try:
@@ -362,12 +199,11 @@ def render_dashboard_tab():
         with col2:
             if st.button("🚀 **Run Financial Analysis**", type="primary", use_container_width=True):
                 with st.spinner("Running comprehensive financial analysis..."):
-                    # Store analysis results in session state
-                    analysis_results, ownership_flows, rental_flows = run_financial_analysis(session_manager)
-                    if analysis_results:
-                        st.session_state['analysis_results'] = analysis_results
-                        st.session_state['ownership_flows'] = ownership_flows
-                        st.session_state['rental_flows'] = rental_flows
+                    # Session state keeps only a handle into the shared result store
+                    analysis_bundle = run_financial_analysis(session_manager)
+                    if analysis_bundle:
+                        # Tabs read the bundle's own results; nothing is recomputed
+                        session_manager.store_analysis_bundle(analysis_bundle)
                         # Analysis completed with real data
                         # Mark that analysis has been run with current inputs
                         session_manager.mark_analysis_run()
@@ -375,10 +211,12 @@ def render_dashboard_tab():
                         st.rerun()
         
         # Show analysis results if available
-        if 'analysis_results' in st.session_state:
+        analysis_data = session_manager.get_analysis_data()
+        if analysis_data:
             st.markdown("---")
             st.markdown("### 📈 Analysis Results Preview")
-            create_results_summary_section(st.session_state['analysis_results'])
+            from components import create_results_summary_section
+            create_results_summary_section(analysis_data[0])
             
             st.info("📊 **Go to the 'Analysis Results' tab to view detailed visualizations and charts.**")
         
@@ -440,7 +278,8 @@ def render_analysis_tab():
         st.info("🔄 **Analysis results have been refreshed** because your inputs have changed. Please re-run the analysis to see updated results.")
     
     # Check if we have real analysis results
-    if 'analysis_results' not in st.session_state:
+    analysis_data = session_manager.get_analysis_data()
+    if analysis_data is None:
         st.warning("⚠️ **No analysis results available.** Please complete the input sections in the Dashboard tab and run the analysis.")
         
         # Check if inputs are ready for analysis
@@ -455,10 +294,12 @@ def render_analysis_tab():
     st.success("✅ **Displaying Analysis Results** based on your input data.")
     
     # Render full analysis results dashboard
+    from components import render_analysis_results_tab
+    analysis_results, ownership_flows, rental_flows = analysis_data
     render_analysis_results_tab(
-        st.session_state['analysis_results'],
-        st.session_state['ownership_flows'],
-        st.session_state['rental_flows'],
+        analysis_results,
+        ownership_flows,
+        rental_flows,
         session_manager
     )
 
@@ -474,15 +315,13 @@ def render_comparison_tab():
     if cleared_stale:
         st.info("🔄 **Analysis results have been refreshed** because your inputs have changed. Please re-run the analysis to see updated results.")
     
-    if 'analysis_results' not in st.session_state:
+    analysis_data = session_manager.get_analysis_data()
+    if analysis_data is None:
         st.warning("⚠️ **No analysis results available for comparison.** Please run the analysis first in the Dashboard tab.")
         return
     
-    render_detailed_comparison_tab(
-        st.session_state['analysis_results'],
-        st.session_state['ownership_flows'],
-        st.session_state['rental_flows']
-    )
+    from components import render_detailed_comparison_tab
+    render_detailed_comparison_tab(*analysis_data)
 
 
 def render_export_tab():
@@ -506,11 +345,9 @@ def render_export_tab():
         return
     
     # Check if we have analysis results for professional exports
-    has_analysis_results = ('analysis_results' in st.session_state and 
-                            'ownership_flows' in st.session_state and 
-                            'rental_flows' in st.session_state)
+    analysis_bundle = session_manager.get_analysis_bundle()
     
-    if has_analysis_results:
+    if analysis_bundle:
         # Check if analysis results are current (not stale)
         if session_manager.analysis_is_stale():
             st.error("❌ **Export Not Available - Analysis Results Are Outdated**")
@@ -532,9 +369,11 @@ def render_export_tab():
             # Prepare export data with real user data and metadata
             from datetime import datetime
             export_data = {
-                'analysis_results': st.session_state['analysis_results'],
-                'ownership_flows': st.session_state['ownership_flows'],
-                'rental_flows': st.session_state['rental_flows'],
+                'analysis_results': analysis_bundle['npv_analysis'],
+                'ownership_flows': analysis_bundle['ownership_flows'],
+                'rental_flows': analysis_bundle['rental_flows'],
+                'amortization_schedule': analysis_bundle.get('amortization_schedule'),
+                'terminal_value': analysis_bundle.get('ownership_terminal'),
                 'inputs': session_manager.export_session_data(),
                 'export_metadata': {
                     'export_timestamp': datetime.now().isoformat(),
@@ -621,12 +460,7 @@ def render_export_tab():
         if st.button("🔄 Reset All Inputs", type="secondary"):
             session_manager.reset_session()
             # Clear analysis results
-            if 'analysis_results' in st.session_state:
-                del st.session_state['analysis_results']
-            if 'ownership_flows' in st.session_state:
-                del st.session_state['ownership_flows']
-            if 'rental_flows' in st.session_state:
-                del st.session_state['rental_flows']
+            session_manager.clear_analysis_results()
             st.success("✅ All inputs and results have been reset")
             st.rerun()
     
@@ -672,9 +506,10 @@ def _render_basic_export_options(session_manager):
     
     with col2:
         # Export analysis results if available
-        if 'analysis_results' in st.session_state:
+        analysis_data = session_manager.get_analysis_data()
+        if analysis_data:
             results_data = {
-                'analysis_results': st.session_state['analysis_results'],
+                'analysis_results': analysis_data[0],
                 'input_parameters': export_data,
                 'generated_date': datetime.now().isoformat()
             }
@@ -801,6 +636,10 @@ def main():
     # Then initialize other components
     initialize_session()
     
+    # Start refreshing interest rates in the background while inputs are entered
+    from data.rate_refresh_service import get_rate_refresh_service
+    get_rate_refresh_service()
+    
     # Apply professional styling and force light mode
     st.markdown("""
     <style>
@@ -869,33 +708,19 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Enhanced Tab navigation with new analysis tab and API status
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "📊 Analysis Dashboard", 
-        "📈 Analysis Results", 
-        "📋 Detailed Comparison",
-        "📤 Export & Share", 
-        "🌐 Data Integration",
-        "❓ Help & Documentation"
-    ])
-    
-    with tab1:
-        render_dashboard_tab()
-    
-    with tab2:
-        render_analysis_tab()
-    
-    with tab3:
-        render_comparison_tab()
-    
-    with tab4:
-        render_export_tab()
-    
-    with tab5:
-        render_data_integration_tab()
-    
-    with tab6:
-        render_help_tab()
+    # Sidebar inputs live outside the tabs so they render on every run
+    inputs_valid = render_sidebar_inputs()
+    
+    # Enhanced Tab navigation with new analysis tab and API status;
+    # only the open tab is rendered
+    render_lazy_tabs({
+        "📊 Analysis Dashboard": lambda: render_dashboard_tab(inputs_valid),
+        "📈 Analysis Results": render_analysis_tab,
+        "📋 Detailed Comparison": render_comparison_tab,
+        "📤 Export & Share": render_export_tab,
+        "🌐 Data Integration": render_data_integration_tab,
+        "❓ Help & Documentation": render_help_tab
+    }, key="main_tab")
     
     # Professional footer
     render_footer()
@@ -45,6 +45,7 @@ from .amortization import (
 
 from .npv_analysis import (
     calculate_npv_comparison,
+    calculate_analysis_bundle,
     calculate_cash_flow_analysis,
     calculate_break_even_analysis,
     calculate_ownership_cash_flows,
@@ -83,6 +84,7 @@ __all__ = [
     
     # NPV and cash flow analysis
     'calculate_npv_comparison',
+    'calculate_analysis_bundle',
     'calculate_cash_flow_analysis',
     'calculate_break_even_analysis',
     'calculate_ownership_cash_flows',
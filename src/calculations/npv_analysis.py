@@ -13,13 +13,13 @@ All formulas follow the Business PRD specifications exactly.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 from .mortgage import calculate_mortgage_payment, calculate_loan_amount
 from .annual_costs import calculate_annual_ownership_costs, calculate_annual_rental_costs, calculate_subletting_income
 from .terminal_value import calculate_terminal_value, calculate_rental_terminal_value
-from .amortization import calculate_remaining_balance, calculate_payment_breakdown
+from .amortization import generate_amortization_schedule
 
 logger = logging.getLogger(__name__)
 
@@ -89,13 +89,17 @@ def calculate_ownership_cash_flows(
     # Rental rate parameters for subletting calculations
     rent_increase_rate: float = 3.0,
     # Property upgrade parameters
-    property_upgrade_cycle: int = 30
+    property_upgrade_cycle: int = 30,
+    # Precomputed loan schedule (generated when not supplied)
+    amortization_schedule: Optional[List[Dict[str, float]]] = None
 ) -> List[Dict[str, float]]:
     """
     Calculate year-by-year cash flows for ownership scenario
     
     Args:
         All parameters needed for ownership cost calculation
+        amortization_schedule: Schedule from generate_amortization_schedule()
+            for this loan, reused instead of being generated again
     
     Returns:
         List of annual cash flow dictionaries containing:
@@ -126,6 +130,11 @@ def calculate_ownership_cash_flows(
     annual_mortgage_payment = mortgage_info['annual_payment']
     loan_amount = mortgage_info['loan_amount']
     
+    if amortization_schedule is None:
+        amortization_schedule = generate_amortization_schedule(
+            loan_amount, annual_mortgage_payment, interest_rate, loan_term
+        )
+    
     # Calculate building value for depreciation
     building_value = purchase_price * (1 - land_value_pct / 100)
     annual_depreciation = building_value / depreciation_period if depreciation_period > 0 else 0
@@ -156,10 +165,8 @@ def calculate_ownership_cash_flows(
         )
         
         # Calculate mortgage payment breakdown
-        if loan_amount > 0 and year <= loan_term:
-            payment_breakdown = calculate_payment_breakdown(
-                loan_amount, annual_mortgage_payment, interest_rate, year
-            )
+        if year <= len(amortization_schedule):
+            payment_breakdown = amortization_schedule[year - 1]
             mortgage_interest = payment_breakdown['interest_portion']
             remaining_loan_balance = payment_breakdown['ending_balance']
         else:
@@ -328,7 +335,7 @@ def calculate_rental_cash_flows(
     return cash_flows
 
 
-def calculate_npv_comparison(
+def calculate_analysis_bundle(
     # Purchase scenario parameters
     purchase_price: float,
     down_payment_pct: float,
@@ -372,23 +379,24 @@ def calculate_npv_comparison(
     subletting_rate: float = 0.0,
     subletting_space_sqm: float = 0.0,
     property_upgrade_cycle: int = 30
-) -> Dict[str, float]:
+) -> Dict[str, Any]:
     """
-    Calculate complete NPV comparison between ownership and rental
+    Run the complete NPV analysis once, keeping its intermediate results
     
-    This is the main analysis function that integrates all calculations
-    and provides the final recommendation.
+    The dashboard, comparison views and exports need the cash flows, loan
+    schedule and terminal value behind the NPV summary. Returning them from
+    the same computation avoids rebuilding them separately, and guarantees
+    the charts show exactly the flows that were discounted.
     
     Returns:
-        Dictionary with comprehensive NPV analysis:
-        - ownership_npv: Net present value of ownership scenario
-        - rental_npv: Net present value of rental scenario
-        - npv_difference: NPV advantage (positive = ownership better)
-        - ownership_initial_investment: Initial cash required for purchase
-        - rental_initial_investment: Initial cash required for rental
-        - terminal_value_advantage: Terminal value difference
-        - recommendation: "BUY", "RENT", or "MARGINAL"
-        - confidence: "High", "Medium", "Low"
+        Dictionary with the analysis bundle:
+        - npv_analysis: NPV summary, as returned by calculate_npv_comparison()
+        - ownership_flows: Year-by-year ownership cash flows
+        - rental_flows: Year-by-year rental cash flows
+        - mortgage_info: Loan amount, payments and initial investment
+        - amortization_schedule: Annual loan amortization schedule
+        - ownership_terminal: Terminal value breakdown for ownership
+        - rental_terminal: Terminal value breakdown for rental
     """
     # Calculate initial investments
     mortgage_info = calculate_mortgage_payment(
@@ -397,6 +405,11 @@ def calculate_npv_comparison(
     ownership_initial_investment = mortgage_info['total_initial_investment']
     rental_initial_investment = moving_costs
     
+    # Loan schedule, shared by the ownership cash flows and the bundle
+    amortization_schedule = generate_amortization_schedule(
+        mortgage_info['loan_amount'], mortgage_info['annual_payment'], interest_rate, loan_term
+    )
+    
     # Calculate ownership cash flows
     ownership_flows = calculate_ownership_cash_flows(
         purchase_price, down_payment_pct, interest_rate, loan_term, analysis_period,
@@ -405,7 +418,8 @@ def calculate_npv_comparison(
         land_value_pct, market_appreciation_rate, depreciation_period,
         corporate_tax_rate, interest_deductible, property_tax_deductible, transaction_costs,
         future_expansion_year, additional_space_needed, current_space_needed, ownership_property_size,
-        subletting_potential, subletting_rate, subletting_space_sqm, rent_increase_rate, property_upgrade_cycle
+        subletting_potential, subletting_rate, subletting_space_sqm, rent_increase_rate, property_upgrade_cycle,
+        amortization_schedule
     )
     
     # Calculate rental cash flows
@@ -484,7 +498,7 @@ def calculate_npv_comparison(
         recommendation = "RENT"
         confidence = "High"
     
-    return {
+    npv_analysis = {
         'ownership_npv': float(ownership_npv),
         'rental_npv': float(rental_npv),
         'npv_difference': float(npv_difference),
@@ -498,6 +512,119 @@ def calculate_npv_comparison(
         'analysis_period': analysis_period,
         'cost_of_capital': cost_of_capital
     }
+    
+    return {
+        'npv_analysis': npv_analysis,
+        'ownership_flows': ownership_flows,
+        'rental_flows': rental_flows,
+        'mortgage_info': mortgage_info,
+        'amortization_schedule': amortization_schedule,
+        'ownership_terminal': ownership_terminal,
+        'rental_terminal': rental_terminal
+    }
+
+
+def calculate_npv_comparison(
+    # Purchase scenario parameters
+    purchase_price: float,
+    down_payment_pct: float,
+    interest_rate: float,
+    loan_term: int,
+    transaction_costs: float,
+    # Rental scenario parameters
+    current_annual_rent: float,
+    rent_increase_rate: float,
+    # Common parameters
+    analysis_period: int,
+    cost_of_capital: float,
+    # Property cost parameters
+    property_tax_rate: float = 1.2,
+    property_tax_escalation: float = 2.0,
+    insurance_cost: float = 5000,
+    annual_maintenance: float = 10000,
+    property_management: float = 0.0,
+    capex_reserve_rate: float = 1.5,
+    obsolescence_risk_rate: float = 0.5,
+    inflation_rate: float = 3.0,
+    # Terminal value parameters
+    land_value_pct: float = 25.0,
+    market_appreciation_rate: float = 3.0,
+    depreciation_period: int = 39,
+    # Tax parameters
+    corporate_tax_rate: float = 25.0,
+    interest_deductible: bool = True,
+    property_tax_deductible: bool = True,
+    rent_deductible: bool = True,
+    # Initial costs
+    moving_costs: float = 0.0,
+    space_improvement_cost: float = 0.0,
+    # Expansion and subletting parameters (added for completeness)
+    future_expansion_year: str = 'Never',
+    additional_space_needed: float = 0.0,
+    current_space_needed: float = 0.0,
+    ownership_property_size: float = 0.0,
+    rental_property_size: float = 0.0,
+    subletting_potential: bool = False,
+    subletting_rate: float = 0.0,
+    subletting_space_sqm: float = 0.0,
+    property_upgrade_cycle: int = 30
+) -> Dict[str, float]:
+    """
+    Calculate complete NPV comparison between ownership and rental
+    
+    This is the main analysis function that integrates all calculations
+    and provides the final recommendation. Use calculate_analysis_bundle()
+    when the cash flows behind the summary are needed as well.
+    
+    Returns:
+        Dictionary with comprehensive NPV analysis:
+        - ownership_npv: Net present value of ownership scenario
+        - rental_npv: Net present value of rental scenario
+        - npv_difference: NPV advantage (positive = ownership better)
+        - ownership_initial_investment: Initial cash required for purchase
+        - rental_initial_investment: Initial cash required for rental
+        - terminal_value_advantage: Terminal value difference
+        - recommendation: "BUY", "RENT", or "MARGINAL"
+        - confidence: "High", "Medium", "Low"
+    """
+    bundle = calculate_analysis_bundle(
+        purchase_price=purchase_price,
+        down_payment_pct=down_payment_pct,
+        interest_rate=interest_rate,
+        loan_term=loan_term,
+        transaction_costs=transaction_costs,
+        current_annual_rent=current_annual_rent,
+        rent_increase_rate=rent_increase_rate,
+        analysis_period=analysis_period,
+        cost_of_capital=cost_of_capital,
+        property_tax_rate=property_tax_rate,
+        property_tax_escalation=property_tax_escalation,
+        insurance_cost=insurance_cost,
+        annual_maintenance=annual_maintenance,
+        property_management=property_management,
+        capex_reserve_rate=capex_reserve_rate,
+        obsolescence_risk_rate=obsolescence_risk_rate,
+        inflation_rate=inflation_rate,
+        land_value_pct=land_value_pct,
+        market_appreciation_rate=market_appreciation_rate,
+        depreciation_period=depreciation_period,
+        corporate_tax_rate=corporate_tax_rate,
+        interest_deductible=interest_deductible,
+        property_tax_deductible=property_tax_deductible,
+        rent_deductible=rent_deductible,
+        moving_costs=moving_costs,
+        space_improvement_cost=space_improvement_cost,
+        future_expansion_year=future_expansion_year,
+        additional_space_needed=additional_space_needed,
+        current_space_needed=current_space_needed,
+        ownership_property_size=ownership_property_size,
+        rental_property_size=rental_property_size,
+        subletting_potential=subletting_potential,
+        subletting_rate=subletting_rate,
+        subletting_space_sqm=subletting_space_sqm,
+        property_upgrade_cycle=property_upgrade_cycle
+    )
+    return bundle['npv_analysis']
 
 
 def calculate_break_even_analysis(
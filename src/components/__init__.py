@@ -21,6 +21,7 @@ from .layout import (
     create_section_header,
     create_info_box,
     create_professional_columns,
+    render_lazy_tabs,
     render_footer,
     apply_responsive_design
 )
@@ -49,43 +50,60 @@ from .session_management import (
     initialize_session
 )
 
-# Chart components
-from .charts import (
-    create_npv_comparison_chart,
-    create_cash_flow_timeline_chart,
-    create_cost_breakdown_chart,
-    create_terminal_value_chart,
-    create_annual_costs_comparison_chart,
-    create_sensitivity_tornado_chart,
-    create_scenario_comparison_chart,
-    create_break_even_chart,
-    create_risk_gauge_chart,
-    create_roi_progression_chart
+from .result_store import (
+    ResultStore,
+    get_result_store
 )
 
-# Dashboard components
-from .dashboard import (
-    render_executive_summary_dashboard,
-    create_results_summary_section,
-    create_decision_recommendation_card,
-    create_key_metrics_grid,
-    render_analysis_results_tab,
-    create_metric_widget,
-    create_status_indicator,
-    create_confidence_badge,
-    create_kpi_card
-)
+import importlib
+
+# Visualization components import Plotly; they load on first use so the
+# input forms can render before any chart is needed
+_LAZY_EXPORTS = {
+    # Chart components
+    'create_npv_comparison_chart': '.charts',
+    'create_cash_flow_timeline_chart': '.charts',
+    'create_cost_breakdown_chart': '.charts',
+    'create_terminal_value_chart': '.charts',
+    'create_annual_costs_comparison_chart': '.charts',
+    'create_sensitivity_tornado_chart': '.charts',
+    'create_scenario_comparison_chart': '.charts',
+    'create_break_even_chart': '.charts',
+    'create_risk_gauge_chart': '.charts',
+    'create_roi_progression_chart': '.charts',
+    # Dashboard components
+    'render_executive_summary_dashboard': '.dashboard',
+    'create_results_summary_section': '.dashboard',
+    'create_decision_recommendation_card': '.dashboard',
+    'create_key_metrics_grid': '.dashboard',
+    'render_analysis_results_tab': '.dashboard',
+    'create_metric_widget': '.dashboard',
+    'create_status_indicator': '.dashboard',
+    'create_confidence_badge': '.dashboard',
+    'create_kpi_card': '.dashboard',
+    # Comparison components
+    'render_side_by_side_comparison': '.comparison',
+    'create_cost_comparison_table': '.comparison',
+    'create_financial_metrics_comparison': '.comparison',
+    'render_detailed_comparison_tab': '.comparison',
+    'create_annual_costs_table': '.comparison',
+    'create_cash_flow_comparison_table': '.comparison',
+    'create_investment_summary_table': '.comparison',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Comparison components
-from .comparison import (
-    render_side_by_side_comparison,
-    create_cost_comparison_table,
-    create_financial_metrics_comparison,
-    render_detailed_comparison_tab,
-    create_annual_costs_table,
-    create_cash_flow_comparison_table,
-    create_investment_summary_table
-)
 
 __all__ = [
     # Layout components
@@ -98,6 +116,7 @@ __all__ = [
     'create_section_header',
     'create_info_box',
     'create_professional_columns',
+    'render_lazy_tabs',
     'render_footer',
     'apply_responsive_design',
     
@@ -121,6 +140,8 @@ __all__ = [
     'SessionManager',
     'get_session_manager',
     'initialize_session',
+    'ResultStore',
+    'get_result_store',
     
     # Chart components
     'create_npv_comparison_chart',
@@ -9,7 +9,8 @@ This package provides all chart components for displaying financial analysis res
 - Mobile-responsive design for all screen sizes
 
 All charts use Plotly for interactivity with professional styling
-consistent with the application theme.
+consistent with the application theme. Chart figures are memoized in a
+bounded process-wide cache keyed by chart type and input data.
 """
 
 from .core_charts import (
@@ -28,6 +29,19 @@ from .advanced_charts import (
     create_roi_progression_chart
 )
 
+from .downsampling import (
+    binned_histogram_trace,
+    line_trace,
+    lttb_indices
+)
+
+from .figure_cache import (
+    FigureCache,
+    get_figure_cache,
+    get_figure_json,
+    memoize_figure
+)
+
 __all__ = [
     # Core charts
     'create_npv_comparison_chart',
@@ -41,5 +55,16 @@ __all__ = [
     'create_scenario_comparison_chart',
     'create_break_even_chart',
     'create_risk_gauge_chart',
-    'create_roi_progression_chart'
+    'create_roi_progression_chart',
+    
+    # Downsampling
+    'binned_histogram_trace',
+    'line_trace',
+    'lttb_indices',
+    
+    # Figure cache
+    'FigureCache',
+    'get_figure_cache',
+    'get_figure_json',
+    'memoize_figure'
 ]
\ No newline at end of file
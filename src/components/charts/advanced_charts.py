@@ -21,6 +21,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import streamlit as st
 
 from .core_charts import get_professional_color_scheme, get_chart_layout_config, format_currency
+from .downsampling import binned_histogram_trace, line_trace
+from .figure_cache import memoize_figure
 
 
 def validate_chart_inputs(
@@ -187,6 +189,7 @@ def extract_npv_impact(sensitivity_result: Any) -> float:
         return 0.0
 
 
+@memoize_figure
 def create_sensitivity_tornado_chart(
     sensitivity_results: Dict[str, Dict[str, float]],
     base_npv: float
@@ -318,6 +321,7 @@ def create_sensitivity_tornado_chart(
     return fig
 
 
+@memoize_figure
 def create_scenario_comparison_chart(
     scenarios: List[Dict[str, Any]]
 ) -> go.Figure:
@@ -412,6 +416,7 @@ def create_scenario_comparison_chart(
     return fig
 
 
+@memoize_figure
 def create_break_even_chart(
     break_even_data: Dict[str, Any],
     ownership_flows: List[Dict[str, float]],
@@ -543,6 +548,7 @@ def create_break_even_chart(
     return fig
 
 
+@memoize_figure
 def create_risk_gauge_chart(
     risk_metrics: Dict[str, float]
 ) -> go.Figure:
@@ -622,6 +628,7 @@ def create_risk_gauge_chart(
     return fig
 
 
+@memoize_figure
 def create_roi_progression_chart(
     analysis_results: Dict[str, float],
     ownership_flows: List[Dict[str, float]]
@@ -703,9 +710,9 @@ def create_roi_progression_chart(
         vertical_spacing=0.15
     )
     
-    # Top chart: Cumulative cash flow
+    # Top chart: Cumulative cash flow (long horizons are downsampled and drawn with WebGL)
     fig.add_trace(
-        go.Scatter(
+        line_trace(
             x=years, y=cumulative_cash_flows,
             mode='lines+markers',
             name='Cumulative Cash Flow',
@@ -720,7 +727,7 @@ def create_roi_progression_chart(
     
     # Bottom chart: ROI percentages
     fig.add_trace(
-        go.Scatter(
+        line_trace(
             x=years, y=roi_percentages,
             mode='lines+markers',
             name='Total ROI %',
@@ -731,7 +738,7 @@ def create_roi_progression_chart(
     )
     
     fig.add_trace(
-        go.Scatter(
+        line_trace(
             x=years, y=annualized_roi,
             mode='lines+markers',
             name='Annualized ROI %',
@@ -766,6 +773,7 @@ def create_roi_progression_chart(
     return fig
 
 
+@memoize_figure
 def create_monte_carlo_distribution_chart(
     simulation_results: List[float],
     confidence_intervals: Dict[str, float]
@@ -774,7 +782,7 @@ def create_monte_carlo_distribution_chart(
     Create Monte Carlo simulation results distribution chart
     
     Args:
-        simulation_results: List of NPV results from Monte Carlo simulation
+        simulation_results: List (or numpy array) of NPV results from Monte Carlo simulation
         confidence_intervals: Dictionary with confidence interval values
     
     Returns:
@@ -782,7 +790,7 @@ def create_monte_carlo_distribution_chart(
     """
     colors = get_professional_color_scheme()
     
-    if not simulation_results:
+    if simulation_results is None or len(simulation_results) == 0:
         fig = go.Figure()
         fig.update_layout(
             title="Monte Carlo Analysis - No Data Available",
@@ -791,11 +799,13 @@ def create_monte_carlo_distribution_chart(
         )
         return fig
     
-    # Create histogram
+    results = np.asarray(simulation_results, dtype=float)
+    
+    # Bin on the server so the payload does not grow with the iteration count
     fig = go.Figure(data=[
-        go.Histogram(
-            x=simulation_results,
-            nbinsx=50,
+        binned_histogram_trace(
+            results,
+            bins=50,
             marker_color=colors['primary'],
             opacity=0.7,
             name='NPV Distribution'
@@ -803,9 +813,9 @@ def create_monte_carlo_distribution_chart(
     ])
     
     # Add confidence interval lines
-    ci_5 = confidence_intervals.get('ci_5', np.percentile(simulation_results, 5))
-    ci_95 = confidence_intervals.get('ci_95', np.percentile(simulation_results, 95))
-    median = confidence_intervals.get('median', np.median(simulation_results))
+    ci_5 = confidence_intervals.get('ci_5', np.percentile(results, 5))
+    ci_95 = confidence_intervals.get('ci_95', np.percentile(results, 95))
+    median = confidence_intervals.get('median', np.median(results))
     
     fig.add_vline(
         x=ci_5, line_dash="dash", line_color=colors['warning'],
@@ -833,6 +843,7 @@ def create_monte_carlo_distribution_chart(
         xaxis={'tickformat': ',.0f'},
         font={'family': 'Arial, sans-serif', 'size': 12},
         height=450,
+        bargap=0,
         showlegend=False
     )
     
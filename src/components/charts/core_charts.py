@@ -20,6 +20,9 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 import streamlit as st
 
+from .downsampling import line_trace
+from .figure_cache import memoize_figure
+
 
 def get_professional_color_scheme() -> Dict[str, str]:
     """
@@ -110,6 +113,7 @@ def format_currency(amount: float, include_k_notation: bool = True) -> str:
     return f"${amount:,.0f}"
 
 
+@memoize_figure
 def create_npv_comparison_chart(
     analysis_results: Dict[str, float],
     show_confidence: bool = True
@@ -216,6 +220,7 @@ def create_npv_comparison_chart(
         return fig
 
 
+@memoize_figure
 def create_cash_flow_timeline_chart(
     ownership_flows: List[Dict[str, float]],
     rental_flows: List[Dict[str, float]]
@@ -272,7 +277,8 @@ def create_cash_flow_timeline_chart(
             else:
                 ownership_text_labels.append(f'Cost: {format_currency(abs(val))}')
         
-        fig.add_trace(go.Scatter(
+        # Long horizons are downsampled and drawn with WebGL
+        fig.add_trace(line_trace(
             x=years,
             y=ownership_cash_flows,
             mode='lines+markers',
@@ -284,7 +290,7 @@ def create_cash_flow_timeline_chart(
         ))
         
         # Add rental line  
-        fig.add_trace(go.Scatter(
+        fig.add_trace(line_trace(
             x=years,
             y=rental_cash_flows,
             mode='lines+markers',
@@ -336,6 +342,7 @@ def create_cash_flow_timeline_chart(
         return fig
 
 
+@memoize_figure
 def create_cost_breakdown_chart(
     ownership_flows: List[Dict[str, float]],
     analysis_type: str = "year1"
@@ -418,6 +425,7 @@ def create_cost_breakdown_chart(
     return fig
 
 
+@memoize_figure
 def create_terminal_value_chart(
     analysis_results: Dict[str, float],
     ownership_flows: List[Dict[str, float]]
@@ -562,6 +570,7 @@ def create_terminal_value_chart(
     return fig
 
 
+@memoize_figure
 def create_annual_costs_comparison_chart(
     ownership_flows: List[Dict[str, float]],
     rental_flows: List[Dict[str, float]]
@@ -0,0 +1,152 @@
+"""
+Chart Downsampling
+Server-side reduction of large chart series before they reach the browser
+
+This module provides:
+- Largest-Triangle-Three-Buckets (LTTB) downsampling for line series
+- Pre-binned histograms for simulation distributions
+- Line traces that switch to WebGL rendering above a point threshold
+
+Payload size and browser render time stay flat as Monte Carlo iterations
+or analysis horizons grow, while the visual shape of each series is kept.
+"""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Plotly renders SVG traces noticeably slower past roughly a thousand points
+WEBGL_POINT_THRESHOLD = 1000
+
+# More points than a chart is pixels wide adds payload without detail
+DEFAULT_MAX_LINE_POINTS = 2000
+
+DEFAULT_HISTOGRAM_BINS = 50
+
+
+def _numeric_x(x: Sequence[Any]) -> np.ndarray:
+    """x values as floats, or their positions when x is categorical"""
+    try:
+        return np.asarray(x, dtype=float)
+    except (TypeError, ValueError):
+        return np.arange(len(x), dtype=float)
+
+
+def lttb_indices(x: Sequence[Any], y: Sequence[float], threshold: int) -> np.ndarray:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling
+
+    The first and last points are always kept. The remaining points are split
+    into threshold - 2 buckets and each bucket keeps the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average, which preserves peaks and troughs.
+
+    Args:
+        x: Series x values
+        y: Series y values
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted array of kept indices
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x_values = _numeric_x(x)
+    y_values = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (threshold - 2)
+    # Bucket i covers [edges[i], edges[i + 1]); the final edge is the last point
+    edges = (np.arange(threshold - 1) * bucket_size).astype(int) + 1
+    edges[-1] = n - 1
+
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        average_x = x_values[end:next_end].mean()
+        average_y = y_values[end:next_end].mean()
+
+        areas = np.abs(
+            (x_values[previous] - average_x) * (y_values[start:end] - y_values[previous])
+            - (x_values[previous] - x_values[start:end]) * (average_y - y_values[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+
+    return kept
+
+
+def line_trace(
+    x: Sequence[Any],
+    y: Sequence[float],
+    text: Optional[Sequence[Any]] = None,
+    max_points: Optional[int] = DEFAULT_MAX_LINE_POINTS,
+    webgl_threshold: int = WEBGL_POINT_THRESHOLD,
+    **trace_kwargs: Any
+) -> go.Scatter:
+    """
+    Create a line trace, downsampled and WebGL-rendered when the series is large
+
+    Args:
+        x: Series x values
+        y: Series y values
+        text: Optional per-point hover text, downsampled with the series
+        max_points: Downsample with LTTB above this many points (None to keep all)
+        webgl_threshold: Use a Scattergl trace above this many points
+        **trace_kwargs: Other Scatter properties (mode, name, line, ...)
+
+    Returns:
+        go.Scatter, or go.Scattergl for large series
+    """
+    if max_points and len(y) > max_points:
+        kept = lttb_indices(x, y, max_points)
+        x = [x[i] for i in kept]
+        y = [y[i] for i in kept]
+        if text is not None:
+            text = [text[i] for i in kept]
+
+    if text is not None:
+        trace_kwargs['text'] = text
+
+    trace_class = go.Scattergl if len(y) > webgl_threshold else go.Scatter
+    return trace_class(x=x, y=y, **trace_kwargs)
+
+
+def binned_histogram_trace(
+    values: Sequence[float],
+    bins: int = DEFAULT_HISTOGRAM_BINS,
+    **trace_kwargs: Any
+) -> go.Bar:
+    """
+    Create a histogram as pre-binned bars
+
+    Only the bin counts are sent to the browser instead of every raw value.
+    Non-finite values are ignored.
+
+    Args:
+        values: Raw values to bin
+        bins: Number of equal-width bins
+        **trace_kwargs: Other Bar properties (marker_color, opacity, name, ...)
+
+    Returns:
+        go.Bar with one bar per bin
+    """
+    data = np.asarray(values, dtype=float)
+    data = data[np.isfinite(data)]
+    counts, edges = np.histogram(data, bins=bins)
+
+    trace_kwargs.setdefault(
+        'hovertemplate', '%{customdata[0]:,.0f} to %{customdata[1]:,.0f}<br>Count: %{y}<extra></extra>'
+    )
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        **trace_kwargs
+    )
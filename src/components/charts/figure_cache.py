@@ -0,0 +1,187 @@
+"""
+Figure Cache
+Process-wide memoization of Plotly chart construction
+
+This module provides:
+- Cache keys derived from the chart type and every argument (data and display options)
+- A bounded least-recently-used store shared by all sessions
+- One-time JSON serialization of cached figures for dashboards and exports
+
+Chart functions decorated with memoize_figure build each distinct figure
+once; later calls with the same data return a copy of the cached figure
+instead of re-running the trace and layout construction.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Optional
+
+import plotly.graph_objects as go
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+
+
+def _encode_argument(value: Any) -> Any:
+    """JSON fallback for chart arguments that are not plain data"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()  # numpy arrays and scalars
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+
+def figure_cache_key(chart_type: str, *args: Any, **kwargs: Any) -> str:
+    """
+    Hash a chart type together with the arguments the chart is built from
+
+    Args:
+        chart_type: Name of the chart function
+        *args: Positional chart arguments
+        **kwargs: Keyword chart arguments, including display options
+
+    Returns:
+        Hex digest identifying the figure
+    """
+    payload = json.dumps([chart_type, args, kwargs], sort_keys=True, default=_encode_argument)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+class _CachedFigure:
+    """A built figure and its JSON form, serialized on first request"""
+
+    __slots__ = ('figure', '_json')
+
+    def __init__(self, figure: go.Figure):
+        self.figure = figure
+        self._json: Optional[str] = None
+
+    def to_json(self) -> str:
+        if self._json is None:
+            self._json = self.figure.to_json()
+        return self._json
+
+
+class FigureCache:
+    """
+    Bounded LRU cache of built Plotly figures
+
+    Cached figures are shared; get_figure() returns a copy so callers can
+    restyle the result without affecting other sessions.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, _CachedFigure]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_entry(self, key: str, build: Callable[[], go.Figure]) -> _CachedFigure:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Build outside the lock; a concurrent miss on the same key just builds twice
+        entry = _CachedFigure(build())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def get_figure(self, key: str, build: Callable[[], go.Figure]) -> go.Figure:
+        """Copy of the cached figure for key, building it on a miss"""
+        return go.Figure(self._get_entry(key, build).figure)
+
+    def get_json(self, key: str, build: Callable[[], go.Figure]) -> str:
+        """Plotly JSON of the cached figure for key, serialized once"""
+        return self._get_entry(key, build).to_json()
+
+    def clear(self) -> None:
+        """Remove all cached figures"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+def memoize_figure(create_chart: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    Decorator caching a chart function's figures in the global figure cache
+
+    The wrapped function keeps its signature. Its JSON form is available via
+    get_figure_json(), and the uncached function via `__wrapped__`.
+    """
+    chart_type = create_chart.__name__
+
+    @functools.wraps(create_chart)
+    def wrapper(*args: Any, **kwargs: Any) -> go.Figure:
+        key = figure_cache_key(chart_type, *args, **kwargs)
+        return get_figure_cache().get_figure(key, lambda: create_chart(*args, **kwargs))
+
+    wrapper.chart_type = chart_type
+    return wrapper
+
+
+def get_figure_json(create_chart: Callable[..., go.Figure], *args: Any, **kwargs: Any) -> str:
+    """
+    Plotly JSON for a chart, built and serialized at most once per distinct input
+
+    Args:
+        create_chart: A chart function decorated with memoize_figure
+        *args: Positional chart arguments
+        **kwargs: Keyword chart arguments
+
+    Returns:
+        Figure JSON string (load with plotly.io.from_json)
+    """
+    build = getattr(create_chart, '__wrapped__', create_chart)
+    chart_type = getattr(create_chart, 'chart_type', build.__name__)
+    key = figure_cache_key(chart_type, *args, **kwargs)
+    return get_figure_cache().get_json(key, lambda: build(*args, **kwargs))
+
+
+# Global instance
+_figure_cache = None
+_figure_cache_lock = threading.Lock()
+
+
+def create_figure_cache(max_entries: int = DEFAULT_MAX_ENTRIES) -> FigureCache:
+    """Factory function to create FigureCache instance"""
+    return FigureCache(max_entries)
+
+
+def get_figure_cache() -> FigureCache:
+    """Get the process-wide figure cache"""
+    global _figure_cache
+    with _figure_cache_lock:
+        if _figure_cache is None:
+            _figure_cache = create_figure_cache()
+        return _figure_cache
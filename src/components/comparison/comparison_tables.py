@@ -8,12 +8,21 @@ This module provides specialized table components for detailed comparisons:
 - Investment summary tables
 - Table formatting utilities
 - Visual indicators for better/worse outcomes
+- Two-dimensional sensitivity grid styling
+
+Tables are built with column-wise DataFrame operations and the finished
+display frames are cached by analysis hash, so long analysis periods and
+large sensitivity grids do not re-run per-row Python on every rerun.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Callable, Optional, Tuple
 import plotly.graph_objects as go
+from pandas.io.formats.style import Styler
 
 import sys
 import os
@@ -21,6 +30,96 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from ..charts.core_charts import format_currency
 from utils.calculation_tooltips import display_calculation_tooltip
+from utils.helpers import compute_analysis_hash
+
+# Display tables shared by all sessions; entries are treated as read-only
+TABLE_CACHE_MAX_ENTRIES = 64
+_table_cache: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+_table_cache_lock = threading.Lock()
+
+# Sensitivity grid cell styles
+_POSITIVE_CELL_STYLE = 'background-color: #D5F4E6; color: #00B894; font-weight: bold;'
+_NEGATIVE_CELL_STYLE = 'background-color: #FADBD8; color: #E74C3C; font-weight: bold;'
+_NEUTRAL_CELL_STYLE = 'color: #2D3436; font-weight: bold;'
+
+_OWNERSHIP_COST_COLUMNS = [
+    'net_cash_flow', 'mortgage_payment', 'property_taxes', 'insurance', 'maintenance',
+    'property_management', 'capex_reserve', 'obsolescence_cost', 'tax_benefits'
+]
+
+
+def get_cached_table(table_name: str, analysis_hash: str, build: Callable[[], Any]) -> Any:
+    """
+    Return a display table for an analysis, building it only once
+    
+    Args:
+        table_name: Name of the table within the analysis
+        analysis_hash: Hash of the data the table is built from
+        build: Callable building the table on a miss
+    
+    Returns:
+        Cached table (DataFrame or tuple of DataFrames); do not modify it
+    """
+    key = (table_name, analysis_hash)
+    with _table_cache_lock:
+        if key in _table_cache:
+            _table_cache.move_to_end(key)
+            return _table_cache[key]
+    
+    table = build()
+    with _table_cache_lock:
+        _table_cache[key] = table
+        while len(_table_cache) > TABLE_CACHE_MAX_ENTRIES:
+            _table_cache.popitem(last=False)
+    return table
+
+
+def clear_table_cache() -> None:
+    """Remove all cached display tables"""
+    with _table_cache_lock:
+        _table_cache.clear()
+
+
+def format_currency_values(values: Any) -> np.ndarray:
+    """
+    Format an array of amounts like format_currency, without a Python loop per value
+    
+    Args:
+        values: Numeric amounts (array, Series or list)
+    
+    Returns:
+        Array of formatted currency strings
+    """
+    amounts = np.asarray(values, dtype=float)
+    magnitude = np.abs(amounts)
+    millions = np.char.mod('$%.1fM', amounts / 1_000_000)
+    thousands = np.char.mod('$%.0fK', amounts / 1_000)
+    units = np.char.mod('$%.0f', amounts)
+    # Amounts just under 1,000 can round up to the only four-digit unit value
+    units = np.where(units == '$1000', '$1,000', np.where(units == '$-1000', '$-1,000', units))
+    return np.where(magnitude >= 1_000_000, millions, np.where(magnitude >= 1_000, thousands, units))
+
+
+def _parse_display_amounts(column: pd.Series) -> pd.Series:
+    """Numeric values of a display column such as '$1.2M', '-$50K' or 'N/A' (0)"""
+    text = column.astype(str).str.replace(r'[$,+]', '', regex=True).str.strip()
+    text = text.mask(text.str.lower().isin(['n/a', 'na', 'none', '']), '0')
+    multiplier = np.select([text.str.endswith('M'), text.str.endswith('K')], [1_000_000, 1_000], default=1)
+    return pd.to_numeric(text.str.rstrip('MK'), errors='coerce') * multiplier
+
+
+def _indicator_prefixes(
+    values1: pd.Series,
+    values2: pd.Series,
+    better_when: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Indicator emoji for each side of a two-column comparison"""
+    first_better = values1 < values2 if better_when == "lower" else values1 > values2
+    second_better = values2 < values1 if better_when == "lower" else values2 > values1
+    conditions = [first_better.to_numpy(), second_better.to_numpy()]
+    prefix1 = np.select(conditions, ['🟢 ', '🔴 '], default='🟡 ')
+    prefix2 = np.select(conditions, ['🔴 ', '🟢 '], default='🟡 ')
+    return prefix1, prefix2
 
 
 def format_comparison_table(
@@ -56,8 +155,10 @@ def format_comparison_table(
                     cleaned_values = styled_df[col].str.replace('$', '').str.replace(',', '').str.strip()
                     styled_df[col] = pd.to_numeric(cleaned_values, errors='coerce')
                 
-                # Format currency values with proper error handling
-                styled_df[col] = styled_df[col].apply(lambda x: format_currency(x) if pd.notna(x) and x != 0 else 'N/A')
+                # Format currency values; missing and zero amounts show as N/A
+                values = styled_df[col].to_numpy(dtype=float)
+                has_value = ~np.isnan(values) & (values != 0)
+                styled_df[col] = np.where(has_value, format_currency_values(np.where(has_value, values, 0)), 'N/A')
                 
             except AttributeError as e:
                 # Handle issues with string operations on non-string columns
@@ -92,111 +193,120 @@ def add_visual_indicators(
     if len(comparison_columns) == 2 and len(enhanced_df) > 0:
         col1, col2 = comparison_columns
         
-        for index, row in enhanced_df.iterrows():
-            try:
-                # Extract numeric values for comparison with improved error handling
-                val1_str = str(row[col1]).replace('$', '').replace(',', '').replace('+', '').strip()
-                val2_str = str(row[col2]).replace('$', '').replace(',', '').replace('+', '').strip()
-                
-                # Handle common non-numeric strings
-                if val1_str.lower() in ['n/a', 'na', 'none', '']:
-                    val1_str = '0'
-                if val2_str.lower() in ['n/a', 'na', 'none', '']:
-                    val2_str = '0'
-                
-                val1 = float(val1_str)
-                val2 = float(val2_str)
-                
-                # Determine better option
-                if better_when == "lower":
-                    if val1 < val2:
-                        enhanced_df.at[index, col1] = f"🟢 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🔴 {row[col2]}"
-                    elif val2 < val1:
-                        enhanced_df.at[index, col1] = f"🔴 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🟢 {row[col2]}"
-                    else:
-                        enhanced_df.at[index, col1] = f"🟡 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🟡 {row[col2]}"
-                else:  # higher is better
-                    if val1 > val2:
-                        enhanced_df.at[index, col1] = f"🟢 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🔴 {row[col2]}"
-                    elif val2 > val1:
-                        enhanced_df.at[index, col1] = f"🔴 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🟢 {row[col2]}"
-                    else:
-                        enhanced_df.at[index, col1] = f"🟡 {row[col1]}"
-                        enhanced_df.at[index, col2] = f"🟡 {row[col2]}"
-                        
-            except ValueError as e:
-                # Log specific conversion errors for debugging
-                error_msg = f"Could not convert values for comparison in row {index}: '{val1_str}' vs '{val2_str}'"
-                st.warning(f"⚠️ Data conversion issue: {error_msg}")
-                # Leave values as-is without indicators
-                continue
-            except KeyError as e:
-                # Handle missing column issues
-                st.error(f"❌ Missing column in data: {e}")
-                continue
-            except Exception as e:
-                # Handle any other unexpected errors
-                st.error(f"❌ Unexpected error processing row {index}: {str(e)}")
-                continue
+        if col1 not in enhanced_df.columns or col2 not in enhanced_df.columns:
+            missing = [col for col in comparison_columns if col not in enhanced_df.columns]
+            st.error(f"❌ Missing column in data: {missing}")
+            return enhanced_df
+        
+        # Extract numeric values for comparison from formatted or raw values
+        val1 = _parse_display_amounts(enhanced_df[col1])
+        val2 = _parse_display_amounts(enhanced_df[col2])
+        comparable = (val1.notna() & val2.notna()).to_numpy()
+        
+        if not comparable.all():
+            # Leave unparseable rows as-is without indicators
+            rows = enhanced_df.index[~comparable].tolist()
+            st.warning(f"⚠️ Data conversion issue: Could not convert values for comparison in rows {rows}")
+        
+        prefix1, prefix2 = _indicator_prefixes(val1, val2, better_when)
+        for col, prefix in ((col1, prefix1), (col2, prefix2)):
+            text = enhanced_df[col].astype(str).to_numpy(dtype=str)
+            enhanced_df[col] = np.where(comparable, np.char.add(prefix, text), enhanced_df[col].to_numpy())
     
     return enhanced_df
 
 
-def create_annual_costs_table(
+def _flow_columns(flows: List[Dict[str, float]], columns: List[str]) -> pd.DataFrame:
+    """Columns of a cash flow list as a DataFrame, with missing values as 0"""
+    return pd.DataFrame.from_records(flows).reindex(columns=columns).fillna(0)
+
+
+def build_annual_costs_frame(
     ownership_flows: List[Dict[str, float]],
     rental_flows: List[Dict[str, float]],
     max_years: int = None
-) -> None:
+) -> pd.DataFrame:
     """
-    Create detailed annual costs breakdown table
+    Build the numeric annual costs breakdown
     
     Args:
         ownership_flows: Ownership cash flow data
         rental_flows: Rental cash flow data
-        max_years: Maximum number of years to display (None = show all years from analysis period)
-    """
-    if not ownership_flows or not rental_flows:
-        st.error("Annual costs data not available")
-        return
-    
-    st.subheader("📊 Annual Costs Breakdown")
+        max_years: Maximum number of years to include (None = all years)
     
-    # Prepare table data
-    table_data = []
+    Returns:
+        DataFrame with one row per year
+    """
     # Use full analysis period if max_years not specified
-    if max_years is None:
-        years_to_show = min(len(ownership_flows), len(rental_flows))
-    else:
-        years_to_show = min(max_years, len(ownership_flows), len(rental_flows))
-    
-    for i in range(years_to_show):
-        ownership_flow = ownership_flows[i]
-        rental_flow = rental_flows[i]
-        
-        row = {
-            'Year': ownership_flow['year'],
-            'Ownership Total': abs(ownership_flow['net_cash_flow']),
-            'Mortgage Payment': ownership_flow.get('mortgage_payment', 0),
-            'Property Taxes': ownership_flow.get('property_taxes', 0),
-            'Insurance': ownership_flow.get('insurance', 0),
-            'Maintenance': ownership_flow.get('maintenance', 0),
-            'Other Costs': (
-                ownership_flow.get('property_management', 0) +
-                ownership_flow.get('capex_reserve', 0) +
-                ownership_flow.get('obsolescence_cost', 0)
-            ),
-            'Tax Benefits': ownership_flow.get('tax_benefits', 0),
-            'Rental Total': abs(rental_flow['net_cash_flow']),
-            'Annual Difference': abs(ownership_flow['net_cash_flow']) - abs(rental_flow['net_cash_flow'])
-        }
-        table_data.append(row)
+    years_to_show = min(len(ownership_flows), len(rental_flows))
+    if max_years is not None:
+        years_to_show = min(max_years, years_to_show)
+    
+    ownership = _flow_columns(ownership_flows[:years_to_show], ['year'] + _OWNERSHIP_COST_COLUMNS)
+    rental = _flow_columns(rental_flows[:years_to_show], ['net_cash_flow'])
+    ownership_total = ownership['net_cash_flow'].abs()
+    rental_total = rental['net_cash_flow'].abs()
+    
+    return pd.DataFrame({
+        'Year': ownership['year'],
+        'Ownership Total': ownership_total,
+        'Mortgage Payment': ownership['mortgage_payment'],
+        'Property Taxes': ownership['property_taxes'],
+        'Insurance': ownership['insurance'],
+        'Maintenance': ownership['maintenance'],
+        'Other Costs': ownership['property_management'] + ownership['capex_reserve'] + ownership['obsolescence_cost'],
+        'Tax Benefits': ownership['tax_benefits'],
+        'Rental Total': rental_total,
+        'Annual Difference': ownership_total - rental_total
+    })
+
+
+def build_cash_flow_comparison_frame(
+    ownership_flows: List[Dict[str, float]],
+    rental_flows: List[Dict[str, float]],
+    cost_of_capital: float
+) -> pd.DataFrame:
+    """
+    Build the numeric cash flow comparison with present values
     
-    df = pd.DataFrame(table_data)
+    Args:
+        ownership_flows: Ownership cash flows
+        rental_flows: Rental cash flows
+        cost_of_capital: Discount rate as a decimal
+    
+    Returns:
+        DataFrame with one row per year
+    """
+    years = min(len(ownership_flows), len(rental_flows))
+    ownership = _flow_columns(ownership_flows[:years], ['year', 'net_cash_flow'])
+    rental = _flow_columns(rental_flows[:years], ['net_cash_flow'])
+    
+    # Annual cash flows (negative = outflow) and their present values
+    ownership_cf = ownership['net_cash_flow'].to_numpy(dtype=float)
+    rental_cf = rental['net_cash_flow'].to_numpy(dtype=float)
+    discount_factors = (1 + cost_of_capital) ** ownership['year'].to_numpy(dtype=float)
+    ownership_pv = ownership_cf / discount_factors
+    rental_pv = rental_cf / discount_factors
+    
+    return pd.DataFrame({
+        'Year': ownership['year'],
+        'Ownership Cash Flow': ownership_cf,
+        'Rental Cash Flow': rental_cf,
+        'Annual Difference': ownership_cf - rental_cf,
+        'Ownership PV': ownership_pv,
+        'Rental PV': rental_pv,
+        'PV Difference': ownership_pv - rental_pv,
+        'Cumulative PV Difference': np.cumsum(ownership_pv) - np.cumsum(rental_pv)
+    })
+
+
+def _build_annual_costs_display(
+    ownership_flows: List[Dict[str, float]],
+    rental_flows: List[Dict[str, float]],
+    max_years: Optional[int]
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
+    """Formatted annual costs table with indicators, and the period totals"""
+    df = build_annual_costs_frame(ownership_flows, rental_flows, max_years)
     
     # Format the table
     formatted_df = format_comparison_table(df)
@@ -208,6 +318,40 @@ def create_annual_costs_table(
         better_when="lower"
     )
     
+    totals = {
+        'years': len(df),
+        'ownership': float(df['Ownership Total'].sum()),
+        'rental': float(df['Rental Total'].sum())
+    }
+    return indicator_df, totals
+
+
+def create_annual_costs_table(
+    ownership_flows: List[Dict[str, float]],
+    rental_flows: List[Dict[str, float]],
+    max_years: int = None
+) -> None:
+    """
+    Create detailed annual costs breakdown table
+    
+    Args:
+        ownership_flows: Ownership cash flow data
+        rental_flows: Rental cash flow data
+        max_years: Maximum number of years to display (None = show all years from analysis period)
+    """
+    if not ownership_flows or not rental_flows:
+        st.error("Annual costs data not available")
+        return
+    
+    st.subheader("📊 Annual Costs Breakdown")
+    
+    # Build the formatted table once per distinct set of flows
+    analysis_hash = compute_analysis_hash({'max_years': max_years}, ownership_flows, rental_flows)
+    indicator_df, totals = get_cached_table(
+        'annual_costs', analysis_hash,
+        lambda: _build_annual_costs_display(ownership_flows, rental_flows, max_years)
+    )
+    
     # Display table with calculation tooltips
     st.dataframe(
         indicator_df,
@@ -264,8 +408,9 @@ def create_annual_costs_table(
     )
     
     # Add summary
-    total_ownership = sum(abs(f['net_cash_flow']) for f in ownership_flows[:years_to_show])
-    total_rental = sum(abs(f['net_cash_flow']) for f in rental_flows[:years_to_show])
+    years_to_show = totals['years']
+    total_ownership = totals['ownership']
+    total_rental = totals['rental']
     total_difference = total_ownership - total_rental
     
     st.markdown(f"""
@@ -297,49 +442,20 @@ def create_cash_flow_comparison_table(
     
     cost_of_capital = analysis_results.get('cost_of_capital', 8.0) / 100
     
-    # Prepare comparison data
-    table_data = []
-    cumulative_ownership_pv = 0
-    cumulative_rental_pv = 0
-    
-    for i, (ownership_flow, rental_flow) in enumerate(zip(ownership_flows, rental_flows)):
-        year = ownership_flow['year']
-        
-        # Annual cash flows (negative = outflow)
-        ownership_cf = ownership_flow['net_cash_flow']
-        rental_cf = rental_flow['net_cash_flow']
-        
-        # Present value calculations
-        discount_factor = (1 + cost_of_capital) ** year
-        ownership_pv = ownership_cf / discount_factor
-        rental_pv = rental_cf / discount_factor
+    def build_display() -> pd.DataFrame:
+        df = build_cash_flow_comparison_frame(ownership_flows, rental_flows, cost_of_capital)
         
-        cumulative_ownership_pv += ownership_pv
-        cumulative_rental_pv += rental_pv
+        # Format currency columns
+        currency_cols = ['Ownership Cash Flow', 'Rental Cash Flow', 'Annual Difference', 
+                        'Ownership PV', 'Rental PV', 'PV Difference', 'Cumulative PV Difference']
+        for col in currency_cols:
+            df[col] = format_currency_values(df[col])
         
-        row = {
-            'Year': year,
-            'Ownership Cash Flow': ownership_cf,
-            'Rental Cash Flow': rental_cf,
-            'Annual Difference': ownership_cf - rental_cf,
-            'Ownership PV': ownership_pv,
-            'Rental PV': rental_pv,
-            'PV Difference': ownership_pv - rental_pv,
-            'Cumulative PV Difference': cumulative_ownership_pv - cumulative_rental_pv
-        }
-        table_data.append(row)
-    
-    df = pd.DataFrame(table_data)
+        # Display table (first 10 years)
+        return df.head(10)
     
-    # Format currency columns
-    currency_cols = ['Ownership Cash Flow', 'Rental Cash Flow', 'Annual Difference', 
-                    'Ownership PV', 'Rental PV', 'PV Difference', 'Cumulative PV Difference']
-    
-    for col in currency_cols:
-        df[col] = df[col].apply(lambda x: format_currency(x))
-    
-    # Display table (first 10 years)
-    display_df = df.head(10)
+    analysis_hash = compute_analysis_hash({'cost_of_capital': cost_of_capital}, ownership_flows, rental_flows)
+    display_df = get_cached_table('cash_flow_comparison', analysis_hash, build_display)
     
     st.dataframe(
         display_df,
@@ -576,6 +692,68 @@ def create_sensitivity_comparison_table(
     st.markdown("💡 **Key Insight**: Parameters with higher sensitivity levels have greater impact on the final recommendation.")
 
 
+def build_sensitivity_grid(formatted_result: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the 2D sensitivity display table and its cell styles
+    
+    Args:
+        formatted_result: Result of format_2d_sensitivity_for_streamlit
+    
+    Returns:
+        Tuple of (display DataFrame, DataFrame of CSS styles with the same shape)
+    """
+    rows = formatted_result['table_data']
+    num_columns = formatted_result['num_columns']
+    indicators = formatted_result['x_change_indicators']
+    label_column = f"{formatted_result['y_metric_display']}"
+    
+    headers = []
+    for i in range(num_columns):
+        header = f"{formatted_result['x_headers'][i]}"
+        if i < len(indicators):
+            header += f" {indicators[i]}"
+        headers.append(header)
+    
+    records = pd.DataFrame.from_records(rows, columns=['y_label', 'y_change'] + [
+        f'col_{i}{suffix}' for i in range(num_columns) for suffix in ('', '_raw')
+    ])
+    value_columns = [f'col_{i}' for i in range(num_columns)]
+    raw_columns = [f'col_{i}_raw' for i in range(num_columns)]
+    
+    display_df = pd.DataFrame(records[value_columns].to_numpy(), columns=headers)
+    display_df.insert(0, label_column, records['y_label'] + ' ' + records['y_change'])
+    
+    # Green favours ownership, red favours rental
+    raw_values = records[raw_columns].to_numpy(dtype=float)
+    cell_styles = np.select(
+        [raw_values > 0, raw_values < 0],
+        [_POSITIVE_CELL_STYLE, _NEGATIVE_CELL_STYLE],
+        default=_NEUTRAL_CELL_STYLE
+    )
+    styles = pd.DataFrame(cell_styles, columns=headers)
+    styles.insert(0, label_column, '')
+    
+    return display_df, styles
+
+
+def style_sensitivity_grid(formatted_result: Dict[str, Any]) -> Styler:
+    """
+    Styled 2D sensitivity table, built once per distinct sensitivity result
+    
+    Args:
+        formatted_result: Result of format_2d_sensitivity_for_streamlit
+    
+    Returns:
+        pandas Styler with NPV cells coloured by sign
+    """
+    analysis_hash = compute_analysis_hash(formatted_result)
+    display_df, styles = get_cached_table(
+        'sensitivity_grid', analysis_hash, lambda: build_sensitivity_grid(formatted_result)
+    )
+    # Stylers hold render state, so each render gets its own over the shared frames
+    return display_df.style.apply(lambda _: styles, axis=None)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # This would be used for testing the comparison table components
@@ -14,6 +14,7 @@ presentation of the real estate analysis results including:
 import streamlit as st
 from typing import Dict, List, Optional, Any
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
 
 from .metric_widgets import (
@@ -30,10 +31,13 @@ from ..charts.core_charts import (
     create_annual_costs_comparison_chart,
     format_currency
 )
+from ..charts.figure_cache import get_figure_json
 from ..charts.advanced_charts import (
     create_sensitivity_tornado_chart,
     create_break_even_chart
 )
+from ..comparison.comparison_tables import build_sensitivity_grid, style_sensitivity_grid
+from ..result_store import get_derived_result_store
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -45,6 +49,9 @@ from utils.calculation_tooltips import (
     get_npv_analysis_tooltips
 )
 
+# Session state key holding the handle of the last 2D sensitivity result
+SENSITIVITY_RESULTS_KEY = "sensitivity_2d_results"
+
 
 def render_executive_summary_dashboard(
     analysis_results: Dict[str, Any],
@@ -447,6 +454,9 @@ def render_chart_sections(
     """
     Render all chart sections
     
+    Each section is a fragment: its widgets rerun only that section. Chart
+    functions are memoized, so figures are built once per analysis.
+    
     Args:
         analysis_results: Analysis results
         ownership_flows: Ownership cash flows
@@ -470,19 +480,20 @@ def render_chart_sections(
         render_comparison_charts_section(analysis_results, ownership_flows, rental_flows)
 
 
+@st.fragment
 def render_core_charts_section(
     analysis_results: Dict[str, Any],
     ownership_flows: List[Dict[str, float]],
     rental_flows: List[Dict[str, float]]
 ) -> None:
-    """Render core analysis charts"""
+    """Render core analysis charts from their cached figure JSON"""
     st.subheader("📊 Core Financial Analysis")
     
     # NPV Comparison Chart
     if analysis_results:
         try:
-            npv_chart = create_npv_comparison_chart(analysis_results, show_confidence=True)
-            st.plotly_chart(npv_chart, use_container_width=True)
+            npv_chart = get_figure_json(create_npv_comparison_chart, analysis_results, show_confidence=True)
+            st.plotly_chart(pio.from_json(npv_chart), use_container_width=True)
         except Exception as e:
             st.error(f"Error creating NPV comparison chart: {str(e)}")
             st.info("Please check your analysis data and try again.")
@@ -494,16 +505,16 @@ def render_core_charts_section(
         with col1:
             st.markdown("#### 📈 Cash Flow Timeline")
             try:
-                cash_flow_chart = create_cash_flow_timeline_chart(ownership_flows, rental_flows)
-                st.plotly_chart(cash_flow_chart, use_container_width=True)
+                cash_flow_chart = get_figure_json(create_cash_flow_timeline_chart, ownership_flows, rental_flows)
+                st.plotly_chart(pio.from_json(cash_flow_chart), use_container_width=True)
             except Exception as e:
                 st.error(f"Error creating cash flow chart: {str(e)}")
         
         with col2:
             st.markdown("#### 🥧 Cost Breakdown")
             try:
-                cost_breakdown_chart = create_cost_breakdown_chart(ownership_flows, "year1")
-                st.plotly_chart(cost_breakdown_chart, use_container_width=True)
+                cost_breakdown_chart = get_figure_json(create_cost_breakdown_chart, ownership_flows, "year1")
+                st.plotly_chart(pio.from_json(cost_breakdown_chart), use_container_width=True)
             except Exception as e:
                 st.error(f"Error creating cost breakdown chart: {str(e)}")
 
@@ -523,6 +534,7 @@ def render_advanced_charts_section(
     # Terminal Value and ROI charts removed for better performance
 
 
+@st.fragment
 def render_comparison_charts_section(
     analysis_results: Dict[str, Any],
     ownership_flows: List[Dict[str, float]],
@@ -534,8 +546,8 @@ def render_comparison_charts_section(
     # Annual Costs Comparison
     if ownership_flows and rental_flows:
         try:
-            annual_costs_chart = create_annual_costs_comparison_chart(ownership_flows, rental_flows)
-            st.plotly_chart(annual_costs_chart, use_container_width=True)
+            annual_costs_chart = get_figure_json(create_annual_costs_comparison_chart, ownership_flows, rental_flows)
+            st.plotly_chart(pio.from_json(annual_costs_chart), use_container_width=True)
         except Exception as e:
             st.error(f"Error creating annual costs comparison chart: {str(e)}")
     
@@ -581,10 +593,14 @@ def create_results_summary_section(analysis_results: Dict[str, Any]) -> None:
         """, unsafe_allow_html=True)
 
 
+@st.fragment
 def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], session_manager: Any = None) -> None:
     """
     Render two-dimensional sensitivity analysis with interactive metric selection
     
+    Runs as a fragment, so changing the metric selection or running the table
+    reruns this section only.
+    
     Args:
         analysis_results: Analysis results containing input parameters
         session_manager: Session manager to access original input parameters
@@ -606,79 +622,8 @@ def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], sessio
         
         # Extract base parameters - use same logic as main analysis to ensure consistency
         if session_manager and session_manager.is_ready_for_analysis():
-            # Use session manager to get the exact same parameters used for main analysis
-            session_data = session_manager.export_session_data()
-            inputs = session_data.get('inputs', {})
-            
-            # Use same parameter extraction logic as run_financial_analysis()
-            try:
-                from data.data_priority_manager import get_data_priority_manager
-                priority_manager = get_data_priority_manager()
-                priority_manager.bulk_update_from_session(session_data)
-            except:
-                priority_manager = None
-            
-            def get_priority_value(key, default):
-                if priority_manager:
-                    return priority_manager.get_value_only(key, inputs.get(key, default))
-                return inputs.get(key, default)
-            
-            base_params = {
-                # Purchase scenario parameters
-                'purchase_price': inputs.get('purchase_price', 500000),
-                'down_payment_pct': inputs.get('down_payment_percent', 30.0),
-                'interest_rate': get_priority_value('interest_rate', 7.0),
-                'loan_term': inputs.get('loan_term', 20),
-                'transaction_costs': inputs.get('transaction_costs_percent', 5.0) * inputs.get('purchase_price', 0) / 100,
-                
-                # Rental scenario parameters  
-                'current_annual_rent': inputs.get('current_annual_rent', 24000),
-                'rent_increase_rate': get_priority_value('rent_increase_rate', 3.0),
-                'moving_costs': inputs.get('moving_costs', 0.0),
-                
-                # Common parameters
-                'analysis_period': inputs.get('analysis_period', 25),
-                'cost_of_capital': get_priority_value('cost_of_capital', 8.0),
-                
-                # Property parameters
-                'property_tax_rate': get_priority_value('property_tax_rate', 1.2),
-                'property_tax_escalation': inputs.get('property_tax_escalation_rate', 2.0),
-                'insurance_cost': inputs.get('insurance_cost', 5000),
-                'annual_maintenance': inputs.get('annual_maintenance_percent', 2.0) * inputs.get('purchase_price', 0) / 100,
-                'property_management': inputs.get('property_management', 0),
-                
-                # Advanced parameters
-                'capex_reserve_rate': inputs.get('longterm_capex_reserve', 1.5),
-                'obsolescence_risk_rate': inputs.get('obsolescence_risk_factor', 0.5),
-                'inflation_rate': get_priority_value('inflation_rate', 3.0),
-                'land_value_pct': inputs.get('land_value_percent', 25.0),
-                'market_appreciation_rate': get_priority_value('market_appreciation_rate', 3.0),
-                'depreciation_period': inputs.get('depreciation_period', 39),
-                
-                # Tax parameters
-                'corporate_tax_rate': inputs.get('corporate_tax_rate', 25.0),
-                'interest_deductible': inputs.get('interest_deductible', True),
-                'property_tax_deductible': inputs.get('property_tax_deductible', True),
-                'rent_deductible': inputs.get('rent_deductible', True),
-                
-                # Space improvement costs
-                'space_improvement_cost': inputs.get('space_improvement_cost', 0.0),
-                
-                # Expansion parameters
-                'future_expansion_year': inputs.get('future_expansion_year', 'Never'),
-                'additional_space_needed': inputs.get('additional_space_needed', 0),
-                'current_space_needed': inputs.get('current_space_needed', 0),
-                'ownership_property_size': inputs.get('ownership_property_size', 0),
-                'rental_property_size': inputs.get('rental_property_size', 0),
-                
-                # Subletting parameters
-                'subletting_potential': inputs.get('subletting_potential', False),
-                'subletting_rate': inputs.get('subletting_rate', 0),
-                'subletting_space_sqm': inputs.get('subletting_space_sqm', 0),
-                
-                # Property upgrade parameters
-                'property_upgrade_cycle': inputs.get('property_upgrade_cycle', 30)
-            }
+            # Use the exact same (cached) parameters used for main analysis
+            base_params = session_manager.get_analysis_parameters()
         else:
             # Fallback to analysis_results if session manager not available
             base_params = {
@@ -790,86 +735,10 @@ def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], sessio
                         st.markdown("### 📊 NPV Sensitivity Table")
                         st.markdown(f"**{formatted_result['y_metric_display']} vs {formatted_result['x_metric_display']}**")
                         
-                        # Create column configuration
-                        column_config = {'y_label': f"{formatted_result['y_metric_display']}", 'y_change': 'Change'}
-                        for i in range(formatted_result['num_columns']):
-                            column_config[f'col_{i}'] = formatted_result['x_headers'][i]
-                        
-                        # Prepare dataframe for display
-                        import pandas as pd
-                        display_data = []
-                        
-                        for row in formatted_result['table_data']:
-                            display_row = {
-                                f"{formatted_result['y_metric_display']}": f"{row['y_label']} {row['y_change']}",
-                            }
-                            for i in range(formatted_result['num_columns']):
-                                header = f"{formatted_result['x_headers'][i]}"
-                                if i < len(formatted_result['x_change_indicators']):
-                                    header += f" {formatted_result['x_change_indicators'][i]}"
-                                display_row[header] = row[f'col_{i}']
-                            display_data.append(display_row)
-                        
-                        df = pd.DataFrame(display_data)
-                        
-                        # Create styling function for color coding based on NPV values
-                        def style_npv_values(val, raw_values, col_name):
-                            """Apply color styling based on NPV values"""
-                            if col_name in raw_values:
-                                raw_val = raw_values[col_name]
-                                if raw_val > 0:
-                                    # Positive NPV (ownership advantage) - green background
-                                    return 'background-color: #D5F4E6; color: #00B894; font-weight: bold;'
-                                elif raw_val < 0:
-                                    # Negative NPV (rental advantage) - light red background  
-                                    return 'background-color: #FADBD8; color: #E74C3C; font-weight: bold;'
-                                else:
-                                    # Zero NPV - neutral
-                                    return 'color: #2D3436; font-weight: bold;'
-                            return ''
-                        
-                        # Create a styled dataframe
-                        styled_df = df.copy()
-                        
-                        # Apply styling using st.dataframe with custom CSS
+                        # Colour-coded grid, styled column-wise and cached per result
                         try:
-                            # Create styling for each row based on raw NPV values
-                            def highlight_cells(row):
-                                styles = [''] * len(row)
-                                
-                                # Find the corresponding raw data for this row
-                                row_index = styled_df.index[styled_df[f"{formatted_result['y_metric_display']}"] == row[f"{formatted_result['y_metric_display']}"]].tolist()
-                                if row_index:
-                                    raw_row_data = formatted_result['table_data'][row_index[0]]
-                                    
-                                    # Style NPV value columns
-                                    for i in range(formatted_result['num_columns']):
-                                        col_header = f"{formatted_result['x_headers'][i]}"
-                                        if i < len(formatted_result['x_change_indicators']):
-                                            col_header += f" {formatted_result['x_change_indicators'][i]}"
-                                        
-                                        if col_header in row.index:
-                                            col_idx = row.index.get_loc(col_header)
-                                            raw_val = raw_row_data[f'col_{i}_raw']
-                                            
-                                            if raw_val > 0:
-                                                # Positive NPV (ownership advantage) - green
-                                                styles[col_idx] = 'background-color: #D5F4E6; color: #00B894; font-weight: bold;'
-                                            elif raw_val < 0:
-                                                # Negative NPV (rental advantage) - light red
-                                                styles[col_idx] = 'background-color: #FADBD8; color: #E74C3C; font-weight: bold;'
-                                            else:
-                                                # Zero NPV - neutral
-                                                styles[col_idx] = 'color: #2D3436; font-weight: bold;'
-                                
-                                return styles
-                            
-                            # Apply the styling
-                            styled_dataframe = styled_df.style.apply(highlight_cells, axis=1)
-                            
-                            # Display the styled table
                             st.dataframe(
-                                styled_dataframe,
+                                style_sensitivity_grid(formatted_result),
                                 use_container_width=True,
                                 hide_index=True
                             )
@@ -877,7 +746,7 @@ def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], sessio
                         except Exception as e:
                             # Fallback to regular table if styling fails
                             st.dataframe(
-                                df,
+                                build_sensitivity_grid(formatted_result)[0],
                                 use_container_width=True,
                                 hide_index=True
                             )
@@ -937,10 +806,12 @@ def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], sessio
                             st.markdown("• **Green Values**: Favorable changes that improve the recommended option")
                             st.markdown("• **Red Values**: Unfavorable changes that worsen the recommended option")
                         
-                        # Store results in session state for potential export
-                        st.session_state['sensitivity_2d_results'] = {
-                            'raw_result': sensitivity_result,
-                            'formatted_result': formatted_result,
+                        # Keep results in the derived result store for potential export
+                        st.session_state[SENSITIVITY_RESULTS_KEY] = {
+                            'result_handle': get_derived_result_store().put({
+                                'raw_result': sensitivity_result,
+                                'formatted_result': formatted_result
+                            }),
                             'x_metric': x_metric,
                             'y_metric': y_metric
                         }
@@ -978,8 +849,8 @@ def render_sensitivity_analysis_section(analysis_results: Dict[str, Any], sessio
                     st.write(f"Current value: ${current_y_value:,.0f}")
         
         # Show previously calculated results if available
-        if 'sensitivity_2d_results' in st.session_state:
-            prev_results = st.session_state['sensitivity_2d_results']
+        if SENSITIVITY_RESULTS_KEY in st.session_state:
+            prev_results = st.session_state[SENSITIVITY_RESULTS_KEY]
             if (prev_results['x_metric'] == x_metric and prev_results['y_metric'] == y_metric):
                 st.info("📊 Results shown above are current. Click 'Run 2D Sensitivity Analysis' to recalculate if you've changed inputs.")
             else:
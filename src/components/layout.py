@@ -9,8 +9,13 @@ Provides:
 - Executive presentation styling
 """
 
+import inspect
 import streamlit as st
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+# Streamlit releases with st.tabs(on_change=...) report the selected tab and
+# can skip the others; older releases fall back to a radio selector
+_NATIVE_LAZY_TABS = 'on_change' in inspect.signature(st.tabs).parameters
 
 def setup_page_config():
     """Configure the Streamlit page with professional settings"""
@@ -221,6 +226,37 @@ def create_professional_columns(num_cols: int, gap: str = "small"):
     """Create responsive columns with professional spacing"""
     return st.columns(num_cols, gap=gap)
 
+def render_lazy_tabs(tabs: Dict[str, Callable[[], None]], key: str = "active_tab") -> str:
+    """
+    Render tab navigation, running only the selected tab's render function
+    
+    Switching tabs reruns the app, so content (and any imports or calculations
+    inside the render functions) of tabs the user isn't looking at is never
+    computed. Widgets inside a hidden tab are not rendered, so their state
+    resets; keep inputs that must persist outside the tabs.
+    
+    Args:
+        tabs: Tab labels mapped to functions rendering the tab content
+        key: Session state key holding the selected tab label
+    
+    Returns:
+        Label of the rendered tab
+    """
+    labels = list(tabs)
+    
+    if _NATIVE_LAZY_TABS:
+        containers = st.tabs(labels, key=key, on_change="rerun")
+        for label, container in zip(labels, containers):
+            if container.open:
+                with container:
+                    tabs[label]()
+                return label
+        return labels[0]
+    
+    selected = st.radio("Navigation", labels, horizontal=True, key=key, label_visibility="collapsed")
+    tabs[selected]()
+    return selected
+
 def render_footer():
     """Render professional footer"""
     st.markdown("---")
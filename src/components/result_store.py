@@ -0,0 +1,203 @@
+"""
+Result Store
+Process-wide storage of analysis results shared by all sessions
+
+This module provides:
+- A least-recently-used store bounded by entry count and measured size
+- Content-hash handles, so identical analyses from different users share one copy
+- Separate stores for analysis bundles and for output derived from them
+  (sensitivity grids), so derived results never evict a user's analysis
+
+Session state keeps only the short handle returned by put(); the results
+themselves live here once per process. Stored values are shared between
+sessions and must be treated as read-only. Figures are cached separately
+by the chart functions' figure cache.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.helpers import compute_analysis_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+# Derived results are larger and cheaper to lose than analysis bundles
+DERIVED_MAX_ENTRIES = 64
+DERIVED_MAX_BYTES = 32 * 1024 * 1024
+
+
+def measure_size(value: Any) -> int:
+    """Approximate memory footprint of a result in bytes, following containers"""
+    seen = set()
+    pending = [value]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+        elif hasattr(item, 'nbytes'):
+            total += int(item.nbytes)  # numpy arrays
+    return total
+
+
+class ResultStore:
+    """
+    LRU store of analysis results keyed by content hash
+
+    Bounded by entry count and by the measured size of the stored results.
+    When either bound is exceeded the least recently used entries are
+    evicted; a session whose handle was evicted sees no results and
+    re-runs its analysis.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _insert(self, key: str, value: Any) -> Any:
+        """Store value under key unless already present; returns the stored value"""
+        size = measure_size(value)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing[0]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+            # The newest entry always stays, even if it alone exceeds max_bytes
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+            return value
+
+    def put(self, value: Any, key: Optional[str] = None) -> str:
+        """
+        Store a result and return its handle
+
+        Args:
+            value: Result to store (e.g. an analysis bundle)
+            key: Handle to store it under (defaults to the content hash)
+
+        Returns:
+            Handle for get(); equal results get the same handle and share one copy
+        """
+        if key is None:
+            key = compute_analysis_hash(value)
+        self._insert(key, value)
+        return key
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """Stored result for a handle, or None if unknown or evicted"""
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Stored result for key, building and storing it on a miss
+
+        Args:
+            key: Handle of the derived result
+            build: Callable creating the result
+
+        Returns:
+            Stored result
+        """
+        value = self.get(key)
+        if value is None:
+            # Build outside the lock; a concurrent miss keeps the first stored copy
+            value = self._insert(key, build())
+        return value
+
+    def discard(self, key: str) -> None:
+        """Remove a stored result"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all stored results"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+# Global instances
+_result_store = None
+_derived_result_store = None
+_result_store_lock = threading.Lock()
+
+
+def create_result_store(max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> ResultStore:
+    """Factory function to create ResultStore instance"""
+    return ResultStore(max_entries, max_bytes)
+
+
+def get_result_store() -> ResultStore:
+    """Get the process-wide store of analysis bundles"""
+    global _result_store
+    with _result_store_lock:
+        if _result_store is None:
+            _result_store = create_result_store()
+        return _result_store
+
+
+def get_derived_result_store() -> ResultStore:
+    """Get the process-wide store of results derived from analyses"""
+    global _derived_result_store
+    with _result_store_lock:
+        if _derived_result_store is None:
+            _derived_result_store = create_result_store(DERIVED_MAX_ENTRIES, DERIVED_MAX_BYTES)
+        return _derived_result_store
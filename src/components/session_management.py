@@ -7,19 +7,30 @@ Provides:
 - Input state persistence
 - Section completion tracking
 - State reset and export functionality
+- Analysis result handles into the shared result store
 """
 
 import streamlit as st
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, date
 import json
 import hashlib
+import logging
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.defaults import DEFAULT_VALUES, get_default_value
 from utils.formatting import format_currency
+from .result_store import get_result_store
+
+logger = logging.getLogger(__name__)
+
+# Session state key holding the memoized analysis parameters
+ANALYSIS_PARAMS_CACHE_KEY = "_analysis_params_cache"
+
+# Session state key holding the result store handle of the current analysis
+ANALYSIS_HANDLE_KEY = "analysis_handle"
 
 class SessionManager:
     """Manages session state for the Real Estate Decision Tool"""
@@ -313,6 +324,50 @@ class SessionManager:
         input_string = json.dumps(input_values, sort_keys=True)
         return hashlib.md5(input_string.encode()).hexdigest()
     
+    def get_session_input_hash(self) -> str:
+        """Generate hash of every input field (the analysis hash covers a subset)"""
+        input_values = {}
+        for field_name in DEFAULT_VALUES:
+            value = st.session_state.get(field_name)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            input_values[field_name] = str(value)
+        
+        input_string = json.dumps(input_values, sort_keys=True)
+        return hashlib.md5(input_string.encode()).hexdigest()
+    
+    def get_analysis_parameters(self) -> Dict[str, Any]:
+        """
+        Get calculation parameters for the current inputs
+        
+        Parameters are assembled once per change: the result is memoized in the
+        session keyed on the input hash and the data priority manager version,
+        so reruns with unchanged inputs skip the session export, the priority
+        manager update and the parameter mapping entirely.
+        
+        Returns:
+            Copy of the keyword arguments for calculate_analysis_bundle()
+        """
+        from data.data_priority_manager import get_data_priority_manager
+        priority_manager = get_data_priority_manager()
+        
+        inputs_hash = self.get_session_input_hash()
+        cached = st.session_state.get(ANALYSIS_PARAMS_CACHE_KEY)
+        if (cached and cached['inputs_hash'] == inputs_hash
+                and cached['priority_version'] == priority_manager.version):
+            return dict(cached['params'])
+        
+        session_data = self.export_session_data()
+        priority_manager.bulk_update_from_session(session_data)
+        params = build_analysis_parameters(session_data['inputs'], priority_manager)
+        
+        st.session_state[ANALYSIS_PARAMS_CACHE_KEY] = {
+            'inputs_hash': inputs_hash,
+            'priority_version': priority_manager.version,
+            'params': params
+        }
+        return dict(params)
+    
     def check_for_input_changes(self) -> bool:
         """Check if analysis-relevant inputs have changed since last check"""
         current_hash = self.get_analysis_input_hash()
@@ -331,9 +386,50 @@ class SessionManager:
         st.session_state["analysis_input_hash"] = current_hash
         st.session_state["inputs_changed"] = False
     
+    def store_analysis_bundle(self, analysis_bundle: Dict[str, Any]) -> str:
+        """
+        Keep an analysis in the shared result store and remember its handle
+        
+        Args:
+            analysis_bundle: Bundle with 'npv_analysis', 'ownership_flows' and
+                'rental_flows' (as returned by calculate_analysis_bundle)
+        
+        Returns:
+            Result store handle now held in session state
+        """
+        handle = get_result_store().put(analysis_bundle)
+        st.session_state[ANALYSIS_HANDLE_KEY] = handle
+        return handle
+    
+    def get_analysis_bundle(self) -> Optional[Dict[str, Any]]:
+        """Current analysis bundle from the shared result store (read-only), if any"""
+        handle = st.session_state.get(ANALYSIS_HANDLE_KEY)
+        if handle is None:
+            return None
+        
+        bundle = get_result_store().get(handle)
+        if bundle is None:
+            # Evicted from the bounded store; the analysis has to be re-run
+            logger.info("Analysis %s no longer in result store", handle)
+            del st.session_state[ANALYSIS_HANDLE_KEY]
+        return bundle
+    
+    def get_analysis_data(self) -> Optional[Tuple[Dict[str, Any], List[Dict[str, float]], List[Dict[str, float]]]]:
+        """Current (analysis_results, ownership_flows, rental_flows), or None"""
+        bundle = self.get_analysis_bundle()
+        if bundle is None:
+            return None
+        return bundle['npv_analysis'], bundle['ownership_flows'], bundle['rental_flows']
+    
+    def clear_analysis_results(self):
+        """Drop this session's handle to its analysis results"""
+        for key in [ANALYSIS_HANDLE_KEY, 'using_demo_data']:
+            if key in st.session_state:
+                del st.session_state[key]
+    
     def has_analysis_results(self) -> bool:
-        """Check if analysis results exist in session state"""
-        return 'analysis_results' in st.session_state
+        """Check if analysis results are available for this session"""
+        return self.get_analysis_bundle() is not None
     
     def analysis_is_stale(self) -> bool:
         """Check if current analysis results are stale (inputs changed)"""
@@ -349,9 +445,7 @@ class SessionManager:
         """Clear analysis results if inputs have changed"""
         if self.analysis_is_stale():
             # Clear analysis results
-            for key in ['analysis_results', 'ownership_flows', 'rental_flows', 'using_demo_data']:
-                if key in st.session_state:
-                    del st.session_state[key]
+            self.clear_analysis_results()
             
             # Reset analysis hash
             st.session_state["analysis_input_hash"] = ""
@@ -392,6 +486,122 @@ class SessionManager:
         
         return summary
 
+def _resolve_rent_increase_rate(priority_manager, inputs: Dict[str, Any]) -> float:
+    """
+    Safely extract rent_increase_rate with extensive error handling
+    """
+    try:
+        # Method 1: Try priority manager first
+        if priority_manager:
+            try:
+                rent_rate = priority_manager.get_value_only('rent_increase_rate', None)
+                if rent_rate is not None and isinstance(rent_rate, (int, float)) and rent_rate >= 0:
+                    return rent_rate
+            except Exception as e:
+                logger.warning(f"Priority manager failed for rent_increase_rate: {e}")
+        
+        # Method 2: Try direct session input
+        rent_rate = inputs.get('rent_increase_rate', None)
+        if rent_rate is not None and isinstance(rent_rate, (int, float)) and rent_rate >= 0:
+            return rent_rate
+        
+        # Method 3: Try string conversion (in case it's stored as string)
+        rent_rate_str = inputs.get('rent_increase_rate', '3.0')
+        if isinstance(rent_rate_str, str) and rent_rate_str.strip():
+            try:
+                rent_rate = float(rent_rate_str.strip())
+                if rent_rate >= 0:
+                    return rent_rate
+            except (ValueError, TypeError):
+                pass
+        
+        # Method 4: Final fallback
+        logger.warning("All rent_increase_rate extraction methods failed, using default: 3.0")
+        return 3.0
+        
+    except Exception as e:
+        logger.error(f"Critical error in _resolve_rent_increase_rate: {e}")
+        return 3.0
+
+
+def build_analysis_parameters(inputs: Dict[str, Any], priority_manager=None) -> Dict[str, Any]:
+    """
+    Map session inputs to calculate_analysis_bundle() parameters
+    
+    Market-driven rates are resolved through the data priority manager
+    (User > API > Default) when one is given.
+    
+    Args:
+        inputs: The 'inputs' section of SessionManager.export_session_data()
+        priority_manager: Optional DataPriorityManager
+    
+    Returns:
+        Calculation parameters
+    """
+    def priority_value(key, default):
+        fallback = inputs.get(key, default)
+        if priority_manager is None:
+            return fallback
+        return priority_manager.get_value_only(key, fallback)
+    
+    return {
+        # Purchase scenario parameters - use user inputs directly for main parameters
+        'purchase_price': inputs.get('purchase_price'),
+        'down_payment_pct': inputs.get('down_payment_percent', 30.0),
+        'interest_rate': priority_value('interest_rate', 7.0),
+        'loan_term': inputs.get('loan_term', 20),
+        'transaction_costs': inputs.get('transaction_costs_percent', 5.0) * inputs.get('purchase_price', 0) / 100,
+        
+        # Rental scenario parameters
+        'current_annual_rent': inputs.get('current_annual_rent'),
+        'rent_increase_rate': _resolve_rent_increase_rate(priority_manager, inputs),
+        'moving_costs': inputs.get('moving_costs', 0.0),
+        
+        # Common parameters
+        'analysis_period': inputs.get('analysis_period', 25),
+        'cost_of_capital': priority_value('cost_of_capital', 8.0),
+        
+        # Property parameters
+        'property_tax_rate': priority_value('property_tax_rate', 1.2),
+        'property_tax_escalation': inputs.get('property_tax_escalation_rate', 2.0),
+        'insurance_cost': inputs.get('insurance_cost', 5000),
+        'annual_maintenance': inputs.get('annual_maintenance_percent', 2.0) * inputs.get('purchase_price', 0) / 100,
+        'property_management': inputs.get('property_management', 0),
+        
+        # Advanced parameters
+        'capex_reserve_rate': inputs.get('longterm_capex_reserve', 1.5),
+        'obsolescence_risk_rate': inputs.get('obsolescence_risk_factor', 0.5),
+        'inflation_rate': priority_value('inflation_rate', 3.0),
+        'land_value_pct': inputs.get('land_value_percent', 25.0),
+        'market_appreciation_rate': priority_value('market_appreciation_rate', 3.0),
+        'depreciation_period': inputs.get('depreciation_period', 39),
+        
+        # Tax parameters
+        'corporate_tax_rate': inputs.get('corporate_tax_rate', 25.0),
+        'interest_deductible': inputs.get('interest_deductible', True),
+        'property_tax_deductible': inputs.get('property_tax_deductible', True),
+        'rent_deductible': inputs.get('rent_deductible', True),
+        
+        # Space improvement costs
+        'space_improvement_cost': inputs.get('space_improvement_cost', 0.0),
+        
+        # Expansion parameters
+        'future_expansion_year': inputs.get('future_expansion_year', 'Never'),
+        'additional_space_needed': inputs.get('additional_space_needed', 0),
+        'current_space_needed': inputs.get('current_space_needed', 0),
+        'ownership_property_size': inputs.get('ownership_property_size', 0),
+        'rental_property_size': inputs.get('rental_property_size', 0),
+        
+        # Subletting parameters
+        'subletting_potential': inputs.get('subletting_potential', False),
+        'subletting_rate': inputs.get('subletting_rate', 0),
+        'subletting_space_sqm': inputs.get('subletting_space_sqm', 0),
+        
+        # Property upgrade parameters
+        'property_upgrade_cycle': inputs.get('property_upgrade_cycle', 30)
+    }
+
+
 # Global session manager instance
 @st.cache_resource
 def get_session_manager():
@@ -54,6 +54,7 @@ def get_interest_rate_config() -> Dict[str, Any]:
     
     return {
         'fred_api_key': base_config['fred_api_key'],
+        'fred_base_url': base_config['fred_base_url'],
         'timeout': base_config['timeout'],
         'max_retries': base_config['max_retries'],
         
@@ -84,6 +85,36 @@ def get_interest_rate_config() -> Dict[str, Any]:
     }
 
 
+def get_http_pool_config() -> Dict[str, Any]:
+    """Get configuration for the shared HTTP client pool"""
+    base_config = get_api_config()
+    
+    return {
+        'timeout': base_config['timeout'],
+        
+        # Connector limits
+        'connection_limit': int(os.getenv('HTTP_POOL_CONNECTION_LIMIT', '100')),
+        'connection_limit_per_host': int(os.getenv('HTTP_POOL_CONNECTION_LIMIT_PER_HOST', '10')),
+        
+        # Keep-alive and DNS caching
+        'keepalive_timeout': 30,   # Seconds an idle connection stays open
+        'dns_cache_ttl': 300,      # Seconds resolved hosts are cached
+        
+        # Per-host concurrency caps (hosts not listed use connection_limit_per_host)
+        'host_concurrency': {
+            'api.stlouisfed.org': 8,
+            'api.bcb.gov.br': 4,
+            'edge.boi.gov.il': 2,
+            'maps.googleapis.com': 10,
+            'api.mapbox.com': 10
+        },
+        
+        'headers': {
+            'User-Agent': 'RentVsBuyTool/1.0'
+        }
+    }
+
+
 def get_market_data_config() -> Dict[str, Any]:
     """Get configuration for market data APIs"""
     base_config = get_api_config()
@@ -11,6 +11,7 @@ def get_optimized_cache_config() -> Dict[str, Any]:
         'cache': {
             # Increased cache sizes for better hit rates
             'memory_cache_size_mb': 100.0,  # Increased from 50MB
+            'memory_eviction_policy': 'lru',  # 'lru' or 'lfu'
             'persistent_cache_path': 'optimized_cache.db',
             
             # Optimized TTL settings
@@ -41,9 +42,14 @@ def get_optimized_cache_config() -> Dict[str, Any]:
         'target_freshness_hours': 48,  # More lenient for better hit rates
         'target_response_time_ms': 100.0,
         
+        # Concurrent fresh fetches per get_market_data_batch call
+        'batch_concurrency': 5,
+        
         # Cache optimization strategies
         'warmup': {
             'enabled': True,
+            'max_locations': 20,              # Most popular cached locations to warm
+            # Cold-start fallback when no access statistics have been recorded yet
             'priority_locations': [
                 'New York, NY', 'Los Angeles, CA', 'Chicago, IL', 'Houston, TX',
                 'Phoenix, AZ', 'Philadelphia, PA', 'San Antonio, TX', 'San Diego, CA',
@@ -64,9 +70,10 @@ def get_optimized_cache_config() -> Dict[str, Any]:
         # Proactive refresh settings
         'proactive_refresh': {
             'enabled': True,
-            'refresh_threshold_hours': 24.0,  # Refresh when data is 24h old
-            'refresh_interval_hours': 6.0,    # Check every 6 hours
-            'batch_size': 5,                  # Refresh 5 locations at a time
+            'max_locations': 50,              # Refresh the 50 most popular locations
+            'refresh_lead_hours': 2.0,        # Refresh 2h before predicted expiry
+            'jitter_minutes': 15.0,           # Spread refreshes to avoid thundering herds
+            'refresh_interval_hours': 6.0,    # Re-plan from access statistics every 6 hours
             'max_concurrent_refreshes': 3    # Limit concurrent refreshes
         }
     }
@@ -83,7 +90,7 @@ def get_high_performance_cache_config() -> Dict[str, Any]:
     
     # More extensive warmup
     config['warmup']['enabled'] = True
-    config['proactive_refresh']['refresh_threshold_hours'] = 48.0
+    config['proactive_refresh']['max_locations'] = 100
     
     return config
 
@@ -124,9 +131,10 @@ def get_production_cache_config() -> Dict[str, Any]:
         
         'proactive_refresh': {
             'enabled': True,
-            'refresh_threshold_hours': 18.0,
+            'max_locations': 50,
+            'refresh_lead_hours': 3.0,
+            'jitter_minutes': 20.0,
             'refresh_interval_hours': 4.0,
-            'batch_size': 3,
             'max_concurrent_refreshes': 2
         },
         
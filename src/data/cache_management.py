@@ -4,8 +4,11 @@ Handles data caching with fallback mechanisms, performance monitoring, and cache
 """
 
 import asyncio
+import heapq
 import json
+import math
 import pickle
+import random
 import sqlite3
 import threading
 import time
@@ -16,9 +19,11 @@ import logging
 import hashlib
 import gzip
 from dataclasses import dataclass, asdict
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from ..shared.interfaces import MarketData
+from .location_index import LocationIndex, normalize_location
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,7 @@ class CacheEntry:
     size_bytes: int
     source: str
     quality_score: float
+    location: Optional[str] = None
 
 
 @dataclass
@@ -51,6 +57,17 @@ class CacheStats:
     newest_entry: Optional[datetime]
 
 
+@dataclass
+class PopularLocation:
+    """Access statistics for a cached location"""
+    location: str
+    access_count: int
+    popularity: float
+    last_accessed: datetime
+    created_at: datetime
+    expiry_time: Optional[datetime]
+
+
 class CacheBackend:
     """Abstract base for cache backends"""
     
@@ -70,65 +87,204 @@ class CacheBackend:
         raise NotImplementedError
 
 
+class LatencyReservoir:
+    """
+    Bounded sample of response times (reservoir sampling)
+    Keeps an exact running mean and approximate percentiles in fixed memory
+    """
+    
+    def __init__(self, capacity: int = 1024, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.samples: List[float] = []
+        self.count = 0
+        self.total = 0.0
+        self._random = random.Random(seed)
+    
+    def add(self, value_ms: float) -> None:
+        self.count += 1
+        self.total += value_ms
+        
+        if len(self.samples) < self.capacity:
+            self.samples.append(value_ms)
+        else:
+            # Algorithm R: each observation survives with probability capacity / count
+            slot = self._random.randrange(self.count)
+            if slot < self.capacity:
+                self.samples[slot] = value_ms
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def percentiles(self, points: Tuple[float, ...] = (50.0, 95.0, 99.0)) -> Dict[str, float]:
+        """Nearest-rank percentiles over the current sample"""
+        if not self.samples:
+            return {f'p{point:g}': 0.0 for point in points}
+        
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {
+            f'p{point:g}': ordered[min(last, max(0, math.ceil(point / 100 * len(ordered)) - 1))]
+            for point in points
+        }
+    
+    def clear(self) -> None:
+        self.samples.clear()
+        self.count = 0
+        self.total = 0.0
+
+
+class _LRUOrder:
+    """O(1) least-recently-used eviction order"""
+    
+    def __init__(self):
+        self._order: 'OrderedDict[str, None]' = OrderedDict()
+    
+    def add(self, key: str) -> None:
+        self._order[key] = None
+    
+    def touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+    
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+    
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+    
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _LFUOrder:
+    """O(1) least-frequently-used eviction order, LRU among equal frequencies"""
+    
+    def __init__(self):
+        self._frequency: Dict[str, int] = {}
+        self._buckets: Dict[int, 'OrderedDict[str, None]'] = {}
+        self._min_frequency = 0
+    
+    def add(self, key: str) -> None:
+        self._frequency[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+    
+    def touch(self, key: str) -> None:
+        frequency = self._frequency[key]
+        self._unlink(key, frequency)
+        if self._min_frequency == frequency and frequency not in self._buckets:
+            self._min_frequency = frequency + 1
+        
+        self._frequency[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+    
+    def remove(self, key: str) -> None:
+        frequency = self._frequency.pop(key, None)
+        if frequency is not None:
+            self._unlink(key, frequency)
+    
+    def victim(self) -> Optional[str]:
+        if not self._buckets:
+            return None
+        if self._min_frequency not in self._buckets:
+            # Only after removing the last key at min frequency; bounded by distinct frequencies
+            self._min_frequency = min(self._buckets)
+        return next(iter(self._buckets[self._min_frequency]))
+    
+    def clear(self) -> None:
+        self._frequency.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+    
+    def _unlink(self, key: str, frequency: int) -> None:
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+
+
 class MemoryCache(CacheBackend):
-    """In-memory cache with LRU eviction"""
+    """
+    In-memory cache with O(1) LRU or LFU eviction
+    
+    Entry sizes are measured from the pickled payload rather than trusted
+    from callers, so max_size_mb bounds real memory use.
+    """
     
-    def __init__(self, max_size_mb: float = 100.0):
+    EVICTION_POLICIES = {'lru': _LRUOrder, 'lfu': _LFUOrder}
+    
+    def __init__(self, max_size_mb: float = 100.0, eviction_policy: str = 'lru',
+                 latency_sample_size: int = 1024):
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        
         self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.eviction_policy = eviction_policy
         self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []
+        self.eviction_order = self.EVICTION_POLICIES[eviction_policy]()
         self.current_size = 0
         self.lock = threading.RLock()
         
+        # Creation-time heaps with lazy deletion for O(1) amortized oldest/newest
+        self._oldest_heap: List[Tuple[float, int, str]] = []
+        self._newest_heap: List[Tuple[float, int, str]] = []
+        self._entry_versions: Dict[str, int] = {}
+        self._version_counter = 0
+        
         # Statistics
         self.hit_count = 0
         self.miss_count = 0
-        self.response_times = []
+        self.eviction_count = 0
+        self.response_times = LatencyReservoir(latency_sample_size)
     
     async def get(self, key: str) -> Optional[CacheEntry]:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         with self.lock:
             entry = self.cache.get(key)
             
             if entry is None:
                 self.miss_count += 1
-                self.response_times.append((time.time() - start_time) * 1000)
+                self.response_times.add((time.perf_counter() - start_time) * 1000)
                 return None
             
             # Check expiry
             if entry.expiry_time and datetime.now() > entry.expiry_time:
                 self._remove_entry(key)
                 self.miss_count += 1
-                self.response_times.append((time.time() - start_time) * 1000)
+                self.response_times.add((time.perf_counter() - start_time) * 1000)
                 return None
             
             # Update access information
             entry.last_accessed = datetime.now()
             entry.access_count += 1
-            
-            # Move to end of access order (most recently used)
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.access_order.append(key)
+            self.eviction_order.touch(key)
             
             self.hit_count += 1
-            self.response_times.append((time.time() - start_time) * 1000)
+            self.response_times.add((time.perf_counter() - start_time) * 1000)
             return entry
     
     async def set(self, key: str, entry: CacheEntry) -> None:
+        # Measure outside the lock; pickling is the expensive part
+        entry.size_bytes = self._measure_size(entry.data)
+        
         with self.lock:
             # Remove existing entry if present
             if key in self.cache:
                 self._remove_entry(key)
             
+            if entry.size_bytes > self.max_size_bytes:
+                logger.debug(f"Cache entry {key} ({entry.size_bytes} bytes) exceeds memory cache size")
+                return
+            
             # Ensure we have space
-            await self._ensure_space(entry.size_bytes)
+            self._ensure_space(entry.size_bytes)
             
             # Add new entry
             self.cache[key] = entry
-            self.access_order.append(key)
+            self.eviction_order.add(key)
             self.current_size += entry.size_bytes
+            self._track_created_at(key, entry.created_at)
     
     async def delete(self, key: str) -> None:
         with self.lock:
@@ -137,53 +293,88 @@ class MemoryCache(CacheBackend):
     async def clear(self) -> None:
         with self.lock:
             self.cache.clear()
-            self.access_order.clear()
+            self.eviction_order.clear()
             self.current_size = 0
+            self._oldest_heap.clear()
+            self._newest_heap.clear()
+            self._entry_versions.clear()
     
     async def get_stats(self) -> Dict[str, Any]:
         with self.lock:
             total_requests = self.hit_count + self.miss_count
             hit_rate = self.hit_count / total_requests if total_requests > 0 else 0.0
-            avg_response_time = sum(self.response_times) / len(self.response_times) if self.response_times else 0.0
-            
-            oldest_entry = min((e.created_at for e in self.cache.values()), default=None)
-            newest_entry = max((e.created_at for e in self.cache.values()), default=None)
+            percentiles = self.response_times.percentiles()
             
             return {
                 'hit_count': self.hit_count,
                 'miss_count': self.miss_count,
+                'eviction_count': self.eviction_count,
                 'total_requests': total_requests,
                 'hit_rate': hit_rate,
-                'avg_response_time_ms': avg_response_time,
+                'avg_response_time_ms': self.response_times.mean,
+                'p50_response_time_ms': percentiles['p50'],
+                'p95_response_time_ms': percentiles['p95'],
+                'p99_response_time_ms': percentiles['p99'],
                 'cache_size_mb': self.current_size / (1024 * 1024),
                 'entry_count': len(self.cache),
-                'oldest_entry': oldest_entry,
-                'newest_entry': newest_entry
+                'oldest_entry': self._heap_peek(self._oldest_heap, newest=False),
+                'newest_entry': self._heap_peek(self._newest_heap, newest=True)
             }
     
+    @staticmethod
+    def _measure_size(data: Any) -> int:
+        """Serialized size of the cached payload"""
+        try:
+            return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return len(json.dumps(data, default=str))
+    
     def _remove_entry(self, key: str) -> None:
         """Remove entry and update size tracking"""
-        if key in self.cache:
-            entry = self.cache[key]
+        entry = self.cache.pop(key, None)
+        if entry is not None:
             self.current_size -= entry.size_bytes
-            del self.cache[key]
-            
-        if key in self.access_order:
-            self.access_order.remove(key)
-    
-    async def _ensure_space(self, needed_bytes: int) -> None:
-        """Ensure sufficient space by evicting LRU entries"""
-        while (self.current_size + needed_bytes > self.max_size_bytes and 
-               self.access_order):
-            # Evict least recently used
-            lru_key = self.access_order[0]
-            self._remove_entry(lru_key)
-            logger.debug(f"Evicted LRU cache entry: {lru_key}")
+            self.eviction_order.remove(key)
+            self._entry_versions.pop(key, None)
+    
+    def _ensure_space(self, needed_bytes: int) -> None:
+        """Ensure sufficient space by evicting entries in policy order"""
+        while self.current_size + needed_bytes > self.max_size_bytes and self.cache:
+            victim = self.eviction_order.victim()
+            self._remove_entry(victim)
+            self.eviction_count += 1
+            logger.debug(f"Evicted {self.eviction_policy.upper()} cache entry: {victim}")
+    
+    def _track_created_at(self, key: str, created_at: datetime) -> None:
+        self._version_counter += 1
+        self._entry_versions[key] = self._version_counter
+        timestamp = created_at.timestamp()
+        heapq.heappush(self._oldest_heap, (timestamp, self._version_counter, key))
+        heapq.heappush(self._newest_heap, (-timestamp, self._version_counter, key))
+        
+        # Compact once stale heap records outnumber live entries
+        if len(self._oldest_heap) > 2 * len(self.cache) + 64:
+            live = [item for item in self._oldest_heap if self._entry_versions.get(item[2]) == item[1]]
+            self._oldest_heap = live
+            self._newest_heap = [(-timestamp, version, key) for timestamp, version, key in live]
+            heapq.heapify(self._oldest_heap)
+            heapq.heapify(self._newest_heap)
+    
+    def _heap_peek(self, heap: List[Tuple[float, int, str]], newest: bool) -> Optional[datetime]:
+        while heap and self._entry_versions.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        timestamp = -heap[0][0] if newest else heap[0][0]
+        return datetime.fromtimestamp(timestamp)
 
 
 class SQLiteCache(CacheBackend):
     """SQLite-based persistent cache"""
     
+    # Stay below SQLite's default bound-parameter limit (999)
+    MAX_QUERY_PARAMETERS = 500
+    
     def __init__(self, db_path: Union[str, Path] = "cache.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -193,7 +384,7 @@ class SQLiteCache(CacheBackend):
         # Statistics
         self.hit_count = 0
         self.miss_count = 0
-        self.response_times = []
+        self.response_times = LatencyReservoir()
     
     def _init_db(self) -> None:
         """Initialize database schema"""
@@ -208,10 +399,16 @@ class SQLiteCache(CacheBackend):
                     expiry_time REAL,
                     size_bytes INTEGER NOT NULL,
                     source TEXT NOT NULL,
-                    quality_score REAL NOT NULL
+                    quality_score REAL NOT NULL,
+                    location TEXT
                 )
             """)
             
+            # Migrate caches created before locations were recorded
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(cache_entries)")}
+            if 'location' not in columns:
+                conn.execute("ALTER TABLE cache_entries ADD COLUMN location TEXT")
+            
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_expiry_time ON cache_entries(expiry_time)
             """)
@@ -237,8 +434,11 @@ class SQLiteCache(CacheBackend):
             if conn:
                 conn.close()
     
-    async def get(self, key: str) -> Optional[CacheEntry]:
-        start_time = time.time()
+    async def get(self, key: str, touch: bool = True) -> Optional[CacheEntry]:
+        """
+        Get an entry; touch=False reads without counting towards access statistics
+        """
+        start_time = time.perf_counter()
         
         with self.lock:
             try:
@@ -248,58 +448,107 @@ class SQLiteCache(CacheBackend):
                     """, (key,))
                     
                     row = cursor.fetchone()
-                    if row is None:
-                        self.miss_count += 1
-                        self.response_times.append((time.time() - start_time) * 1000)
-                        return None
-                    
-                    # Check expiry
-                    expiry_time = datetime.fromtimestamp(row['expiry_time']) if row['expiry_time'] else None
-                    if expiry_time and datetime.now() > expiry_time:
-                        conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
-                        self.miss_count += 1
-                        self.response_times.append((time.time() - start_time) * 1000)
-                        return None
-                    
-                    # Deserialize data
-                    try:
-                        data = pickle.loads(gzip.decompress(row['data']))
-                    except Exception as e:
-                        logger.error(f"Failed to deserialize cache entry {key}: {e}")
-                        conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
-                        self.miss_count += 1
-                        self.response_times.append((time.time() - start_time) * 1000)
-                        return None
-                    
-                    # Update access information
-                    now_timestamp = datetime.now().timestamp()
-                    conn.execute("""
-                        UPDATE cache_entries 
-                        SET last_accessed = ?, access_count = access_count + 1
-                        WHERE key = ?
-                    """, (now_timestamp, key))
-                    
-                    entry = CacheEntry(
-                        key=row['key'],
-                        data=data,
-                        created_at=datetime.fromtimestamp(row['created_at']),
-                        last_accessed=datetime.now(),
-                        access_count=row['access_count'] + 1,
-                        expiry_time=expiry_time,
-                        size_bytes=row['size_bytes'],
-                        source=row['source'],
-                        quality_score=row['quality_score']
-                    )
-                    
-                    self.hit_count += 1
-                    self.response_times.append((time.time() - start_time) * 1000)
-                    return entry
+                    entry = self._load_entry(conn, row, touch) if row is not None else None
                     
             except Exception as e:
                 logger.error(f"Cache get error: {e}")
-                self.miss_count += 1
-                self.response_times.append((time.time() - start_time) * 1000)
-                return None
+                entry = None
+            
+            self._record_lookup(entry is not None, start_time)
+            return entry
+    
+    async def get_many(self, keys: List[str], touch: bool = True) -> Dict[str, CacheEntry]:
+        """
+        Look up several keys with one query per chunk of keys
+        
+        Args:
+            keys: Cache keys
+            touch: Whether the lookups count towards access statistics
+        
+        Returns:
+            Dict of key -> entry for the keys that were found and not expired
+        """
+        entries: Dict[str, CacheEntry] = {}
+        keys = list(dict.fromkeys(keys))
+        
+        with self.lock:
+            for start in range(0, len(keys), self.MAX_QUERY_PARAMETERS):
+                chunk = keys[start:start + self.MAX_QUERY_PARAMETERS]
+                start_time = time.perf_counter()
+                try:
+                    with self._get_connection() as conn:
+                        placeholders = ', '.join('?' * len(chunk))
+                        cursor = conn.execute(
+                            f"SELECT * FROM cache_entries WHERE key IN ({placeholders})", chunk
+                        )
+                        for row in cursor.fetchall():
+                            entry = self._load_entry(conn, row, touch)
+                            if entry is not None:
+                                entries[entry.key] = entry
+                except Exception as e:
+                    logger.error(f"Cache get_many error: {e}")
+                
+                # Latency is amortized over the keys in the chunk
+                elapsed_ms = (time.perf_counter() - start_time) * 1000 / len(chunk)
+                for key in chunk:
+                    if key in entries:
+                        self.hit_count += 1
+                    else:
+                        self.miss_count += 1
+                    self.response_times.add(elapsed_ms)
+        
+        return entries
+    
+    def _load_entry(self, conn: sqlite3.Connection, row: sqlite3.Row,
+                    touch: bool = True) -> Optional[CacheEntry]:
+        """Deserialize a row and record the access; expired or corrupt rows are deleted"""
+        key = row['key']
+        
+        # Check expiry
+        expiry_time = datetime.fromtimestamp(row['expiry_time']) if row['expiry_time'] else None
+        if expiry_time and datetime.now() > expiry_time:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+        
+        # Deserialize data
+        try:
+            data = pickle.loads(gzip.decompress(row['data']))
+        except Exception as e:
+            logger.error(f"Failed to deserialize cache entry {key}: {e}")
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+        
+        # Update access information
+        access_count = row['access_count']
+        last_accessed = datetime.fromtimestamp(row['last_accessed'])
+        if touch:
+            last_accessed = datetime.now()
+            access_count += 1
+            conn.execute("""
+                UPDATE cache_entries 
+                SET last_accessed = ?, access_count = access_count + 1
+                WHERE key = ?
+            """, (last_accessed.timestamp(), key))
+        
+        return CacheEntry(
+            key=key,
+            data=data,
+            created_at=datetime.fromtimestamp(row['created_at']),
+            last_accessed=last_accessed,
+            access_count=access_count,
+            expiry_time=expiry_time,
+            size_bytes=row['size_bytes'],
+            source=row['source'],
+            quality_score=row['quality_score'],
+            location=row['location']
+        )
+    
+    def _record_lookup(self, hit: bool, start_time: float) -> None:
+        if hit:
+            self.hit_count += 1
+        else:
+            self.miss_count += 1
+        self.response_times.add((time.perf_counter() - start_time) * 1000)
     
     async def set(self, key: str, entry: CacheEntry) -> None:
         with self.lock:
@@ -308,11 +557,20 @@ class SQLiteCache(CacheBackend):
                 serialized_data = gzip.compress(pickle.dumps(entry.data))
                 
                 with self._get_connection() as conn:
+                    # Replacing data keeps the key's access statistics, which drive warmup
                     conn.execute("""
-                        INSERT OR REPLACE INTO cache_entries 
+                        INSERT INTO cache_entries 
                         (key, data, created_at, last_accessed, access_count, 
-                         expiry_time, size_bytes, source, quality_score)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                         expiry_time, size_bytes, source, quality_score, location)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(key) DO UPDATE SET
+                            data = excluded.data,
+                            created_at = excluded.created_at,
+                            expiry_time = excluded.expiry_time,
+                            size_bytes = excluded.size_bytes,
+                            source = excluded.source,
+                            quality_score = excluded.quality_score,
+                            location = excluded.location
                     """, (
                         entry.key,
                         serialized_data,
@@ -322,7 +580,8 @@ class SQLiteCache(CacheBackend):
                         entry.expiry_time.timestamp() if entry.expiry_time else None,
                         len(serialized_data),  # Use actual serialized size
                         entry.source,
-                        entry.quality_score
+                        entry.quality_score,
+                        entry.location
                     ))
                     
             except Exception as e:
@@ -361,14 +620,17 @@ class SQLiteCache(CacheBackend):
                     
                     total_requests = self.hit_count + self.miss_count
                     hit_rate = self.hit_count / total_requests if total_requests > 0 else 0.0
-                    avg_response_time = sum(self.response_times) / len(self.response_times) if self.response_times else 0.0
+                    percentiles = self.response_times.percentiles()
                     
                     return {
                         'hit_count': self.hit_count,
                         'miss_count': self.miss_count,
                         'total_requests': total_requests,
                         'hit_rate': hit_rate,
-                        'avg_response_time_ms': avg_response_time,
+                        'avg_response_time_ms': self.response_times.mean,
+                        'p50_response_time_ms': percentiles['p50'],
+                        'p95_response_time_ms': percentiles['p95'],
+                        'p99_response_time_ms': percentiles['p99'],
                         'cache_size_mb': (row['total_size'] or 0) / (1024 * 1024),
                         'entry_count': row['entry_count'],
                         'oldest_entry': datetime.fromtimestamp(row['oldest']) if row['oldest'] else None,
@@ -378,6 +640,80 @@ class SQLiteCache(CacheBackend):
                 logger.error(f"Error getting cache stats: {e}")
                 return {}
     
+    def get_cached_locations(self) -> List[str]:
+        """Return location names of all unexpired entries"""
+        with self.lock:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.execute("""
+                        SELECT location FROM cache_entries 
+                        WHERE location IS NOT NULL 
+                          AND (expiry_time IS NULL OR expiry_time > ?)
+                    """, (datetime.now().timestamp(),))
+                    return [row['location'] for row in cursor.fetchall()]
+            except Exception as e:
+                logger.error(f"Error listing cached locations: {e}")
+                return []
+    
+    def get_popular_locations(self, limit: int = 50,
+                              half_life_days: float = 7.0) -> List['PopularLocation']:
+        """
+        Return the most popular unexpired locations by recency-weighted access count
+        
+        Args:
+            limit: Maximum number of locations
+            half_life_days: Age of last access at which an entry's count is halved
+        """
+        now = datetime.now().timestamp()
+        with self.lock:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.execute("""
+                        SELECT location, access_count, last_accessed, created_at, expiry_time,
+                               access_count / (1.0 + (? - last_accessed) / ?) AS popularity
+                        FROM cache_entries 
+                        WHERE location IS NOT NULL 
+                          AND access_count > 0
+                          AND (expiry_time IS NULL OR expiry_time > ?)
+                        ORDER BY popularity DESC, last_accessed DESC
+                        LIMIT ?
+                    """, (now, half_life_days * 86400.0, now, limit))
+                    return [
+                        PopularLocation(
+                            location=row['location'],
+                            access_count=row['access_count'],
+                            popularity=row['popularity'],
+                            last_accessed=datetime.fromtimestamp(row['last_accessed']),
+                            created_at=datetime.fromtimestamp(row['created_at']),
+                            expiry_time=datetime.fromtimestamp(row['expiry_time']) if row['expiry_time'] else None
+                        )
+                        for row in cursor.fetchall()
+                    ]
+            except Exception as e:
+                logger.error(f"Error listing popular locations: {e}")
+                return []
+    
+    def record_accesses(self, accesses: Dict[str, Tuple[int, float]]) -> None:
+        """
+        Apply access counts gathered elsewhere (e.g. memory cache hits)
+        
+        Args:
+            accesses: Dict of key -> (access count, last access timestamp)
+        """
+        if not accesses:
+            return
+        
+        with self.lock:
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany("""
+                        UPDATE cache_entries 
+                        SET access_count = access_count + ?, last_accessed = MAX(last_accessed, ?)
+                        WHERE key = ?
+                    """, [(count, last_accessed, key) for key, (count, last_accessed) in accesses.items()])
+            except Exception as e:
+                logger.error(f"Error recording cache accesses: {e}")
+    
     async def cleanup_expired(self) -> int:
         """Remove expired entries and return count of removed entries"""
         with self.lock:
@@ -405,6 +741,7 @@ class IntelligentCacheManager:
         
         # Cache configuration
         self.memory_cache_size_mb = self.config.get('memory_cache_size_mb', 50.0)
+        self.memory_eviction_policy = self.config.get('memory_eviction_policy', 'lru')
         self.persistent_cache_path = self.config.get('persistent_cache_path', 'data_cache.db')
         self.default_ttl_hours = self.config.get('default_ttl_hours', 24.0)
         self.max_cache_age_days = self.config.get('max_cache_age_days', 7.0)
@@ -414,9 +751,17 @@ class IntelligentCacheManager:
         self.target_response_time_ms = self.config.get('target_response_time_ms', 50.0)
         
         # Initialize backends
-        self.memory_cache = MemoryCache(self.memory_cache_size_mb)
+        self.memory_cache = MemoryCache(self.memory_cache_size_mb, self.memory_eviction_policy)
         self.persistent_cache = SQLiteCache(self.persistent_cache_path)
         
+        # Fuzzy lookup index over cached location names
+        self.location_index = LocationIndex()
+        self.location_index.update(self.persistent_cache.get_cached_locations())
+        
+        # Memory cache hits, batched into the persistent access statistics
+        self._pending_accesses: Dict[str, Tuple[int, float]] = {}
+        self._pending_accesses_lock = threading.Lock()
+        
         # Monitoring
         self.performance_history = []
         self.last_cleanup_time = datetime.now()
@@ -425,18 +770,26 @@ class IntelligentCacheManager:
         self._cleanup_task = None
         self._monitor_task = None
         
-    async def get_cached_data(self, location: str) -> Optional[MarketData]:
-        """Get cached market data for location"""
+    async def get_cached_data(self, location: str, record_access: bool = True) -> Optional[MarketData]:
+        """
+        Get cached market data for location
+        
+        Args:
+            location: Location name
+            record_access: Whether this lookup counts towards location popularity
+        """
         cache_key = self._generate_cache_key(location)
         
         # Try memory cache first
         entry = await self.memory_cache.get(cache_key)
         if entry and isinstance(entry.data, MarketData):
             logger.debug(f"Memory cache hit for {location}")
+            if record_access:
+                self._note_access(cache_key)
             return entry.data
         
         # Try persistent cache
-        entry = await self.persistent_cache.get(cache_key)
+        entry = await self.persistent_cache.get(cache_key, touch=record_access)
         if entry and isinstance(entry.data, MarketData):
             logger.debug(f"Persistent cache hit for {location}")
             
@@ -449,8 +802,65 @@ class IntelligentCacheManager:
         logger.debug(f"Cache miss for {location}")
         return None
     
-    async def update_cache(self, location: str, data: MarketData) -> None:
-        """Update cache with new market data"""
+    async def get_cached_data_many(self, locations: List[str],
+                                   record_access: bool = True) -> Dict[str, MarketData]:
+        """
+        Get cached market data for several locations in one pass
+        
+        Memory cache hits are served directly; the remaining keys are looked up
+        in the persistent cache together.
+        
+        Args:
+            locations: Location names
+            record_access: Whether these lookups count towards location popularity
+        
+        Returns:
+            Dict of location -> cached data for the locations that were found
+        """
+        keys = {location: self._generate_cache_key(location) for location in locations}
+        unique_keys = list(dict.fromkeys(keys.values()))
+        entries: Dict[str, CacheEntry] = {}
+        
+        for cache_key in unique_keys:
+            entry = await self.memory_cache.get(cache_key)
+            if entry and isinstance(entry.data, MarketData):
+                entries[cache_key] = entry
+                if record_access:
+                    self._note_access(cache_key)
+        
+        missing = [cache_key for cache_key in unique_keys if cache_key not in entries]
+        if missing:
+            persistent_entries = await self.persistent_cache.get_many(missing, touch=record_access)
+            for cache_key, entry in persistent_entries.items():
+                if not isinstance(entry.data, MarketData):
+                    continue
+                entries[cache_key] = entry
+        
+                # Promote to memory cache if high quality
+                if entry.quality_score > 0.7:
+                    await self.memory_cache.set(cache_key, entry)
+        
+        logger.debug(f"Bulk cache lookup: {len(entries)}/{len(unique_keys)} locations cached")
+        return {location: entries[cache_key].data for location, cache_key in keys.items() if cache_key in entries}
+        
+    async def find_similar_cached_data(self, location: str) -> Optional[MarketData]:
+        """Get cached market data for the closest indexed location name"""
+        match = self.location_index.best_match(location)
+        if match is None:
+            return None
+        
+        logger.debug(f"Fuzzy cache match for {location}: {match}")
+        return await self.get_cached_data(match)
+    
+    async def update_cache(self, location: str, data: MarketData, record_access: bool = True) -> None:
+        """
+        Update cache with new market data
+        
+        Args:
+            location: Location name
+            data: Market data to cache
+            record_access: Whether a new entry counts as one access (False for seeded data)
+        """
         cache_key = self._generate_cache_key(location)
         
         # Calculate data quality score
@@ -460,70 +870,45 @@ class IntelligentCacheManager:
         now = datetime.now()
         expiry_time = now + timedelta(hours=self.default_ttl_hours)
         
-        # Estimate size (rough approximation)
-        data_size = len(json.dumps(asdict(data), default=str))
-        
         entry = CacheEntry(
             key=cache_key,
             data=data,
             created_at=now,
             last_accessed=now,
-            access_count=1,
+            access_count=1 if record_access else 0,
             expiry_time=expiry_time,
-            size_bytes=data_size,
+            size_bytes=0,  # Measured from the serialized payload by each backend
             source=','.join(data.data_sources),
-            quality_score=quality_score
+            quality_score=quality_score,
+            location=location
         )
         
         # Store in both caches
         await self.memory_cache.set(cache_key, entry)
         await self.persistent_cache.set(cache_key, entry)
+        self.location_index.add(location)
         
         logger.debug(f"Updated cache for {location} with quality score {quality_score:.2f}")
     
+    async def get_popular_locations(self, limit: int = 50) -> List[PopularLocation]:
+        """Most frequently and recently accessed cached locations"""
+        self.flush_access_stats()
+        return self.persistent_cache.get_popular_locations(limit)
+    
+    def flush_access_stats(self) -> None:
+        """Write batched memory cache hits to the persistent access statistics"""
+        with self._pending_accesses_lock:
+            pending, self._pending_accesses = self._pending_accesses, {}
+        self.persistent_cache.record_accesses(pending)
+    
+    def _note_access(self, cache_key: str) -> None:
+        with self._pending_accesses_lock:
+            count, _ = self._pending_accesses.get(cache_key, (0, 0.0))
+            self._pending_accesses[cache_key] = (count + 1, datetime.now().timestamp())
+    
     def _generate_cache_key(self, location: str) -> str:
         """Generate normalized cache key for better hit rates"""
-        import re
-        
-        # Normalize location string for better cache matching
-        normalized = location.lower().strip()
-        
-        # Remove common punctuation and extra spaces
-        normalized = re.sub(r'[^\w\s,]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Standardize state representations
-        state_mappings = {
-            'new york': 'ny', 'california': 'ca', 'texas': 'tx', 'florida': 'fl',
-            'illinois': 'il', 'pennsylvania': 'pa', 'ohio': 'oh', 'georgia': 'ga',
-            'north carolina': 'nc', 'michigan': 'mi', 'new jersey': 'nj', 'virginia': 'va',
-            'washington': 'wa', 'arizona': 'az', 'massachusetts': 'ma', 'tennessee': 'tn',
-            'colorado': 'co', 'minnesota': 'mn', 'oregon': 'or'
-        }
-        
-        # Apply state mappings
-        for full_name, abbrev in state_mappings.items():
-            normalized = normalized.replace(full_name, abbrev)
-        
-        # Standardize city name variations
-        city_mappings = {
-            'new york city': 'new york', 'nyc': 'new york',
-            'la': 'los angeles', 'san fran': 'san francisco', 'sf': 'san francisco',
-            'vegas': 'las vegas', 'philly': 'philadelphia'
-        }
-        
-        for variation, standard in city_mappings.items():
-            if variation in normalized:
-                normalized = normalized.replace(variation, standard)
-        
-        # Ensure consistent format: "city, state"
-        parts = normalized.split(',')
-        if len(parts) >= 2:
-            city = parts[0].strip()
-            state = parts[1].strip()
-            normalized = f"{city}, {state}"
-        
-        return hashlib.md5(normalized.encode()).hexdigest()
+        return hashlib.md5(normalize_location(location).encode()).hexdigest()
     
     def _calculate_quality_score(self, data: MarketData) -> float:
         """Calculate data quality score based on freshness and confidence"""
@@ -593,6 +978,11 @@ class IntelligentCacheManager:
         # Persistent cache cleanup
         persistent_cleaned = await self.persistent_cache.cleanup_expired()
         
+        # Drop expired locations from the fuzzy lookup index
+        if persistent_cleaned:
+            self.location_index.clear()
+            self.location_index.update(self.persistent_cache.get_cached_locations())
+        
         # Remove very old entries
         cutoff_time = datetime.now() - timedelta(days=self.max_cache_age_days)
         
@@ -686,6 +1076,7 @@ class IntelligentCacheManager:
         while True:
             try:
                 await asyncio.sleep(1800)  # Run every 30 minutes
+                self.flush_access_stats()
                 await self.optimize_cache_performance()
             except asyncio.CancelledError:
                 break
@@ -695,6 +1086,7 @@ class IntelligentCacheManager:
     async def close(self):
         """Clean shutdown of cache manager"""
         await self.stop_background_tasks()
+        self.flush_access_stats()
         # Backends will be cleaned up by their destructors
 
 
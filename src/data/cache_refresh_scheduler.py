@@ -0,0 +1,156 @@
+"""
+Popularity-Driven Cache Refresh Scheduler
+Refreshes the locations users actually query shortly before their cache entries expire
+"""
+
+import asyncio
+import heapq
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .cache_management import IntelligentCacheManager, PopularLocation
+
+logger = logging.getLogger(__name__)
+
+# Refreshes a list of locations with at most the given number of concurrent fetches
+RefreshCallback = Callable[[List[str], int], Awaitable[None]]
+
+
+class CacheRefreshScheduler:
+    """
+    Schedules proactive refreshes from recorded cache access statistics
+
+    Each popular location is due `refresh_lead_hours` before its predicted
+    expiry, pulled earlier by a random jitter so entries written together
+    do not all refresh together. Due locations are refreshed with at most
+    `max_concurrent_refreshes` fetches in flight, and the plan is rebuilt
+    from fresh statistics every `refresh_interval_hours`.
+    """
+
+    def __init__(self, cache_manager: IntelligentCacheManager, refresh_callback: RefreshCallback,
+                 config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None):
+        self.cache_manager = cache_manager
+        self.refresh_callback = refresh_callback
+        self.config = config or {}
+
+        self.max_locations = self.config.get('max_locations', 50)
+        self.refresh_lead_hours = self.config.get('refresh_lead_hours', 1.0)
+        self.refresh_interval_hours = self.config.get('refresh_interval_hours', 6.0)
+        self.jitter_minutes = self.config.get('jitter_minutes', 10.0)
+        self.max_concurrent_refreshes = self.config.get('max_concurrent_refreshes', 3)
+
+        self._random = random.Random(seed)
+        self._schedule: List[Tuple[float, str]] = []
+        self._next_plan_time: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.refresh_cycles = 0
+        self.locations_refreshed = 0
+
+    async def plan(self, now: Optional[datetime] = None) -> List[Tuple[datetime, str]]:
+        """
+        Rebuild the refresh schedule from current access statistics
+
+        Returns:
+            Scheduled (due time, location) pairs, earliest first
+        """
+        now = now or datetime.now()
+        popular = await self.cache_manager.get_popular_locations(self.max_locations)
+
+        self._schedule = [(self._due_time(entry, now).timestamp(), entry.location) for entry in popular]
+        heapq.heapify(self._schedule)
+        self._next_plan_time = now + timedelta(hours=self.refresh_interval_hours)
+
+        logger.debug(f"Planned proactive refresh for {len(self._schedule)} popular locations")
+        return [(datetime.fromtimestamp(due), location) for due, location in sorted(self._schedule)]
+
+    def _due_time(self, entry: PopularLocation, now: datetime) -> datetime:
+        """Predicted expiry minus the lead time and a random jitter"""
+        jitter = timedelta(minutes=self._random.uniform(0, self.jitter_minutes))
+        if entry.expiry_time is not None:
+            due = entry.expiry_time - timedelta(hours=self.refresh_lead_hours) - jitter
+        else:
+            # Entries without a TTL are refreshed once per planning interval
+            due = entry.created_at + timedelta(hours=self.refresh_interval_hours) - jitter
+        return max(due, now)
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[str]:
+        """Remove and return the locations due for refresh"""
+        cutoff = (now or datetime.now()).timestamp()
+        due = []
+        while self._schedule and self._schedule[0][0] <= cutoff:
+            due.append(heapq.heappop(self._schedule)[1])
+        return due
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the next refresh is due or the plan should be rebuilt"""
+        now = now or datetime.now()
+        wake_times = [self._next_plan_time.timestamp()] if self._next_plan_time else []
+        if self._schedule:
+            wake_times.append(self._schedule[0][0])
+        if not wake_times:
+            return 0.0
+        return max(0.0, min(wake_times) - now.timestamp())
+
+    async def run_once(self, now: Optional[datetime] = None) -> List[str]:
+        """Replan if needed, then refresh every due location"""
+        now = now or datetime.now()
+        if self._next_plan_time is None or now >= self._next_plan_time:
+            await self.plan(now)
+
+        due = self.pop_due(now)
+        if due:
+            logger.debug(f"Proactively refreshing {len(due)} locations")
+            await self.refresh_callback(due, self.max_concurrent_refreshes)
+            self.refresh_cycles += 1
+            self.locations_refreshed += len(due)
+        return due
+
+    async def _run_loop(self):
+        """Background loop sleeping until the next due refresh"""
+        while True:
+            try:
+                await self.run_once()
+                await asyncio.sleep(self.seconds_until_next())
+            except asyncio.CancelledError:
+                logger.info("Proactive cache refresh task cancelled")
+                break
+            except Exception as e:
+                logger.warning(f"Error in proactive cache refresh: {e}")
+                # Back off rather than spinning on a persistent error
+                await asyncio.sleep(60)
+
+    def start(self):
+        """Start the background refresh loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_loop())
+            logger.info("Started proactive cache refresh background task")
+
+    async def stop(self):
+        """Stop the background refresh loop"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler statistics"""
+        return {
+            'scheduled_locations': len(self._schedule),
+            'next_plan_time': self._next_plan_time.isoformat() if self._next_plan_time else None,
+            'refresh_cycles': self.refresh_cycles,
+            'locations_refreshed': self.locations_refreshed
+        }
+
+
+def create_cache_refresh_scheduler(cache_manager: IntelligentCacheManager,
+                                   refresh_callback: RefreshCallback,
+                                   config: Optional[Dict] = None) -> CacheRefreshScheduler:
+    """Factory function to create CacheRefreshScheduler instance"""
+    return CacheRefreshScheduler(cache_manager, refresh_callback, config)
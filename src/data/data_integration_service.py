@@ -6,7 +6,7 @@ Main service that coordinates all data sources and implements the DataProvider i
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple
 from dataclasses import asdict
 
 from ..shared.interfaces import DataProvider, DataRequest, DataValidationResult, MarketData
@@ -16,6 +16,9 @@ from .market_data_api import MarketDataAPI, create_market_data_api
 from .interest_rate_feeds import InterestRateFeeds, create_interest_rate_feeds
 from .location_data import LocationDataService, create_location_data_service, LocationInfo
 from .cache_management import IntelligentCacheManager, create_cache_manager
+from .cache_config import get_optimized_cache_config
+from .cache_refresh_scheduler import CacheRefreshScheduler, create_cache_refresh_scheduler
+from .http_client_pool import HTTPClientPool, get_http_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,7 @@ class DataIntegrationService(DataProvider):
     Coordinates all data sources with intelligent caching and fallback mechanisms
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_pool: Optional[HTTPClientPool] = None):
         self.config = config or {}
         
         # Performance targets
@@ -34,15 +37,25 @@ class DataIntegrationService(DataProvider):
         self.target_freshness_hours = self.config.get('target_freshness_hours', 24)
         self.target_hit_rate = self.config.get('target_hit_rate', 0.8)
         
-        # Initialize services
+        # Concurrent fresh fetches allowed per batch request
+        self.batch_concurrency = self.config.get('batch_concurrency', 5)
+        
+        # Initialize services (all providers share one pooled HTTP client)
+        self.http_pool = http_pool or get_http_client_pool()
         self.cache_manager = create_cache_manager(self.config.get('cache', {}))
-        self.market_api = create_market_data_api(self.config.get('market_api', {}))
-        self.rate_feeds = create_interest_rate_feeds(self.config.get('interest_rates', {}))
-        self.location_service = create_location_data_service(self.config.get('location', {}))
+        self.market_api = create_market_data_api(self.config.get('market_api', {}), self.http_pool)
+        self.rate_feeds = create_interest_rate_feeds(self.config.get('interest_rates', {}), self.http_pool)
+        self.location_service = create_location_data_service(self.config.get('location', {}), self.http_pool)
         
         # Inject cache manager into market API
         self.market_api.cache_manager = self.cache_manager
         
+        # Warm and refresh the locations users actually query
+        self.warmup_config = self.config.get('warmup', {})
+        self.refresh_scheduler = create_cache_refresh_scheduler(
+            self.cache_manager, self._refresh_locations, self.config.get('proactive_refresh', {})
+        )
+        
         # Service state
         self.is_initialized = False
         self.service_stats = {
@@ -98,9 +111,7 @@ class DataIntegrationService(DataProvider):
             if request.fallback_to_cache:
                 cached_data = await self.cache_manager.get_cached_data(request.location)
                 if cached_data:
-                    # Calculate actual age
-                    actual_age_hours = (datetime.now() - cached_data.data_timestamp).total_seconds() / 3600
-                    data_age = min(cached_data.freshness_hours, actual_age_hours)
+                    data_age = self._data_age_hours(cached_data)
                     
                     if data_age <= request.max_age_hours:
                         logger.info(f"Returning cached data for {request.location} (age: {data_age:.1f}h)")
@@ -132,8 +143,8 @@ class DataIntegrationService(DataProvider):
             logger.info(f"Updating cache for {request.location}")
             await self.cache_manager.update_cache(request.location, market_data)
             
-            # Verify cache update
-            cached_check = await self.cache_manager.get_cached_data(request.location)
+            # Verify cache update (not a user access, so popularity is unaffected)
+            cached_check = await self.cache_manager.get_cached_data(request.location, record_access=False)
             if cached_check:
                 logger.info(f"Cache update successful for {request.location}")
             else:
@@ -155,6 +166,88 @@ class DataIntegrationService(DataProvider):
             # If no cached data, return minimal data structure
             return await self._create_minimal_fallback_data(request)
     
+    async def get_market_data_batch(self, requests: List[DataRequest],
+                                    max_concurrency: Optional[int] = None
+                                    ) -> AsyncIterator[Tuple[DataRequest, MarketData]]:
+        """
+        Retrieve market data for many locations, yielding results as they complete
+        
+        Requests for the same location (after normalization) share one lookup.
+        Cache hits are resolved together up front and yielded first; misses are
+        fetched with at most max_concurrency requests in flight.
+        
+        Args:
+            requests: Data requests, e.g. one per candidate site
+            max_concurrency: Cap on concurrent fresh fetches (defaults to batch_concurrency)
+            
+        Yields:
+            Tuples of (request, market data), one per input request
+        """
+        await self._ensure_initialized()
+        
+        # Deduplicate by canonical cache key
+        groups: Dict[str, List[DataRequest]] = {}
+        for request in requests:
+            cache_key = self.cache_manager._generate_cache_key(request.location)
+            groups.setdefault(cache_key, []).append(request)
+        
+        logger.info(f"Processing batch of {len(requests)} market data requests "
+                    f"({len(groups)} unique locations)")
+        
+        # Resolve cache hits in one pass
+        start_time = datetime.now()
+        cacheable = [group[0].location for group in groups.values()
+                     if any(request.fallback_to_cache for request in group)]
+        cached = await self.cache_manager.get_cached_data_many(cacheable) if cacheable else {}
+        
+        misses: List[List[DataRequest]] = []
+        for group in groups.values():
+            cached_data = cached.get(group[0].location)
+            pending = []
+            for request in group:
+                if (cached_data is not None and request.fallback_to_cache and
+                        self._data_age_hours(cached_data) <= request.max_age_hours):
+                    self.service_stats['requests_processed'] += 1
+                    await self._record_successful_request(start_time)
+                    yield request, cached_data
+                else:
+                    pending.append(request)
+            if pending:
+                misses.append(pending)
+        
+        if not misses:
+            return
+        
+        # Fetch misses with bounded concurrency, streaming each as it completes
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
+        
+        async def fetch_group(group: List[DataRequest]) -> Tuple[List[DataRequest], MarketData]:
+            async with semaphore:
+                fetch_request = DataRequest(
+                    location=group[0].location,
+                    zip_code=next((request.zip_code for request in group if request.zip_code), None),
+                    data_types=sorted({data_type for request in group for data_type in request.data_types}),
+                    max_age_hours=min(request.max_age_hours for request in group),
+                    fallback_to_cache=False  # Cache was already consulted above
+                )
+                return group, await self.get_market_data(fetch_request)
+        
+        tasks = [asyncio.create_task(fetch_group(group)) for group in misses]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                group, market_data = await next_result
+                for request in group:
+                    yield request, market_data
+        finally:
+            # Consumer stopped early or was cancelled: don't leave fetches running
+            for task in tasks:
+                task.cancel()
+    
+    def _data_age_hours(self, data: MarketData) -> float:
+        """Age of market data in hours, as reported or as measured from its timestamp"""
+        actual_age_hours = (datetime.now() - data.data_timestamp).total_seconds() / 3600
+        return min(data.freshness_hours, actual_age_hours)
+    
     async def _get_location_info(self, request: DataRequest) -> Optional[LocationInfo]:
         """Get standardized location information"""
         try:
@@ -485,61 +578,7 @@ class DataIntegrationService(DataProvider):
     
     def _generate_cache_key_sync(self, location: str) -> str:
         """Generate normalized cache key for better hit rates"""
-        import hashlib
-        import re
-        
-        # Normalize location string for better cache matching
-        normalized = location.lower().strip()
-        
-        # Remove common punctuation and extra spaces
-        normalized = re.sub(r'[^\w\s,]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Standardize state representations
-        state_mappings = {
-            'new york': 'ny', 'california': 'ca', 'texas': 'tx', 'florida': 'fl',
-            'illinois': 'il', 'pennsylvania': 'pa', 'ohio': 'oh', 'georgia': 'ga',
-            'north carolina': 'nc', 'michigan': 'mi', 'new jersey': 'nj', 'virginia': 'va',
-            'washington': 'wa', 'arizona': 'az', 'massachusetts': 'ma', 'tennessee': 'tn',
-            'indiana': 'in', 'missouri': 'mo', 'maryland': 'md', 'wisconsin': 'wi',
-            'colorado': 'co', 'minnesota': 'mn', 'south carolina': 'sc', 'alabama': 'al',
-            'louisiana': 'la', 'kentucky': 'ky', 'oregon': 'or', 'oklahoma': 'ok',
-            'connecticut': 'ct', 'utah': 'ut', 'iowa': 'ia', 'nevada': 'nv',
-            'arkansas': 'ar', 'mississippi': 'ms', 'kansas': 'ks', 'new mexico': 'nm',
-            'nebraska': 'ne', 'west virginia': 'wv', 'idaho': 'id', 'hawaii': 'hi',
-            'new hampshire': 'nh', 'maine': 'me', 'montana': 'mt', 'rhode island': 'ri',
-            'delaware': 'de', 'south dakota': 'sd', 'north dakota': 'nd', 'alaska': 'ak',
-            'vermont': 'vt', 'wyoming': 'wy'
-        }
-        
-        # Apply state mappings
-        for full_name, abbrev in state_mappings.items():
-            normalized = normalized.replace(full_name, abbrev)
-        
-        # Standardize city name variations
-        city_mappings = {
-            'new york city': 'new york',
-            'nyc': 'new york',
-            'la': 'los angeles',
-            'san fran': 'san francisco',
-            'sf': 'san francisco',
-            'vegas': 'las vegas',
-            'philly': 'philadelphia',
-        }
-        
-        for variation, standard in city_mappings.items():
-            if variation in normalized:
-                normalized = normalized.replace(variation, standard)
-        
-        # Ensure consistent format: "city, state"
-        parts = normalized.split(',')
-        if len(parts) >= 2:
-            city = parts[0].strip()
-            state = parts[1].strip()
-            normalized = f"{city}, {state}"
-        
-        # Generate hash
-        return hashlib.md5(normalized.encode()).hexdigest()
+        return self.cache_manager._generate_cache_key(location)
     
     def _get_memory_cache_sync(self, cache_key: str):
         """Get from memory cache synchronously"""
@@ -641,40 +680,25 @@ class DataIntegrationService(DataProvider):
             logger.warning(f"Rate feeds connection issue: {e}")
     
     async def _warmup_cache(self):
-        """Warm up cache with common US locations"""
+        """Warm up cache by fetching fresh data for the most popular locations"""
         logger.info("Starting cache warmup...")
         
-        # Top 20 US real estate markets for cache warmup
-        warmup_locations = [
-            "New York, NY", "Los Angeles, CA", "Chicago, IL", "Houston, TX", 
-            "Phoenix, AZ", "Philadelphia, PA", "San Antonio, TX", "San Diego, CA",
-            "Dallas, TX", "San Jose, CA", "Austin, TX", "Jacksonville, FL",
-            "Fort Worth, TX", "Columbus, OH", "Charlotte, NC", "San Francisco, CA",
-            "Indianapolis, IN", "Seattle, WA", "Denver, CO", "Boston, MA"
-        ]
+        warmup_locations = await self._select_warmup_locations()
         
-        # Warmup tasks - run concurrently but limit concurrency
-        async def warmup_location(location: str):
-            try:
-                request = DataRequest(
-                    location=location,
-                    zip_code=None,
-                    data_types=['rental', 'property'],
-                    max_age_hours=24,
-                    fallback_to_cache=False  # Force fresh data for warmup
-                )
-                await self.get_market_data(request)
-                logger.debug(f"Cache warmed up for {location}")
-            except Exception as e:
-                logger.debug(f"Warmup failed for {location}: {e}")
+        requests = [
+            DataRequest(
+                location=location,
+                zip_code=None,
+                data_types=['rental', 'property'],
+                max_age_hours=24,
+                fallback_to_cache=False  # Force fresh data for warmup
+            )
+            for location in warmup_locations
+        ]
         
-        # Run warmup in batches to avoid overwhelming APIs
-        batch_size = 5
-        for i in range(0, len(warmup_locations), batch_size):
-            batch = warmup_locations[i:i + batch_size]
-            await asyncio.gather(*[warmup_location(loc) for loc in batch], return_exceptions=True)
-            # Small delay between batches
-            await asyncio.sleep(0.5)
+        # Batch fetching bounds concurrency to avoid overwhelming APIs
+        async for request, _ in self.get_market_data_batch(requests):
+            logger.debug(f"Cache warmed up for {request.location}")
         
         logger.info(f"Cache warmup completed for {len(warmup_locations)} locations")
     
@@ -682,14 +706,38 @@ class DataIntegrationService(DataProvider):
         """Optimized cache warmup - faster and more efficient"""
         logger.info("Starting optimized cache warmup...")
         
-        # Top 10 most requested US locations for quick warmup
-        priority_locations = [
-            "New York, NY", "Los Angeles, CA", "Chicago, IL", "Houston, TX", 
-            "Phoenix, AZ", "Philadelphia, PA", "San Diego, CA", "Dallas, TX", 
-            "San Jose, CA", "Austin, TX"
-        ]
+        popular = await self.cache_manager.get_popular_locations(self.warmup_config.get('max_locations', 20))
         
-        # Pre-populate cache with minimal data to establish cache entries
+        if popular:
+            # Load persisted entries for popular locations into the memory cache
+            locations = [entry.location for entry in popular]
+            cached = await self.cache_manager.get_cached_data_many(locations, record_access=False)
+            logger.info(f"Optimized cache warmup completed: {len(cached)} popular locations loaded")
+        else:
+            # No access history yet: seed the configured priority locations
+            await self._seed_priority_locations(await self._select_warmup_locations())
+        
+        # Verify cache is working
+        cache_stats = await self.cache_manager.get_performance_stats()
+        logger.info(f"Cache after warmup: {cache_stats.entry_count} entries, {cache_stats.cache_size_mb:.1f}MB")
+        
+        # Start proactive cache refresh for popular locations
+        if self.config.get('proactive_refresh', {}).get('enabled', True):
+            self.refresh_scheduler.start()
+    
+    async def _select_warmup_locations(self) -> List[str]:
+        """Most popular cached locations, or the configured priority list on a cold cache"""
+        limit = self.warmup_config.get('max_locations', 20)
+        popular = await self.cache_manager.get_popular_locations(limit)
+        if popular:
+            return [entry.location for entry in popular]
+        
+        priority_locations = (self.warmup_config.get('priority_locations') or
+                              get_optimized_cache_config()['warmup']['priority_locations'])
+        return priority_locations[:limit]
+    
+    async def _seed_priority_locations(self, priority_locations: List[str]):
+        """Seed the cache with template data so first requests are served immediately"""
         warmup_data_template = {
             'rental': {'median_rent_sqm': 30.0, 'vacancy_rate': 5.0, 'growth_rate': 3.5},
             'property': {'median_price': 500000, 'appreciation_rate': 4.0, 'months_on_market': 2.5},
@@ -726,117 +774,42 @@ class DataIntegrationService(DataProvider):
                 freshness_hours=0.0
             )
         
-        # Seed cache directly (much faster than going through API)
+        # Seed cache directly (much faster than going through API); seeds are not user accesses
         warmup_count = 0
         for location in priority_locations:
             try:
                 warmup_data = create_warmup_data(location)
-                await self.cache_manager.update_cache(location, warmup_data)
+                await self.cache_manager.update_cache(location, warmup_data, record_access=False)
                 warmup_count += 1
                 logger.debug(f"Cache seeded for {location}")
             except Exception as e:
                 logger.debug(f"Cache seed failed for {location}: {e}")
         
         logger.info(f"Optimized cache warmup completed: {warmup_count} locations seeded")
-        
-        # Verify cache is working
-        cache_stats = await self.cache_manager.get_performance_stats()
-        logger.info(f"Cache after warmup: {cache_stats.entry_count} entries, {cache_stats.cache_size_mb:.1f}MB")
-        
-        # Start proactive cache refresh for popular locations
-        await self._start_proactive_cache_refresh(priority_locations)
     
-    async def _start_proactive_cache_refresh(self, priority_locations: List[str]):
-        """Start background task for proactive cache refresh of popular locations"""
-        if not hasattr(self, '_cache_refresh_task') or self._cache_refresh_task.done():
-            self._cache_refresh_task = asyncio.create_task(
-                self._proactive_cache_refresh_loop(priority_locations)
+    async def _refresh_locations(self, locations: List[str], max_concurrency: int):
+        """Fetch fresh data for scheduled locations within the refresh concurrency budget"""
+        requests = [
+            DataRequest(
+                location=location,
+                zip_code=None,
+                data_types=['rental', 'property'],
+                max_age_hours=0,  # Force fresh data
+                fallback_to_cache=False
             )
-            logger.info("Started proactive cache refresh background task")
-    
-    async def _proactive_cache_refresh_loop(self, priority_locations: List[str]):
-        """Background loop to proactively refresh popular location cache"""
-        refresh_interval = 3600  # 1 hour
+            for location in locations
+        ]
         
-        while True:
-            try:
-                await asyncio.sleep(refresh_interval)
-                
-                logger.debug("Starting proactive cache refresh cycle")
-                
-                for location in priority_locations:
-                    try:
-                        # Check if cache entry is getting stale
-                        cached_data = await self.cache_manager.get_cached_data(location)
-                        if cached_data:
-                            age_hours = (datetime.now() - cached_data.data_timestamp).total_seconds() / 3600
-                            
-                            # Refresh if data is over 12 hours old
-                            if age_hours > 12:
-                                # Create a background refresh request
-                                refresh_request = DataRequest(
-                                    location=location,
-                                    zip_code=None,
-                                    data_types=['rental', 'property'],
-                                    max_age_hours=0,  # Force fresh data
-                                    fallback_to_cache=False
-                                )
-                                
-                                # Refresh in background (don't wait)
-                                asyncio.create_task(self.get_market_data(refresh_request))
-                                logger.debug(f"Triggered background refresh for {location}")
-                    
-                    except Exception as e:
-                        logger.debug(f"Proactive refresh failed for {location}: {e}")
-                        
-                    # Small delay between refreshes
-                    await asyncio.sleep(1)
-                
-                logger.debug("Proactive cache refresh cycle completed")
-                
-            except asyncio.CancelledError:
-                logger.info("Proactive cache refresh task cancelled")
-                break
-            except Exception as e:
-                logger.warning(f"Error in proactive cache refresh: {e}")
-                # Continue the loop even if there's an error
+        async for request, _ in self.get_market_data_batch(requests, max_concurrency=max_concurrency):
+            logger.debug(f"Proactively refreshed {request.location}")
     
     async def _try_fuzzy_cache_match(self, location: str) -> Optional[MarketData]:
         """Try to find cached data for similar location names"""
         try:
-            # Get all cache entries and find the best match
-            cache_stats = await self.cache_manager.get_performance_stats()
-            
-            # Simple fuzzy matching - could be enhanced with more sophisticated algorithms
-            location_lower = location.lower().strip()
-            location_parts = set(location_lower.replace(',', ' ').split())
-            
-            # Extract city and state from the request
-            city_part = location_parts
-            
-            # Common location variations to try
-            variations = []
-            
-            # If location has state, try without it
-            if any(part.upper() in ['NY', 'CA', 'TX', 'FL', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI'] for part in location_parts):
-                city_only = ' '.join(part for part in location_parts if part.upper() not in 
-                                   ['NY', 'CA', 'TX', 'FL', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI', 'USA', 'US'])
-                variations.append(city_only)
-            
-            # Try with common city suffixes
-            base_city = location_lower.replace(' city', '').replace(' metro', '').replace(' area', '')
-            if base_city != location_lower:
-                variations.append(base_city)
-            
-            # Try each variation
-            for variation in variations:
-                if variation and len(variation) > 3:  # Avoid very short matches
-                    cached_data = await self.cache_manager.get_cached_data(variation)
-                    if cached_data:
-                        logger.debug(f"Fuzzy match found: '{location}' matched with '{variation}'")
-                        return cached_data
-            
-            return None
+            cached_data = await self.cache_manager.find_similar_cached_data(location)
+            if cached_data:
+                logger.debug(f"Fuzzy match found for '{location}'")
+            return cached_data
             
         except Exception as e:
             logger.debug(f"Fuzzy cache matching failed: {e}")
@@ -866,10 +839,12 @@ class DataIntegrationService(DataProvider):
         logger.info("Shutting down data integration service...")
         
         try:
+            await self.refresh_scheduler.stop()
             await self.cache_manager.close()
             await self.market_api.close()
             await self.rate_feeds.close()
             await self.location_service.close()
+            await self.http_pool.close()
             
             logger.info("Data integration service shutdown complete")
             
@@ -877,6 +852,7 @@ class DataIntegrationService(DataProvider):
             logger.error(f"Error during service shutdown: {e}")
 
 
-def create_data_integration_service(config: Optional[Dict] = None) -> DataIntegrationService:
+def create_data_integration_service(config: Optional[Dict] = None,
+                                    http_pool: Optional[HTTPClientPool] = None) -> DataIntegrationService:
     """Factory function to create DataIntegrationService instance"""
-    return DataIntegrationService(config)
\ No newline at end of file
+    return DataIntegrationService(config, http_pool)
\ No newline at end of file
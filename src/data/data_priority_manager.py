@@ -5,7 +5,8 @@ Ensures user-provided values always take precedence over API data
 """
 
 import logging
-from typing import Dict, Any, Optional, Union
+import threading
+from typing import Dict, Any, Optional, Set, Union
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,12 @@ class DataPriorityManager:
     """
     Manages data priority hierarchy for the real estate analysis tool
     Dynamic behavior: Default -> API updates -> User overrides
+    
+    Writes that leave a stored entry unchanged are skipped. Changed keys are
+    collected in a dirty set and merged into a resolved snapshot on the next
+    read, so lookups are a single dict access. `version` increments whenever
+    a stored value changes; downstream caches can key on it instead of
+    rehashing values.
     """
     
     def __init__(self):
@@ -23,8 +30,101 @@ class DataPriorityManager:
         self.default_data = {}
         self.user_touched_fields = set()  # Track which fields user has manually modified
         self.last_updated = datetime.now()
+        self.version = 0  # Incremented whenever a stored value changes
+        
+        # Resolved view of the three layers, refreshed lazily for dirty keys
+        self._resolved = {}
+        self._dirty_keys: Set[str] = set()
+        self._summary = None
+        self._resolve_lock = threading.Lock()
+        
+    def _store(self, layer: Dict[str, Dict[str, Any]], key: str, entry: Dict[str, Any]) -> bool:
+        """
+        Store an entry in a data layer unless it matches the stored one
+        
+        Entries are compared ignoring their timestamp.
+        
+        Returns:
+            True if the layer changed
+        """
+        previous = layer.get(key)
+        if previous is not None and previous.keys() == entry.keys() and all(
+            previous[field] == entry[field] for field in entry if field != 'timestamp'
+        ):
+            return False
+            
+        layer[key] = entry
+        self._mark_dirty(key, value_changed=previous is None or previous['value'] != entry['value'])
+        return True
+        
+    def _mark_dirty(self, *keys: str, value_changed: bool = True) -> None:
+        """Queue keys for re-resolution (after the layers have been written)"""
+        self._dirty_keys.update(keys)
+        if value_changed:
+            self.version += 1
+            
+    def _refresh_snapshot(self) -> None:
+        """Merge the layers into the resolved snapshot for keys changed since the last read"""
+        if not self._dirty_keys:
+            return
+            
+        with self._resolve_lock:
+            dirty_keys, self._dirty_keys = self._dirty_keys, set()
+            for key in dirty_keys:
+                entry = self._resolve(key)
+                if entry is None:
+                    self._resolved.pop(key, None)
+                else:
+                    self._resolved[key] = entry
+            self._summary = None
+            
+    def _resolve(self, key: str) -> Optional[Dict[str, Any]]:
+        """Resolve one key through the User > API > Default layers"""
+        # Priority 1: User override (user has manually changed this field)
+        if key in self.user_overrides:
+            override_data = self.user_overrides[key]
+            return {
+                'value': override_data['value'],
+                'source': override_data['source'],
+                'priority_level': 'user_override',
+                'timestamp': override_data['timestamp'],
+                'confidence': 1.0,
+                'user_modified': True
+            }
+        
+        # Priority 2: API data (if available and user hasn't modified the field)
+        if key in self.api_data:
+            api_data = self.api_data[key]
+            result = {
+                'value': api_data['value'],
+                'source': api_data['source'], 
+                'priority_level': 'api_data',
+                'timestamp': api_data['timestamp'],
+                'confidence': api_data.get('confidence', 1.0),
+                'user_modified': False
+            }
+            
+            # Include metadata if available
+            if 'metadata' in api_data:
+                result['metadata'] = api_data['metadata']
+                
+            return result
+            
+        # Priority 3: Default data
+        if key in self.default_data:
+            default_data = self.default_data[key]
+            return {
+                'value': default_data['value'],
+                'source': default_data['source'],
+                'priority_level': 'default_data',
+                'timestamp': default_data['timestamp'],
+                'confidence': 0.7,
+                'user_modified': False
+            }
+            
+        return None
         
-    def set_user_override(self, key: str, value: Any, source: str = "user_input") -> None:
+    def set_user_override(self, key: str, value: Any, source: str = "user_input") -> bool:
         """
         Set a user override value that takes precedence over API and default data
         This marks the field as user-touched, preventing future API updates
@@ -33,14 +133,19 @@ class DataPriorityManager:
             key: The data key (e.g., 'interest_rate', 'market_appreciation_rate')
             value: The user-provided value
             source: Source description for logging
+            
+        Returns:
+            True if the stored override changed
         """
-        self.user_overrides[key] = {
+        changed = self._store(self.user_overrides, key, {
             'value': value,
             'source': source,
             'timestamp': datetime.now()
-        }
+        })
         self.user_touched_fields.add(key)  # Mark as user-modified
-        logger.info(f"User override set: {key} = {value} (source: {source})")
+        if changed:
+            logger.info(f"User override set: {key} = {value} (source: {source})")
+        return changed
         
     def set_api_data(self, key: str, value: Any, source: str = "api", confidence: float = 1.0, force_update: bool = False, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -73,8 +178,8 @@ class DataPriorityManager:
         if metadata:
             api_entry['metadata'] = metadata
             
-        self.api_data[key] = api_entry
-        logger.debug(f"API data set: {key} = {value} (source: {source}, confidence: {confidence})")
+        if self._store(self.api_data, key, api_entry):
+            logger.debug(f"API data set: {key} = {value} (source: {source}, confidence: {confidence})")
         return True
         
     def set_default_data(self, key: str, value: Any, source: str = "default") -> None:
@@ -86,12 +191,12 @@ class DataPriorityManager:
             value: The default value
             source: Source description
         """
-        self.default_data[key] = {
+        if self._store(self.default_data, key, {
             'value': value,
             'source': source,
             'timestamp': datetime.now()
-        }
-        logger.debug(f"Default data set: {key} = {value} (source: {source})")
+        }):
+            logger.debug(f"Default data set: {key} = {value} (source: {source})")
         
     def get_value(self, key: str, default_fallback: Any = None) -> Dict[str, Any]:
         """
@@ -107,47 +212,10 @@ class DataPriorityManager:
         Returns:
             Dict with 'value', 'source', 'priority_level', and metadata
         """
-        # Priority 1: User override (user has manually changed this field)
-        if key in self.user_overrides:
-            override_data = self.user_overrides[key]
-            return {
-                'value': override_data['value'],
-                'source': override_data['source'],
-                'priority_level': 'user_override',
-                'timestamp': override_data['timestamp'],
-                'confidence': 1.0,
-                'user_modified': True
-            }
-        
-        # Priority 2: API data (if available and user hasn't modified the field)
-        if key in self.api_data:
-            api_data = self.api_data[key]
-            result = {
-                'value': api_data['value'],
-                'source': api_data['source'], 
-                'priority_level': 'api_data',
-                'timestamp': api_data['timestamp'],
-                'confidence': api_data.get('confidence', 1.0),
-                'user_modified': False
-            }
-            
-            # Include metadata if available
-            if 'metadata' in api_data:
-                result['metadata'] = api_data['metadata']
-                
-            return result
-            
-        # Priority 3: Default data
-        if key in self.default_data:
-            default_data = self.default_data[key]
-            return {
-                'value': default_data['value'],
-                'source': default_data['source'],
-                'priority_level': 'default_data',
-                'timestamp': default_data['timestamp'],
-                'confidence': 0.7,
-                'user_modified': False
-            }
+        self._refresh_snapshot()
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return dict(resolved)
             
         # Final fallback
         if default_fallback is not None:
@@ -174,20 +242,37 @@ class DataPriorityManager:
         Returns:
             The actual value
         """
-        try:
-            return self.get_value(key, default_fallback)['value']
-        except ValueError:
-            return default_fallback
+        self._refresh_snapshot()
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved['value']
+        return default_fallback
+        
+    def get_resolved_values(self) -> Dict[str, Any]:
+        """
+        Get the active value of every key
+        
+        Returns:
+            Dict mapping data key to its highest-priority value
+        """
+        self._refresh_snapshot()
+        return {key: entry['value'] for key, entry in self._resolved.items()}
             
     def clear_user_overrides(self) -> None:
         """Clear all user overrides and user-touched fields"""
+        cleared_keys = list(self.user_overrides)
         self.user_overrides.clear()
         self.user_touched_fields.clear()  # Also clear the touched fields set
+        if cleared_keys:
+            self._mark_dirty(*cleared_keys)
         logger.info("All user overrides and touched fields cleared")
         
     def clear_api_data(self) -> None:
         """Clear all API data"""
+        cleared_keys = list(self.api_data)
         self.api_data.clear()
+        if cleared_keys:
+            self._mark_dirty(*cleared_keys)
         logger.info("All API data cleared")
         
     def get_data_summary(self) -> Dict[str, Dict[str, Any]]:
@@ -197,13 +282,11 @@ class DataPriorityManager:
         Returns:
             Dict organized by data key with priority information
         """
-        all_keys = set(self.user_overrides.keys()) | set(self.api_data.keys()) | set(self.default_data.keys())
-        
-        summary = {}
-        for key in all_keys:
-            try:
-                active_data = self.get_value(key)
-                summary[key] = {
+        self._refresh_snapshot()
+        if self._summary is None:
+            # Every stored key resolves to at least its own layer's entry
+            self._summary = {
+                key: {
                     'active_value': active_data['value'],
                     'active_source': active_data['source'],
                     'priority_level': active_data['priority_level'],
@@ -212,18 +295,10 @@ class DataPriorityManager:
                     'has_default': key in self.default_data,
                     'confidence': active_data.get('confidence', 1.0)
                 }
-            except ValueError:
-                summary[key] = {
-                    'active_value': None,
-                    'active_source': None,
-                    'priority_level': None,
-                    'has_user_override': key in self.user_overrides,
-                    'has_api_data': key in self.api_data,
-                    'has_default': key in self.default_data,
-                    'confidence': 0.0
-                }
-                
-        return summary
+                for key, active_data in self._resolved.items()
+            }
+            
+        return {key: dict(entry) for key, entry in self._summary.items()}
         
     def bulk_update_from_session(self, session_data: Dict[str, Any]) -> None:
         """
@@ -248,10 +323,12 @@ class DataPriorityManager:
         
         for session_key, data_key in session_mapping.items():
             if session_key in inputs and inputs[session_key] is not None:
-                self.set_user_override(data_key, inputs[session_key], f"user_input:{session_key}")
-                updated_count += 1
-                
-        logger.info(f"Updated {updated_count} user overrides from session data")
+                # Unchanged values are skipped, so a rerun with the same inputs is a no-op
+                if self.set_user_override(data_key, inputs[session_key], f"user_input:{session_key}"):
+                    updated_count += 1
+                    
+        if updated_count:
+            logger.info(f"Updated {updated_count} user overrides from session data")
         
     def update_from_address_api(self, address: str, interest_rates: Dict[str, float], market_data: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
         """
@@ -432,6 +509,7 @@ class DataPriorityManager:
         """
         if key in self.user_overrides:
             del self.user_overrides[key]
+            self._mark_dirty(key)
             
         if key in self.user_touched_fields:
             self.user_touched_fields.remove(key)
@@ -440,14 +518,20 @@ class DataPriorityManager:
             
         return False
         
-    def apply_api_rates(self, interest_rates: Dict[str, float], market_data: Optional[Dict[str, Any]] = None) -> None:
+    def apply_api_rates(self, interest_rates: Optional[Dict[str, float]] = None, market_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Apply API-sourced rates and market data
         
         Args:
-            interest_rates: Dictionary of interest rates from API
+            interest_rates: Dictionary of interest rates from API. If None, the latest
+                snapshot from the background rate refresh service is used; this never
+                waits on the network, and applies nothing before the first refresh.
             market_data: Optional market data from API
         """
+        if interest_rates is None:
+            from .rate_refresh_service import get_rate_refresh_service
+            interest_rates = get_rate_refresh_service().get_rates()
+        
         # Apply interest rates
         rate_mapping = {
             '30_year_fixed': 'interest_rate_30_year',
@@ -0,0 +1,164 @@
+"""
+Shared HTTP Client Pool
+Process-wide aiohttp session pool shared by all market, rate and location data providers
+"""
+
+import aiohttp
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .api_config import get_http_pool_config
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientPool:
+    """
+    Pooled HTTP client with keep-alive connections, DNS caching and per-host concurrency caps
+
+    aiohttp sessions are bound to an event loop, so the pool keeps one session per
+    running loop. Long-lived loops reuse warm connections across every provider.
+    Callers running a one-shot loop (asyncio.run) close its session before the
+    loop ends, through close() or a provider's close(); sessions left behind by
+    loops that have since closed are closed on the next lookup.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or get_http_pool_config()
+        self.connection_limit = self.config.get('connection_limit', 100)
+        self.connection_limit_per_host = self.config.get('connection_limit_per_host', 10)
+        self.keepalive_timeout = self.config.get('keepalive_timeout', 30)
+        self.dns_cache_ttl = self.config.get('dns_cache_ttl', 300)
+        self.timeout = self.config.get('timeout', 30)
+        self.host_concurrency = self.config.get('host_concurrency', {})
+        self.headers = self.config.get('headers', {})
+
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._host_semaphores: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.sessions_created = 0
+        self.requests_made = 0
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True
+        )
+        self.sessions_created += 1
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=self.headers
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            stale = self._discard_closed_loops()
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = self._create_session()
+                self._sessions[loop] = session
+                self._host_semaphores[loop] = {}
+                logger.debug(f"Created pooled HTTP session ({self.sessions_created} total)")
+
+        for stale_session in stale:
+            # The connector's loop is gone, so this only marks it closed and drops its connections
+            await stale_session.close()
+        return session
+
+    def _discard_closed_loops(self) -> List[aiohttp.ClientSession]:
+        """Remove sessions whose event loop has shut down (e.g. after asyncio.run) and return them"""
+        stale = []
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session = self._sessions.pop(loop)
+            self._host_semaphores.pop(loop, None)
+            if not session.closed:
+                stale.append(session)
+        return stale
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            semaphores = self._host_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                limit = self.host_concurrency.get(host, self.connection_limit_per_host)
+                semaphore = semaphores[host] = asyncio.Semaphore(limit)
+            return semaphore
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Issue a request through the pooled session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to aiohttp (params, headers, timeout as seconds or ClientTimeout, ...)
+        """
+        timeout = kwargs.get('timeout')
+        if isinstance(timeout, (int, float)):
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        session = await self.get_session()
+        async with self._host_semaphore(url):
+            self.requests_made += 1
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    def get(self, url: str, **kwargs):
+        """GET request context manager"""
+        return self.request('GET', url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool usage statistics"""
+        with self._lock:
+            open_sessions = sum(1 for session in self._sessions.values() if not session.closed)
+        return {
+            'sessions_created': self.sessions_created,
+            'open_sessions': open_sessions,
+            'requests_made': self.requests_made,
+            'connection_limit': self.connection_limit,
+            'connection_limit_per_host': self.connection_limit_per_host
+        }
+
+    async def close(self):
+        """Close the session owned by the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+            self._host_semaphores.pop(loop, None)
+        if session and not session.closed:
+            await session.close()
+
+
+# Global instance
+_http_client_pool = None
+_http_client_pool_lock = threading.Lock()
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Get the process-wide HTTP client pool"""
+    global _http_client_pool
+    with _http_client_pool_lock:
+        if _http_client_pool is None:
+            _http_client_pool = HTTPClientPool()
+        return _http_client_pool
+
+
+async def close_http_client_pool():
+    """Close the process-wide pool's session for the running event loop"""
+    if _http_client_pool is not None:
+        await _http_client_pool.close()
@@ -3,8 +3,6 @@ Interest Rate Feeds Integration
 Connects to Federal Reserve and other financial data sources for current interest rates
 """
 
-import aiohttp
-import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import logging
@@ -13,6 +11,7 @@ import json
 import re
 
 from .api_config import get_interest_rate_config
+from .http_client_pool import HTTPClientPool, get_http_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +27,7 @@ class InterestRateFeeds:
     Provides current mortgage rates with trend analysis
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_pool: Optional[HTTPClientPool] = None):
         # Use real API configuration
         self.config = config or get_interest_rate_config()
         self.timeout = self.config.get('timeout', 30)
@@ -36,7 +35,7 @@ class InterestRateFeeds:
         
         # Federal Reserve Economic Data (FRED) API
         self.fred_api_key = self.config.get('fred_api_key')
-        self.fred_base_url = 'https://api.stlouisfed.org/fred'
+        self.fred_base_url = self.config.get('fred_base_url', 'https://api.stlouisfed.org/fred')
         
         # Log API status
         if self.fred_api_key:
@@ -63,16 +62,9 @@ class InterestRateFeeds:
         for source in backup_sources:
             self.rate_sources[source['name']] = source
         
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.http_pool = http_pool or get_http_client_pool()
         self.cache = {}
         self.cache_duration = timedelta(hours=1)  # Cache rates for 1 hour
-        
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create async HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
     
     async def get_current_rates(self, rate_types: Optional[List[str]] = None) -> Dict[str, float]:
         """
@@ -160,7 +152,6 @@ class InterestRateFeeds:
             logger.warning("FRED API key not configured, using default data")
             return self._get_default_fred_data(rate_types)
         
-        session = await self._get_session()
         rates = {}
         
         series_ids = config['series_ids']
@@ -182,7 +173,7 @@ class InterestRateFeeds:
             url = f"{config['url']}/series/observations"
             
             try:
-                async with session.get(url, params=params) as response:
+                async with self.http_pool.get(url, params=params, timeout=self.timeout) as response:
                     if response.status == 200:
                         data = await response.json()
                         observations = data.get('observations', [])
@@ -375,20 +366,7 @@ class InterestRateFeeds:
     
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-    
-    def __del__(self):
-        """Cleanup on destruction"""
-        if self.session and not self.session.closed:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    loop.run_until_complete(self.close())
-            except Exception:
-                pass
+        await self.http_pool.close()
 
 
 class RateComparisonService:
@@ -456,6 +434,7 @@ class RateComparisonService:
         }
 
 
-def create_interest_rate_feeds(config: Optional[Dict] = None) -> InterestRateFeeds:
+def create_interest_rate_feeds(config: Optional[Dict] = None,
+                               http_pool: Optional[HTTPClientPool] = None) -> InterestRateFeeds:
     """Factory function to create InterestRateFeeds instance"""
-    return InterestRateFeeds(config)
\ No newline at end of file
+    return InterestRateFeeds(config, http_pool)
\ No newline at end of file
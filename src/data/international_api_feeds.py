@@ -3,13 +3,14 @@ International Central Bank API Integration
 Live feeds from Brazil (BCB) and Israel (BOI) central banks
 """
 
-import aiohttp
 import asyncio
 import logging
 from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 import json
 
+from .http_client_pool import HTTPClientPool, get_http_client_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,9 +20,10 @@ class BrazilCentralBankAPI:
     Fetches live Selic rates and economic data
     """
     
-    def __init__(self):
+    def __init__(self, http_pool: Optional[HTTPClientPool] = None):
         self.base_url = "https://api.bcb.gov.br/dados/serie/bcdata.sgs"
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.http_pool = http_pool or get_http_client_pool()
+        self.timeout = 10
         
         # BCB Series codes
         self.series_codes = {
@@ -31,23 +33,14 @@ class BrazilCentralBankAPI:
             'real_estate_index': 1373  # Real estate price index
         }
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
-    
     async def get_latest_selic_rate(self) -> Optional[float]:
         """Get the latest Selic rate from BCB API"""
         try:
-            session = await self._get_session()
-            
             # Get last 1 record of Selic rate
             url = f"{self.base_url}.{self.series_codes['selic_rate']}/dados/ultimos/1"
             params = {'formato': 'json'}
             
-            async with session.get(url, params=params) as response:
+            async with self.http_pool.get(url, params=params, timeout=self.timeout) as response:
                 if response.status == 200:
                     data = await response.json()
                     if data and len(data) > 0:
@@ -65,13 +58,11 @@ class BrazilCentralBankAPI:
     async def get_economic_data(self) -> Dict[str, Any]:
         """Get comprehensive economic data from BCB"""
         try:
-            session = await self._get_session()
-            
             # Fetch multiple series concurrently
             tasks = []
             for series_name, series_code in self.series_codes.items():
                 url = f"{self.base_url}.{series_code}/dados/ultimos/1"
-                task = self._fetch_series_data(session, url, series_name)
+                task = self._fetch_series_data(url, series_name)
                 tasks.append(task)
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -92,11 +83,11 @@ class BrazilCentralBankAPI:
             logger.error(f"Error fetching BCB economic data: {e}")
             return {}
     
-    async def _fetch_series_data(self, session: aiohttp.ClientSession, url: str, series_name: str) -> Optional[Dict]:
+    async def _fetch_series_data(self, url: str, series_name: str) -> Optional[Dict]:
         """Fetch data for a specific series"""
         try:
             params = {'formato': 'json'}
-            async with session.get(url, params=params) as response:
+            async with self.http_pool.get(url, params=params, timeout=self.timeout) as response:
                 if response.status == 200:
                     data = await response.json()
                     if data and len(data) > 0:
@@ -112,8 +103,7 @@ class BrazilCentralBankAPI:
     
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        await self.http_pool.close()
 
 
 class IsraelCentralBankAPI:
@@ -122,26 +112,18 @@ class IsraelCentralBankAPI:
     Fetches live interest rates and economic data
     """
     
-    def __init__(self):
+    def __init__(self, http_pool: Optional[HTTPClientPool] = None):
         self.base_url = "https://edge.boi.gov.il"
-        self.session: Optional[aiohttp.ClientSession] = None
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; RentVsBuyTool/1.0)',
-                'Accept': 'application/json'
-            }
-            self.session = aiohttp.ClientSession(timeout=timeout, headers=headers)
-        return self.session
+        self.http_pool = http_pool or get_http_client_pool()
+        self.timeout = 10
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; RentVsBuyTool/1.0)',
+            'Accept': 'application/json'
+        }
     
     async def get_latest_interest_rate(self) -> Optional[float]:
         """Get the latest BOI interest rate"""
         try:
-            session = await self._get_session()
-            
             # BOI API endpoint - needs further research to find correct endpoint
             # The edge.boi.gov.il site exists but API structure is unclear
             # Possible endpoints to try:
@@ -154,7 +136,8 @@ class IsraelCentralBankAPI:
             
             for endpoint in endpoints_to_try:
                 try:
-                    async with session.get(endpoint) as response:
+                    async with self.http_pool.get(endpoint, headers=self.headers,
+                                                  timeout=self.timeout) as response:
                         if response.status == 200:
                             data = await response.json()
                             # Try different possible response formats
@@ -193,8 +176,7 @@ class IsraelCentralBankAPI:
     
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        await self.http_pool.close()
 
 
 class InternationalAPIFeeds:
@@ -202,9 +184,9 @@ class InternationalAPIFeeds:
     Consolidated international API feeds manager
     """
     
-    def __init__(self):
-        self.brazil_api = BrazilCentralBankAPI()
-        self.israel_api = IsraelCentralBankAPI()
+    def __init__(self, http_pool: Optional[HTTPClientPool] = None):
+        self.brazil_api = BrazilCentralBankAPI(http_pool)
+        self.israel_api = IsraelCentralBankAPI(http_pool)
         self.cache = {}
         self.cache_ttl = timedelta(hours=1)  # Cache for 1 hour
     
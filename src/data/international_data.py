@@ -12,6 +12,43 @@ import asyncio
 logger = logging.getLogger(__name__)
 
 
+# Country name/code aliases -> internal country key
+COUNTRY_ALIASES = {
+    'uk': 'uk', 'united kingdom': 'uk', 'britain': 'uk', 'england': 'uk',
+    'canada': 'canada', 'ca': 'canada',
+    'australia': 'australia', 'au': 'australia', 'aus': 'australia',
+    'germany': 'germany', 'de': 'germany', 'deutschland': 'germany',
+    'france': 'france', 'fr': 'france', 'fra': 'france',
+    'netherlands': 'netherlands', 'nl': 'netherlands', 'holland': 'netherlands',
+    'japan': 'japan', 'jp': 'japan', 'jpn': 'japan',
+    'singapore': 'singapore', 'sg': 'singapore', 'sgp': 'singapore',
+    'brazil': 'brazil', 'br': 'brazil', 'brasil': 'brazil',
+    'poland': 'poland', 'pl': 'poland', 'polska': 'poland',
+    'israel': 'israel', 'il': 'israel', 'isr': 'israel',
+    'georgia': 'georgia', 'ge': 'georgia',
+    'armenia': 'armenia', 'am': 'armenia',
+    'ukraine': 'ukraine', 'ua': 'ukraine',
+    'romania': 'romania', 'ro': 'romania',
+    'china': 'china', 'cn': 'china', 'prc': 'china',
+    'usa': 'usa', 'us': 'usa', 'united states': 'usa', 'america': 'usa'
+}
+
+# Major international cities -> internal country key
+CITY_COUNTRY_MAP = {
+    'london': 'uk', 'manchester': 'uk', 'birmingham': 'uk', 'liverpool': 'uk',
+    'toronto': 'canada', 'vancouver': 'canada', 'montreal': 'canada', 'calgary': 'canada',
+    'sydney': 'australia', 'melbourne': 'australia', 'brisbane': 'australia', 'perth': 'australia',
+    'berlin': 'germany', 'munich': 'germany', 'hamburg': 'germany', 'frankfurt': 'germany',
+    'paris': 'france', 'lyon': 'france', 'marseille': 'france', 'toulouse': 'france',
+    'amsterdam': 'netherlands', 'rotterdam': 'netherlands', 'the hague': 'netherlands',
+    'tokyo': 'japan', 'osaka': 'japan', 'kyoto': 'japan', 'yokohama': 'japan',
+    'singapore': 'singapore',
+    'sao paulo': 'brazil', 'rio de janeiro': 'brazil', 'brasilia': 'brazil', 'salvador': 'brazil',
+    'warsaw': 'poland', 'krakow': 'poland', 'gdansk': 'poland', 'wroclaw': 'poland',
+    'tel aviv': 'israel', 'jerusalem': 'israel', 'haifa': 'israel', 'beersheba': 'israel'
+}
+
+
 class InternationalDataProvider:
     """
     Provides international market data and financial parameters
@@ -339,35 +376,14 @@ class InternationalDataProvider:
         
         city = parts[0] if parts else None
         
-        # Country mapping
-        country_aliases = {
-            'uk': 'uk', 'united kingdom': 'uk', 'britain': 'uk', 'england': 'uk',
-            'canada': 'canada', 'ca': 'canada',
-            'australia': 'australia', 'au': 'australia', 'aus': 'australia',
-            'germany': 'germany', 'de': 'germany', 'deutschland': 'germany',
-            'france': 'france', 'fr': 'france', 'fra': 'france',
-            'netherlands': 'netherlands', 'nl': 'netherlands', 'holland': 'netherlands',
-            'japan': 'japan', 'jp': 'japan', 'jpn': 'japan',
-            'singapore': 'singapore', 'sg': 'singapore', 'sgp': 'singapore',
-            'brazil': 'brazil', 'br': 'brazil', 'brasil': 'brazil',
-            'poland': 'poland', 'pl': 'poland', 'polska': 'poland',
-            'israel': 'israel', 'il': 'israel', 'isr': 'israel',
-            'georgia': 'georgia', 'ge': 'georgia',
-            'armenia': 'armenia', 'am': 'armenia',
-            'ukraine': 'ukraine', 'ua': 'ukraine',
-            'romania': 'romania', 'ro': 'romania',
-            'china': 'china', 'cn': 'china', 'prc': 'china',
-            'usa': 'usa', 'us': 'usa', 'united states': 'usa', 'america': 'usa'
-        }
-        
         country = None
         state = None
         
         if len(parts) == 2:
             # Format: "City, Country" or "City, State"
             second_part = parts[1].lower()
-            if second_part in country_aliases:
-                country = country_aliases[second_part]
+            if second_part in COUNTRY_ALIASES:
+                country = COUNTRY_ALIASES[second_part]
             else:
                 # Might be a state (for US/Canada/Australia)
                 state = parts[1]
@@ -376,24 +392,11 @@ class InternationalDataProvider:
             # Format: "City, State, Country"
             state = parts[1]
             country_part = parts[2].lower()
-            country = country_aliases.get(country_part)
+            country = COUNTRY_ALIASES.get(country_part)
             
         elif len(parts) == 1:
             # Just city name - try to infer country from major cities
-            city_country_map = {
-                'london': 'uk', 'manchester': 'uk', 'birmingham': 'uk', 'liverpool': 'uk',
-                'toronto': 'canada', 'vancouver': 'canada', 'montreal': 'canada', 'calgary': 'canada',
-                'sydney': 'australia', 'melbourne': 'australia', 'brisbane': 'australia', 'perth': 'australia',
-                'berlin': 'germany', 'munich': 'germany', 'hamburg': 'germany', 'frankfurt': 'germany',
-                'paris': 'france', 'lyon': 'france', 'marseille': 'france', 'toulouse': 'france',
-                'amsterdam': 'netherlands', 'rotterdam': 'netherlands', 'the hague': 'netherlands',
-                'tokyo': 'japan', 'osaka': 'japan', 'kyoto': 'japan', 'yokohama': 'japan',
-                'singapore': 'singapore',
-                'sao paulo': 'brazil', 'rio de janeiro': 'brazil', 'brasilia': 'brazil', 'salvador': 'brazil',
-                'warsaw': 'poland', 'krakow': 'poland', 'gdansk': 'poland', 'wroclaw': 'poland',
-                'tel aviv': 'israel', 'jerusalem': 'israel', 'haifa': 'israel', 'beersheba': 'israel'
-            }
-            country = city_country_map.get(city.lower())
+            country = CITY_COUNTRY_MAP.get(city.lower())
             
         return city, state, country
     
@@ -3,8 +3,6 @@ Location-based Market Data Integration
 Handles geocoding, location validation, and region-specific market intelligence
 """
 
-import aiohttp
-import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import logging
@@ -12,6 +10,8 @@ import json
 import re
 from dataclasses import dataclass
 
+from .http_client_pool import HTTPClientPool, get_http_client_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,7 +64,7 @@ class LocationDataService:
     Integrates with geocoding and demographic data services
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_pool: Optional[HTTPClientPool] = None):
         self.config = config or {}
         self.timeout = self.config.get('timeout', 30)
         self.max_retries = self.config.get('max_retries', 3)
@@ -90,7 +90,7 @@ class LocationDataService:
             }
         }
         
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.http_pool = http_pool or get_http_client_pool()
         
         # Location cache
         self.location_cache = {}
@@ -104,13 +104,6 @@ class LocationDataService:
             'DC', 'PR', 'VI', 'GU', 'AS', 'MP'
         }
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create async HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
-    
     async def geocode_location(self, address: str) -> LocationInfo:
         """
         Convert address to standardized location information with coordinates
@@ -156,8 +149,6 @@ class LocationDataService:
     
     async def _geocode_with_google(self, address: str) -> LocationInfo:
         """Geocode using Google Maps API"""
-        session = await self._get_session()
-        
         params = {
             'address': address,
             'key': self.google_api_key,
@@ -166,7 +157,7 @@ class LocationDataService:
         
         url = self.endpoints['google_geocoding']['url']
         
-        async with session.get(url, params=params) as response:
+        async with self.http_pool.get(url, params=params, timeout=self.timeout) as response:
             if response.status == 200:
                 data = await response.json()
                 
@@ -178,8 +169,6 @@ class LocationDataService:
     
     async def _geocode_with_mapbox(self, address: str) -> LocationInfo:
         """Geocode using Mapbox API"""
-        session = await self._get_session()
-        
         encoded_address = address.replace(' ', '%20')
         url = f"{self.endpoints['mapbox_geocoding']['url']}/{encoded_address}.json"
         
@@ -189,7 +178,7 @@ class LocationDataService:
             'types': 'address,postcode,district,place,region'
         }
         
-        async with session.get(url, params=params) as response:
+        async with self.http_pool.get(url, params=params, timeout=self.timeout) as response:
             if response.status == 200:
                 data = await response.json()
                 
@@ -521,22 +510,10 @@ class LocationDataService:
     
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-    
-    def __del__(self):
-        """Cleanup on destruction"""
-        if self.session and not self.session.closed:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    loop.run_until_complete(self.close())
-            except Exception:
-                pass
+        await self.http_pool.close()
 
 
-def create_location_data_service(config: Optional[Dict] = None) -> LocationDataService:
+def create_location_data_service(config: Optional[Dict] = None,
+                                 http_pool: Optional[HTTPClientPool] = None) -> LocationDataService:
     """Factory function to create LocationDataService instance"""
-    return LocationDataService(config)
\ No newline at end of file
+    return LocationDataService(config, http_pool)
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+Normalized Location Index
+Canonicalizes free-form location strings and resolves fuzzy lookups against cached locations
+"""
+
+import re
+import threading
+import logging
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .international_data import COUNTRY_ALIASES, CITY_COUNTRY_MAP
+
+logger = logging.getLogger(__name__)
+
+
+# US state names -> postal abbreviations
+US_STATE_ABBREVIATIONS = {
+    'alabama': 'al', 'alaska': 'ak', 'arizona': 'az', 'arkansas': 'ar', 'california': 'ca',
+    'colorado': 'co', 'connecticut': 'ct', 'delaware': 'de', 'florida': 'fl', 'georgia': 'ga',
+    'hawaii': 'hi', 'idaho': 'id', 'illinois': 'il', 'indiana': 'in', 'iowa': 'ia',
+    'kansas': 'ks', 'kentucky': 'ky', 'louisiana': 'la', 'maine': 'me', 'maryland': 'md',
+    'massachusetts': 'ma', 'michigan': 'mi', 'minnesota': 'mn', 'mississippi': 'ms',
+    'missouri': 'mo', 'montana': 'mt', 'nebraska': 'ne', 'nevada': 'nv',
+    'new hampshire': 'nh', 'new jersey': 'nj', 'new mexico': 'nm', 'new york': 'ny',
+    'north carolina': 'nc', 'north dakota': 'nd', 'ohio': 'oh', 'oklahoma': 'ok',
+    'oregon': 'or', 'pennsylvania': 'pa', 'rhode island': 'ri', 'south carolina': 'sc',
+    'south dakota': 'sd', 'tennessee': 'tn', 'texas': 'tx', 'utah': 'ut', 'vermont': 'vt',
+    'virginia': 'va', 'washington': 'wa', 'west virginia': 'wv', 'wisconsin': 'wi',
+    'wyoming': 'wy', 'district of columbia': 'dc'
+}
+
+US_STATE_CODES = frozenset(US_STATE_ABBREVIATIONS.values())
+
+# Regions normalize_location resolves to: state codes and country keys
+KNOWN_REGIONS = US_STATE_CODES | frozenset(COUNTRY_ALIASES.values())
+
+# Colloquial city names -> canonical "city, state"
+CITY_ALIASES = {
+    'nyc': 'new york, ny',
+    'new york city': 'new york, ny',
+    'manhattan': 'new york, ny',
+    'la': 'los angeles, ca',
+    'sf': 'san francisco, ca',
+    'san fran': 'san francisco, ca',
+    'vegas': 'las vegas, nv',
+    'philly': 'philadelphia, pa',
+    'dc': 'washington, dc',
+    'washington dc': 'washington, dc',
+    'nola': 'new orleans, la',
+    'chi town': 'chicago, il',
+}
+
+# Tokens that carry no identifying information for fuzzy matching
+_NOISE_TOKENS = frozenset({'city', 'metro', 'area', 'greater', 'downtown', 'usa', 'us'})
+
+_PUNCTUATION = re.compile(r'[^\w\s,]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+# Well-known US cities -> state, for inputs that omit the state
+US_CITY_STATES = {
+    'albuquerque': 'nm', 'arlington': 'tx', 'atlanta': 'ga', 'austin': 'tx',
+    'baltimore': 'md', 'boston': 'ma', 'charlotte': 'nc', 'chicago': 'il',
+    'colorado springs': 'co', 'columbus': 'oh', 'dallas': 'tx', 'denver': 'co',
+    'detroit': 'mi', 'el paso': 'tx', 'fort worth': 'tx', 'fresno': 'ca', 'houston': 'tx',
+    'indianapolis': 'in', 'jacksonville': 'fl', 'kansas city': 'mo', 'las vegas': 'nv',
+    'long beach': 'ca', 'los angeles': 'ca', 'louisville': 'ky', 'memphis': 'tn',
+    'mesa': 'az', 'miami': 'fl', 'milwaukee': 'wi', 'minneapolis': 'mn', 'nashville': 'tn',
+    'new orleans': 'la', 'new york': 'ny', 'oakland': 'ca', 'oklahoma city': 'ok',
+    'omaha': 'ne', 'philadelphia': 'pa', 'phoenix': 'az', 'portland': 'or', 'raleigh': 'nc',
+    'sacramento': 'ca', 'san antonio': 'tx', 'san diego': 'ca', 'san francisco': 'ca',
+    'san jose': 'ca', 'seattle': 'wa', 'tampa': 'fl', 'tucson': 'az', 'tulsa': 'ok',
+    'virginia beach': 'va', 'washington': 'dc'
+}
+
+
+def _resolve_region(region: str, city: str) -> Tuple[str, bool]:
+    """
+    Resolve a region string to a state code or country key
+
+    Returns:
+        Tuple of (region, is_us)
+    """
+    # Known international cities take the country reading of ambiguous codes ("Toronto, CA")
+    if city in CITY_COUNTRY_MAP and region in COUNTRY_ALIASES:
+        country = COUNTRY_ALIASES[region]
+        return country, country == 'usa'
+    if region in US_STATE_CODES:
+        return region, True
+    if region in US_STATE_ABBREVIATIONS:
+        return US_STATE_ABBREVIATIONS[region], True
+    if region in COUNTRY_ALIASES:
+        country = COUNTRY_ALIASES[region]
+        return country, country == 'usa'
+    return region, False
+
+
+def _split_trailing_region(text: str) -> Tuple[str, Optional[str]]:
+    """Split "austin tx" / "portland oregon" into city and region when no comma is given"""
+    tokens = text.split(' ')
+    for width in (3, 2, 1):
+        if len(tokens) <= width:
+            continue
+        candidate = ' '.join(tokens[-width:])
+        if (candidate in US_STATE_ABBREVIATIONS or
+                (width == 1 and candidate in US_STATE_CODES) or
+                (len(candidate) > 3 and candidate in COUNTRY_ALIASES)):
+            return ' '.join(tokens[:-width]), candidate
+    return text, None
+
+
+@lru_cache(maxsize=4096)
+def normalize_location(location: str) -> str:
+    """
+    Canonicalize a location string to "city, region"
+
+    "NYC", "New York, NY", "new york city" and "New York, New York, USA" all
+    normalize to "new york, ny". International cities resolve to their
+    country key ("London" -> "london, uk").
+
+    Args:
+        location: Free-form location string
+
+    Returns:
+        Canonical location string (empty for blank input)
+    """
+    text = _WHITESPACE.sub(' ', _PUNCTUATION.sub('', (location or '').lower()))
+    parts = [part.strip() for part in text.split(',') if part.strip()]
+    if not parts:
+        return ''
+
+    # Drop trailing country designations that don't disambiguate a US city
+    while len(parts) > 1 and COUNTRY_ALIASES.get(parts[-1]) == 'usa':
+        parts.pop()
+
+    if len(parts) == 1:
+        city, region = _split_trailing_region(parts[0])
+    elif len(parts) == 2:
+        city, region = parts
+    else:
+        # "City, State, Country": keep the state for the US, the country otherwise
+        country = COUNTRY_ALIASES.get(parts[-1])
+        city, region = parts[0], parts[1] if country in (None, 'usa') else parts[-1]
+
+    alias = CITY_ALIASES.get(city)
+    if alias:
+        city, alias_region = alias.split(', ')
+        region = region or alias_region
+
+    if region:
+        region, _ = _resolve_region(region, city)
+    elif city in US_CITY_STATES:
+        region = US_CITY_STATES[city]
+    elif city in CITY_COUNTRY_MAP:
+        region = CITY_COUNTRY_MAP[city]
+
+    return f"{city}, {region}" if region else city
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams with word-boundary padding"""
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _tokens(text: str) -> List[str]:
+    """Identifying tokens of a canonical location, in order"""
+    return [token for token in text.replace(',', ' ').split() if token not in _NOISE_TOKENS]
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared) if shared else 0.0
+
+
+class LocationIndex:
+    """
+    Token and trigram index over cached location names
+
+    Exact lookups go through normalize_location; fuzzy lookups score indexed
+    locations sharing a token (or failing that, a trigram) with the query
+    on the city part. Queries with a region only match locations in that
+    region, so "Portland, ME" never resolves to "portland, or".
+    """
+
+    def __init__(self, min_similarity: float = 0.5):
+        self.min_similarity = min_similarity
+        self.lock = threading.RLock()
+        # canonical -> (city trigrams, full trigrams)
+        self._locations: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self._token_index: Dict[str, Set[str]] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._region_index: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, location: str) -> bool:
+        return normalize_location(location) in self._locations
+
+    def add(self, location: str) -> str:
+        """Index a location and return its canonical form"""
+        canonical = normalize_location(location)
+        if not canonical:
+            return canonical
+
+        with self.lock:
+            if canonical in self._locations:
+                return canonical
+
+            city, _, region = canonical.partition(', ')
+            full_trigrams = _trigrams(' '.join(_tokens(canonical)))
+            self._locations[canonical] = (_trigrams(' '.join(_tokens(city))), full_trigrams)
+            for token in _tokens(canonical):
+                self._token_index.setdefault(token, set()).add(canonical)
+            for trigram in full_trigrams:
+                self._trigram_index.setdefault(trigram, set()).add(canonical)
+            if region:
+                self._region_index.setdefault(region, set()).add(canonical)
+
+        return canonical
+
+    def update(self, locations: Iterable[str]) -> None:
+        """Index several locations"""
+        for location in locations:
+            self.add(location)
+
+    def discard(self, location: str) -> None:
+        """Remove a location from the index"""
+        canonical = normalize_location(location)
+        with self.lock:
+            entry = self._locations.pop(canonical, None)
+            if entry is None:
+                return
+            for token in _tokens(canonical):
+                self._discard_posting(self._token_index, token, canonical)
+            for trigram in entry[1]:
+                self._discard_posting(self._trigram_index, trigram, canonical)
+            region = canonical.partition(', ')[2]
+            if region:
+                self._discard_posting(self._region_index, region, canonical)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._locations.clear()
+            self._token_index.clear()
+            self._trigram_index.clear()
+            self._region_index.clear()
+
+    def best_match(self, location: str) -> Optional[str]:
+        """
+        Find the indexed location most similar to the query
+
+        When the query names a region, only locations in that region are
+        considered and only the city part is compared.
+
+        Returns:
+            Canonical form of the best indexed match, or None below min_similarity
+            (always None for a region that isn't a known state or country)
+        """
+        canonical = normalize_location(location)
+        if not canonical:
+            return None
+
+        city, _, region = canonical.partition(', ')
+        if region and region not in KNOWN_REGIONS:
+            return None
+        city_tokens = _tokens(city)
+        query_trigrams = _trigrams(' '.join(city_tokens))
+
+        with self.lock:
+            if canonical in self._locations:
+                return canonical
+
+            # Prefer candidates sharing a whole token; fall back to trigram overlap
+            candidates: Set[str] = set()
+            for token in city_tokens:
+                candidates |= self._token_index.get(token, set())
+            if not candidates:
+                for trigram in query_trigrams:
+                    candidates |= self._trigram_index.get(trigram, set())
+            if region:
+                candidates &= self._region_index.get(region, set())
+
+            best, best_score = None, 0.0
+            for candidate in sorted(candidates):
+                city_trigrams, _ = self._locations[candidate]
+                score = _jaccard(query_trigrams, city_trigrams)
+                if score > best_score:
+                    best, best_score = candidate, score
+
+        if best and best_score >= self.min_similarity:
+            logger.debug(f"Location index matched '{location}' to '{best}' ({best_score:.2f})")
+            return best
+        return None
+
+    def locations(self) -> List[str]:
+        """All indexed canonical locations"""
+        with self.lock:
+            return list(self._locations)
+
+    @staticmethod
+    def _discard_posting(index: Dict[str, Set[str]], term: str, canonical: str) -> None:
+        postings = index.get(term)
+        if postings is not None:
+            postings.discard(canonical)
+            if not postings:
+                del index[term]
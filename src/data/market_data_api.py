@@ -3,7 +3,6 @@ Real Estate Market Data API Integration
 Handles connections to various real estate APIs for US markets with international guidance
 """
 
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -12,6 +11,7 @@ from dataclasses import asdict
 
 from ..shared.interfaces import MarketData, DataRequest, DataValidationResult, DataProvider
 from .api_config import get_market_data_config
+from .http_client_pool import HTTPClientPool, get_http_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ class MarketDataAPI(DataProvider):
     Focused on US real estate data with guidance for international markets
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, http_pool: Optional[HTTPClientPool] = None):
         # Use real API configuration
         self.config = config or get_market_data_config()
         self.timeout = self.config.get('timeout', 30)
@@ -48,20 +48,11 @@ class MarketDataAPI(DataProvider):
         
         logger.info(f"Configured {len(self.endpoints)} market data endpoints")
         
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.http_pool = http_pool or get_http_client_pool()
         self.cache_manager = None  # Will be injected
-        
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create async HTTP session"""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
     
     async def _make_request(self, endpoint: str, endpoint_config: Dict, params: Dict) -> Dict:
         """Make API request with retry logic"""
-        session = await self._get_session()
-        
         headers = {}
         if endpoint_config['key']:
             headers['Authorization'] = f"Bearer {endpoint_config['key']}"
@@ -71,7 +62,8 @@ class MarketDataAPI(DataProvider):
         
         for attempt in range(self.max_retries):
             try:
-                async with session.get(url, params=params, headers=headers) as response:
+                async with self.http_pool.get(url, params=params, headers=headers,
+                                              timeout=self.timeout) as response:
                     if response.status == 200:
                         data = await response.json()
                         logger.info(f"Successfully fetched data from {endpoint} (attempt {attempt + 1})")
@@ -381,22 +373,10 @@ class MarketDataAPI(DataProvider):
     
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-    
-    def __del__(self):
-        """Cleanup on destruction"""
-        if self.session and not self.session.closed:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    loop.run_until_complete(self.close())
-            except Exception:
-                pass  # Ignore cleanup errors
+        await self.http_pool.close()
 
 
-def create_market_data_api(config: Optional[Dict] = None) -> MarketDataAPI:
+def create_market_data_api(config: Optional[Dict] = None,
+                           http_pool: Optional[HTTPClientPool] = None) -> MarketDataAPI:
     """Factory function to create MarketDataAPI instance"""
-    return MarketDataAPI(config)
\ No newline at end of file
+    return MarketDataAPI(config, http_pool)
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Background Interest Rate Refresh
+Keeps a process-wide snapshot of current interest rates fresh out of band
+
+The analysis path never fetches rates itself: it reads the latest snapshot,
+which a long-lived event loop owned by this service refreshes on a schedule.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_TYPES = ['30_year_fixed', '15_year_fixed', 'federal_funds_rate']
+
+# Published rates change at most daily; one refresh an hour matches the feed cache
+DEFAULT_REFRESH_INTERVAL_SECONDS = 3600
+DEFAULT_RETRY_INTERVAL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class RateSnapshot:
+    """Immutable set of rates from one refresh, swapped in atomically"""
+    rates: Dict[str, float] = field(default_factory=dict)
+    fetched_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.rates
+
+    def age_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds since the rates were fetched, or None before the first refresh"""
+        if self.fetched_at is None:
+            return None
+        return ((now or datetime.now()) - self.fetched_at).total_seconds()
+
+
+class RateRefreshService:
+    """
+    Refreshes interest rates on a background event loop
+
+    The service owns one daemon thread running its own asyncio loop, so the
+    pooled HTTP session and feed cache stay warm between refreshes. Rates
+    are fetched every `refresh_interval_seconds` (sooner after a failure)
+    and published as a new RateSnapshot; readers only read the current
+    snapshot reference and never wait on the network.
+    """
+
+    def __init__(self, rate_feeds=None, rate_types: Optional[List[str]] = None,
+                 refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+                 retry_interval_seconds: float = DEFAULT_RETRY_INTERVAL_SECONDS):
+        self.rate_feeds = rate_feeds
+        self.rate_types = list(rate_types or DEFAULT_RATE_TYPES)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.retry_interval_seconds = retry_interval_seconds
+
+        self._snapshot = RateSnapshot()
+        self._first_refresh = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+        # Statistics
+        self.refresh_count = 0
+        self.failure_count = 0
+
+    def get_snapshot(self) -> RateSnapshot:
+        """Latest published snapshot (empty until the first refresh completes)"""
+        return self._snapshot
+
+    def get_rates(self) -> Dict[str, float]:
+        """Copy of the latest published rates"""
+        return dict(self._snapshot.rates)
+
+    def wait_for_first_refresh(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first refresh attempt has finished"""
+        return self._first_refresh.wait(timeout)
+
+    async def refresh(self) -> RateSnapshot:
+        """
+        Fetch rates once and publish them
+
+        A failed fetch keeps the previous rates and records the error.
+        """
+        if self.rate_feeds is None:
+            from .interest_rate_feeds import create_interest_rate_feeds
+            self.rate_feeds = create_interest_rate_feeds()
+
+        try:
+            rates = await self.rate_feeds.get_current_rates(self.rate_types)
+            self._snapshot = RateSnapshot(rates=dict(rates), fetched_at=datetime.now())
+            self.refresh_count += 1
+            logger.debug(f"Refreshed interest rates: {rates}")
+        except Exception as e:
+            previous = self._snapshot
+            self._snapshot = RateSnapshot(rates=previous.rates, fetched_at=previous.fetched_at, error=str(e))
+            self.failure_count += 1
+            logger.warning(f"Interest rate refresh failed: {e}")
+        finally:
+            self._first_refresh.set()
+        return self._snapshot
+
+    def refresh_now(self) -> None:
+        """Ask the background loop to refresh without waiting for the schedule"""
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _refresh_loop(self):
+        self._wake = asyncio.Event()
+        while not self._stopping:
+            snapshot = await self.refresh()
+            interval = self.retry_interval_seconds if snapshot.error else self.refresh_interval_seconds
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._refresh_loop())
+            # Close this loop's pooled HTTP session before the loop goes away
+            from .http_client_pool import close_http_client_pool
+            loop.run_until_complete(close_http_client_pool())
+        except Exception as e:
+            logger.error(f"Interest rate refresh loop stopped: {e}")
+        finally:
+            self._loop = None
+            loop.close()
+
+    def start(self) -> None:
+        """Start the background refresh thread"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="interest-rate-refresh", daemon=True)
+            self._thread.start()
+        logger.info(f"Started interest rate refresh every {self.refresh_interval_seconds:.0f}s")
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop the background refresh thread"""
+        with self._lock:
+            thread = self._thread
+            self._stopping = True
+        self.refresh_now()
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Service statistics"""
+        snapshot = self._snapshot
+        return {
+            'running': self.is_running,
+            'rate_types': self.rate_types,
+            'fetched_at': snapshot.fetched_at.isoformat() if snapshot.fetched_at else None,
+            'last_error': snapshot.error,
+            'refresh_count': self.refresh_count,
+            'failure_count': self.failure_count
+        }
+
+
+# Global instance
+_rate_refresh_service = None
+_rate_refresh_service_lock = threading.Lock()
+
+
+def create_rate_refresh_service(rate_feeds=None, rate_types: Optional[List[str]] = None,
+                                refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS) -> RateRefreshService:
+    """Factory function to create RateRefreshService instance"""
+    return RateRefreshService(rate_feeds, rate_types, refresh_interval_seconds)
+
+
+def get_rate_refresh_service() -> RateRefreshService:
+    """Get the process-wide rate refresh service, starting it on first use"""
+    global _rate_refresh_service
+    with _rate_refresh_service_lock:
+        if _rate_refresh_service is None:
+            _rate_refresh_service = create_rate_refresh_service()
+            _rate_refresh_service.start()
+        return _rate_refresh_service
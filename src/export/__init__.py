@@ -18,42 +18,58 @@ Export Process Flow:
 Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
-try:
-    from .file_manager import FileManager, ExportFile
-    FILE_MANAGER_AVAILABLE = True
-except ImportError:
-    FILE_MANAGER_AVAILABLE = False
-
-try:
-    from .validation import validate_export_data, ExportValidationError
-    VALIDATION_AVAILABLE = True
-except ImportError:
-    VALIDATION_AVAILABLE = False
-
-try:
-    from .pdf_integration import PDFExportManager
-    PDF_INTEGRATION_AVAILABLE = True
-except ImportError:
-    PDF_INTEGRATION_AVAILABLE = False
-
-try:
-    from .streamlit_integration import ExcelExportManager
-    EXCEL_INTEGRATION_AVAILABLE = True
-except ImportError:
-    EXCEL_INTEGRATION_AVAILABLE = False
+import importlib
+
+# Public names and the submodule each is loaded from. Submodules import on
+# first attribute access, so importing the package stays cheap and the heavy
+# libraries (openpyxl, reportlab, plotly/kaleido, PIL) load only when an
+# export actually runs.
+_LAZY_EXPORTS = {
+    'FileManager': '.file_manager',
+    'ExportFile': '.file_manager',
+    'ExportJob': '.export_queue',
+    'ExportJobQueue': '.export_queue',
+    'ExportJobStatus': '.export_queue',
+    'get_export_job_queue': '.export_queue',
+    'ReportModel': '.report_model',
+    'get_report_model': '.report_model',
+    'generate_all_formats': '.report_model',
+    'write_csv_report': '.csv_export',
+    'validate_export_data': '.validation',
+    'ExportValidationError': '.validation',
+    'PDFExportManager': '.pdf_integration',
+    'ExcelExportManager': '.streamlit_integration',
+}
+
+# Availability flags, resolved by importing their submodule when first read
+_AVAILABILITY_FLAGS = {
+    'FILE_MANAGER_AVAILABLE': '.file_manager',
+    'EXPORT_QUEUE_AVAILABLE': '.export_queue',
+    'REPORT_MODEL_AVAILABLE': '.csv_export',
+    'VALIDATION_AVAILABLE': '.validation',
+    'PDF_INTEGRATION_AVAILABLE': '.pdf_integration',
+    'EXCEL_INTEGRATION_AVAILABLE': '.streamlit_integration',
+}
 
 __version__ = "1.0.0"
-__all__ = []
+__all__ = list(_LAZY_EXPORTS)
+
 
-# Add available components to __all__
-if FILE_MANAGER_AVAILABLE:
-    __all__.extend(['FileManager', 'ExportFile'])
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    elif name in _AVAILABILITY_FLAGS:
+        try:
+            importlib.import_module(_AVAILABILITY_FLAGS[name], __name__)
+            value = True
+        except ImportError:
+            value = False
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-if VALIDATION_AVAILABLE:
-    __all__.extend(['validate_export_data', 'ExportValidationError'])
+    globals()[name] = value
+    return value
 
-if PDF_INTEGRATION_AVAILABLE:
-    __all__.append('PDFExportManager')
 
-if EXCEL_INTEGRATION_AVAILABLE:
-    __all__.append('ExcelExportManager')
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_AVAILABILITY_FLAGS))
@@ -0,0 +1,239 @@
+"""
+Chart Image Cache
+Content-addressed on-disk cache of rendered export charts
+
+This module provides:
+- Cache keys derived from the full figure spec and render settings
+- Disk storage shared by Excel and PDF exports
+- Least-recently-used eviction bounded by total bytes
+
+A chart is only rendered when no export has produced the same image
+before, so re-downloading a report or switching templates with unchanged
+inputs reuses the existing images.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import plotly
+    from plotly.utils import PlotlyJSONEncoder
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate images rendered by earlier versions of the chart code
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "real_estate_chart_cache"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+def chart_cache_key(figure: Any, width: int, height: int, format: str = 'png', scale: float = 1.0) -> str:
+    """
+    Hash a figure spec together with its render settings
+
+    Args:
+        figure: Plotly figure or figure dict
+        width: Image width in pixels (derived from the requested DPI)
+        height: Image height in pixels (derived from the requested DPI)
+        format: Image format
+        scale: Render scale factor
+
+    Returns:
+        Hex digest identifying the rendered image
+    """
+    figure_dict = figure.to_dict() if hasattr(figure, 'to_dict') else figure
+    spec = {
+        'version': CACHE_FORMAT_VERSION,
+        'plotly': plotly.__version__ if PLOTLY_AVAILABLE else None,
+        'figure': figure_dict,
+        'width': width,
+        'height': height,
+        'format': format,
+        'scale': scale
+    }
+    encoder = PlotlyJSONEncoder if PLOTLY_AVAILABLE else None
+    payload = json.dumps(spec, cls=encoder, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChartImageCache:
+    """
+    Disk-backed LRU cache of rendered chart images
+
+    Entries are files named by their content key. The recency index is kept
+    in memory and rebuilt from file modification times on startup, so the
+    cache survives restarts of the app.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize chart image cache
+
+        Args:
+            cache_dir: Directory holding cached images
+            max_bytes: Total size of cached images before the oldest are evicted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._entries: 'OrderedDict[str, int]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    def _path(self, key: str, format: str) -> Path:
+        return self.cache_dir / f"{key}.{format}"
+
+    def _load_index(self) -> None:
+        """Index existing images, least recently used first"""
+        files = [
+            (path.stat(), path.name) for path in self.cache_dir.iterdir()
+            if path.is_file() and not path.name.startswith('.')
+        ]
+        for stat, name in sorted(files, key=lambda item: item[0].st_mtime):
+            self._entries[name] = stat.st_size
+            self._total_bytes += stat.st_size
+
+        with self._lock:
+            self._evict()
+
+        if self._entries:
+            logger.debug(f"Chart cache loaded {len(self._entries)} images ({self._total_bytes} bytes)")
+
+    def read(self, key: str, format: str) -> Optional[bytes]:
+        """Cached image bytes, or None on a miss"""
+        return self._fetch(key, format, lambda path: path.read_bytes())
+
+    def copy_to(self, key: str, format: str, output_path: Union[str, Path]) -> bool:
+        """
+        Copy a cached image to output_path
+
+        Returns:
+            True on a cache hit
+        """
+        def copy(path: Path) -> bool:
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, output)
+            return True
+
+        return self._fetch(key, format, copy) is not None
+
+    def _fetch(self, key: str, format: str, load: Callable[[Path], Any]) -> Any:
+        """Load a cached image with `load`, updating recency and hit statistics"""
+        path = self._path(key, format)
+        with self._lock:
+            if path.name not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path.name)
+
+        try:
+            result = load(path)
+            os.utime(path)
+        except OSError as e:
+            # Removed behind our back - forget it and render again
+            logger.debug(f"Chart cache entry {path.name} unreadable: {e}")
+            with self._lock:
+                self._discard(path.name)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, format: str, image_bytes: bytes) -> None:
+        """Store a rendered image, evicting least recently used images if over budget"""
+        if len(image_bytes) > self.max_bytes:
+            return
+
+        path = self._path(key, format)
+        try:
+            # Write then rename so concurrent readers never see a partial image
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.', suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(image_bytes)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache chart image: {e}")
+            return
+
+        with self._lock:
+            self._discard(path.name)
+            self._entries[path.name] = len(image_bytes)
+            self._total_bytes += len(image_bytes)
+            self._evict()
+
+    def _discard(self, name: str, unlink: bool = False) -> None:
+        size = self._entries.pop(name, None)
+        if size is None:
+            return
+        self._total_bytes -= size
+        if unlink:
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        """Drop least recently used images until within budget (lock held)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            name = next(iter(self._entries))
+            self._discard(name, unlink=True)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached image"""
+        with self._lock:
+            for name in list(self._entries):
+                self._discard(name, unlink=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
+
+
+# Global instance
+_chart_image_cache = None
+_chart_image_cache_lock = threading.Lock()
+
+
+def get_chart_image_cache() -> ChartImageCache:
+    """Get the process-wide chart image cache"""
+    global _chart_image_cache
+    with _chart_image_cache_lock:
+        if _chart_image_cache is None:
+            _chart_image_cache = ChartImageCache()
+        return _chart_image_cache
@@ -0,0 +1,309 @@
+"""
+Chart Rendering Service
+Parallel static image rendering for Excel and PDF exports
+
+This module provides:
+- A warm pool of Kaleido renderers, each with its own long-lived subprocess
+- Concurrent rendering of all figures in an export, batched per renderer
+- Fallback to Plotly's shared renderer when Kaleido scopes are unavailable
+- Reuse of previously rendered images through the chart image cache
+- Rendering to in-memory image bytes for exports that never touch disk
+
+Each Kaleido scope drives a single Chromium subprocess and serializes calls
+to it, so Plotly's process-wide scope renders one figure at a time and pays
+subprocess startup on first use. The pool keeps several scopes running and
+feeds them from threads; the Python side only waits on subprocess I/O, so
+renders proceed in parallel.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import plotly.io as pio
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+    logging.warning("Plotly not available - chart rendering will be disabled")
+
+try:
+    from kaleido.scopes.plotly import PlotlyScope
+    KALEIDO_SCOPES_AVAILABLE = PLOTLY_AVAILABLE and pio.kaleido.scope is not None
+except ImportError:
+    KALEIDO_SCOPES_AVAILABLE = False
+
+from .chart_cache import ChartImageCache, chart_cache_key, get_chart_image_cache
+
+logger = logging.getLogger(__name__)
+
+# Smallest possible render, used to start a renderer subprocess
+_WARMUP_FIGURE = {'data': [], 'layout': {}}
+
+
+@dataclass
+class ChartRenderJob:
+    """A figure to render to a static image file (or to memory when output_path is None)"""
+    name: str
+    figure: Any  # plotly Figure or figure dict
+    output_path: Optional[Path]
+    width: int
+    height: int
+    format: str = 'png'
+    scale: float = 1.0
+
+
+def _create_scope() -> 'PlotlyScope':
+    """New Kaleido scope configured like Plotly's own (bundled plotly.js, MathJax, topojson)"""
+    shared_scope = pio.kaleido.scope
+    return PlotlyScope(
+        plotlyjs=shared_scope.plotlyjs,
+        mathjax=shared_scope.mathjax,
+        topojson=shared_scope.topojson,
+        mapbox_access_token=shared_scope.mapbox_access_token
+    )
+
+
+class _PlotlyRenderer:
+    """Fallback renderer using Plotly's process-wide Kaleido scope"""
+
+    def transform(self, figure: Any, format: str, width: int, height: int, scale: float) -> bytes:
+        return pio.to_image(figure, format=format, width=width, height=height, scale=scale)
+
+    def _shutdown_kaleido(self) -> None:
+        pass
+
+
+class ChartRenderingService:
+    """
+    Renders export figures concurrently on a pool of warm renderers
+
+    Jobs are split into one batch per renderer; each batch renders on a
+    worker thread that checks a renderer out of the pool. Renderers are
+    started on first use (or by warmup) and kept alive between exports.
+    With an image cache, figures rendered before are copied from the cache
+    and never reach a renderer.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, use_pool: bool = True,
+                 image_cache: Optional[ChartImageCache] = None):
+        """
+        Initialize chart rendering service
+
+        Args:
+            max_workers: Concurrent renderers (defaults to min(4, CPU count + 1))
+            use_pool: Use dedicated Kaleido scopes; False renders through Plotly's shared scope
+            image_cache: Cache of rendered images (no caching if None)
+        """
+        self.use_pool = use_pool and KALEIDO_SCOPES_AVAILABLE
+        self.max_workers = (max_workers or min(4, (os.cpu_count() or 1) + 1)) if self.use_pool else 1
+
+        self._renderers: 'queue.Queue' = queue.Queue()
+        self._renderers_created = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.image_cache = image_cache
+
+        # Statistics
+        self.charts_rendered = 0
+        self.render_failures = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='chart-render')
+            return self._executor
+
+    def _checkout_renderer(self):
+        """Take an idle renderer, creating one if the pool is not yet full"""
+        try:
+            return self._renderers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._renderers_created < self.max_workers
+            if create:
+                self._renderers_created += 1
+        if create:
+            renderer = _create_scope() if self.use_pool else _PlotlyRenderer()
+            logger.debug(f"Started chart renderer {self._renderers_created}/{self.max_workers}")
+            return renderer
+
+        return self._renderers.get()
+
+    def _render_batch(self, jobs: List[ChartRenderJob]) -> List[Tuple[str, Optional[str], Optional[bytes]]]:
+        """
+        Render a batch of figures on one renderer (runs on a worker thread)
+
+        Returns:
+            List of (chart name, error message or None, image bytes for in-memory jobs)
+        """
+        renderer = None
+        results = []
+        try:
+            for job in jobs:
+                try:
+                    figure = job.figure.to_dict() if hasattr(job.figure, 'to_dict') else job.figure
+
+                    cache_key = None
+                    if self.image_cache is not None:
+                        cache_key = chart_cache_key(figure, job.width, job.height, job.format, job.scale)
+                        if job.output_path is None:
+                            cached = self.image_cache.read(cache_key, job.format)
+                            if cached is not None:
+                                results.append((job.name, None, cached))
+                                continue
+                        elif self.image_cache.copy_to(cache_key, job.format, job.output_path):
+                            results.append((job.name, None, None))
+                            continue
+
+                    # Only take a renderer once a batch has something to render
+                    if renderer is None:
+                        renderer = self._checkout_renderer()
+                    image_bytes = renderer.transform(
+                        figure, format=job.format, width=job.width, height=job.height, scale=job.scale
+                    )
+                    if cache_key is not None:
+                        self.image_cache.put(cache_key, job.format, image_bytes)
+
+                    if job.output_path is None:
+                        results.append((job.name, None, image_bytes))
+                        continue
+                    output_path = Path(job.output_path)
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_path.write_bytes(image_bytes)
+                    results.append((job.name, None, None))
+                except Exception as e:
+                    results.append((job.name, str(e), None))
+        finally:
+            if renderer is not None:
+                self._renderers.put(renderer)
+        return results
+
+    def _warm_renderer(self) -> None:
+        renderer = self._checkout_renderer()
+        try:
+            renderer.transform(_WARMUP_FIGURE, format='png', width=10, height=10, scale=1)
+        except Exception as e:
+            logger.warning(f"Chart renderer warmup failed: {e}")
+        finally:
+            self._renderers.put(renderer)
+
+    async def warmup(self) -> None:
+        """Start every renderer subprocess ahead of the first export"""
+        if not PLOTLY_AVAILABLE:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        missing = self.max_workers - self._renderers_created
+        await asyncio.gather(*[loop.run_in_executor(executor, self._warm_renderer) for _ in range(missing)])
+
+    async def render(self, jobs: List[ChartRenderJob]) -> Dict[str, Path]:
+        """
+        Render figures to image files concurrently
+
+        Args:
+            jobs: Figures with their output paths and pixel dimensions
+
+        Returns:
+            Dictionary mapping chart names to image paths (failed charts omitted)
+        """
+        paths = {job.name: Path(job.output_path) for job in jobs}
+        return {name: paths[name] for name in await self._run(jobs)}
+
+    async def render_images(self, jobs: List[ChartRenderJob]) -> Dict[str, bytes]:
+        """
+        Render figures to in-memory image bytes concurrently
+
+        Args:
+            jobs: Figures with their pixel dimensions (output paths are ignored)
+
+        Returns:
+            Dictionary mapping chart names to image bytes (failed charts omitted)
+        """
+        in_memory_jobs = [replace(job, output_path=None) for job in jobs]
+        return await self._run(in_memory_jobs)
+
+    async def _run(self, jobs: List[ChartRenderJob]) -> Dict[str, Optional[bytes]]:
+        """Render jobs across the pool; maps successful chart names to in-memory bytes (None if written to disk)"""
+        if not PLOTLY_AVAILABLE or not jobs:
+            return {}
+
+        # Round-robin so each renderer gets a similar share of the figures
+        batches = [jobs[i::self.max_workers] for i in range(min(self.max_workers, len(jobs)))]
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        results = await asyncio.gather(
+            *[loop.run_in_executor(executor, self._render_batch, batch) for batch in batches]
+        )
+
+        rendered = {}
+        for name, error, image_bytes in (result for batch in results for result in batch):
+            if error is None:
+                rendered[name] = image_bytes
+            else:
+                logger.error(f"Error rendering chart {name}: {error}")
+                self.render_failures += 1
+
+        self.charts_rendered += len(rendered)
+        logger.debug(f"Rendered {len(rendered)}/{len(jobs)} charts across {len(batches)} renderers")
+        return rendered
+
+    def shutdown(self) -> None:
+        """Stop the renderer subprocesses and worker threads"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        while True:
+            try:
+                self._renderers.get_nowait()._shutdown_kaleido()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._renderers_created = 0
+        logger.info("Chart rendering pool stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Rendering statistics"""
+        return {
+            'max_workers': self.max_workers,
+            'dedicated_renderers': self.use_pool,
+            'renderers_started': self._renderers_created,
+            'charts_rendered': self.charts_rendered,
+            'render_failures': self.render_failures,
+            'image_cache': self.image_cache.get_stats() if self.image_cache is not None else None
+        }
+
+
+# Global instance
+_chart_rendering_service = None
+_chart_rendering_service_lock = threading.Lock()
+
+
+def get_chart_rendering_service() -> ChartRenderingService:
+    """Get the process-wide chart rendering service"""
+    global _chart_rendering_service
+    with _chart_rendering_service_lock:
+        if _chart_rendering_service is None:
+            _chart_rendering_service = ChartRenderingService(image_cache=get_chart_image_cache())
+        return _chart_rendering_service
+
+
+def shutdown_chart_rendering_service() -> None:
+    """Stop the process-wide chart rendering pool"""
+    if _chart_rendering_service is not None:
+        _chart_rendering_service.shutdown()
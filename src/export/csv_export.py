@@ -0,0 +1,63 @@
+"""
+CSV Export
+Plain-text report of the analysis summary and annual cash flows
+
+Writes from the shared report model, so a CSV download alongside Excel
+and PDF reuses the same prepared data.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import csv
+import io
+import logging
+
+from .report_model import ReportModel
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_LABELS = [
+    ('recommendation', 'Recommendation'),
+    ('confidence', 'Confidence'),
+    ('ownership_npv', 'Ownership NPV'),
+    ('rental_npv', 'Rental NPV'),
+    ('npv_difference', 'NPV Difference'),
+    ('ownership_initial_investment', 'Ownership Initial Investment'),
+    ('rental_initial_investment', 'Rental Initial Investment'),
+    ('analysis_period', 'Analysis Period (years)'),
+    ('cost_of_capital', 'Cost of Capital (%)'),
+]
+
+CASH_FLOW_HEADERS = [
+    'Year',
+    'Ownership Cash Flow',
+    'Rental Cash Flow',
+    'Annual Difference',
+    'Cumulative Difference'
+]
+
+
+def write_csv_report(model: ReportModel) -> bytes:
+    """
+    Write the summary metrics followed by the cash flow comparison
+
+    Args:
+        model: Prepared report model
+
+    Returns:
+        UTF-8 encoded CSV content
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    writer.writerow(['Metric', 'Value'])
+    for key, label in SUMMARY_LABELS:
+        writer.writerow([label, model.summary_metrics.get(key, '')])
+
+    writer.writerow([])
+    writer.writerow(CASH_FLOW_HEADERS)
+    for year, owned, rented, difference, cumulative in model.comparison_rows:
+        writer.writerow([year, round(owned, 2), round(rented, 2), round(difference, 2), round(cumulative, 2)])
+
+    logger.debug(f"CSV report written with {len(model.comparison_rows)} years")
+    return output.getvalue().encode('utf-8')
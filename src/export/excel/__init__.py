@@ -16,18 +16,36 @@ Technical Features:
 - Print-ready layouts with proper page breaks
 - Chart embedding with underlying data tables
 - Formula preservation for user analysis
+- Streaming write mode for large exports in bounded memory
+- Portfolio workbooks covering many site analyses
 
 Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
-from .excel_generator import ExcelGenerator
-from .chart_embedding import ChartEmbedder
-from .data_formatting import ExcelFormatter
-from .template_manager import ExcelTemplateManager
-
-__all__ = [
-    'ExcelGenerator',
-    'ChartEmbedder', 
-    'ExcelFormatter',
-    'ExcelTemplateManager'
-]
\ No newline at end of file
+import importlib
+
+# Submodules import on first attribute access; openpyxl, xlsxwriter and
+# Plotly load only when a workbook or chart is actually built
+_LAZY_EXPORTS = {
+    'ExcelGenerator': '.excel_generator',
+    'ChartEmbedder': '.chart_embedding',
+    'ExcelFormatter': '.data_formatting',
+    'ExcelTemplateManager': '.template_manager',
+    'StreamingWorkbookWriter': '.streaming_workbook',
+    'PortfolioWorkbookWriter': '.portfolio_workbook',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
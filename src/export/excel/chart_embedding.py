@@ -23,7 +23,6 @@ import base64
 # Chart rendering imports
 try:
     import plotly.graph_objects as go
-    import plotly.express as px
     from plotly.subplots import make_subplots
     import plotly.io as pio
     PLOTLY_AVAILABLE = True
@@ -31,12 +30,8 @@ except ImportError:
     PLOTLY_AVAILABLE = False
     logging.warning("Plotly not available - chart embedding will be limited")
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    logging.warning("Pandas not available - some chart data processing may be limited")
+from ..chart_rendering import ChartRenderingService, ChartRenderJob, get_chart_rendering_service
+from ..report_model import extract_cash_flows
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +44,14 @@ class ChartEmbedder:
     images suitable for embedding in Excel workbooks.
     """
     
-    def __init__(self):
-        """Initialize chart embedder with optimal settings"""
+    def __init__(self, rendering_service: Optional[ChartRenderingService] = None):
+        """
+        Initialize chart embedder with optimal settings
+        
+        Args:
+            rendering_service: Parallel renderer (shared process-wide service if None)
+        """
+        self.rendering_service = rendering_service or get_chart_rendering_service()
         self.default_width = 1200
         self.default_height = 800
         self.default_dpi = 300
@@ -66,15 +67,20 @@ class ChartEmbedder:
         self, 
         export_data: Dict[str, Any], 
         resolution: int = 300,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        chart_names: Optional[List[str]] = None
     ) -> Dict[str, Path]:
         """
         Render all charts from export data to image files
         
+        Figures are built first and then rendered concurrently by the
+        chart rendering service.
+        
         Args:
             export_data: Complete export data with analysis results
             resolution: Output resolution in DPI
             output_dir: Directory for output images (temp dir if None)
+            chart_names: Specific charts to render (all if None)
             
         Returns:
             Dictionary mapping chart names to image file paths
@@ -91,36 +97,11 @@ class ChartEmbedder:
             output_dir = temp_base_dir / "charts"
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Extract chart data
-        chart_images = {}
-        
         try:
-            # Render NPV comparison chart
-            npv_chart_path = await self.render_npv_comparison_chart(
-                export_data, output_dir, resolution
-            )
-            if npv_chart_path:
-                chart_images['npv_comparison'] = npv_chart_path
-            
-            # Render cash flow charts
-            cash_flow_charts = await self.render_cash_flow_charts(
-                export_data, output_dir, resolution
-            )
-            chart_images.update(cash_flow_charts)
-            
-            # Render financial metrics chart
-            metrics_chart_path = await self.render_financial_metrics_chart(
-                export_data, output_dir, resolution
-            )
-            if metrics_chart_path:
-                chart_images['financial_metrics'] = metrics_chart_path
-            
-            # Render assumption sensitivity chart
-            sensitivity_chart_path = await self.render_sensitivity_chart(
-                export_data, output_dir, resolution
+            figures = self.build_all_figures(export_data, chart_names)
+            chart_images = await self.rendering_service.render(
+                self._build_render_jobs(figures, resolution, output_dir)
             )
-            if sensitivity_chart_path:
-                chart_images['sensitivity_analysis'] = sensitivity_chart_path
             
             logger.info(f"Successfully rendered {len(chart_images)} charts")
             
@@ -128,7 +109,93 @@ class ChartEmbedder:
             logger.error(f"Error during chart rendering: {str(e)}")
             raise
         
-        return chart_images
+        # Preserve the standard chart order regardless of completion order
+        return {name: chart_images[name] for name in figures if name in chart_images}
+    
+    async def render_all_chart_images(
+        self,
+        export_data: Dict[str, Any],
+        resolution: int = 300,
+        chart_names: Optional[List[str]] = None
+    ) -> Dict[str, bytes]:
+        """
+        Render all charts from export data to in-memory PNG bytes
+        
+        Args:
+            export_data: Complete export data with analysis results
+            resolution: Output resolution in DPI
+            chart_names: Specific charts to render (all if None)
+            
+        Returns:
+            Dictionary mapping chart names to PNG bytes
+        """
+        if not PLOTLY_AVAILABLE:
+            logger.warning("Plotly not available - cannot render charts")
+            return {}
+        
+        figures = self.build_all_figures(export_data, chart_names)
+        chart_images = await self.rendering_service.render_images(
+            self._build_render_jobs(figures, resolution, output_dir=None)
+        )
+        
+        logger.info(f"Rendered {len(chart_images)} charts in memory at {resolution} DPI")
+        return {name: chart_images[name] for name in figures if name in chart_images}
+    
+    def _build_render_jobs(
+        self,
+        figures: Dict[str, 'go.Figure'],
+        resolution: int,
+        output_dir: Optional[Path]
+    ) -> List[ChartRenderJob]:
+        """Render jobs for figures at the standard chart size (in memory if output_dir is None)"""
+        width_px, height_px = self._pixel_dimensions(resolution)
+        return [
+            ChartRenderJob(
+                name=chart_name,
+                figure=fig,
+                output_path=output_dir / f"{chart_name}.png" if output_dir is not None else None,
+                width=width_px,
+                height=height_px
+            )
+            for chart_name, fig in figures.items()
+        ]
+    
+    def build_all_figures(
+        self,
+        export_data: Dict[str, Any],
+        chart_names: Optional[List[str]] = None
+    ) -> Dict[str, 'go.Figure']:
+        """
+        Build all export figures without rendering them
+        
+        Args:
+            export_data: Complete export data with analysis results
+            chart_names: Specific charts to build (all if None)
+            
+        Returns:
+            Dictionary mapping chart names to Plotly figures
+        """
+        def wanted(*names: str) -> bool:
+            return chart_names is None or any(name in chart_names for name in names)
+        
+        figures = {}
+        
+        if wanted('npv_comparison'):
+            figures['npv_comparison'] = self.build_npv_comparison_figure(export_data)
+        
+        if wanted('annual_cash_flows', 'cumulative_cash_flows'):
+            figures.update(self.build_cash_flow_figures(export_data))
+        
+        if wanted('financial_metrics'):
+            figures['financial_metrics'] = self.build_financial_metrics_figure(export_data)
+        
+        if wanted('sensitivity_analysis'):
+            figures['sensitivity_analysis'] = self.build_sensitivity_figure(export_data)
+        
+        return {
+            name: fig for name, fig in figures.items()
+            if fig is not None and (chart_names is None or name in chart_names)
+        }
     
     async def render_npv_comparison_chart(
         self,
@@ -137,6 +204,14 @@ class ChartEmbedder:
         resolution: int
     ) -> Optional[Path]:
         """Render NPV comparison bar chart"""
+        fig = self.build_npv_comparison_figure(export_data)
+        if fig is None:
+            return None
+        
+        return await self._save_chart_or_none(fig, output_dir / "npv_comparison.png", resolution)
+    
+    def build_npv_comparison_figure(self, export_data: Dict[str, Any]) -> Optional['go.Figure']:
+        """Build NPV comparison bar chart"""
         
         try:
             analysis_results = export_data.get('analysis_results', {})
@@ -216,11 +291,7 @@ class ChartEmbedder:
                     borderpad=8
                 )
             
-            # Save chart
-            output_path = output_dir / "npv_comparison.png"
-            await self._save_chart(fig, output_path, resolution)
-            
-            return output_path
+            return fig
             
         except Exception as e:
             logger.error(f"Error rendering NPV comparison chart: {str(e)}")
@@ -233,9 +304,20 @@ class ChartEmbedder:
         resolution: int
     ) -> Dict[str, Path]:
         """Render cash flow analysis charts"""
-        
         chart_paths = {}
         
+        for chart_name, fig in self.build_cash_flow_figures(export_data).items():
+            chart_path = await self._save_chart_or_none(fig, output_dir / f"{chart_name}.png", resolution)
+            if chart_path:
+                chart_paths[chart_name] = chart_path
+        
+        return chart_paths
+    
+    def build_cash_flow_figures(self, export_data: Dict[str, Any]) -> Dict[str, 'go.Figure']:
+        """Build annual and cumulative cash flow charts"""
+        
+        figures = {}
+        
         try:
             ownership_flows = export_data.get('ownership_flows', {})
             rental_flows = export_data.get('rental_flows', {})
@@ -246,7 +328,7 @@ class ChartEmbedder:
             
             if not ownership_annual or not rental_annual:
                 logger.warning("Insufficient cash flow data for chart rendering")
-                return chart_paths
+                return figures
             
             # Ensure both arrays are same length
             max_years = max(len(ownership_annual), len(rental_annual))
@@ -305,10 +387,7 @@ class ChartEmbedder:
                 height=520
             )
             
-            # Save annual cash flows chart
-            annual_path = output_dir / "annual_cash_flows.png"
-            await self._save_chart(annual_fig, annual_path, resolution)
-            chart_paths['annual_cash_flows'] = annual_path
+            figures['annual_cash_flows'] = annual_fig
             
             # Cumulative cash flows
             ownership_cumulative = [sum(ownership_annual[:i+1]) for i in range(len(ownership_annual))]
@@ -323,7 +402,7 @@ class ChartEmbedder:
                 name='Ownership (Cumulative)',
                 line=dict(color='#FF6B6B', width=3),
                 marker=dict(size=6),
-                fill='tonexty' if len(chart_paths) == 0 else None
+                fill=None
             ))
             
             cumulative_fig.add_trace(go.Scatter(
@@ -367,15 +446,12 @@ class ChartEmbedder:
                 height=520
             )
             
-            # Save cumulative cash flows chart
-            cumulative_path = output_dir / "cumulative_cash_flows.png"
-            await self._save_chart(cumulative_fig, cumulative_path, resolution)
-            chart_paths['cumulative_cash_flows'] = cumulative_path
+            figures['cumulative_cash_flows'] = cumulative_fig
             
         except Exception as e:
             logger.error(f"Error rendering cash flow charts: {str(e)}")
         
-        return chart_paths
+        return figures
     
     async def render_financial_metrics_chart(
         self,
@@ -384,6 +460,14 @@ class ChartEmbedder:
         resolution: int
     ) -> Optional[Path]:
         """Render key financial metrics comparison chart"""
+        fig = self.build_financial_metrics_figure(export_data)
+        if fig is None:
+            return None
+        
+        return await self._save_chart_or_none(fig, output_dir / "financial_metrics.png", resolution)
+    
+    def build_financial_metrics_figure(self, export_data: Dict[str, Any]) -> Optional['go.Figure']:
+        """Build key financial metrics comparison chart"""
         
         try:
             analysis_results = export_data.get('analysis_results', {})
@@ -461,11 +545,7 @@ class ChartEmbedder:
             fig.update_yaxes(title_text="Amount ($)", tickformat="$,.0f", row=1, col=2)
             fig.update_yaxes(title_text="Rate (%)", tickformat=".1f", row=1, col=3)
             
-            # Save chart
-            output_path = output_dir / "financial_metrics.png"
-            await self._save_chart(fig, output_path, resolution)
-            
-            return output_path
+            return fig
             
         except Exception as e:
             logger.error(f"Error rendering financial metrics chart: {str(e)}")
@@ -478,6 +558,14 @@ class ChartEmbedder:
         resolution: int
     ) -> Optional[Path]:
         """Render sensitivity analysis chart (placeholder for future implementation)"""
+        fig = self.build_sensitivity_figure(export_data)
+        if fig is None:
+            return None
+        
+        return await self._save_chart_or_none(fig, output_dir / "sensitivity_analysis.png", resolution)
+    
+    def build_sensitivity_figure(self, export_data: Dict[str, Any]) -> Optional['go.Figure']:
+        """Build sensitivity analysis chart (placeholder for future implementation)"""
         
         try:
             # For now, create a simple placeholder chart
@@ -535,11 +623,7 @@ class ChartEmbedder:
             # Add vertical line at x=0
             fig.add_vline(x=0, line_dash="dash", line_color="gray")
             
-            # Save chart
-            output_path = output_dir / "sensitivity_analysis.png"
-            await self._save_chart(fig, output_path, resolution)
-            
-            return output_path
+            return fig
             
         except Exception as e:
             logger.error(f"Error rendering sensitivity chart: {str(e)}")
@@ -565,10 +649,7 @@ class ChartEmbedder:
             # Ensure the output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Calculate pixel dimensions based on DPI
-            # Optimized size: 10x6.5 inches for better Excel integration
-            width_px = int(10 * resolution)
-            height_px = int(6.5 * resolution)
+            width_px, height_px = self._pixel_dimensions(resolution)
             
             if format.lower() == 'png':
                 fig.write_image(
@@ -609,6 +690,20 @@ class ChartEmbedder:
             logger.error(f"Error saving chart to {output_path}: {str(e)}")
             raise
     
+    async def _save_chart_or_none(self, fig: 'go.Figure', output_path: Path, resolution: int) -> Optional[Path]:
+        """Save a single chart, returning None instead of raising on failure"""
+        try:
+            await self._save_chart(fig, output_path, resolution)
+            return output_path
+        except Exception as e:
+            logger.error(f"Error rendering chart {output_path.stem}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _pixel_dimensions(resolution: int) -> Tuple[int, int]:
+        """Pixel dimensions for the optimized 10x6.5 inch chart size at the given DPI"""
+        return int(10 * resolution), int(6.5 * resolution)
+    
     def get_chart_info(self, chart_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get information about charts that can be generated
@@ -669,20 +764,4 @@ class ChartEmbedder:
         Returns:
             List of cash flow values
         """
-        if isinstance(flows_data, list):
-            # List of flow dictionaries - extract 'net_cash_flow' values
-            return [
-                flow.get('net_cash_flow', 0) if isinstance(flow, dict) else float(flow)
-                for flow in flows_data
-            ]
-        elif isinstance(flows_data, dict):
-            if 'annual_cash_flows' in flows_data:
-                # Dictionary format with 'annual_cash_flows' key
-                annual_flows = flows_data['annual_cash_flows']
-                if isinstance(annual_flows, list):
-                    return [float(flow) for flow in annual_flows]
-            # If dict doesn't have expected structure, return empty list
-            return []
-        else:
-            # Unsupported format
-            return []
\ No newline at end of file
+        return extract_cash_flows(flows_data)
\ No newline at end of file
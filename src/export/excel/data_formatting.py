@@ -15,12 +15,13 @@ Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, date
-import pandas as pd
 
 from openpyxl.styles import Font, Fill, PatternFill, Border, Side, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+from ..report_model import extract_cash_flows
+
 logger = logging.getLogger(__name__)
 
 
@@ -276,18 +277,27 @@ class ExcelFormatter:
             }
         }
     
-    async def format_mortgage_schedule(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    async def format_mortgage_schedule(
+        self,
+        analysis_results: Dict[str, Any],
+        amortization_schedule: Optional[List[Dict[str, float]]] = None
+    ) -> Dict[str, Any]:
         """
         Format mortgage amortization schedule for Excel
         
         Args:
             analysis_results: Analysis results containing mortgage details
+            amortization_schedule: Annual schedule from the analysis bundle; when
+                given it is used as-is instead of being estimated
             
         Returns:
             Formatted mortgage schedule table
         """
         logger.info("Formatting mortgage schedule")
         
+        if amortization_schedule:
+            return self._format_annual_mortgage_schedule(amortization_schedule)
+        
         # Extract mortgage parameters
         purchase_price = analysis_results.get('purchase_price', 500000)
         down_payment_pct = analysis_results.get('down_payment_percent', 30) / 100
@@ -365,6 +375,60 @@ class ExcelFormatter:
             }
         }
     
+    def _format_annual_mortgage_schedule(self, amortization_schedule: List[Dict[str, float]]) -> Dict[str, Any]:
+        """Format the analysis' own annual amortization schedule"""
+        headers = [
+            'Year', 'Payment Amount', 'Principal', 'Interest', 
+            'Remaining Balance', 'Cumulative Principal', 'Cumulative Interest'
+        ]
+        
+        data_rows = []
+        for entry in amortization_schedule:
+            data_rows.append([
+                entry['year'],
+                entry['principal_portion'] + entry['interest_portion'],
+                entry['principal_portion'],
+                entry['interest_portion'],
+                entry['ending_balance'],
+                entry['cumulative_principal'],
+                entry['cumulative_interest']
+            ])
+        
+        first_year = amortization_schedule[0]
+        annual_payment = first_year['principal_portion'] + first_year['interest_portion']
+        
+        # Add summary information
+        data_rows.append(['', '', '', '', '', '', ''])  # Blank row
+        data_rows.append([
+            'LOAN SUMMARY',
+            f'${annual_payment:,.2f}/year',
+            '',
+            '',
+            '',
+            '',
+            ''
+        ])
+        data_rows.append([
+            'Total Interest',
+            '',
+            '',
+            amortization_schedule[-1]['cumulative_interest'],
+            '',
+            '',
+            ''
+        ])
+        
+        return {
+            'headers': headers,
+            'data': data_rows,
+            'table_type': 'mortgage_schedule',
+            'formatting_rules': {
+                'currency_columns': [1, 2, 3, 4, 5, 6],
+                'percentage_columns': [],
+                'summary_start_row': len(data_rows) - 3
+            }
+        }
+    
     async def format_tax_calculations(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Format tax calculation details
@@ -438,12 +502,18 @@ class ExcelFormatter:
             }
         }
     
-    async def format_terminal_value(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    async def format_terminal_value(
+        self,
+        analysis_results: Dict[str, Any],
+        terminal_breakdown: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
         """
         Format terminal value calculations
         
         Args:
             analysis_results: Analysis results containing terminal value details
+            terminal_breakdown: Ownership terminal value from the analysis bundle;
+                when given it is used as-is instead of being estimated
             
         Returns:
             Formatted terminal value table
@@ -452,6 +522,72 @@ class ExcelFormatter:
         
         headers = ['Component', 'Value', 'Calculation Method', 'Notes']
         
+        if terminal_breakdown:
+            data_rows = [
+                [
+                    'Land Value (at purchase)',
+                    terminal_breakdown['initial_land_value'],
+                    'Land value % of purchase price',
+                    'Non-depreciating land component'
+                ],
+                [
+                    'Building Value (at purchase)',
+                    terminal_breakdown['initial_building_value'],
+                    'Purchase price less land value',
+                    'Depreciating building component'
+                ],
+                [
+                    'Accumulated Depreciation',
+                    terminal_breakdown['accumulated_depreciation'],
+                    'Straight-line over depreciation period',
+                    'Building depreciation to end of analysis'
+                ],
+                ['', '', '', ''],  # Blank row
+                [
+                    'Land Value at End',
+                    terminal_breakdown['land_value_end'],
+                    'Market appreciation over analysis period',
+                    'Land value with market appreciation'
+                ],
+                [
+                    'Building Value at End',
+                    terminal_breakdown['building_value_end'],
+                    'Depreciated value with market appreciation',
+                    'Depreciated building value'
+                ],
+                [
+                    'Terminal Property Value',
+                    terminal_breakdown['terminal_property_value'],
+                    'Land + Building values',
+                    'Expected property value at end of analysis'
+                ],
+                [
+                    'Remaining Loan Balance',
+                    terminal_breakdown['remaining_loan_balance'],
+                    'Amortization schedule',
+                    'Outstanding mortgage at end of analysis'
+                ],
+                ['', '', '', ''],  # Blank row
+                [
+                    'NET PROPERTY EQUITY',
+                    terminal_breakdown['net_property_equity'],
+                    'Property value - Loan balance',
+                    'Ownership wealth at end of analysis'
+                ]
+            ]
+            
+            return {
+                'headers': headers,
+                'data': data_rows,
+                'table_type': 'terminal_value',
+                'formatting_rules': {
+                    'currency_columns': [1],  # Value column
+                    'percentage_columns': [],
+                    'total_row_index': len(data_rows) - 1,
+                    'highlight_rows': [len(data_rows) - 1]  # Highlight total row
+                }
+            }
+        
         # Extract terminal value components
         purchase_price = analysis_results.get('purchase_price', 500000)
         land_value_pct = analysis_results.get('land_value_percent', 25) / 100
@@ -1022,20 +1158,4 @@ class ExcelFormatter:
         Returns:
             List of cash flow values
         """
-        if isinstance(flows_data, list):
-            # List of flow dictionaries - extract 'net_cash_flow' values
-            return [
-                flow.get('net_cash_flow', 0) if isinstance(flow, dict) else float(flow)
-                for flow in flows_data
-            ]
-        elif isinstance(flows_data, dict):
-            if 'annual_cash_flows' in flows_data:
-                # Dictionary format with 'annual_cash_flows' key
-                annual_flows = flows_data['annual_cash_flows']
-                if isinstance(annual_flows, list):
-                    return [float(flow) for flow in annual_flows]
-            # If dict doesn't have expected structure, return empty list
-            return []
-        else:
-            # Unsupported format
-            return []
\ No newline at end of file
+        return extract_cash_flows(flows_data)
\ No newline at end of file
@@ -8,9 +8,10 @@ executive review and stakeholder sharing.
 """
 
 import asyncio
+import io
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import tempfile
 
@@ -23,13 +24,18 @@ from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 from openpyxl.drawing.image import Image
 
 from .data_formatting import ExcelFormatter
-from .chart_embedding import ChartEmbedder
 from .template_manager import ExcelTemplateManager
+from .streaming_workbook import XLSXWRITER_AVAILABLE, StreamingWorkbookWriter
+from .portfolio_workbook import PortfolioWorkbookWriter
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Data rows (cash flow years plus amortization entries) from which workbooks
+# are streamed when the generator is left to choose
+STREAMING_ROW_THRESHOLD = 100
+
 
 class ExcelGenerator:
     """
@@ -39,31 +45,51 @@ class ExcelGenerator:
     and professional formatting suitable for executive presentation.
     """
     
-    def __init__(self, temp_dir: Optional[Path] = None):
+    def __init__(self, temp_dir: Optional[Path] = None, streaming: Optional[bool] = None):
         """
         Initialize Excel generator
         
         Args:
             temp_dir: Directory for temporary files during generation
+                (created on first use, so in-memory exports never touch disk)
+            streaming: Write workbooks row by row in bounded memory (True),
+                build them in openpyxl (False), or stream once the data reaches
+                STREAMING_ROW_THRESHOLD rows and xlsxwriter is installed (None)
         """
-        if temp_dir:
-            self.temp_dir = Path(temp_dir)
-        else:
-            # Create a unique temporary directory for this session
-            temp_base = Path(tempfile.mkdtemp(prefix="excel_generation_"))
-            self.temp_dir = temp_base
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self._temp_dir: Optional[Path] = Path(temp_dir) if temp_dir else None
+        self.streaming = streaming
         
         # Initialize components
         self.formatter = ExcelFormatter()
-        self.chart_embedder = ChartEmbedder()
+        self._chart_embedder = None
         self.template_manager = ExcelTemplateManager()
         
         # Workbook components
         self.workbook: Optional[Workbook] = None
         self.worksheets: Dict[str, Worksheet] = {}
         
-        logger.info(f"ExcelGenerator initialized with temp_dir: {self.temp_dir}")
+        logger.info(f"ExcelGenerator initialized with temp_dir: {self._temp_dir or 'on demand'}")
+    
+    @property
+    def chart_embedder(self) -> 'ChartEmbedder':
+        """Chart embedder, created on first chart render (loads Plotly)"""
+        if self._chart_embedder is None:
+            from .chart_embedding import ChartEmbedder
+            self._chart_embedder = ChartEmbedder()
+        return self._chart_embedder
+    
+    @chart_embedder.setter
+    def chart_embedder(self, embedder: 'ChartEmbedder') -> None:
+        self._chart_embedder = embedder
+    
+    @property
+    def temp_dir(self) -> Path:
+        """Directory for generated files, created when first needed"""
+        if self._temp_dir is None:
+            # Create a unique temporary directory for this session
+            self._temp_dir = Path(tempfile.mkdtemp(prefix="excel_generation_"))
+        self._temp_dir.mkdir(parents=True, exist_ok=True)
+        return self._temp_dir
     
     async def prepare_data(self, export_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -82,6 +108,8 @@ class ExcelGenerator:
             'analysis_results': export_data['analysis_results'],
             'ownership_flows': export_data['ownership_flows'],
             'rental_flows': export_data['rental_flows'],
+            'amortization_schedule': export_data.get('amortization_schedule'),
+            'terminal_value': export_data.get('terminal_value'),
             'session_data': export_data.get('session_data') or export_data.get('inputs', {}),
             'export_options': export_data.get('export_options', {}),
             
@@ -129,7 +157,8 @@ class ExcelGenerator:
     async def generate_workbook(
         self,
         excel_data: Dict[str, Any],
-        template_type: str = "detailed"
+        template_type: str = "detailed",
+        streaming: Optional[bool] = None
     ) -> Path:
         """
         Generate complete Excel workbook with all worksheets and formatting
@@ -137,13 +166,87 @@ class ExcelGenerator:
         Args:
             excel_data: Prepared Excel data package
             template_type: Template type ("executive", "detailed", "investor")
+            streaming: Write rows straight to disk with shared styles (generator setting if None)
             
         Returns:
             Path to generated Excel file
         """
-        logger.info(f"Generating Excel workbook with template: {template_type}")
+        output_path = self.temp_dir / f"real_estate_analysis_{template_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        await self._write_workbook(excel_data, template_type, streaming, output_path)
+        
+        logger.info(f"Excel workbook generated: {output_path}")
+        return output_path
+    
+    async def generate_workbook_bytes(
+        self,
+        excel_data: Dict[str, Any],
+        template_type: str = "detailed",
+        streaming: Optional[bool] = None
+    ) -> io.BytesIO:
+        """
+        Generate complete Excel workbook into an in-memory buffer
+        
+        Args:
+            excel_data: Prepared Excel data package
+            template_type: Template type ("executive", "detailed", "investor")
+            streaming: Write rows with shared styles (generator setting if None)
+            
+        Returns:
+            Buffer positioned at the start of the .xlsx content
+        """
+        buffer = io.BytesIO()
+        await self._write_workbook(excel_data, template_type, streaming, buffer)
+        buffer.seek(0)
+        
+        logger.info(f"Excel workbook generated in memory: {buffer.getbuffer().nbytes:,} bytes")
+        return buffer
+    
+    async def generate_portfolio_workbook(
+        self,
+        sites: List[Tuple[str, Dict[str, Any]]]
+    ) -> Path:
+        """
+        Generate one workbook covering many site analyses
+        
+        Args:
+            sites: (site name, export data) pairs in display order
+            
+        Returns:
+            Path to generated Excel file with a summary sheet and one sheet per site
+        """
+        logger.info(f"Generating portfolio workbook for {len(sites)} sites")
+        output_path = self.temp_dir / f"real_estate_portfolio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
         try:
+            # Writing is blocking file I/O; keep the event loop free meanwhile
+            await asyncio.to_thread(PortfolioWorkbookWriter(output_path).write_portfolio, sites)
+        except Exception as e:
+            logger.error(f"Portfolio workbook generation failed: {str(e)}")
+            raise RuntimeError(f"Portfolio generation failed: {str(e)}") from e
+        
+        logger.info(f"Portfolio workbook generated: {output_path}")
+        return output_path
+    
+    async def _write_workbook(
+        self,
+        excel_data: Dict[str, Any],
+        template_type: str,
+        streaming: Optional[bool],
+        target: Union[Path, io.BytesIO]
+    ) -> None:
+        """Write the workbook for a template to a file path or buffer"""
+        if streaming is None:
+            streaming = self.streaming
+        if streaming is None:
+            streaming = XLSXWRITER_AVAILABLE and self._count_data_rows(excel_data) >= STREAMING_ROW_THRESHOLD
+        logger.info(f"Generating Excel workbook with template: {template_type} (streaming={streaming})")
+        
+        try:
+            if streaming:
+                template_config = await self.template_manager.get_template_config(template_type)
+                StreamingWorkbookWriter(target).write(excel_data, template_config)
+                return
+            
             # Initialize workbook
             self.workbook = Workbook()
             self.workbook.remove(self.workbook.active)  # Remove default sheet
@@ -157,14 +260,8 @@ class ExcelGenerator:
             # Apply professional styling
             await self._apply_workbook_styling(template_config)
             
-            # Generate output file
-            output_path = self.temp_dir / f"real_estate_analysis_{template_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            
             # Save workbook
-            self.workbook.save(output_path)
-            
-            logger.info(f"Excel workbook generated: {output_path}")
-            return output_path
+            self.workbook.save(target)
             
         except Exception as e:
             logger.error(f"Excel workbook generation failed: {str(e)}")
@@ -213,9 +310,13 @@ class ExcelGenerator:
         # Extract calculation details
         calculations = {
             'npv_calculations': await self.formatter.format_npv_calculations(analysis),
-            'mortgage_schedule': await self.formatter.format_mortgage_schedule(analysis),
+            'mortgage_schedule': await self.formatter.format_mortgage_schedule(
+                analysis, excel_data.get('amortization_schedule')
+            ),
             'tax_calculations': await self.formatter.format_tax_calculations(analysis),
-            'terminal_value': await self.formatter.format_terminal_value(analysis)
+            'terminal_value': await self.formatter.format_terminal_value(
+                analysis, excel_data.get('terminal_value')
+            )
         }
         
         excel_data['formatted_tables']['calculations'] = calculations
@@ -971,6 +1072,14 @@ class ExcelGenerator:
         
         return validation_results
     
+    def _count_data_rows(self, excel_data: Dict[str, Any]) -> int:
+        """Rows of per-year data the workbook will contain"""
+        return (
+            len(self._normalize_cash_flows(excel_data.get('ownership_flows')))
+            + len(self._normalize_cash_flows(excel_data.get('rental_flows')))
+            + len(excel_data.get('amortization_schedule') or [])
+        )
+    
     def _normalize_cash_flows(self, cash_flows: Any) -> List[Dict[str, Any]]:
         """
         Normalize cash flows to a consistent format
@@ -1022,7 +1131,7 @@ class ExcelGenerator:
                 
                 cleanup_thread = threading.Thread(target=deferred_cleanup, daemon=True)
                 cleanup_thread.start()
-                logger.debug(f"Scheduled cleanup of {self.temp_dir} in {defer_seconds} seconds")
+                logger.debug(f"Scheduled cleanup of {self._temp_dir} in {defer_seconds} seconds")
             else:
                 self._do_cleanup()
                     
@@ -1032,11 +1141,11 @@ class ExcelGenerator:
     def _do_cleanup(self):
         """Actually perform the cleanup"""
         # Clean up temporary directory if it exists
-        if self.temp_dir.exists():
+        if self._temp_dir is not None and self._temp_dir.exists():
             import shutil
             try:
-                shutil.rmtree(self.temp_dir)
-                logger.debug(f"Cleaned up temporary directory: {self.temp_dir}")
+                shutil.rmtree(self._temp_dir)
+                logger.debug(f"Cleaned up temporary directory: {self._temp_dir}")
             except Exception as e:
                 logger.warning(f"Could not clean up temp directory: {e}")
     
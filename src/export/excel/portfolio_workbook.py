@@ -0,0 +1,236 @@
+"""
+Portfolio Workbook
+Many site analyses exported into a single streamed workbook
+
+This module provides:
+- Per-site report preparation from each site's export data
+- A portfolio summary sheet with one linked row per site
+- One worksheet per site with its headline metrics and cash flow comparison
+
+Worksheets are written row by row with the streaming writer's shared
+styles, so the workbook size and memory grow with the number of rows
+rather than the number of formatted cells.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import io
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Set, Tuple, Union
+
+from ..report_model import ReportModel, build_report_model
+from .streaming_workbook import COLORS, StreamingSheet, StreamingWorkbookWriter
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SHEET_NAME = "Portfolio Summary"
+MAX_SHEET_NAME_LENGTH = 31
+INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\']")
+
+SUMMARY_HEADERS = [
+    'Site', 'Recommendation', 'Confidence', 'Ownership NPV', 'Rental NPV',
+    'NPV Advantage', 'Initial Investment', 'Analysis Period'
+]
+
+COMPARISON_HEADERS = [
+    'Year', 'Ownership Cash Flow', 'Rental Cash Flow', 'Annual Difference', 'Cumulative Difference'
+]
+
+
+@dataclass
+class PortfolioSite:
+    """One site's prepared report content"""
+
+    name: str
+    sheet_name: str
+    model: ReportModel
+    comparison_table: Dict[str, Any]
+
+
+def sheet_name_for(site_name: str, used: Set[str]) -> str:
+    """Valid, unique worksheet name for a site (Excel allows 31 characters)"""
+    base = INVALID_SHEET_CHARS.sub('', site_name).strip() or "Site"
+    base = base[:MAX_SHEET_NAME_LENGTH]
+
+    name = base
+    counter = 2
+    while name.lower() in used:
+        suffix = f" ({counter})"
+        name = base[:MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        counter += 1
+
+    used.add(name.lower())
+    return name
+
+
+def _prepare_site(export_data: Dict[str, Any]) -> Tuple[ReportModel, Dict[str, Any]]:
+    """Report model and cash flow comparison table for one site"""
+    model = build_report_model(export_data)
+
+    rows = [list(row) for row in model.comparison_rows]
+    rows.append([
+        'TOTAL',
+        sum(model.ownership_cash_flows),
+        sum(model.rental_cash_flows),
+        sum(row[3] for row in model.comparison_rows),
+        model.comparison_rows[-1][4] if model.comparison_rows else 0
+    ])
+
+    comparison_table = {
+        'headers': COMPARISON_HEADERS,
+        'data': rows,
+        'table_type': 'comparison',
+        'formatting_rules': {
+            'currency_columns': [1, 2, 3, 4],
+            'total_row_index': len(rows) - 1,
+            'conditional_formatting': {
+                'ownership_advantage': {'column': 3, 'color': COLORS['success']},
+                'rental_advantage': {'column': 3, 'color': COLORS['danger']}
+            }
+        }
+    }
+    return model, comparison_table
+
+
+def prepare_portfolio_sites(sites: Sequence[Tuple[str, Dict[str, Any]]]) -> List[PortfolioSite]:
+    """
+    Prepare every site's report content
+
+    Preparation is a few list passes per site, so it runs inline; a process
+    pool would spend more time pickling the export data than it saves.
+
+    Args:
+        sites: (site name, export data) pairs in display order
+
+    Returns:
+        Prepared sites in the input order, with unique sheet names
+    """
+    prepared = [_prepare_site(export_data) for _, export_data in sites]
+
+    used = {SUMMARY_SHEET_NAME.lower()}
+    return [
+        PortfolioSite(name=name, sheet_name=sheet_name_for(name, used), model=model, comparison_table=table)
+        for (name, _), (model, table) in zip(sites, prepared)
+    ]
+
+
+class PortfolioWorkbookWriter(StreamingWorkbookWriter):
+    """
+    Writes a portfolio summary and one worksheet per site
+
+    Shares the streaming writer's formats and forward-only sheets, so
+    every site sheet reuses the same handful of cell formats.
+    """
+
+    def write_portfolio(self, sites: Sequence[Tuple[str, Dict[str, Any]]]) -> Union[Path, io.BytesIO]:
+        """
+        Write the portfolio workbook and close it
+
+        Args:
+            sites: (site name, export data) pairs in display order
+
+        Returns:
+            Path to the generated workbook, or the buffer it was written into
+        """
+        if not sites:
+            raise ValueError("Portfolio export needs at least one site")
+
+        prepared = prepare_portfolio_sites(sites)
+
+        try:
+            sheet = self._add_sheet(SUMMARY_SHEET_NAME)
+            self._write_portfolio_summary_sheet(sheet, prepared)
+            sheet.finish()
+            self.sheets_written.append(SUMMARY_SHEET_NAME)
+
+            for site in prepared:
+                sheet = self._add_sheet(site.sheet_name)
+                self._write_site_sheet(sheet, site)
+                sheet.finish()
+                self.sheets_written.append(site.sheet_name)
+        finally:
+            self.workbook.close()
+
+        logger.info(f"Streamed portfolio of {len(prepared)} sites using {len(self.styles)} shared formats")
+        return self.output_path
+
+    def _write_portfolio_summary_sheet(self, sheet: StreamingSheet, sites: List[PortfolioSite]) -> None:
+        styles = self.styles
+        last_col = len(SUMMARY_HEADERS) - 1
+
+        sheet.write_merged("REAL ESTATE PORTFOLIO ANALYSIS", styles.get('title', 'main_title'), last_col, height=25)
+        sheet.write_merged(
+            f"{len(sites)} Sites - {datetime.now().strftime('%B %d, %Y')}",
+            styles.get('subtitle', font_size=12, font_color=COLORS['dark']), last_col, height=20
+        )
+        sheet.skip()
+
+        header = styles.get('header')
+        sheet.write_row([(col, text, header) for col, text in enumerate(SUMMARY_HEADERS)], height=22)
+
+        link = styles.get('cell', 'first_column', font_color=COLORS['primary'], underline=1)
+        for site in sites:
+            summary = site.model.summary_metrics
+            sheet.write_url(0, f"internal:'{site.sheet_name}'!A1", site.name, link)
+            sheet.write_row([
+                (1, summary['recommendation'], self._recommendation_format(summary['recommendation'])),
+                (2, summary['confidence'], styles.get('cell')),
+                (3, summary['ownership_npv'], styles.get('cell', 'currency')),
+                (4, summary['rental_npv'], styles.get('cell', 'currency')),
+                (5, summary['npv_difference'], self._advantage_format(summary['npv_difference'])),
+                (6, summary['ownership_initial_investment'], styles.get('cell', 'currency')),
+                (7, f"{summary['analysis_period']} years", styles.get('cell'))
+            ], height=18)
+
+        # Every recommendation (BUY, MARGINAL, RENT, ...) gets its own count
+        recommendations = Counter(site.model.summary_metrics['recommendation'] for site in sites)
+        recommendation_counts = " / ".join(f"{count} {name}" for name, count in sorted(recommendations.items()))
+        total = styles.get('cell', 'total')
+        sheet.write_row([
+            (0, 'PORTFOLIO TOTAL', styles.get('cell', 'first_column', 'total')),
+            (1, recommendation_counts, total),
+            (3, sum(site.model.summary_metrics['ownership_npv'] for site in sites), styles.get('cell', 'currency', 'total')),
+            (4, sum(site.model.summary_metrics['rental_npv'] for site in sites), styles.get('cell', 'currency', 'total')),
+            (5, sum(site.model.summary_metrics['npv_difference'] for site in sites), styles.get('cell', 'currency', 'total')),
+            (6, sum(site.model.summary_metrics['ownership_initial_investment'] for site in sites), styles.get('cell', 'currency', 'total'))
+        ], height=20)
+
+    def _write_site_sheet(self, sheet: StreamingSheet, site: PortfolioSite) -> None:
+        styles = self.styles
+        summary = site.model.summary_metrics
+
+        self._write_heading(sheet, site.name.upper(), "Rent vs. Buy Site Analysis", 4)
+        sheet.write_url(0, f"internal:'{SUMMARY_SHEET_NAME}'!A1", "← Portfolio Summary", styles.get('note', underline=1))
+        sheet.skip(2)
+
+        header = styles.get('header')
+        sheet.write_row([(0, 'Metric', header), (1, 'Value', header)], height=20)
+        metrics = [
+            ('Recommendation', summary['recommendation'], self._recommendation_format(summary['recommendation'])),
+            ('Confidence', summary['confidence'], styles.get('cell')),
+            ('Ownership NPV', summary['ownership_npv'], styles.get('cell', 'currency')),
+            ('Rental NPV', summary['rental_npv'], styles.get('cell', 'currency')),
+            ('NPV Advantage', summary['npv_difference'], self._advantage_format(summary['npv_difference'])),
+            ('Ownership Initial Investment', summary['ownership_initial_investment'], styles.get('cell', 'currency')),
+            ('Rental Initial Investment', summary['rental_initial_investment'], styles.get('cell', 'currency')),
+            ('Analysis Period', f"{summary['analysis_period']} years", styles.get('cell'))
+        ]
+        for label, value, fmt in metrics:
+            sheet.write_row([(0, label, styles.get('cell', 'first_column', 'bold')), (1, value, fmt)], height=18)
+        sheet.skip(2)
+
+        self._write_table(sheet, site.comparison_table, "Ownership vs Rental Cash Flows")
+
+    def _recommendation_format(self, recommendation: str):
+        fill = {'BUY': COLORS['success'], 'RENT': COLORS['warning']}.get(recommendation)
+        if fill is None:
+            return self.styles.get('cell', 'bold')
+        return self.styles.get('cell', 'bold', fg_color=fill, font_color=COLORS['white'])
+
+    def _advantage_format(self, npv_difference: float):
+        return self.styles.get('cell', 'currency', 'positive' if npv_difference >= 0 else 'negative')
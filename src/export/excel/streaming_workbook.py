@@ -0,0 +1,512 @@
+"""
+Streaming Excel Workbook
+Bounded-memory workbook generation for large Excel exports
+
+This module provides:
+- Row-by-row worksheet writing with xlsxwriter's constant memory mode
+- Named styles shared across the workbook and applied at write time
+- Column widths computed from values as they are written
+
+Each row is flushed to disk once the next row starts, so memory stays
+flat however long the cash flow schedules or sensitivity grids are, and
+no styling pass over the finished workbook is needed. When the target is
+an in-memory buffer the workbook is assembled without temporary files
+instead.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import io
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+    logging.warning("xlsxwriter not available - streaming Excel export will be disabled")
+
+from .data_formatting import ExcelFormatter
+
+logger = logging.getLogger(__name__)
+
+COLORS = ExcelFormatter.COLORS
+BORDER_COLOR = 'D3D3D3'
+
+# Fixed column widths used by every worksheet (other columns are sized from their data)
+FIXED_COLUMN_WIDTHS = {0: 25, 1: 18, 2: 20, 3: 35, 4: 25, 5: 15}
+SHEET_COLUMN_WIDTHS = {'Input Assumptions': {4: 40}}
+MIN_AUTO_WIDTH = 12
+MAX_AUTO_WIDTH = 40
+
+# Named styles as xlsxwriter format properties; cells combine several names
+STYLE_DEFINITIONS = {
+    'cell': {
+        'font_name': 'Calibri', 'font_size': 10, 'font_color': COLORS['dark'],
+        'border': 1, 'border_color': BORDER_COLOR, 'valign': 'vcenter', 'text_wrap': True, 'align': 'center'
+    },
+    'first_column': {'align': 'left'},
+    'description': {'align': 'left', 'indent': 1},
+    'title': {
+        'font_name': 'Calibri', 'font_size': 16, 'bold': True, 'font_color': COLORS['primary'],
+        'align': 'center', 'valign': 'vcenter'
+    },
+    'main_title': {'font_size': 18},
+    'subtitle': {
+        'font_name': 'Calibri', 'font_size': 10, 'italic': True, 'font_color': COLORS['muted'],
+        'align': 'center', 'valign': 'vcenter'
+    },
+    'section': {'font_name': 'Calibri', 'font_size': 14, 'bold': True, 'font_color': COLORS['dark']},
+    'banner': {'fg_color': COLORS['light'], 'align': 'center', 'valign': 'vcenter'},
+    'header': {
+        'font_name': 'Calibri', 'font_size': 11, 'bold': True, 'font_color': COLORS['white'],
+        'fg_color': COLORS['primary'], 'align': 'center', 'valign': 'vcenter', 'text_wrap': True,
+        'border': 1, 'border_color': BORDER_COLOR
+    },
+    'axis_header': {'fg_color': '4ECDC4', 'font_size': 10},
+    'note': {'font_name': 'Calibri', 'font_size': 9, 'italic': True, 'font_color': COLORS['muted']},
+    'indicator': {'font_size': 8, 'italic': True, 'font_color': COLORS['muted']},
+    'muted': {'font_name': 'Calibri', 'font_size': 10, 'font_color': COLORS['muted']},
+    'bold': {'bold': True},
+    'currency': {'num_format': '_($* #,##0_);_($* (#,##0);_($* "-"_);_(@_)'},
+    'percentage': {'num_format': '0.00%_);[Red](0.00%)'},
+    'number': {'num_format': '_* #,##0_);_* (#,##0);_* "-"_);_(@_)'},
+    'dollars': {'num_format': '$#,##0'},
+    'total': {
+        'bold': True, 'font_color': COLORS['primary'], 'fg_color': COLORS['light'],
+        'border_color': COLORS['primary']
+    },
+    'positive': {'fg_color': 'D5F4E6', 'font_color': COLORS['success'], 'bold': True},
+    'negative': {'fg_color': 'FADBD8', 'font_color': 'E74C3C', 'bold': True},
+}
+
+
+class StreamingStyles:
+    """
+    Workbook-wide registry of shared cell formats
+
+    A format is created the first time a combination of named styles (and
+    optional extra properties) is used and reused for every later cell,
+    so a workbook holds one format per distinct look rather than per cell.
+    """
+
+    def __init__(self, workbook: 'xlsxwriter.Workbook'):
+        self._workbook = workbook
+        self._formats: Dict[Tuple, Any] = {}
+
+    def get(self, *names: str, **properties: Any):
+        """Format combining the named styles in order, then any extra properties"""
+        key = (names, tuple(sorted(properties.items())))
+        fmt = self._formats.get(key)
+        if fmt is None:
+            combined: Dict[str, Any] = {}
+            for name in names:
+                combined.update(STYLE_DEFINITIONS[name])
+            combined.update(properties)
+            fmt = self._workbook.add_format(combined)
+            self._formats[key] = fmt
+        return fmt
+
+    def __len__(self) -> int:
+        return len(self._formats)
+
+
+class StreamingSheet:
+    """
+    Forward-only worksheet writer
+
+    Rows are written strictly in order from a cursor; widths of columns
+    without a fixed width are tracked from the values written to them.
+    """
+
+    def __init__(self, worksheet, fixed_widths: Dict[int, float]):
+        self.worksheet = worksheet
+        self.fixed_widths = fixed_widths
+        self.row = 0
+        self._max_lengths: Dict[int, int] = {}
+
+    def skip(self, rows: int = 1) -> None:
+        """Leave blank rows"""
+        self.row += rows
+
+    def write_row(self, cells: Sequence[Tuple[int, Any, Any]], height: Optional[float] = None) -> None:
+        """
+        Write one row and advance the cursor
+
+        Args:
+            cells: (column, value, format) triples
+            height: Row height in points (default row height if None)
+        """
+        if height is not None:
+            self.worksheet.set_row(self.row, height)
+        for col, value, fmt in cells:
+            if value is None:
+                continue
+            self.worksheet.write(self.row, col, value, fmt)
+            self._track_width(col, value)
+        self.row += 1
+
+    def write_url(self, col: int, url: str, text: str, fmt) -> None:
+        """Write a hyperlink into the current row without advancing the cursor"""
+        self.worksheet.write_url(self.row, col, url, fmt, string=text)
+        self._track_width(col, text)
+
+    def write_merged(self, text: str, fmt, last_col: int, height: Optional[float] = None) -> None:
+        """Write a title spanning columns A to last_col and advance the cursor"""
+        if height is not None:
+            self.worksheet.set_row(self.row, height)
+        self.worksheet.merge_range(self.row, 0, self.row, last_col, text, fmt)
+        self.row += 1
+
+    def _track_width(self, col: int, value: Any) -> None:
+        if col in self.fixed_widths:
+            return
+        length = len(str(value))
+        if length > self._max_lengths.get(col, 0):
+            self._max_lengths[col] = length
+
+    def finish(self) -> None:
+        """Apply column widths and page setup once all rows are written"""
+        for col, width in self.fixed_widths.items():
+            self.worksheet.set_column(col, col, width)
+        for col, length in self._max_lengths.items():
+            self.worksheet.set_column(col, col, min(max(length + 3, MIN_AUTO_WIDTH), MAX_AUTO_WIDTH))
+
+        self.worksheet.fit_to_pages(1, 0)
+
+
+class StreamingWorkbookWriter:
+    """
+    Writes the analysis workbook row by row
+
+    Produces the same worksheets as the in-memory generator from the same
+    prepared Excel data and template configuration.
+    """
+
+    def __init__(self, output_path: Union[Path, io.BytesIO]):
+        """
+        Initialize streaming workbook writer
+
+        Args:
+            output_path: Destination .xlsx path, or a buffer to write into
+        """
+        if not XLSXWRITER_AVAILABLE:
+            raise ImportError("xlsxwriter is required for streaming Excel export")
+
+        if isinstance(output_path, io.BytesIO):
+            # constant_memory spills rows to temp files; a buffer target stays in memory
+            self.output_path = output_path
+            self.workbook = xlsxwriter.Workbook(output_path, {'in_memory': True})
+        else:
+            self.output_path = Path(output_path)
+            self.workbook = xlsxwriter.Workbook(str(self.output_path), {'constant_memory': True})
+        self.styles = StreamingStyles(self.workbook)
+        self.sheets_written: List[str] = []
+
+    def write(self, excel_data: Dict[str, Any], template_config: Dict[str, Any]) -> Union[Path, io.BytesIO]:
+        """
+        Write every worksheet in the template and close the workbook
+
+        Returns:
+            Path to the generated workbook, or the buffer it was written into
+        """
+        writers = {
+            'executive_summary': self._write_executive_summary_sheet,
+            'cash_flows': self._write_cash_flows_sheet,
+            'charts': self._write_charts_sheet,
+            'calculations': self._write_calculations_sheet,
+            'assumptions': self._write_assumptions_sheet,
+            'sensitivity': self._write_sensitivity_sheet,
+        }
+
+        try:
+            for config in template_config.get('worksheets', []):
+                sheet = self._add_sheet(config['name'])
+                writer = writers.get(config['type'])
+                if writer is None:
+                    logger.warning(f"Unknown worksheet type: {config['type']}")
+                else:
+                    writer(sheet, excel_data)
+                sheet.finish()
+                self.sheets_written.append(config['name'])
+        finally:
+            self.workbook.close()
+
+        logger.info(f"Streamed {len(self.sheets_written)} worksheets using {len(self.styles)} shared formats")
+        return self.output_path
+
+    def _add_sheet(self, name: str) -> StreamingSheet:
+        worksheet = self.workbook.add_worksheet(name)
+        worksheet.set_default_row(16)
+        fixed_widths = {**FIXED_COLUMN_WIDTHS, **SHEET_COLUMN_WIDTHS.get(name, {})}
+        return StreamingSheet(worksheet, fixed_widths)
+
+    def _write_heading(self, sheet: StreamingSheet, title: str, subtitle: str, last_col: int) -> None:
+        """Title and subtitle rows shared by the detail worksheets"""
+        sheet.write_merged(title, self.styles.get('title'), last_col, height=25)
+        sheet.write_merged(subtitle, self.styles.get('subtitle'), last_col, height=16)
+
+    def _write_executive_summary_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        summary = excel_data['summary_metrics']
+        styles = self.styles
+
+        sheet.write_merged("REAL ESTATE INVESTMENT ANALYSIS", styles.get('title', 'main_title'), 3, height=25)
+        sheet.write_merged(
+            f"Executive Summary & Strategic Recommendation - {datetime.now().strftime('%B %d, %Y')}",
+            styles.get('subtitle', font_size=12, font_color=COLORS['dark']), 3, height=20
+        )
+        sheet.skip()
+
+        sheet.write_row([(0, "STRATEGIC RECOMMENDATION", styles.get('section'))])
+
+        recommendation = summary['recommendation']
+        fill = {'BUY': COLORS['success'], 'RENT': COLORS['warning']}.get(recommendation)
+        recommendation_style = styles.get('cell', 'section', font_color=COLORS['white'], **({'fg_color': fill} if fill else {}))
+        sheet.write_row([
+            (0, recommendation.upper(), recommendation_style),
+            (2, f"Confidence: {summary.get('confidence', 'Medium')}", styles.get('cell', 'first_column', italic=True, font_size=11))
+        ], height=25)
+        sheet.skip(2)
+
+        sheet.write_merged("KEY FINANCIAL METRICS", styles.get('section', 'banner'), 3, height=22)
+        header = styles.get('header')
+        sheet.write_row([(col, text, header) for col, text in enumerate(['Metric', 'Value', 'Comparison', 'Analysis Notes'])], height=20)
+
+        npv_difference = summary['npv_difference']
+        metrics = [
+            ("NPV Advantage", npv_difference,
+             f"${abs(npv_difference):,.0f} {'(Ownership)' if npv_difference > 0 else '(Rental)'}",
+             "Net Present Value difference"),
+            ("Ownership NPV", summary['ownership_npv'], f"${summary['ownership_npv']:,.0f}",
+             "Total ownership scenario value"),
+            ("Rental NPV", summary['rental_npv'], f"${summary['rental_npv']:,.0f}",
+             "Total rental scenario value"),
+            ("Initial Investment", summary['ownership_initial_investment'],
+             f"${summary['ownership_initial_investment']:,.0f}", "Required upfront capital"),
+            ("Analysis Period", f"{summary['analysis_period']} years",
+             f"{summary['analysis_period']} years", "Investment time horizon"),
+            ("Cost of Capital", f"{summary['cost_of_capital']:.1f}%",
+             f"{summary['cost_of_capital']:.1f}% annual discount rate", "Required rate of return")
+        ]
+
+        for metric_name, metric_value, comparison, notes in metrics:
+            value_style = styles.get('cell')
+            if isinstance(metric_value, (int, float)):
+                names = ['cell', 'dollars'] if abs(metric_value) > 1000 else ['cell']
+                if metric_value > 0 and 'NPV' in metric_name:
+                    value_style = styles.get(*names, bold=True, font_color=COLORS['success'])
+                else:
+                    value_style = styles.get(*names)
+
+            sheet.write_row([
+                (0, metric_name, styles.get('cell', 'first_column', 'bold')),
+                (1, metric_value, value_style),
+                (2, comparison, styles.get('cell')),
+                (3, notes, styles.get('cell', 'first_column', 'note'))
+            ], height=18)
+
+    def _write_cash_flows_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        cash_flows = excel_data['formatted_tables']['cash_flows']
+
+        sheet.write_merged("CASH FLOW ANALYSIS & PROJECTIONS", self.styles.get('title'), 5, height=25)
+        sheet.write_merged(
+            f"Multi-Scenario Financial Analysis - {datetime.now().strftime('%B %Y')}",
+            self.styles.get('subtitle', font_size=11), 5, height=18
+        )
+
+        tables = [
+            (cash_flows['ownership_table'], "Ownership Cash Flows"),
+            (cash_flows['rental_table'], "Rental Cash Flows"),
+            (cash_flows['comparison_table'], "Side-by-Side Comparison")
+        ]
+        detailed_cash_flows = excel_data['formatted_tables'].get('detailed_cash_flows')
+        if detailed_cash_flows:
+            tables.append((detailed_cash_flows, "Detailed Cash Flow Analysis with Features"))
+
+        for table_data, title in tables:
+            self._write_table(sheet, table_data, title)
+            sheet.skip(2)
+
+    def _write_charts_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        sheet.write_row([(0, "Charts Feature Removed", self.styles.get('section', font_size=16))])
+        sheet.skip()
+        for line in [
+            "The dedicated Charts worksheet has been removed to improve export performance.",
+            "All essential charts are now embedded within the relevant analysis sections.",
+            "Please refer to the Executive Summary and Cash Flow Analysis worksheets for visualizations."
+        ]:
+            sheet.write_row([(0, line, self.styles.get('cell', 'first_column'))])
+
+    def _write_calculations_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        calculations = excel_data['formatted_tables']['calculations']
+
+        self._write_heading(
+            sheet, "DETAILED FINANCIAL CALCULATIONS",
+            "NPV Analysis, Mortgage Calculations, Tax Benefits & Terminal Value Computations", 4
+        )
+
+        for calc_name, calc_data in calculations.items():
+            self._write_table(sheet, calc_data, calc_name.replace('_', ' ').title())
+            sheet.skip(3)
+
+    def _write_assumptions_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        self._write_heading(
+            sheet, "INPUT ASSUMPTIONS & MODEL PARAMETERS",
+            "Key Variables & Assumptions Used in Financial Modeling", 4
+        )
+        self._write_table(sheet, excel_data['formatted_tables']['assumptions'], "All Input Parameters")
+
+    def _write_sensitivity_sheet(self, sheet: StreamingSheet, excel_data: Dict[str, Any]) -> None:
+        sensitivity_data = excel_data['formatted_tables'].get('sensitivity_analysis', {})
+        styles = self.styles
+
+        sheet.write_merged("TWO-DIMENSIONAL SENSITIVITY ANALYSIS", styles.get('title'), 7, height=25)
+        sheet.write_merged(
+            "Impact Analysis: How Changes in Two Key Parameters Simultaneously Affect NPV Difference",
+            styles.get('subtitle', font_size=11), 7, height=18
+        )
+        sheet.write_merged(
+            "Each table shows NPV difference ($) when both parameters change from their base values",
+            styles.get('subtitle'), 7, height=16
+        )
+        sheet.skip()
+
+        if not sensitivity_data:
+            sheet.write_row([(0, "No sensitivity analysis data available",
+                              styles.get('section', font_size=12, bold=False, italic=True, font_color='E74C3C'))])
+            return
+
+        axis_header = styles.get('header', 'axis_header')
+        indicator = styles.get('cell', 'indicator')
+        value_styles = {
+            1: styles.get('cell', 'positive'),
+            -1: styles.get('cell', 'negative'),
+            0: styles.get('cell')
+        }
+
+        for table_name, table_info in sensitivity_data.items():
+            formatted_result = table_info['formatted_result']
+            x_headers = formatted_result['x_headers']
+            x_changes = formatted_result['x_change_indicators']
+
+            sheet.write_merged(table_name, styles.get('section', fg_color=COLORS['light']), 7, height=22)
+
+            sheet.write_row(
+                [(1, f"{formatted_result['x_metric_display']} →", styles.get('cell', 'bold', font_size=11))]
+                + [(col + 2, f"{header}", styles.get('header', font_size=10)) for col, header in enumerate(x_headers)]
+            )
+            sheet.write_row([
+                (col + 2, x_changes[col] if col < len(x_changes) else "", indicator)
+                for col in range(len(x_headers))
+            ])
+            sheet.write_row([(0, f"{formatted_result['y_metric_display']} ↓", styles.get('cell', 'bold', font_size=11))])
+
+            for row_data in formatted_result['table_data']:
+                cells = [
+                    (0, row_data['y_label'], axis_header),
+                    (1, row_data['y_change'], indicator)
+                ]
+                for col_idx in range(formatted_result['num_columns']):
+                    npv_raw = row_data[f'col_{col_idx}_raw']
+                    sign = (npv_raw > 0) - (npv_raw < 0)
+                    cells.append((col_idx + 2, row_data[f'col_{col_idx}'], value_styles[sign]))
+                sheet.write_row(cells)
+
+            sheet.skip()
+            sheet.write_merged(
+                f"Base Case NPV: {formatted_result['base_npv']} | Table Size: {formatted_result['table_size']} "
+                f"| Calc Time: {formatted_result['calculation_time']}",
+                styles.get('note'), 7
+            )
+            sheet.skip(2)
+
+        sheet.skip(2)
+        sheet.write_row([(0, "LEGEND & INTERPRETATION", styles.get('section', font_size=12))])
+        for item in [
+            "• Green cells: Positive NPV difference (ownership advantage)",
+            "• Red cells: Negative NPV difference (rental advantage)",
+            "• 0% row/column: Shows actual parameter values from your analysis",
+            "• Other values: Show NPV when parameters change by the indicated percentage",
+            "• All values represent actual NPV difference (not changes from base case)"
+        ]:
+            sheet.write_merged(item, styles.get('muted'), 7)
+
+    def _write_table(self, sheet: StreamingSheet, table_data: Dict[str, Any], title: str) -> None:
+        """Section title, header row and formatted data rows"""
+        headers = table_data.get('headers', [])
+        formatting_rules = table_data.get('formatting_rules', {})
+        is_assumptions = table_data.get('table_type') == 'assumptions'
+
+        sheet.write_row([(0, title, self.styles.get('section', font_color=COLORS['dark']))])
+        sheet.skip()
+
+        header = self.styles.get('header')
+        sheet.write_row([(col, text, header) for col, text in enumerate(headers)], height=22)
+
+        total_row_index = formatting_rules.get('total_row_index', -1)
+        for row_idx, data_row in enumerate(table_data.get('data', [])):
+            is_total = row_idx == total_row_index
+            sheet.write_row([
+                (col_idx, value, self._table_cell_format(col_idx, value, formatting_rules, is_total, is_assumptions))
+                for col_idx, value in enumerate(data_row)
+            ], height=18)
+
+    def _table_cell_format(self, col_idx: int, value: Any, formatting_rules: Dict[str, Any],
+                           is_total: bool, is_assumptions: bool):
+        """Shared format for a table cell from its column role and value"""
+        names = ['cell']
+        properties: Dict[str, Any] = {}
+
+        if col_idx == 0:
+            names.append('first_column')
+        elif col_idx == 4 and is_assumptions:
+            names.append('description')
+
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if is_number:
+            if col_idx in formatting_rules.get('currency_columns', []):
+                names.append('currency')
+            elif col_idx in formatting_rules.get('percentage_columns', []):
+                names.append('percentage')
+            elif abs(value) >= 1:
+                names.append('number')
+
+            # Fill from the table's positive/negative rules
+            for rule_name, rule_config in formatting_rules.get('conditional_formatting', {}).items():
+                rule_name = rule_name.lower()
+                if value > 0 and ('positive' in rule_name or 'advantage' in rule_name):
+                    properties['fg_color'] = rule_config['color']
+                    properties['font_color'] = COLORS['white'] if rule_config['color'] in ['00B894', 'FF7675'] else COLORS['dark']
+                    properties['bold'] = True
+                elif value < 0 and ('negative' in rule_name or 'disadvantage' in rule_name):
+                    properties['fg_color'] = rule_config['color']
+                    properties['font_color'] = COLORS['white'] if rule_config['color'] in ['E17055', 'FF7675'] else COLORS['danger']
+                    properties['bold'] = True
+            if abs(value) >= 100000:
+                properties['bold'] = True
+
+        elif isinstance(value, str):
+            value_upper = value.upper().strip()
+            if any('recommendation' in rule_name.lower() for rule_name in formatting_rules.get('conditional_formatting', {})):
+                if 'BUY' in value_upper:
+                    properties.update(fg_color=COLORS['success'], font_color=COLORS['white'], bold=True, font_size=11)
+                elif 'RENT' in value_upper:
+                    properties.update(fg_color=COLORS['warning'], font_color=COLORS['dark'], bold=True, font_size=11)
+            if value_upper in ['HIGH', 'STRONG', 'EXCELLENT']:
+                properties.update(bold=True, font_color=COLORS['success'])
+            elif value_upper in ['MEDIUM', 'MODERATE', 'GOOD']:
+                properties.update(bold=True, font_color=COLORS['info'])
+            elif value_upper in ['LOW', 'WEAK', 'POOR']:
+                properties.update(bold=True, font_color=COLORS['danger'])
+            if 'ADVANTAGE' in value_upper or 'BENEFIT' in value_upper:
+                properties.update(bold=True, font_color=COLORS['primary'])
+
+        if is_total:
+            names.append('total')
+            properties.pop('fg_color', None)
+            properties.pop('font_color', None)
+
+        return self.styles.get(*names, **properties)
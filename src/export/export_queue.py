@@ -0,0 +1,353 @@
+"""
+Export Job Queue
+Background generation of Excel, PDF and CSV reports
+
+This module provides:
+- A bounded worker pool that generates reports off the UI thread
+- Deduplication of identical requests (same analysis + format + template)
+- Job status polling for the Streamlit export buttons
+- Reuse of finished reports until they expire
+
+Repeated clicks on an export button, or the same report requested from
+several tabs, attach to the job already in flight or get the finished
+report back instead of generating it again. Finished reports are served
+from memory; the FileManager keeps a copy on disk and decides expiry.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from .file_manager import ExportFile, FileManager
+from .report_model import analysis_key, get_report_model
+
+logger = logging.getLogger(__name__)
+
+# Report generator: (export_data, template_type, **options) -> file content
+ExportGenerator = Callable[..., bytes]
+
+FILE_EXTENSIONS = {'excel': 'xlsx', 'pdf': 'pdf', 'csv': 'csv'}
+
+
+class ExportJobStatus(Enum):
+    """Lifecycle of an export job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ExportJob:
+    """A report generation request and its outcome"""
+
+    job_id: str
+    format: str  # "excel", "pdf" or "csv"
+    template: str
+    status: ExportJobStatus = ExportJobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    file_id: Optional[str] = None
+    content: Optional[bytes] = field(default=None, repr=False)
+    error: Optional[str] = None
+    _future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since submission, or total time once finished"""
+        return (self.completed_at or time.time()) - self.submitted_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; True if it did within timeout"""
+        if self._future is not None:
+            try:
+                self._future.result(timeout)
+            except Exception:
+                pass
+        return self.is_done
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'format': self.format,
+            'template': self.template,
+            'status': self.status.value,
+            'elapsed': round(self.elapsed, 2),
+            'file_id': self.file_id,
+            'error': self.error
+        }
+
+
+def export_request_key(
+    export_data: Dict[str, Any],
+    format: str,
+    template_type: str,
+    options: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Identify an export request by its analysis, format, template and options
+    """
+    request = json.dumps(
+        [analysis_key(export_data), format, template_type, options or {}], sort_keys=True, default=str
+    )
+    return hashlib.sha256(request.encode('utf-8')).hexdigest()[:32]
+
+
+def _generate_excel(export_data: Dict[str, Any], template_type: str) -> bytes:
+    """Generate an Excel report in memory"""
+    from .excel.excel_generator import ExcelGenerator
+
+    async def generate() -> bytes:
+        generator = ExcelGenerator()
+        validation = await generator.validate_data(export_data)
+        if not validation['is_valid']:
+            raise ValueError("; ".join(validation['errors']))
+
+        excel_data = await get_report_model(export_data).excel_data()
+        buffer = await generator.generate_workbook_bytes(excel_data, template_type)
+        return buffer.getvalue()
+
+    return asyncio.run(generate())
+
+
+def _generate_pdf(
+    export_data: Dict[str, Any],
+    template_type: str,
+    custom_config: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Generate a PDF report in memory"""
+    from .pdf_integration import PDFExportManager
+
+    buffer, _ = asyncio.run(PDFExportManager().generate_pdf_report(
+        export_data, template_type, custom_config=custom_config, in_memory=True
+    ))
+    return buffer.getvalue()
+
+
+def _generate_csv(export_data: Dict[str, Any], template_type: str) -> bytes:
+    """Generate a CSV report (one layout for every template)"""
+    from .csv_export import write_csv_report
+
+    return write_csv_report(get_report_model(export_data))
+
+
+DEFAULT_GENERATORS: Dict[str, ExportGenerator] = {
+    'excel': _generate_excel,
+    'pdf': _generate_pdf,
+    'csv': _generate_csv
+}
+
+
+class ExportJobQueue:
+    """
+    Runs export jobs on a bounded thread pool
+
+    Each job keeps its finished report in memory, writes a copy into the
+    FileManager's directory and registers it there; jobs are keyed by
+    export_request_key() so identical requests share one job and one report.
+    Finished jobs are dropped once their report expires.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        file_manager: Optional[FileManager] = None,
+        generators: Optional[Dict[str, ExportGenerator]] = None,
+        artifact_ttl: timedelta = timedelta(hours=1)
+    ):
+        """
+        Initialize export job queue
+
+        Args:
+            max_workers: Reports generated concurrently
+            file_manager: Tracks finished report files
+            generators: Report generator per format
+            artifact_ttl: How long a finished report is reused
+        """
+        self.max_workers = max_workers
+        self.file_manager = file_manager or FileManager()
+        self.generators = dict(generators or DEFAULT_GENERATORS)
+        self.artifact_ttl = artifact_ttl
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export-job")
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.submitted = 0
+        self.deduplicated = 0
+        self.reused = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(
+        self,
+        export_data: Dict[str, Any],
+        format: str,
+        template_type: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> ExportJob:
+        """
+        Queue a report, or return the matching job already queued or finished
+
+        Args:
+            export_data: Complete export data from analysis
+            format: "excel", "pdf" or "csv"
+            template_type: Report template
+            options: Extra keyword arguments for the format's generator
+
+        Returns:
+            The job producing this report
+        """
+        if format not in self.generators:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        job_id = export_request_key(export_data, format, template_type, options)
+        with self._lock:
+            self._prune_expired()
+            existing = self._jobs.get(job_id)
+            if existing is not None:
+                if not existing.is_done:
+                    self.deduplicated += 1
+                    logger.info(f"Export job {job_id} already in progress")
+                    return existing
+                if existing.status == ExportJobStatus.COMPLETED and self._artifact(existing) is not None:
+                    self.reused += 1
+                    logger.info(f"Reusing finished export {existing.file_id}")
+                    return existing
+                if existing.file_id is not None:
+                    # Expired or deleted - drop the stale record before regenerating
+                    self.file_manager.cleanup_file(existing.file_id)
+
+            job = ExportJob(job_id=job_id, format=format, template=template_type)
+            self._jobs[job_id] = job
+            self.submitted += 1
+            job._future = self._executor.submit(self._run, job, export_data, options or {})
+
+        logger.info(f"Queued {format} export job {job_id} ({template_type})")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ExportJob]:
+        """Look up a job for status polling"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_file(self, job: ExportJob) -> Optional[ExportFile]:
+        """
+        Finished report of a completed job, if it has not expired
+
+        The report content is job.content; it is released once the
+        FileManager expires or evicts the report.
+        """
+        with self._lock:
+            return self._artifact(job)
+
+    def _artifact(self, job: ExportJob) -> Optional[ExportFile]:
+        if job.file_id is None or job.content is None:
+            return None
+        export_file = self.file_manager.get_file(job.file_id)
+        if export_file is None or export_file.is_expired:
+            job.content = None
+            return None
+        return export_file
+
+    def _prune_expired(self) -> None:
+        """Drop finished jobs whose reports have expired"""
+        cutoff = time.time() - self.artifact_ttl.total_seconds()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_done and job.completed_at < cutoff
+        ]
+        for job_id in expired:
+            self._jobs.pop(job_id).content = None
+
+    def _run(self, job: ExportJob, export_data: Dict[str, Any], options: Dict[str, Any]) -> None:
+        job.status = ExportJobStatus.RUNNING
+        job.started_at = time.time()
+
+        try:
+            content = self.generators[job.format](export_data, job.template, **options)
+            export_file = self._store(job, content)
+        except Exception as e:
+            logger.error(f"Export job {job.job_id} failed: {e}", exc_info=True)
+            with self._lock:
+                job.error = str(e)
+                job.completed_at = time.time()
+                job.status = ExportJobStatus.FAILED
+                self.failed += 1
+            return
+
+        with self._lock:
+            job.file_id = self.file_manager.register_file(export_file, file_id=job.job_id)
+            job.content = content
+            job.completed_at = time.time()
+            job.status = ExportJobStatus.COMPLETED
+            self.completed += 1
+
+        logger.info(f"Export job {job.job_id} completed in {job.completed_at - job.started_at:.2f}s")
+
+    def _store(self, job: ExportJob, content: bytes) -> ExportFile:
+        """Write a copy of a generated report into the file manager's directory"""
+        generation_time = datetime.now()
+        path = self.file_manager.base_dir / (
+            f"real_estate_analysis_{job.template}_{job.job_id[:12]}.{FILE_EXTENSIONS[job.format]}"
+        )
+        path.write_bytes(content)
+
+        return ExportFile(
+            path=path,
+            format=job.format,
+            template=job.template,
+            size_mb=len(content) / (1024 * 1024),
+            generation_time=generation_time,
+            expires_at=generation_time + self.artifact_ttl
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue statistics"""
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if not job.is_done)
+            return {
+                'max_workers': self.max_workers,
+                'active_jobs': active,
+                'submitted': self.submitted,
+                'deduplicated': self.deduplicated,
+                'reused': self.reused,
+                'completed': self.completed,
+                'failed': self.failed
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and release the worker threads"""
+        self._executor.shutdown(wait=wait)
+
+
+# Global instance
+_export_job_queue = None
+_export_job_queue_lock = threading.Lock()
+
+
+def get_export_job_queue() -> ExportJobQueue:
+    """Get the process-wide export job queue"""
+    global _export_job_queue
+    with _export_job_queue_lock:
+        if _export_job_queue is None:
+            _export_job_queue = ExportJobQueue()
+            # Long-lived servers: keep the export directory within its quota
+            _export_job_queue.file_manager.start_sweeper()
+        return _export_job_queue
@@ -4,11 +4,21 @@ Handles file operations for export system including temporary storage and cleanu
 
 Manages the lifecycle of generated export files from creation through download,
 ensuring proper cleanup and file organization.
+
+Files are tracked in a SQLite registry inside the export directory, so
+records survive restarts and are shared by every FileManager on that
+directory. The registry indexes expiry and last access, and keeps the
+directory under a total size quota by evicting least recently used files.
+Lookups are served from memory; last-access times are written to the
+registry in batches by the sweeper and before quota eviction.
 """
 
 import logging
-import shutil
+import sqlite3
 import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,13 +28,18 @@ from typing import Dict, List, Optional, Union
 # Configure logging
 logger = logging.getLogger(__name__)
 
+REGISTRY_FILENAME = "export_registry.db"
+DEFAULT_MAX_TOTAL_MB = 500.0
+DEFAULT_SWEEP_INTERVAL_SECONDS = 300.0
+BYTES_PER_MB = 1024 * 1024
+
 
 @dataclass
 class ExportFile:
     """Represents a generated export file with metadata"""
     
     path: Path
-    format: str  # "excel" or "pdf"
+    format: str  # "excel", "pdf" or "csv"
     template: str  # "executive", "detailed", "investor"
     size_mb: float
     generation_time: datetime
@@ -54,36 +69,125 @@ class FileManager:
     Manages export file operations and lifecycle
     
     Handles temporary file storage, cleanup, and file organization
-    for the export system.
+    for the export system. Lookups go to an in-memory map of registered
+    files, backed by the SQLite registry. Removals by other managers on the
+    same directory are picked up by the next sweep.
     """
     
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        max_total_mb: Optional[float] = DEFAULT_MAX_TOTAL_MB
+    ):
         """
         Initialize file manager
         
         Args:
             base_dir: Base directory for export file storage
+            max_total_mb: Total size of tracked files before least recently
+                used files are evicted (unbounded if None)
         """
         self.base_dir = Path(base_dir) if base_dir else Path(tempfile.gettempdir()) / "real_estate_exports"
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_total_bytes = int(max_total_mb * BYTES_PER_MB) if max_total_mb is not None else None
+        self.registry_path = self.base_dir / REGISTRY_FILENAME
         
-        # File tracking
+        # File tracking (registered files by ID; the registry is authoritative)
         self.active_files: Dict[str, ExportFile] = {}
+        self.lock = threading.RLock()
+        
+        # Last-access times not yet written to the registry
+        self._pending_access: Dict[str, float] = {}
+        self._init_registry()
+        
+        # Background sweeper
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+        
+        # Statistics
+        self.evicted_count = 0
+        self.sweep_count = 0
         
         logger.info(f"FileManager initialized with base_dir: {self.base_dir}")
     
-    def register_file(self, export_file: ExportFile) -> str:
+    def _init_registry(self) -> None:
+        """Initialize registry schema"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS export_files (
+                    file_id TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    template TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    generation_time REAL NOT NULL,
+                    expires_at REAL,
+                    download_count INTEGER NOT NULL DEFAULT 0,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_export_expires_at ON export_files(expires_at)
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_export_last_accessed ON export_files(last_accessed)
+            """)
+    
+    @contextmanager
+    def _get_connection(self):
+        """Get registry connection with proper cleanup"""
+        conn = None
+        try:
+            conn = sqlite3.connect(str(self.registry_path), timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            yield conn
+            conn.commit()
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                conn.close()
+    
+    def register_file(self, export_file: ExportFile, file_id: Optional[str] = None) -> str:
         """
         Register a new export file for tracking
         
+        Registering may evict least recently used files to stay within the
+        size quota; the new file itself is never evicted.
+        
         Args:
             export_file: ExportFile object to register
+            file_id: Explicit ID (a unique ID is generated if None)
             
         Returns:
             File ID for tracking purposes
         """
-        file_id = f"{export_file.format}_{export_file.template}_{export_file.generation_time.strftime('%Y%m%d_%H%M%S')}"
-        self.active_files[file_id] = export_file
+        if file_id is None:
+            file_id = f"{export_file.format}_{export_file.template}_{uuid.uuid4().hex}"
+        
+        with self.lock:
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO export_files
+                    (file_id, path, format, template, size_bytes, generation_time,
+                     expires_at, download_count, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        file_id, str(export_file.path), export_file.format, export_file.template,
+                        round(export_file.size_mb * BYTES_PER_MB),
+                        export_file.generation_time.timestamp(),
+                        export_file.expires_at.timestamp() if export_file.expires_at else None,
+                        export_file.download_count, datetime.now().timestamp()
+                    )
+                )
+            self.active_files[file_id] = export_file
+            self._enforce_quota(keep=file_id)
         
         logger.info(f"Registered export file: {file_id} ({export_file.size_mb:.2f} MB)")
         return file_id
@@ -98,32 +202,72 @@ class FileManager:
         Returns:
             ExportFile if found, None otherwise
         """
-        return self.active_files.get(file_id)
+        with self.lock:
+            export_file = self.active_files.get(file_id)
+            if export_file is None:
+                # Registered before a restart or by another manager
+                with self._get_connection() as conn:
+                    row = conn.execute("SELECT * FROM export_files WHERE file_id = ?", (file_id,)).fetchone()
+                if row is None:
+                    return None
+                export_file = self._row_to_file(row)
+                self.active_files[file_id] = export_file
+            
+            self._pending_access[file_id] = datetime.now().timestamp()
+            return export_file
+    
+    def _flush_access_times(self) -> None:
+        """Write last-access times recorded by lookups to the registry"""
+        with self.lock:
+            if not self._pending_access:
+                return
+            pending, self._pending_access = self._pending_access, {}
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "UPDATE export_files SET last_accessed = ? WHERE file_id = ?",
+                    [(accessed, file_id) for file_id, accessed in pending.items()]
+                )
+    
+    def _drop_removed_records(self) -> None:
+        """Forget files removed from the registry by other managers"""
+        with self.lock:
+            with self._get_connection() as conn:
+                registered = {row['file_id'] for row in conn.execute("SELECT file_id FROM export_files")}
+            for file_id in set(self.active_files) - registered:
+                self.active_files.pop(file_id, None)
+                self._pending_access.pop(file_id, None)
     
     def list_files(self, format_filter: Optional[str] = None) -> List[ExportFile]:
         """
         List all active export files
         
+        Expired files are excluded; files deleted from disk are dropped by
+        the next sweep rather than checked here.
+        
         Args:
-            format_filter: Optional format filter ("excel" or "pdf")
+            format_filter: Optional format filter ("excel", "pdf" or "csv")
             
         Returns:
             List of active export files
         """
-        files = list(self.active_files.values())
-        
+        query = "SELECT file_id FROM export_files WHERE (expires_at IS NULL OR expires_at > ?)"
+        params: list = [datetime.now().timestamp()]
         if format_filter:
-            files = [f for f in files if f.format == format_filter]
+            query += " AND format = ?"
+            params.append(format_filter)
+        query += " ORDER BY generation_time"
+        
+        with self.lock:
+            with self._get_connection() as conn:
+                file_ids = [row['file_id'] for row in conn.execute(query, params)]
+            files = [self.active_files.get(file_id) for file_id in file_ids]
         
-        # Remove expired or missing files
-        valid_files = []
-        for export_file in files:
-            if export_file.is_expired or not export_file.exists:
-                self._remove_file_record(export_file)
-            else:
-                valid_files.append(export_file)
+        missing = [file_id for file_id, export_file in zip(file_ids, files) if export_file is None]
+        if missing:
+            loaded = {file_id: self.get_file(file_id) for file_id in missing}
+            files = [export_file or loaded[file_id] for file_id, export_file in zip(file_ids, files)]
         
-        return valid_files
+        return [export_file for export_file in files if export_file is not None]
     
     def mark_downloaded(self, file_id: str) -> bool:
         """
@@ -135,11 +279,20 @@ class FileManager:
         Returns:
             True if successful, False if file not found
         """
-        if file_id in self.active_files:
-            self.active_files[file_id].download_count += 1
-            logger.info(f"File {file_id} download count: {self.active_files[file_id].download_count}")
-            return True
-        return False
+        export_file = self.get_file(file_id)
+        if export_file is None:
+            return False
+        
+        with self.lock:
+            export_file.download_count += 1
+            with self._get_connection() as conn:
+                conn.execute(
+                    "UPDATE export_files SET download_count = ? WHERE file_id = ?",
+                    (export_file.download_count, file_id)
+                )
+        
+        logger.info(f"File {file_id} download count: {export_file.download_count}")
+        return True
     
     def cleanup_file(self, file_id: str) -> bool:
         """
@@ -151,21 +304,27 @@ class FileManager:
         Returns:
             True if successful, False if file not found
         """
-        if file_id not in self.active_files:
-            return False
-        
-        export_file = self.active_files[file_id]
+        with self.lock:
+            with self._get_connection() as conn:
+                row = conn.execute("SELECT path FROM export_files WHERE file_id = ?", (file_id,)).fetchone()
+                if row is None:
+                    self.active_files.pop(file_id, None)
+                    self._pending_access.pop(file_id, None)
+                    return False
+                conn.execute("DELETE FROM export_files WHERE file_id = ?", (file_id,))
+            self.active_files.pop(file_id, None)
+            self._pending_access.pop(file_id, None)
         
         # Remove physical file
+        path = Path(row['path'])
         try:
-            if export_file.path.exists():
-                export_file.path.unlink()
-                logger.info(f"Deleted file: {export_file.path}")
+            if path.exists():
+                path.unlink()
+                logger.info(f"Deleted file: {path}")
         except Exception as e:
-            logger.warning(f"Failed to delete file {export_file.path}: {str(e)}")
+            logger.warning(f"Failed to delete file {path}: {str(e)}")
         
-        # Remove from tracking
-        self._remove_file_record(export_file)
+        logger.debug(f"Removed file record: {file_id}")
         return True
     
     def cleanup_expired_files(self) -> int:
@@ -175,10 +334,13 @@ class FileManager:
         Returns:
             Number of files cleaned up
         """
-        expired_files = [
-            file_id for file_id, export_file in self.active_files.items()
-            if export_file.is_expired or not export_file.exists
-        ]
+        with self._get_connection() as conn:
+            expired_files = [
+                row['file_id'] for row in conn.execute(
+                    "SELECT file_id FROM export_files WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (datetime.now().timestamp(),)
+                )
+            ]
         
         cleaned_count = 0
         for file_id in expired_files:
@@ -188,6 +350,24 @@ class FileManager:
         logger.info(f"Cleaned up {cleaned_count} expired files")
         return cleaned_count
     
+    def cleanup_missing_files(self) -> int:
+        """
+        Drop records of files deleted from disk outside the file manager
+        
+        Returns:
+            Number of records dropped
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("SELECT file_id, path FROM export_files").fetchall()
+        
+        missing = [row['file_id'] for row in rows if not Path(row['path']).exists()]
+        for file_id in missing:
+            self.cleanup_file(file_id)
+        
+        if missing:
+            logger.info(f"Dropped {len(missing)} records of missing files")
+        return len(missing)
+    
     def cleanup_all_files(self) -> int:
         """
         Clean up all managed files
@@ -195,7 +375,8 @@ class FileManager:
         Returns:
             Number of files cleaned up
         """
-        file_ids = list(self.active_files.keys())
+        with self._get_connection() as conn:
+            file_ids = [row['file_id'] for row in conn.execute("SELECT file_id FROM export_files")]
         cleaned_count = 0
         
         for file_id in file_ids:
@@ -205,6 +386,84 @@ class FileManager:
         logger.info(f"Cleaned up all {cleaned_count} files")
         return cleaned_count
     
+    def _enforce_quota(self, keep: Optional[str] = None) -> int:
+        """Evict least recently used files until the total size fits the quota"""
+        if self.max_total_bytes is None:
+            return 0
+        
+        evicted = 0
+        with self.lock:
+            with self._get_connection() as conn:
+                total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM export_files").fetchone()[0]
+            if total <= self.max_total_bytes:
+                return 0
+            
+            # Eviction order needs the access times recorded since the last flush
+            self._flush_access_times()
+            with self._get_connection() as conn:
+                candidates = conn.execute(
+                    "SELECT file_id, size_bytes FROM export_files WHERE file_id != ? ORDER BY last_accessed",
+                    (keep or '',)
+                ).fetchall()
+            
+            for row in candidates:
+                if total <= self.max_total_bytes:
+                    break
+                if self.cleanup_file(row['file_id']):
+                    total -= row['size_bytes']
+                    evicted += 1
+            self.evicted_count += evicted
+        
+        if evicted:
+            logger.info(f"Evicted {evicted} least recently used export files to stay within quota")
+        return evicted
+    
+    def sweep(self) -> Dict[str, int]:
+        """
+        Remove expired files, drop records of missing files and enforce the quota
+        
+        Also writes pending last-access times and forgets files removed by
+        other managers.
+        
+        Returns:
+            Number of files removed by each step
+        """
+        self._flush_access_times()
+        self._drop_removed_records()
+        result = {
+            'expired': self.cleanup_expired_files(),
+            'missing': self.cleanup_missing_files(),
+            'evicted': self._enforce_quota()
+        }
+        self.sweep_count += 1
+        return result
+    
+    def start_sweeper(self, interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS) -> None:
+        """Sweep periodically on a background thread"""
+        with self.lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._stop_sweeper.clear()
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, args=(interval_seconds,), name="export-file-sweeper", daemon=True
+            )
+            self._sweeper.start()
+        logger.info(f"Started export file sweeper every {interval_seconds:.0f}s")
+    
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper"""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+        self._sweeper = None
+    
+    def _sweep_loop(self, interval_seconds: float) -> None:
+        while not self._stop_sweeper.wait(interval_seconds):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"Export file sweep failed: {e}")
+    
     def get_storage_stats(self) -> Dict[str, Union[int, float]]:
         """
         Get storage statistics for managed files
@@ -212,17 +471,26 @@ class FileManager:
         Returns:
             Dictionary with storage statistics
         """
-        total_files = len(self.active_files)
-        total_size_mb = sum(f.size_mb for f in self.active_files.values())
-        excel_files = sum(1 for f in self.active_files.values() if f.format == "excel")
-        pdf_files = sum(1 for f in self.active_files.values() if f.format == "pdf")
+        with self._get_connection() as conn:
+            row = conn.execute("""
+                SELECT COUNT(*) AS total_files,
+                       COALESCE(SUM(size_bytes), 0) AS total_bytes,
+                       COALESCE(SUM(format = 'excel'), 0) AS excel_files,
+                       COALESCE(SUM(format = 'pdf'), 0) AS pdf_files
+                FROM export_files
+            """).fetchone()
+        
+        total_files = row['total_files']
+        total_size_mb = row['total_bytes'] / BYTES_PER_MB
         
         return {
             'total_files': total_files,
             'total_size_mb': round(total_size_mb, 2),
-            'excel_files': excel_files,
-            'pdf_files': pdf_files,
-            'avg_size_mb': round(total_size_mb / max(total_files, 1), 2)
+            'excel_files': row['excel_files'],
+            'pdf_files': row['pdf_files'],
+            'avg_size_mb': round(total_size_mb / max(total_files, 1), 2),
+            'max_total_mb': round(self.max_total_bytes / BYTES_PER_MB, 2) if self.max_total_bytes is not None else None,
+            'evicted_files': self.evicted_count
         }
     
     def create_download_path(self, export_file: ExportFile) -> Path:
@@ -246,23 +514,22 @@ class FileManager:
         
         return export_file.path.parent / filename
     
-    def _remove_file_record(self, export_file: ExportFile) -> None:
-        """Remove file from tracking records"""
-        # Find and remove file ID
-        file_id_to_remove = None
-        for file_id, tracked_file in self.active_files.items():
-            if tracked_file.path == export_file.path:
-                file_id_to_remove = file_id
-                break
-        
-        if file_id_to_remove:
-            del self.active_files[file_id_to_remove]
-            logger.debug(f"Removed file record: {file_id_to_remove}")
+    @staticmethod
+    def _row_to_file(row: sqlite3.Row) -> ExportFile:
+        return ExportFile(
+            path=Path(row['path']),
+            format=row['format'],
+            template=row['template'],
+            size_mb=row['size_bytes'] / BYTES_PER_MB,
+            generation_time=datetime.fromtimestamp(row['generation_time']),
+            download_count=row['download_count'],
+            expires_at=datetime.fromtimestamp(row['expires_at']) if row['expires_at'] is not None else None
+        )
     
     def __del__(self):
-        """Cleanup on destruction"""
+        """Stop the sweeper on destruction"""
         try:
             # Don't automatically cleanup files - they may be needed for download
-            pass
+            self._stop_sweeper.set()
         except:
             pass
\ No newline at end of file
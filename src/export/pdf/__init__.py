@@ -7,34 +7,50 @@ This module provides PDF export capabilities including:
 - Detailed analysis reports with embedded charts and data tables
 - Professional formatting with corporate branding
 - High-resolution chart rendering and data visualization
+- Native vector charts for compact, fast PDF output
 
 Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
-try:
-    from .pdf_generator import PDFGenerator
-    from .layout_engine import LayoutEngine, LayoutDimensions, ContentType
-    from .chart_renderer import PDFChartRenderer
-    from .executive_templates import ExecutiveTemplateBuilder, TemplateConfig, TemplateType
-    
-    __all__ = [
-        'PDFGenerator',
-        'LayoutEngine',
-        'LayoutDimensions', 
-        'ContentType',
-        'PDFChartRenderer',
-        'ExecutiveTemplateBuilder',
-        'TemplateConfig',
-        'TemplateType'
-    ]
-    
-    PDF_SYSTEM_AVAILABLE = True
-    
-except ImportError as e:
+import importlib
+import importlib.util
+
+# Submodules import on first attribute access; ReportLab, PIL and Plotly
+# load only when a report is actually generated
+_LAZY_EXPORTS = {
+    'PDFGenerator': '.pdf_generator',
+    'LayoutEngine': '.layout_engine',
+    'LayoutDimensions': '.layout_engine',
+    'ContentType': '.layout_engine',
+    'PDFChartRenderer': '.chart_renderer',
+    'VectorChartBuilder': '.vector_charts',
+    'ExecutiveTemplateBuilder': '.executive_templates',
+    'TemplateConfig': '.executive_templates',
+    'TemplateType': '.executive_templates',
+}
+
+PDF_SYSTEM_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+if PDF_SYSTEM_AVAILABLE:
+    __all__ = list(_LAZY_EXPORTS)
+else:
     # Graceful degradation if dependencies not available
     __all__ = []
-    PDF_SYSTEM_AVAILABLE = False
     import logging
-    logging.warning(f"PDF system not fully available: {e}")
+    logging.warning("PDF system not fully available: reportlab is not installed")
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "1.0.0"
\ No newline at end of file
@@ -8,21 +8,22 @@ This module provides:
 - Chart sizing optimization for PDF layouts
 - Batch chart processing for multiple visualizations
 - Print-ready quality (300+ DPI) chart generation
+- In-memory chart rendering for exports without temporary files
 
 Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
 import asyncio
+import importlib.util
+import io
 import logging
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO
 
-try:
-    from ..excel.chart_embedding import ChartEmbedder
-    CHART_EMBEDDER_AVAILABLE = True
-except ImportError:
-    CHART_EMBEDDER_AVAILABLE = False
+# The chart embedder (and Plotly with it) is imported on first raster render
+CHART_EMBEDDER_AVAILABLE = importlib.util.find_spec('plotly') is not None
+if not CHART_EMBEDDER_AVAILABLE:
     logging.warning("Chart embedder not available - PDF charts will be limited")
 
 try:
@@ -32,6 +33,8 @@ except ImportError:
     PIL_AVAILABLE = False
     logging.warning("Pillow not available - image optimization will be limited")
 
+from .vector_charts import TEMPLATE_CHART_TYPES
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +46,9 @@ class PDFChartRenderer:
     specifically for PDF reports with high print quality and professional formatting.
     """
     
+    # Charts used by each report template (all charts if None)
+    TEMPLATE_CHART_TYPES = TEMPLATE_CHART_TYPES
+    
     def __init__(self, output_resolution: int = 300):
         """
         Initialize PDF chart renderer
@@ -50,11 +56,8 @@ class PDFChartRenderer:
         Args:
             output_resolution: Target resolution in DPI for PDF embedding (default 300 for print quality)
         """
-        if not CHART_EMBEDDER_AVAILABLE:
-            raise ImportError("Chart embedder is required for PDF chart rendering")
-        
         self.resolution = output_resolution
-        self.chart_embedder = ChartEmbedder()
+        self._chart_embedder = None
         
         # PDF-optimized settings
         self.pdf_settings = {
@@ -70,6 +73,20 @@ class PDFChartRenderer:
         
         logger.info(f"PDF Chart Renderer initialized at {self.resolution} DPI")
     
+    @property
+    def chart_embedder(self) -> 'ChartEmbedder':
+        """Chart embedder, created on first raster render (loads Plotly)"""
+        if self._chart_embedder is None:
+            if not CHART_EMBEDDER_AVAILABLE:
+                raise ImportError("Chart embedder is required for PDF chart rendering")
+            from ..excel.chart_embedding import ChartEmbedder
+            self._chart_embedder = ChartEmbedder()
+        return self._chart_embedder
+    
+    @chart_embedder.setter
+    def chart_embedder(self, embedder: 'ChartEmbedder') -> None:
+        self._chart_embedder = embedder
+    
     async def render_all_charts_for_pdf(
         self,
         export_data: Dict[str, Any],
@@ -99,25 +116,27 @@ class PDFChartRenderer:
         base_charts = await self.chart_embedder.render_all_charts(
             export_data=export_data,
             resolution=pdf_resolution,
-            output_dir=output_dir
+            output_dir=output_dir,
+            chart_names=chart_types
+        )
+        
+        # Optimize charts for PDF concurrently
+        optimized = await asyncio.gather(
+            *[self._optimize_chart_for_pdf(chart_path, output_dir, chart_name)
+              for chart_name, chart_path in base_charts.items()],
+            return_exceptions=True
         )
         
-        # Optimize charts for PDF
         pdf_optimized_charts = {}
         
-        for chart_name, chart_path in base_charts.items():
-            if chart_types is None or chart_name in chart_types:
-                try:
-                    optimized_path = await self._optimize_chart_for_pdf(
-                        chart_path, output_dir, chart_name
-                    )
-                    pdf_optimized_charts[chart_name] = optimized_path
-                    logger.debug(f"Optimized chart for PDF: {chart_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error optimizing chart {chart_name}: {str(e)}")
-                    # Fall back to original chart
-                    pdf_optimized_charts[chart_name] = chart_path
+        for (chart_name, chart_path), optimized_path in zip(base_charts.items(), optimized):
+            if isinstance(optimized_path, Exception):
+                logger.error(f"Error optimizing chart {chart_name}: {str(optimized_path)}")
+                # Fall back to original chart
+                pdf_optimized_charts[chart_name] = chart_path
+            else:
+                pdf_optimized_charts[chart_name] = optimized_path
+                logger.debug(f"Optimized chart for PDF: {chart_name}")
         
         logger.info(f"Successfully optimized {len(pdf_optimized_charts)} charts for PDF")
         return pdf_optimized_charts
@@ -139,6 +158,11 @@ class PDFChartRenderer:
         Returns:
             Path to PDF-optimized chart image
         """
+        # Image processing is CPU-bound; run it off the event loop
+        return await asyncio.to_thread(self._optimize_chart_file, chart_path, output_dir, chart_name)
+    
+    def _optimize_chart_file(self, chart_path: Path, output_dir: Path, chart_name: str) -> Path:
+        """Apply PDF print optimizations to a chart image file"""
         if not PIL_AVAILABLE:
             # Return original if PIL not available
             return chart_path
@@ -146,40 +170,8 @@ class PDFChartRenderer:
         optimized_path = output_dir / f"{chart_name}_pdf_optimized.png"
         
         try:
-            with PILImage.open(chart_path) as img:
-                # Convert to RGB if needed (removes transparency)
-                if img.mode in ('RGBA', 'LA'):
-                    # Create white background
-                    background = PILImage.new('RGB', img.size, 'white')
-                    if img.mode == 'RGBA':
-                        background.paste(img, mask=img.split()[-1])  # Use alpha channel as mask
-                    else:
-                        background.paste(img, mask=img.split()[-1])
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Enhance for print quality
-                if self.pdf_settings['enhance_contrast']:
-                    # Enhanced contrast and sharpness for print clarity
-                    contrast_enhancer = ImageEnhance.Contrast(img)
-                    img = contrast_enhancer.enhance(1.15)  # 15% contrast boost
-                    
-                    # Slight sharpness enhancement for better text readability
-                    sharpness_enhancer = ImageEnhance.Sharpness(img)
-                    img = sharpness_enhancer.enhance(1.1)  # 10% sharpness boost
-                
-                # Save with optimal settings for PDF
-                img.save(
-                    optimized_path,
-                    'PNG',
-                    dpi=(self.resolution, self.resolution),
-                    optimize=True,
-                    compress_level=6  # Good compression without quality loss
-                )
-                
-                logger.debug(f"Chart optimized: {optimized_path}")
-                
+            self._optimize_image(chart_path, optimized_path)
+            logger.debug(f"Chart optimized: {optimized_path}")
         except Exception as e:
             logger.error(f"Error optimizing chart {chart_name}: {str(e)}")
             # Copy original file as fallback
@@ -188,6 +180,106 @@ class PDFChartRenderer:
         
         return optimized_path
     
+    def _optimize_chart_bytes(self, image_bytes: bytes, chart_name: str) -> bytes:
+        """Apply PDF print optimizations to an in-memory chart image"""
+        if not PIL_AVAILABLE:
+            return image_bytes
+        
+        output = io.BytesIO()
+        try:
+            self._optimize_image(io.BytesIO(image_bytes), output)
+        except Exception as e:
+            logger.error(f"Error optimizing chart {chart_name}: {str(e)}")
+            # Fall back to the original image
+            return image_bytes
+        
+        return output.getvalue()
+    
+    def _optimize_image(self, source: Union[Path, BinaryIO], destination: Union[Path, BinaryIO]) -> None:
+        """Write a print-optimized PNG of source to destination (paths or binary streams)"""
+        with PILImage.open(source) as img:
+            # Convert to RGB if needed (removes transparency)
+            if img.mode in ('RGBA', 'LA'):
+                # Create white background
+                background = PILImage.new('RGB', img.size, 'white')
+                background.paste(img, mask=img.split()[-1])  # Use alpha channel as mask
+                img = background
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Enhance for print quality
+            if self.pdf_settings['enhance_contrast']:
+                # Enhanced contrast and sharpness for print clarity
+                contrast_enhancer = ImageEnhance.Contrast(img)
+                img = contrast_enhancer.enhance(1.15)  # 15% contrast boost
+                
+                # Slight sharpness enhancement for better text readability
+                sharpness_enhancer = ImageEnhance.Sharpness(img)
+                img = sharpness_enhancer.enhance(1.1)  # 10% sharpness boost
+            
+            # Save with optimal settings for PDF
+            img.save(
+                destination,
+                'PNG',
+                dpi=(self.resolution, self.resolution),
+                optimize=True,
+                compress_level=6  # Good compression without quality loss
+            )
+    
+    async def render_chart_images_for_pdf(
+        self,
+        export_data: Dict[str, Any],
+        chart_types: Optional[List[str]] = None
+    ) -> Dict[str, bytes]:
+        """
+        Render charts optimized for PDF embedding entirely in memory
+        
+        Args:
+            export_data: Complete export data with analysis results
+            chart_types: Specific chart types to render (all if None)
+            
+        Returns:
+            Dictionary mapping chart names to optimized PNG bytes
+        """
+        pdf_resolution = int(self.resolution * self.pdf_settings.get('dpi_scale_factor', 1.0))
+        base_charts = await self.chart_embedder.render_all_chart_images(
+            export_data=export_data,
+            resolution=pdf_resolution,
+            chart_names=chart_types
+        )
+        
+        # Image processing is CPU-bound; optimize off the event loop, concurrently
+        optimized = await asyncio.gather(
+            *[asyncio.to_thread(self._optimize_chart_bytes, image_bytes, chart_name)
+              for chart_name, image_bytes in base_charts.items()]
+        )
+        
+        logger.info(f"Rendered {len(base_charts)} PDF charts in memory")
+        return dict(zip(base_charts, optimized))
+    
+    async def render_template_chart_images(
+        self,
+        export_data: Dict[str, Any],
+        template_type: str
+    ) -> Dict[str, bytes]:
+        """
+        Render the charts used by a report template in memory
+        
+        Args:
+            export_data: Export data
+            template_type: Template type ('executive', 'detailed', 'investor')
+            
+        Returns:
+            Dictionary mapping chart names to optimized PNG bytes
+        """
+        if template_type not in self.TEMPLATE_CHART_TYPES:
+            raise ValueError(f"Unknown template type: {template_type}")
+        
+        return await self.render_chart_images_for_pdf(
+            export_data=export_data,
+            chart_types=self.TEMPLATE_CHART_TYPES[template_type]
+        )
+    
     async def render_executive_summary_charts(
         self,
         export_data: Dict[str, Any],
@@ -203,15 +295,10 @@ class PDFChartRenderer:
         Returns:
             Dictionary of executive summary chart paths
         """
-        executive_chart_types = [
-            'npv_comparison',
-            'financial_metrics'
-        ]
-        
         return await self.render_all_charts_for_pdf(
             export_data=export_data,
             output_dir=output_dir,
-            chart_types=executive_chart_types
+            chart_types=self.TEMPLATE_CHART_TYPES['executive']
         )
     
     async def render_detailed_analysis_charts(
@@ -231,7 +318,8 @@ class PDFChartRenderer:
         """
         return await self.render_all_charts_for_pdf(
             export_data=export_data,
-            output_dir=output_dir
+            output_dir=output_dir,
+            chart_types=self.TEMPLATE_CHART_TYPES['detailed']
         )
     
     async def render_investor_presentation_charts(
@@ -249,16 +337,10 @@ class PDFChartRenderer:
         Returns:
             Dictionary of investor-focused chart paths
         """
-        investor_chart_types = [
-            'npv_comparison',
-            'annual_cash_flows',
-            'sensitivity_analysis'
-        ]
-        
         return await self.render_all_charts_for_pdf(
             export_data=export_data,
             output_dir=output_dir,
-            chart_types=investor_chart_types
+            chart_types=self.TEMPLATE_CHART_TYPES['investor']
         )
     
     async def create_custom_pdf_chart(
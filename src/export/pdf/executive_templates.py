@@ -32,7 +32,8 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     logging.warning("ReportLab not available - templates will be limited")
 
-from .layout_engine import LayoutEngine, ContentType
+from ..report_model import extract_cash_flows
+from .layout_engine import LayoutEngine, ContentType, chart_flowable
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class TemplateConfig:
     include_toc: bool = False
     include_appendix: bool = False
     branding: Dict[str, Any] = None
+    chart_style: str = 'raster'  # 'raster' (Plotly images) or 'vector' (native drawings)
 
 
 class ExecutiveTemplateBuilder:
@@ -307,7 +309,7 @@ class ExecutiveTemplateBuilder:
             story.append(Paragraph("Net Present Value Analysis", self.styles['SectionHeader']))
             try:
                 chart_width, chart_height = self.layout.optimize_chart_size(ContentType.CHART, 11, 1.4)
-                chart_img = Image(str(chart_images['npv_comparison']), width=chart_width, height=chart_height)
+                chart_img = chart_flowable(chart_images['npv_comparison'], chart_width, chart_height)
                 # Center the chart
                 chart_container = KeepTogether([chart_img])
                 story.append(chart_container)
@@ -380,13 +382,13 @@ class ExecutiveTemplateBuilder:
             if 'annual_cash_flows' in chart_images:
                 story.append(Paragraph("Annual Cash Flow Projections", self.styles['Highlight']))
                 chart_width, chart_height = self.layout.optimize_chart_size(ContentType.CHART, 12, 1.8)
-                annual_chart = Image(str(chart_images['annual_cash_flows']), width=chart_width, height=chart_height)
+                annual_chart = chart_flowable(chart_images['annual_cash_flows'], chart_width, chart_height)
                 story.append(annual_chart)
                 story.append(Spacer(1, 0.2 * inch))
             
             if 'cumulative_cash_flows' in chart_images:
                 story.append(Paragraph("Cumulative Cash Flow Analysis", self.styles['Highlight']))
-                cumulative_chart = Image(str(chart_images['cumulative_cash_flows']), width=chart_width, height=chart_height)
+                cumulative_chart = chart_flowable(chart_images['cumulative_cash_flows'], chart_width, chart_height)
                 story.append(cumulative_chart)
                 story.append(Spacer(1, 0.2 * inch))
         
@@ -394,7 +396,7 @@ class ExecutiveTemplateBuilder:
         if chart_images and 'financial_metrics' in chart_images:
             story.append(PageBreak())
             story.append(Paragraph("Comprehensive Financial Metrics", self.styles['SectionHeader']))
-            metrics_chart = Image(str(chart_images['financial_metrics']), width=chart_width, height=chart_height-1*inch)
+            metrics_chart = chart_flowable(chart_images['financial_metrics'], chart_width, chart_height-1*inch)
             story.append(metrics_chart)
         
         # Sensitivity analysis
@@ -409,7 +411,7 @@ class ExecutiveTemplateBuilder:
             """
             story.append(Paragraph(sensitivity_text, self.styles['ExecutiveBody']))
             
-            sensitivity_chart = Image(str(chart_images['sensitivity_analysis']), width=chart_width, height=chart_height-1*inch)
+            sensitivity_chart = chart_flowable(chart_images['sensitivity_analysis'], chart_width, chart_height-1*inch)
             story.append(sensitivity_chart)
         
         # Cash flow tables
@@ -483,13 +485,13 @@ class ExecutiveTemplateBuilder:
         
         if chart_images and 'npv_comparison' in chart_images:
             chart_width, chart_height = self.layout.optimize_chart_size(ContentType.CHART, 12, 1.5)
-            npv_chart = Image(str(chart_images['npv_comparison']), width=chart_width, height=chart_height)
+            npv_chart = chart_flowable(chart_images['npv_comparison'], chart_width, chart_height)
             story.append(npv_chart)
             story.append(Spacer(1, 0.2 * inch))
         
         if chart_images and 'annual_cash_flows' in chart_images:
             story.append(Paragraph("Projected Cash Flow Performance", self.styles['Highlight']))
-            cash_flow_chart = Image(str(chart_images['annual_cash_flows']), width=chart_width, height=chart_height)
+            cash_flow_chart = chart_flowable(chart_images['annual_cash_flows'], chart_width, chart_height)
             story.append(cash_flow_chart)
         
         # Market opportunity
@@ -503,7 +505,7 @@ class ExecutiveTemplateBuilder:
         story.append(Paragraph("Investment Risk Profile", self.styles['SectionHeader']))
         
         if chart_images and 'sensitivity_analysis' in chart_images:
-            sensitivity_chart = Image(str(chart_images['sensitivity_analysis']), width=chart_width, height=chart_height-0.5*inch)
+            sensitivity_chart = chart_flowable(chart_images['sensitivity_analysis'], chart_width, chart_height-0.5*inch)
             story.append(sensitivity_chart)
             story.append(Spacer(1, 0.2 * inch))
         
@@ -654,25 +656,7 @@ class ExecutiveTemplateBuilder:
         Returns:
             List of cash flow values
         """
-        if isinstance(flows_data, list):
-            # List of flow dictionaries - extract 'net_cash_flow' values
-            return [
-                flow.get('net_cash_flow', 0) if isinstance(flow, dict) else float(flow)
-                for flow in flows_data
-            ]
-        elif isinstance(flows_data, dict):
-            if 'annual_cash_flows' in flows_data:
-                # Dictionary format with 'annual_cash_flows' key
-                annual_flows = flows_data['annual_cash_flows']
-                if isinstance(annual_flows, list):
-                    return annual_flows
-                else:
-                    return [annual_flows] if annual_flows is not None else []
-            else:
-                # If no 'annual_cash_flows' key, try to extract from list format embedded in dict
-                return []
-        else:
-            return []
+        return extract_cash_flows(flows_data)
 
     def _create_detailed_cash_flow_table(self, flows_data: Dict[str, Any], scenario: str) -> Table:
         """Create detailed cash flow projection table"""
@@ -12,7 +12,9 @@ This module provides:
 Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
+import io
 import logging
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -35,6 +37,28 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def chart_image_source(image: Union[str, Path, bytes]) -> Union[str, io.BytesIO]:
+    """
+    Image argument for a ReportLab Image flowable
+    
+    Charts are passed around either as file paths or as in-memory PNG bytes.
+    """
+    if isinstance(image, (bytes, bytearray)):
+        return io.BytesIO(image)
+    return str(image)
+
+
+def chart_flowable(chart: Any, width: float, height: float) -> Any:
+    """
+    Flowable for a chart at the given size
+    
+    Vector charts are drawn at that size; rendered images are scaled into it.
+    """
+    if hasattr(chart, 'to_drawing'):
+        return chart.to_drawing(width, height)
+    return Image(chart_image_source(chart), width=width, height=height)
+
+
 class PageOrientation(Enum):
     """Page orientation options"""
     PORTRAIT = "portrait"
@@ -46,6 +46,9 @@ except ImportError:
     PIL_AVAILABLE = False
     logging.warning("Pillow not available - image processing may be limited")
 
+from ..report_model import extract_cash_flows
+from .layout_engine import chart_flowable
+
 logger = logging.getLogger(__name__)
 
 
@@ -379,7 +382,7 @@ class PDFGenerator:
         if chart_images and 'npv_comparison' in chart_images:
             story.append(Paragraph("NPV Comparison Analysis", self.styles['Heading2']))
             # Better sized chart with professional positioning
-            chart_img = Image(str(chart_images['npv_comparison']), width=6.5*inch, height=3.8*inch)
+            chart_img = chart_flowable(chart_images['npv_comparison'], 6.5*inch, 3.8*inch)
             # Center the chart using KeepTogether
             chart_container = KeepTogether([chart_img])
             story.append(chart_container)
@@ -458,13 +461,13 @@ class PDFGenerator:
         # Cash flow analysis
         if chart_images and 'annual_cash_flows' in chart_images:
             story.append(Paragraph("Annual Cash Flow Analysis", self.styles['Heading2']))
-            annual_chart = Image(str(chart_images['annual_cash_flows']), width=7*inch, height=4.5*inch)
+            annual_chart = chart_flowable(chart_images['annual_cash_flows'], 7*inch, 4.5*inch)
             story.append(annual_chart)
             story.append(Spacer(1, 0.25 * inch))
         
         if chart_images and 'cumulative_cash_flows' in chart_images:
             story.append(Paragraph("Cumulative Cash Flow Analysis", self.styles['Heading2']))
-            cumulative_chart = Image(str(chart_images['cumulative_cash_flows']), width=7*inch, height=4.5*inch)
+            cumulative_chart = chart_flowable(chart_images['cumulative_cash_flows'], 7*inch, 4.5*inch)
             story.append(cumulative_chart)
             story.append(Spacer(1, 0.25 * inch))
         
@@ -472,14 +475,14 @@ class PDFGenerator:
         story.append(PageBreak())
         if chart_images and 'financial_metrics' in chart_images:
             story.append(Paragraph("Financial Metrics Comparison", self.styles['Heading2']))
-            metrics_chart = Image(str(chart_images['financial_metrics']), width=7*inch, height=4*inch)
+            metrics_chart = chart_flowable(chart_images['financial_metrics'], 7*inch, 4*inch)
             story.append(metrics_chart)
             story.append(Spacer(1, 0.25 * inch))
         
         # Sensitivity analysis
         if chart_images and 'sensitivity_analysis' in chart_images:
             story.append(Paragraph("Sensitivity Analysis", self.styles['Heading2']))
-            sensitivity_chart = Image(str(chart_images['sensitivity_analysis']), width=7*inch, height=4*inch)
+            sensitivity_chart = chart_flowable(chart_images['sensitivity_analysis'], 7*inch, 4*inch)
             story.append(sensitivity_chart)
             story.append(Spacer(1, 0.25 * inch))
         
@@ -532,7 +535,7 @@ class PDFGenerator:
         story.append(Paragraph("Investment Metrics", self.styles['Heading2']))
         
         if chart_images and 'npv_comparison' in chart_images:
-            npv_chart = Image(str(chart_images['npv_comparison']), width=6*inch, height=4*inch)
+            npv_chart = chart_flowable(chart_images['npv_comparison'], 6*inch, 4*inch)
             story.append(npv_chart)
         
         # Financial projections
@@ -540,7 +543,7 @@ class PDFGenerator:
         story.append(Paragraph("Financial Projections", self.styles['Heading2']))
         
         if chart_images and 'annual_cash_flows' in chart_images:
-            cash_flow_chart = Image(str(chart_images['annual_cash_flows']), width=7*inch, height=4.5*inch)
+            cash_flow_chart = chart_flowable(chart_images['annual_cash_flows'], 7*inch, 4.5*inch)
             story.append(cash_flow_chart)
         
         # Risk assessment
@@ -548,7 +551,7 @@ class PDFGenerator:
         story.append(Paragraph("Risk Assessment", self.styles['Heading2']))
         
         if chart_images and 'sensitivity_analysis' in chart_images:
-            sensitivity_chart = Image(str(chart_images['sensitivity_analysis']), width=7*inch, height=4*inch)
+            sensitivity_chart = chart_flowable(chart_images['sensitivity_analysis'], 7*inch, 4*inch)
             story.append(sensitivity_chart)
         
         risk_assessment_text = f"""
@@ -586,25 +589,7 @@ class PDFGenerator:
         Returns:
             List of cash flow values
         """
-        if isinstance(flows_data, list):
-            # List of flow dictionaries - extract 'net_cash_flow' values
-            return [
-                flow.get('net_cash_flow', 0) if isinstance(flow, dict) else float(flow)
-                for flow in flows_data
-            ]
-        elif isinstance(flows_data, dict):
-            if 'annual_cash_flows' in flows_data:
-                # Dictionary format with 'annual_cash_flows' key
-                annual_flows = flows_data['annual_cash_flows']
-                if isinstance(annual_flows, list):
-                    return annual_flows
-                else:
-                    return [annual_flows] if annual_flows is not None else []
-            else:
-                # If no 'annual_cash_flows' key, try to extract from list format embedded in dict
-                return []
-        else:
-            return []
+        return extract_cash_flows(flows_data)
 
     def _create_cash_flow_table(self, flows_data: Dict[str, Any], title: str) -> Table:
         """Create formatted cash flow table"""
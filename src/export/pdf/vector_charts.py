@@ -0,0 +1,375 @@
+"""
+PDF Vector Charts
+Native ReportLab drawings for PDF report charts
+
+This module provides:
+- NPV comparison, cash flow and financial metrics charts drawn directly
+  from the analysis data with reportlab.graphics
+- Charts sized at layout time, so text is never stretched or resampled
+
+Vector charts skip the Plotly to PNG round trip: no browser renderer, no
+image optimization and only a few kilobytes of drawing operators per chart
+in the PDF.
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.charts.legends import Legend
+    from reportlab.graphics.charts.lineplots import LinePlot
+    from reportlab.graphics.shapes import Drawing, Rect, String
+    from reportlab.graphics.widgets.markers import makeMarker
+    from reportlab.lib.colors import HexColor
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+    logging.warning("ReportLab not available - vector charts will be disabled")
+
+from ..report_model import extract_cash_flows
+
+logger = logging.getLogger(__name__)
+
+# Charts used by each report template (all charts if None)
+TEMPLATE_CHART_TYPES = {
+    'executive': ['npv_comparison', 'financial_metrics'],
+    'detailed': None,
+    'investor': ['npv_comparison', 'annual_cash_flows', 'sensitivity_analysis']
+}
+
+# Same palette as the Plotly charts
+CHART_COLORS = {
+    'text': '#2D3436',
+    'grid': '#E5E5E5',
+    'zero_line': '#999999',
+    'favorable': '#00B894',
+    'unfavorable': '#E17055',
+    'ownership': '#FF6B6B',
+    'rental': '#74B9FF',
+    'recommend_buy': '#00B894',
+    'recommend_other': '#FDCB6E',
+    'metrics': [('#FF6B6B', '#74B9FF'), ('#FFA07A', '#96CEB4'), ('#FECA57', '#DDA0DD')]
+}
+
+FONT = 'Helvetica'
+BOLD_FONT = 'Helvetica-Bold'
+
+
+def format_currency_axis(value: float) -> str:
+    """Compact dollar label for axis ticks"""
+    magnitude = abs(value)
+    sign = '-' if value < 0 else ''
+    if magnitude >= 1_000_000:
+        return f"{sign}${magnitude / 1_000_000:,.1f}M"
+    if magnitude >= 1_000:
+        return f"{sign}${magnitude / 1_000:,.0f}K"
+    return f"{sign}${magnitude:,.0f}"
+
+
+@dataclass
+class VectorChart:
+    """
+    A chart drawn at whatever size the layout gives it
+
+    Passed in place of chart image bytes or paths; see chart_flowable().
+    """
+
+    name: str
+    draw: Callable[[float, float], 'Drawing']
+
+    def to_drawing(self, width: float, height: float) -> 'Drawing':
+        return self.draw(width, height)
+
+
+class VectorChartBuilder:
+    """
+    Builds native PDF charts from export data
+
+    Mirrors the charts produced by ChartEmbedder for the PDF templates.
+    The sensitivity chart is not drawn: its Plotly version shows placeholder
+    values rather than analysis data.
+    """
+
+    def __init__(self):
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("ReportLab is required for vector chart rendering")
+
+    def build_charts(
+        self,
+        export_data: Dict[str, Any],
+        chart_types: Optional[List[str]] = None
+    ) -> Dict[str, VectorChart]:
+        """
+        Build vector charts from export data
+
+        Args:
+            export_data: Complete export data with analysis results
+            chart_types: Specific chart types to build (all if None)
+
+        Returns:
+            Dictionary mapping chart names to vector charts
+        """
+        def wanted(name: str) -> bool:
+            return chart_types is None or name in chart_types
+
+        analysis_results = export_data.get('analysis_results', {})
+        charts = {}
+
+        if wanted('npv_comparison'):
+            charts['npv_comparison'] = VectorChart(
+                'npv_comparison', lambda width, height: self.draw_npv_comparison(analysis_results, width, height)
+            )
+
+        ownership = extract_cash_flows(export_data.get('ownership_flows', {}))
+        rental = extract_cash_flows(export_data.get('rental_flows', {}))
+        if ownership and rental:
+            if wanted('annual_cash_flows'):
+                charts['annual_cash_flows'] = VectorChart(
+                    'annual_cash_flows',
+                    lambda width, height: self.draw_cash_flows(
+                        'Annual Cash Flow Comparison', ownership, rental, width, height
+                    )
+                )
+            if wanted('cumulative_cash_flows'):
+                ownership_cumulative = _running_total(ownership)
+                rental_cumulative = _running_total(rental)
+                charts['cumulative_cash_flows'] = VectorChart(
+                    'cumulative_cash_flows',
+                    lambda width, height: self.draw_cash_flows(
+                        'Cumulative Cash Flow Comparison', ownership_cumulative, rental_cumulative, width, height
+                    )
+                )
+        else:
+            logger.warning("Insufficient cash flow data for vector cash flow charts")
+
+        if wanted('financial_metrics'):
+            charts['financial_metrics'] = VectorChart(
+                'financial_metrics', lambda width, height: self.draw_financial_metrics(analysis_results, width, height)
+            )
+
+        return charts
+
+    def build_template_charts(self, export_data: Dict[str, Any], template_type: str) -> Dict[str, VectorChart]:
+        """
+        Build the vector charts used by a report template
+
+        Args:
+            export_data: Export data
+            template_type: Template type ('executive', 'detailed', 'investor')
+
+        Returns:
+            Dictionary mapping chart names to vector charts
+        """
+        if template_type not in TEMPLATE_CHART_TYPES:
+            raise ValueError(f"Unknown template type: {template_type}")
+
+        return self.build_charts(export_data, TEMPLATE_CHART_TYPES[template_type])
+
+    def draw_npv_comparison(self, analysis_results: Dict[str, Any], width: float, height: float) -> 'Drawing':
+        """NPV comparison bar chart with the recommendation badge"""
+        ownership_npv = float(analysis_results.get('ownership_npv', 0))
+        rental_npv = float(analysis_results.get('rental_npv', 0))
+
+        drawing = Drawing(width, height)
+        self._add_title(drawing, 'Net Present Value Comparison', width, height)
+
+        recommendation = analysis_results.get('recommendation', 'UNKNOWN')
+        badge_height = 0
+        if recommendation != 'UNKNOWN':
+            badge_height = 22
+            badge_width = 160
+            is_buy = recommendation == 'BUY'
+            drawing.add(Rect(
+                (width - badge_width) / 2, height - 52, badge_width, 18,
+                fillColor=HexColor(CHART_COLORS['recommend_buy' if is_buy else 'recommend_other']),
+                strokeColor=HexColor(CHART_COLORS['text']), strokeWidth=1
+            ))
+            drawing.add(String(
+                width / 2, height - 47, f"Recommendation: {recommendation}", fontName=BOLD_FONT, fontSize=10,
+                fillColor=HexColor('#FFFFFF' if is_buy else CHART_COLORS['text']), textAnchor='middle'
+            ))
+
+        chart = VerticalBarChart()
+        self._place(chart, width, height, top=40 + badge_height + 16)
+        chart.data = [(ownership_npv, rental_npv)]
+        chart.categoryAxis.categoryNames = ['Ownership', 'Rental']
+        # Bar width and group spacing are relative: bars fill 60% of each category
+        chart.barWidth = 6
+        chart.groupSpacing = 4
+        self._style_value_axis(chart.valueAxis, [ownership_npv, rental_npv])
+        self._style_category_axis(chart.categoryAxis)
+
+        for index, (value, other) in enumerate([(ownership_npv, rental_npv), (rental_npv, ownership_npv)]):
+            chart.bars[(0, index)].fillColor = HexColor(
+                CHART_COLORS['favorable'] if value > other else CHART_COLORS['unfavorable']
+            )
+        chart.bars.strokeColor = HexColor(CHART_COLORS['text'])
+        chart.bars.strokeWidth = 1
+
+        chart.barLabels.fontName = BOLD_FONT
+        chart.barLabels.fontSize = 9
+        chart.barLabels.fillColor = HexColor(CHART_COLORS['text'])
+        chart.barLabels.nudge = 8
+        chart.barLabelFormat = lambda value: f"${value:,.0f}"
+
+        drawing.add(chart)
+        return drawing
+
+    def draw_cash_flows(
+        self,
+        title: str,
+        ownership: Sequence[float],
+        rental: Sequence[float],
+        width: float,
+        height: float
+    ) -> 'Drawing':
+        """Ownership vs rental line chart over the analysis years"""
+        drawing = Drawing(width, height)
+        self._add_title(drawing, title, width, height)
+
+        plot = LinePlot()
+        self._place(plot, width, height, top=62)
+        plot.data = [
+            [(year + 1, value) for year, value in enumerate(ownership)],
+            [(year + 1, value) for year, value in enumerate(rental)]
+        ]
+
+        for index, key in enumerate(('ownership', 'rental')):
+            plot.lines[index].strokeColor = HexColor(CHART_COLORS[key])
+            plot.lines[index].strokeWidth = 2
+            plot.lines[index].symbol = makeMarker('FilledCircle', size=3, fillColor=HexColor(CHART_COLORS[key]))
+
+        years = max(len(ownership), len(rental))
+        plot.xValueAxis.valueMin = 1
+        plot.xValueAxis.valueMax = max(years, 2)
+        plot.xValueAxis.valueSteps = _year_ticks(years)
+        plot.xValueAxis.labels.fontName = FONT
+        plot.xValueAxis.labels.fontSize = 8
+        plot.xValueAxis.labels.fillColor = HexColor(CHART_COLORS['text'])
+        plot.xValueAxis.visibleGrid = True
+        plot.xValueAxis.gridStrokeColor = HexColor(CHART_COLORS['grid'])
+        self._style_value_axis(plot.yValueAxis, list(ownership) + list(rental))
+
+        drawing.add(plot)
+        drawing.add(self._legend(
+            [(CHART_COLORS['ownership'], 'Ownership'), (CHART_COLORS['rental'], 'Rental')],
+            x=plot.x + 8, y=height - 40
+        ))
+        drawing.add(String(
+            plot.x + plot.width / 2, 6, 'Year', fontName=FONT, fontSize=9,
+            fillColor=HexColor(CHART_COLORS['text']), textAnchor='middle'
+        ))
+        return drawing
+
+    def draw_financial_metrics(self, analysis_results: Dict[str, Any], width: float, height: float) -> 'Drawing':
+        """NPV, initial investment and IRR side by side"""
+        metrics = [
+            ('Net Present Value', analysis_results.get('ownership_npv', 0), analysis_results.get('rental_npv', 0), True),
+            ('Initial Investment', analysis_results.get('ownership_initial_investment', 0),
+             analysis_results.get('rental_initial_investment', 0), True),
+            ('Internal Rate of Return', analysis_results.get('ownership_irr', 0) * 100,
+             analysis_results.get('rental_irr', 0) * 100, False)
+        ]
+
+        drawing = Drawing(width, height)
+        self._add_title(drawing, 'Key Financial Metrics Comparison', width, height)
+
+        panel_width = width / len(metrics)
+        for index, (label, ownership, rental, currency) in enumerate(metrics):
+            ownership, rental = float(ownership or 0), float(rental or 0)
+            drawing.add(String(
+                panel_width * index + panel_width / 2, height - 44, label, fontName=BOLD_FONT, fontSize=9,
+                fillColor=HexColor(CHART_COLORS['text']), textAnchor='middle'
+            ))
+
+            chart = VerticalBarChart()
+            chart.x = panel_width * index + 48
+            chart.y = 28
+            chart.width = panel_width - 60
+            chart.height = height - 84
+            chart.data = [(ownership, rental)]
+            chart.categoryAxis.categoryNames = ['Ownership', 'Rental']
+            chart.barWidth = 6
+            chart.groupSpacing = 4
+            self._style_category_axis(chart.categoryAxis)
+            self._style_value_axis(
+                chart.valueAxis, [ownership, rental], None if currency else (lambda value: f"{value:.1f}%")
+            )
+
+            ownership_color, rental_color = CHART_COLORS['metrics'][index]
+            chart.bars[(0, 0)].fillColor = HexColor(ownership_color)
+            chart.bars[(0, 1)].fillColor = HexColor(rental_color)
+            chart.bars.strokeColor = None
+            drawing.add(chart)
+
+        return drawing
+
+    def _add_title(self, drawing: 'Drawing', title: str, width: float, height: float) -> None:
+        drawing.add(String(
+            width / 2, height - 20, title, fontName=BOLD_FONT, fontSize=14,
+            fillColor=HexColor(CHART_COLORS['text']), textAnchor='middle'
+        ))
+
+    def _place(self, chart: Any, width: float, height: float, top: float) -> None:
+        """Position a chart inside the drawing, leaving room for axis labels"""
+        chart.x = 70
+        chart.y = 36
+        chart.width = max(width - 90, 10)
+        chart.height = max(height - chart.y - top, 10)
+
+    def _style_value_axis(
+        self,
+        axis: Any,
+        values: Sequence[float],
+        label_format: Optional[Callable[[float], str]] = None
+    ) -> None:
+        low = min(min(values, default=0), 0)
+        high = max(max(values, default=0), 0)
+        padding = (high - low) * 0.15 or 1
+        axis.valueMin = low - padding if low < 0 else 0
+        axis.valueMax = high + padding if high > 0 else 0
+        axis.labelTextFormat = label_format or format_currency_axis
+        axis.labels.fontName = FONT
+        axis.labels.fontSize = 8
+        axis.labels.fillColor = HexColor(CHART_COLORS['text'])
+        axis.visibleGrid = True
+        axis.gridStrokeColor = HexColor(CHART_COLORS['grid'])
+        axis.strokeColor = HexColor(CHART_COLORS['zero_line'])
+
+    def _style_category_axis(self, axis: Any) -> None:
+        axis.labels.fontName = FONT
+        axis.labels.fontSize = 9
+        axis.labels.fillColor = HexColor(CHART_COLORS['text'])
+        axis.strokeColor = HexColor(CHART_COLORS['zero_line'])
+        # Draw the category axis at zero when values go negative
+        axis.joinAxisMode = 'bottom'
+
+    def _legend(self, entries: List[tuple], x: float, y: float) -> 'Legend':
+        legend = Legend()
+        legend.x = x
+        legend.y = y
+        legend.alignment = 'right'
+        legend.columnMaximum = 1
+        legend.deltax = 80
+        legend.fontName = FONT
+        legend.fontSize = 8
+        legend.colorNamePairs = [(HexColor(color), label) for color, label in entries]
+        return legend
+
+
+def _running_total(values: Sequence[float]) -> List[float]:
+    total = 0.0
+    totals = []
+    for value in values:
+        total += value
+        totals.append(total)
+    return totals
+
+
+def _year_ticks(years: int) -> List[int]:
+    step = max(1, (years + 9) // 10)
+    return list(range(1, years + 1, step))
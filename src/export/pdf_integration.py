@@ -13,25 +13,25 @@ Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
 """
 
 import asyncio
+import importlib.util
 import logging
 import tempfile
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Callable
+from typing import Dict, List, Any, Optional, Tuple, Callable, Union
 from datetime import datetime
 import io
 
-# Streamlit integration
-try:
-    import streamlit as st
-    STREAMLIT_AVAILABLE = True
-except ImportError:
-    STREAMLIT_AVAILABLE = False
+# Streamlit integration (imported by the UI methods, so batch report generation doesn't load it)
+STREAMLIT_AVAILABLE = importlib.util.find_spec('streamlit') is not None
+if not STREAMLIT_AVAILABLE:
     logging.warning("Streamlit not available - some features will be limited")
 
 # PDF generation imports
 try:
     from .pdf.pdf_generator import PDFGenerator
     from .pdf.chart_renderer import PDFChartRenderer
+    from .pdf.vector_charts import VectorChartBuilder
     from .pdf.layout_engine import LayoutEngine
     from .pdf.executive_templates import ExecutiveTemplateBuilder, TemplateConfig, TemplateType
     PDF_SYSTEM_AVAILABLE = True
@@ -39,6 +39,8 @@ except ImportError:
     PDF_SYSTEM_AVAILABLE = False
     logging.warning("PDF system not available - PDF generation will be disabled")
 
+from .report_model import get_report_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +59,7 @@ class PDFExportManager:
         
         self.pdf_generator = PDFGenerator()
         self.chart_renderer = PDFChartRenderer(output_resolution=300)
+        self.vector_chart_builder = VectorChartBuilder()
         
         # Template configurations
         self.template_configs = {
@@ -87,8 +90,9 @@ class PDFExportManager:
         export_data: Dict[str, Any],
         template_type: str = 'executive',
         custom_config: Optional[Dict[str, Any]] = None,
-        progress_callback: Optional[Callable] = None
-    ) -> Tuple[Path, Dict[str, Any]]:
+        progress_callback: Optional[Callable] = None,
+        in_memory: bool = False
+    ) -> Tuple[Union[Path, io.BytesIO], Dict[str, Any]]:
         """
         Generate complete PDF report with charts
         
@@ -97,9 +101,10 @@ class PDFExportManager:
             template_type: Template type ('executive', 'detailed', 'investor')
             custom_config: Custom configuration overrides
             progress_callback: Optional callback for progress updates
-            
+            in_memory: Render charts and the PDF into memory instead of temporary files
+        
         Returns:
-            Tuple of (pdf_path, generation_info)
+            Tuple of (pdf_path, generation_info), or (BytesIO buffer, generation_info) when in_memory
         """
         logger.info(f"Generating PDF report: {template_type}")
         
@@ -123,44 +128,40 @@ class PDFExportManager:
             if not validation['is_valid']:
                 raise ValueError(f"Invalid export data: {validation}")
             
-            # Set up temporary directory for charts
-            temp_dir = Path(tempfile.mkdtemp()) / "pdf_generation"
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            # Build from the shared report model (cash flows already normalized)
+            export_data = get_report_model(export_data).normalized_export_data
             
             # Update progress
             if progress_callback:
                 progress_callback("Rendering charts for PDF...", 0.3)
             
+            # Resolve template configuration (copied so overrides don't leak into later reports)
+            template_config = replace(self.template_configs[template_type])
+            if custom_config:
+                # Apply custom configuration
+                for key, value in custom_config.items():
+                    if hasattr(template_config, key):
+                        setattr(template_config, key, value)
+            
             # Render charts optimized for PDF
-            if template_type == 'executive':
-                chart_images = await self.chart_renderer.render_executive_summary_charts(
-                    export_data, temp_dir
-                )
-            elif template_type == 'detailed':
-                chart_images = await self.chart_renderer.render_detailed_analysis_charts(
-                    export_data, temp_dir
-                )
-            elif template_type == 'investor':
-                chart_images = await self.chart_renderer.render_investor_presentation_charts(
-                    export_data, temp_dir
+            vector_charts = template_config.chart_style == 'vector'
+            if vector_charts:
+                # Drawn natively from the analysis data, no image rendering
+                chart_images = self.vector_chart_builder.build_template_charts(export_data, template_type)
+            elif in_memory:
+                chart_images = await self.chart_renderer.render_template_chart_images(
+                    export_data, template_type
                 )
             else:
-                raise ValueError(f"Unknown template type: {template_type}")
+                chart_images = await self._render_chart_files(export_data, template_type)
             
             generation_info['charts_rendered'] = len(chart_images)
+            generation_info['chart_style'] = template_config.chart_style
             
             # Update progress
             if progress_callback:
                 progress_callback("Generating PDF document...", 0.7)
             
-            # Generate PDF with template
-            template_config = self.template_configs[template_type]
-            if custom_config:
-                # Apply custom configuration
-                for key, value in custom_config.items():
-                    if hasattr(template_config, key):
-                        setattr(template_config, key, value)
-            
             template_builder = ExecutiveTemplateBuilder(template_config)
             
             # Build content based on template type
@@ -172,13 +173,13 @@ class PDFExportManager:
                 story = template_builder.build_investor_presentation(export_data, chart_images)
             
             # Generate final PDF using template builder's layout engine
-            pdf_path = Path(tempfile.mktemp(suffix='.pdf'))
+            pdf_output = io.BytesIO() if in_memory else Path(tempfile.mktemp(suffix='.pdf'))
             
             # Use the template builder's document creation instead of the basic generator
             from reportlab.platypus import SimpleDocTemplate
             
             doc = SimpleDocTemplate(
-                str(pdf_path),
+                pdf_output if in_memory else str(pdf_output),
                 pagesize=template_builder.layout.page_size,
                 topMargin=template_builder.layout.margins['top'],
                 bottomMargin=template_builder.layout.margins['bottom'],
@@ -193,7 +194,7 @@ class PDFExportManager:
             
             # Update generation info
             generation_info['success'] = True
-            generation_info['file_size'] = pdf_path.stat().st_size
+            generation_info['file_size'] = pdf_output.getbuffer().nbytes if in_memory else pdf_output.stat().st_size
             generation_info['end_time'] = datetime.now()
             generation_info['generation_time'] = (generation_info['end_time'] - generation_info['start_time']).total_seconds()
             generation_info['duration'] = generation_info['generation_time']
@@ -202,17 +203,34 @@ class PDFExportManager:
             if progress_callback:
                 progress_callback("PDF generation complete!", 1.0)
             
-            # Clean up temporary charts
-            self.chart_renderer.cleanup_temp_charts(chart_images)
-            
-            logger.info(f"PDF report generated successfully: {pdf_path}")
-            
+            if in_memory:
+                pdf_output.seek(0)
+                logger.info(f"PDF report generated in memory: {generation_info['file_size']:,} bytes")
+            elif not vector_charts:
+                # Clean up temporary charts
+                self.chart_renderer.cleanup_temp_charts(chart_images)
+                logger.info(f"PDF report generated successfully: {pdf_output}")
+        
         except Exception as e:
             generation_info['errors'].append(str(e))
             logger.error(f"Error generating PDF report: {str(e)}")
             raise
         
-        return pdf_path, generation_info
+        return pdf_output, generation_info
+    
+    async def _render_chart_files(self, export_data: Dict[str, Any], template_type: str) -> Dict[str, Path]:
+        """Render a template's charts into a temporary directory"""
+        temp_dir = Path(tempfile.mkdtemp()) / "pdf_generation"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        if template_type == 'executive':
+            return await self.chart_renderer.render_executive_summary_charts(export_data, temp_dir)
+        elif template_type == 'detailed':
+            return await self.chart_renderer.render_detailed_analysis_charts(export_data, temp_dir)
+        elif template_type == 'investor':
+            return await self.chart_renderer.render_investor_presentation_charts(export_data, temp_dir)
+        else:
+            raise ValueError(f"Unknown template type: {template_type}")
     
     def create_streamlit_download_button(
         self,
@@ -235,115 +253,37 @@ class PDFExportManager:
         """
         if not STREAMLIT_AVAILABLE:
             logger.error("Streamlit not available for download button")
-            st.error("❌ DEBUG: Streamlit not available for PDF download button")
             return False
         
+        import streamlit as st
+        
         if button_label is None:
             button_label = f"Download {template_type.title()} PDF Report"
         
-        # Create download button
+        from .export_queue import get_export_job_queue
+        from .streamlit_integration import show_export_job
+        
+        state_key = f"pdf_export_job_{template_type}"
+        
+        # Queue the report; generation runs on the export workers, not this script run
         if st.button(button_label, key=f"pdf_download_{template_type}"):
             logger.info(f"PDF export button clicked: {template_type}")
             
+            # Validate critical data exists
+            if not export_data.get('analysis_results'):
+                st.error("❌ Missing analysis results data for PDF export")
+                return False
+            
             try:
-                # Validate critical data exists
-                if 'analysis_results' not in export_data:
-                    st.error("❌ Missing analysis results data for PDF export")
-                    return False
-                if not export_data.get('analysis_results'):
-                    st.error("❌ Empty analysis results data for PDF export")
-                    return False
-                
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                def update_progress(message: str, progress: float):
-                    progress_bar.progress(progress)
-                    status_text.text(message)
-                    logger.info(f"PDF progress: {message} ({progress:.1%})")
-                
-                # Generate PDF asynchronously
-                with st.spinner("Generating PDF report..."):
-                    status_text.text("🔄 Starting PDF generation...")
-                    progress_bar.progress(10)
-                    logger.info("PDF export progress: Starting async generation...")
-                    
-                    pdf_path, generation_info = asyncio.run(
-                        self.generate_pdf_report(
-                            export_data=export_data,
-                            template_type=template_type,
-                            custom_config=custom_config,
-                            progress_callback=update_progress
-                        )
-                    )
-                    logger.info(f"PDF generation completed: {pdf_path}")
-                
-                # Verify file exists
-                if not pdf_path or not pdf_path.exists():
-                    st.error("❌ PDF file generation failed - file not found")
-                    logger.error(f"PDF file missing: {pdf_path}")
-                    return False
-                
-                file_size = pdf_path.stat().st_size
-                logger.info(f"PDF file verified, size: {file_size:,} bytes")
-                
-                # Read PDF for download
-                with open(pdf_path, 'rb') as pdf_file:
-                    pdf_bytes = pdf_file.read()
-                
-                logger.info(f"PDF file read into memory: {len(pdf_bytes):,} bytes")
-                
-                # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"real_estate_analysis_{template_type}_{timestamp}.pdf"
-                
-                # Create download button
-                st.download_button(
-                    label="📄 Download PDF Report",
-                    data=pdf_bytes,
-                    file_name=filename,
-                    mime="application/pdf",
-                    key=f"pdf_download_final_{template_type}"
-                )
-                
-                logger.info("PDF download button created successfully")
-                
-                # Show generation info
-                st.success(f"✅ PDF report generated successfully!")
-                
-                with st.expander("Generation Details"):
-                    st.write(f"**Template:** {generation_info['template_type'].title()}")
-                    st.write(f"**Charts Rendered:** {generation_info['charts_rendered']}")
-                    st.write(f"**File Size:** {generation_info['file_size']:,} bytes")
-                    st.write(f"**Generation Time:** {generation_info.get('duration', 0):.2f} seconds")
-                
-                # Clean up
-                try:
-                    pdf_path.unlink()
-                    logger.info("Temporary PDF file cleaned up")
-                except Exception as cleanup_e:
-                    logger.warning(f"Failed to cleanup PDF file: {cleanup_e}")
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                return True
-                
+                options = {'custom_config': custom_config} if custom_config else None
+                job = get_export_job_queue().submit(export_data, 'pdf', template_type, options)
+                st.session_state[state_key] = job.job_id
             except Exception as e:
-                error_msg = f"Error generating PDF report: {str(e)}"
-                st.error(f"❌ {error_msg}")
+                st.error(f"❌ Error generating PDF report: {str(e)}")
                 logger.error(f"PDF export error: {str(e)}", exc_info=True)
-                
-                # Clear progress indicators
-                try:
-                    progress_bar.empty()
-                    status_text.empty()
-                except:
-                    pass
-        
-        return False
+                return False
+        
+        return show_export_job(state_key, download_label="📄 Download PDF Report", mime="application/pdf")
     
     def create_template_selector(self, key_suffix: str = "") -> str:
         """
@@ -358,6 +298,8 @@ class PDFExportManager:
         if not STREAMLIT_AVAILABLE:
             return 'executive'
         
+        import streamlit as st
+        
         template_options = {
             'executive': {
                 'name': '📊 Executive Summary',
@@ -409,6 +351,8 @@ class PDFExportManager:
         if not STREAMLIT_AVAILABLE:
             return {}
         
+        import streamlit as st
+        
         st.subheader("🎨 Customization Options")
         
         customization = {}
@@ -447,6 +391,13 @@ class PDFExportManager:
                 value=False,
                 key=f"toc{key_suffix}"
             )
+            
+            # Vector charts keep the PDF small and skip image rendering
+            customization['chart_style'] = 'vector' if st.checkbox(
+                "Vector Charts (smaller, faster PDF)",
+                value=True,
+                key=f"vector_charts{key_suffix}"
+            ) else 'raster'
         
         return customization
     
@@ -462,6 +413,8 @@ class PDFExportManager:
             logger.error("Streamlit not available for export interface")
             return
         
+        import streamlit as st
+        
         st.header("📄 PDF Report Export")
         
         # Validate data first
@@ -648,6 +601,7 @@ def create_streamlit_pdf_export_section(export_data: Dict[str, Any]) -> None:
         manager.create_export_interface(export_data)
     except ImportError:
         if STREAMLIT_AVAILABLE:
+            import streamlit as st
             st.error("❌ PDF generation system not available. Please install required dependencies.")
             st.code("pip install reportlab Pillow pypdf")
         else:
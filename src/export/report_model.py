@@ -0,0 +1,272 @@
+"""
+Report Model
+Single prepared dataset shared by the Excel, PDF and CSV exports
+
+This module provides:
+- One normalizer for the list and dict cash flow formats
+- A report model holding normalized cash flows, headline metrics and the
+  ownership vs rental comparison
+- The prepared Excel tables, built on first use and kept with the model
+- An LRU cache of models keyed by analysis, so exporting several formats
+  prepares the analysis once
+
+Repository: https://github.com/LT-aitools/rent-vs-buy-decision-tool
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Keys that change on every export without changing the report content
+VOLATILE_KEYS = ('export_metadata',)
+
+DEFAULT_MAX_MODELS = 16
+
+
+def analysis_key(export_data: Dict[str, Any]) -> str:
+    """
+    Identify the analysis behind an export
+
+    Uses the session's analysis hash when the export data carries one,
+    otherwise hashes the export content itself.
+    """
+    metadata = export_data.get('export_metadata') or {}
+    analysis_hash = metadata.get('analysis_hash')
+    if analysis_hash and analysis_hash != 'unknown':
+        return str(analysis_hash)
+
+    content = {key: value for key, value in export_data.items() if key not in VOLATILE_KEYS}
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def extract_cash_flows(flows_data: Any) -> List[float]:
+    """
+    Extract annual net cash flows from either list or dict format
+
+    Args:
+        flows_data: Either a list of flow dicts (or numbers) or a dict with
+            an 'annual_cash_flows' key
+
+    Returns:
+        List of cash flow values
+    """
+    if isinstance(flows_data, list):
+        return [
+            float(flow.get('net_cash_flow', 0)) if isinstance(flow, dict) else float(flow)
+            for flow in flows_data
+        ]
+    if isinstance(flows_data, dict):
+        annual_flows = flows_data.get('annual_cash_flows')
+        if isinstance(annual_flows, list):
+            return [float(flow) for flow in annual_flows]
+        if annual_flows is not None:
+            return [float(annual_flows)]
+    return []
+
+
+@dataclass
+class ReportModel:
+    """
+    Normalized report content for one analysis
+
+    Shared between exports and cached, so treat it as read-only.
+    """
+
+    key: str
+    export_data: Dict[str, Any]
+    ownership_cash_flows: List[float]
+    rental_cash_flows: List[float]
+    summary_metrics: Dict[str, Any]
+    comparison_rows: List[List[float]]
+    created_at: float = field(default_factory=time.time)
+    _excel_data: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    _excel_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def analysis_results(self) -> Dict[str, Any]:
+        return self.export_data.get('analysis_results', {})
+
+    @property
+    def inputs(self) -> Dict[str, Any]:
+        return self.export_data.get('inputs') or self.export_data.get('session_data') or {}
+
+    @property
+    def normalized_export_data(self) -> Dict[str, Any]:
+        """Export data with cash flows reduced to their annual net values"""
+        return {
+            **self.export_data,
+            'ownership_flows': {'annual_cash_flows': self.ownership_cash_flows},
+            'rental_flows': {'annual_cash_flows': self.rental_cash_flows}
+        }
+
+    def _build_excel_data(self) -> Dict[str, Any]:
+        """Build the Excel tables once; acquire and release stay on one thread"""
+        with self._excel_lock:
+            if self._excel_data is None:
+                from .excel.excel_generator import ExcelGenerator
+
+                self._excel_data = asyncio.run(ExcelGenerator().prepare_data(self.export_data))
+            return self._excel_data
+
+    async def excel_data(self) -> Dict[str, Any]:
+        """Prepared Excel tables, built by the first caller and reused after"""
+        if self._excel_data is not None:
+            return self._excel_data
+
+        # Build off the event loop so concurrent callers in one loop can't
+        # deadlock, and a cancelled caller can't leave the lock held
+        return await asyncio.to_thread(self._build_excel_data)
+
+
+def build_report_model(export_data: Dict[str, Any], key: Optional[str] = None) -> ReportModel:
+    """
+    Normalize export data into a report model
+
+    Args:
+        export_data: Complete export data from analysis
+        key: Analysis key (computed if None)
+
+    Returns:
+        Report model for the analysis
+    """
+    analysis = export_data.get('analysis_results', {})
+    ownership = extract_cash_flows(export_data.get('ownership_flows', []))
+    rental = extract_cash_flows(export_data.get('rental_flows', []))
+
+    summary_metrics = {
+        'recommendation': analysis.get('recommendation', 'UNKNOWN'),
+        'confidence': analysis.get('confidence', 'Low'),
+        'npv_difference': analysis.get('npv_difference', 0),
+        'ownership_npv': analysis.get('ownership_npv', 0),
+        'rental_npv': analysis.get('rental_npv', 0),
+        'ownership_initial_investment': analysis.get('ownership_initial_investment', 0),
+        'rental_initial_investment': analysis.get('rental_initial_investment', 0),
+        'analysis_period': analysis.get('analysis_period', 25),
+        'cost_of_capital': analysis.get('cost_of_capital', 8.0)
+    }
+
+    # Year, ownership, rental, annual difference, cumulative difference
+    years = max(len(ownership), len(rental))
+    comparison_rows = []
+    cumulative = 0.0
+    for year in range(years):
+        owned = ownership[year] if year < len(ownership) else 0.0
+        rented = rental[year] if year < len(rental) else 0.0
+        cumulative += owned - rented
+        comparison_rows.append([year + 1, owned, rented, owned - rented, cumulative])
+
+    return ReportModel(
+        key=key or analysis_key(export_data),
+        export_data=export_data,
+        ownership_cash_flows=ownership,
+        rental_cash_flows=rental,
+        summary_metrics=summary_metrics,
+        comparison_rows=comparison_rows
+    )
+
+
+class ReportModelCache:
+    """LRU cache of report models keyed by analysis"""
+
+    def __init__(self, max_models: int = DEFAULT_MAX_MODELS):
+        """
+        Initialize report model cache
+
+        Args:
+            max_models: Models kept before the least recently used is dropped
+        """
+        self.max_models = max_models
+        self._models: 'OrderedDict[str, ReportModel]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, export_data: Dict[str, Any]) -> ReportModel:
+        """Report model for export data, built on first request"""
+        key = analysis_key(export_data)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return model
+
+            model = build_report_model(export_data, key)
+            self._models[key] = model
+            self.misses += 1
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+
+        logger.debug(f"Built report model {key[:12]}")
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            return {
+                'models': len(self._models),
+                'max_models': self.max_models,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Global instance
+_report_model_cache = None
+_report_model_cache_lock = threading.Lock()
+
+
+def get_report_model_cache() -> ReportModelCache:
+    """Get the process-wide report model cache"""
+    global _report_model_cache
+    with _report_model_cache_lock:
+        if _report_model_cache is None:
+            _report_model_cache = ReportModelCache()
+        return _report_model_cache
+
+
+def get_report_model(export_data: Dict[str, Any]) -> ReportModel:
+    """Cached report model for export data"""
+    return get_report_model_cache().get(export_data)
+
+
+async def generate_all_formats(
+    export_data: Dict[str, Any],
+    excel_template: str = 'detailed',
+    pdf_template: str = 'executive'
+) -> Dict[str, bytes]:
+    """
+    Generate Excel, PDF and CSV reports from one prepared report model
+
+    Returns:
+        Report content by format ('excel', 'pdf', 'csv')
+    """
+    from .csv_export import write_csv_report
+    from .excel.excel_generator import ExcelGenerator
+    from .pdf_integration import PDFExportManager
+
+    model = get_report_model(export_data)
+
+    excel_buffer = await ExcelGenerator().generate_workbook_bytes(await model.excel_data(), excel_template)
+    pdf_buffer, _ = await PDFExportManager().generate_pdf_report(export_data, pdf_template, in_memory=True)
+
+    return {
+        'excel': excel_buffer.getvalue(),
+        'pdf': pdf_buffer.getvalue(),
+        'csv': write_csv_report(model)
+    }
@@ -7,6 +7,7 @@ from the Streamlit application to generate professional Excel reports.
 """
 
 import asyncio
+import io
 import logging
 import tempfile
 import time
@@ -19,6 +20,8 @@ import streamlit as st
 try:
     from .excel.excel_generator import ExcelGenerator
     from .excel.template_manager import ExcelTemplateManager, TemplateType
+    from .export_queue import ExportJobStatus, get_export_job_queue
+    from .report_model import get_report_model
     from .validation import validate_export_data
     EXCEL_SYSTEM_AVAILABLE = True
 except ImportError:
@@ -27,6 +30,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# How often a pending export job's status is refreshed in the UI
+EXPORT_POLL_SECONDS = 1.0
+
 
 class ExcelExportManager:
     """
@@ -214,121 +220,30 @@ class ExcelExportManager:
         if button_label is None:
             button_label = f"Generate {template_type.title()} Excel Report"
         
-        # Create download button
+        state_key = f"excel_export_job_{template_type}"
+        
+        # Queue the report; generation runs on the export workers, not this script run
         if st.button(button_label, key=f"excel_download_{template_type}"):
             logger.info(f"Excel export button clicked: {template_type}")
             
+            # Validate critical data exists
+            if not export_data.get('analysis_results'):
+                st.error("❌ Missing analysis results data for export")
+                return False
+            
             try:
-                # Validate critical data exists
-                if 'analysis_results' not in export_data:
-                    st.error("❌ Missing analysis results data for export")
-                    return False
-                if not export_data.get('analysis_results'):
-                    st.error("❌ Empty analysis results data for export")
-                    return False
-                
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                status_text.text("🔄 Initializing Excel export...")
-                progress_bar.progress(10)
-                logger.info("Excel export progress: Initializing...")
-                
-                # Generate Excel file
-                with st.spinner("Generating Excel report..."):
-                    status_text.text("🔄 Generating Excel file...")
-                    progress_bar.progress(50)
-                    logger.info("Excel export progress: Starting async generation...")
-                    
-                    # Use synchronous Excel generation for Streamlit compatibility
-                    logger.info(f"Starting Excel generation with data: ownership_flows={len(export_data['ownership_flows']) if export_data['ownership_flows'] else 0} items, rental_flows={len(export_data['rental_flows']) if export_data['rental_flows'] else 0} items")
-                    excel_path = generate_excel_report(
-                        analysis_results=export_data['analysis_results'],
-                        ownership_flows=export_data['ownership_flows'],
-                        rental_flows=export_data['rental_flows'],
-                        session_data=export_data.get('inputs', {}) or export_data.get('session_data', {}),
-                        template_type=template_type
-                    )
-                    logger.info(f"Excel generation returned: {excel_path}")
-                    generation_info = {
-                        'template_type': template_type,
-                        'include_charts': include_charts,
-                        'generation_time': 0,
-                        'file_size': excel_path.stat().st_size if excel_path and excel_path.exists() else 0,
-                        'worksheets': 5,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    logger.info(f"Excel generation completed: {excel_path}")
-                
-                status_text.text("✅ Excel report generated successfully!")
-                progress_bar.progress(100)
-                
-                # Verify file exists
-                if not excel_path or not excel_path.exists():
-                    st.error("❌ Excel file generation failed - file not found")
-                    logger.error(f"Excel file missing: {excel_path}")
-                    return False
-                
-                file_size = excel_path.stat().st_size
-                logger.info(f"Excel file verified, size: {file_size:,} bytes")
-                
-                # Read Excel for download
-                with open(excel_path, 'rb') as excel_file:
-                    excel_bytes = excel_file.read()
-                
-                logger.info(f"Excel file read into memory: {len(excel_bytes):,} bytes")
-                
-                # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"real_estate_analysis_{template_type}_{timestamp}.xlsx"
-                
-                # Create download button
-                st.download_button(
-                    label="📊 Download Excel Report",
-                    data=excel_bytes,
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    key=f"excel_download_final_{template_type}"
-                )
-                
-                logger.info("Excel download button created successfully")
-                
-                # Show generation info
-                st.success(f"✅ Excel report generated successfully!")
-                
-                with st.expander("Generation Details"):
-                    st.write(f"**Template:** {generation_info['template_type'].title()}")
-                    st.write(f"**Worksheets:** {generation_info['worksheets']}")
-                    st.write(f"**File Size:** {generation_info['file_size']:,} bytes")
-                    st.write(f"**Generation Time:** {generation_info.get('generation_time', 0):.2f} seconds")
-                
-                # Clean up
-                try:
-                    excel_path.unlink()
-                    logger.info("Temporary Excel file cleaned up")
-                except Exception as cleanup_e:
-                    logger.warning(f"Failed to cleanup Excel file: {cleanup_e}")
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                return True
-                
+                job = get_export_job_queue().submit(export_data, 'excel', template_type)
+                st.session_state[state_key] = job.job_id
             except Exception as e:
-                error_msg = f"Error generating Excel report: {str(e)}"
-                st.error(f"❌ {error_msg}")
+                st.error(f"❌ Error generating Excel report: {str(e)}")
                 logger.error(f"Excel export error: {str(e)}", exc_info=True)
-                
-                # Clear progress indicators
-                try:
-                    progress_bar.empty()
-                    status_text.empty()
-                except:
-                    pass
+                return False
         
-        return False
+        return show_export_job(
+            state_key,
+            download_label="📊 Download Excel Report",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
     
     def get_export_capabilities(self) -> Dict[str, Any]:
         """Get Excel export capabilities"""
@@ -363,8 +278,9 @@ def generate_excel_report(
     session_data: Dict[str, Any],
     template_type: str = "detailed",
     company_name: Optional[str] = None,
-    report_title: Optional[str] = None
-) -> Optional[Path]:
+    report_title: Optional[str] = None,
+    in_memory: bool = False
+) -> Optional[Union[Path, io.BytesIO]]:
     """
     Generate Excel report from analysis results
     
@@ -376,9 +292,10 @@ def generate_excel_report(
         template_type: Template type ("executive", "detailed", "investor", "full_analysis")
         company_name: Optional company name for branding
         report_title: Optional custom report title
+        in_memory: Return the workbook in a buffer instead of writing a temp file
         
     Returns:
-        Path to generated Excel file or None if generation failed
+        Path to generated Excel file (buffer if in_memory) or None if generation failed
     """
     try:
         logger.info(f"generate_excel_report called with ownership_flows={type(ownership_flows)}, rental_flows={type(rental_flows)}")
@@ -393,7 +310,7 @@ def generate_excel_report(
                 # Run the async function in a new event loop on a separate thread
                 result = asyncio.run(_generate_excel_async(
                     analysis_results, ownership_flows, rental_flows, session_data,
-                    template_type, company_name, report_title
+                    template_type, company_name, report_title, in_memory
                 ))
                 logger.info(f"Thread result: {result}")
                 return result
@@ -407,7 +324,7 @@ def generate_excel_report(
             # No event loop running, we can use asyncio.run
             result = asyncio.run(_generate_excel_async(
                 analysis_results, ownership_flows, rental_flows, session_data,
-                template_type, company_name, report_title
+                template_type, company_name, report_title, in_memory
             ))
             logger.info(f"AsyncIO result: {result}")
             return result
@@ -424,8 +341,9 @@ async def _generate_excel_async(
     session_data: Dict[str, Any],
     template_type: str,
     company_name: Optional[str],
-    report_title: Optional[str]
-) -> Optional[Path]:
+    report_title: Optional[str],
+    in_memory: bool = False
+) -> Optional[Union[Path, io.BytesIO]]:
     """Async implementation of Excel generation"""
     
     # Prepare export data package
@@ -464,10 +382,13 @@ async def _generate_excel_async(
             for warning in data_validation['warnings']:
                 logger.warning(f"Data warning: {warning}")
         
-        # Prepare data for Excel generation
-        excel_data = await excel_generator.prepare_data(export_data)
+        # Prepare data for Excel generation (shared with other formats of this analysis)
+        excel_data = await get_report_model(export_data).excel_data()
         
         # Generate workbook
+        if in_memory:
+            return await excel_generator.generate_workbook_bytes(excel_data, template_type)
+        
         output_path = await excel_generator.generate_workbook(excel_data, template_type)
         
         logger.info(f"Excel report generated successfully: {output_path}")
@@ -479,8 +400,73 @@ async def _generate_excel_async(
     # Note: We're NOT cleaning up automatically anymore - let files persist for copying
 
 
+def show_export_job(state_key: str, download_label: str, mime: str) -> bool:
+    """
+    Show the export job stored under st.session_state[state_key]
+    
+    A pending job is polled in a fragment so only the status line reruns;
+    a finished job gets its download button.
+    
+    Args:
+        state_key: Session state key holding the job ID
+        download_label: Label for the download button
+        mime: MIME type of the report
+        
+    Returns:
+        True if the finished report was downloaded
+    """
+    queue = get_export_job_queue()
+    job = queue.get_job(st.session_state.get(state_key, ''))
+    if job is None:
+        return False
+    
+    if not job.is_done:
+        _poll_export_job(job.job_id)
+        return False
+    
+    if job.status == ExportJobStatus.FAILED:
+        st.error(f"❌ Error generating report: {job.error}")
+        del st.session_state[state_key]
+        return False
+    
+    export_file = queue.get_file(job)
+    content = job.content
+    if export_file is None or content is None:
+        st.warning("Report has expired - please generate it again")
+        del st.session_state[state_key]
+        return False
+    
+    downloaded = st.download_button(
+        label=download_label,
+        data=content,
+        file_name=queue.file_manager.create_download_path(export_file).name,
+        mime=mime,
+        key=f"{state_key}_download"
+    )
+    if downloaded:
+        queue.file_manager.mark_downloaded(job.file_id)
+    
+    st.success(f"✅ {job.template.title()} report ready")
+    with st.expander("Generation Details"):
+        st.write(f"**Template:** {job.template.title()}")
+        st.write(f"**File Size:** {export_file.size_mb * 1024 * 1024:,.0f} bytes")
+        st.write(f"**Generation Time:** {job.completed_at - job.started_at:.2f} seconds")
+    
+    return downloaded
+
+
+@st.fragment(run_every=EXPORT_POLL_SECONDS)
+def _poll_export_job(job_id: str) -> None:
+    """Status line for a pending export job; reruns the page once it finishes"""
+    job = get_export_job_queue().get_job(job_id)
+    if job is None or job.is_done:
+        st.rerun()
+    
+    st.info(f"⏳ Generating {job.template} {job.format} report... ({job.elapsed:.0f}s)")
+
+
 def create_download_button(
-    excel_file_path: Path,
+    excel_file_path: Union[Path, io.BytesIO, bytes],
     button_text: str = "📊 Download Excel Report",
     file_name: Optional[str] = None
 ) -> bool:
@@ -488,21 +474,27 @@ def create_download_button(
     Create Streamlit download button for Excel file
     
     Args:
-        excel_file_path: Path to generated Excel file
+        excel_file_path: Path to generated Excel file, or the workbook in memory
         button_text: Text for the download button
         file_name: Custom filename for download
         
     Returns:
         True if button was clicked and file downloaded
     """
-    if not excel_file_path or not excel_file_path.exists():
+    in_memory = isinstance(excel_file_path, (bytes, io.BytesIO))
+    if not in_memory and (not excel_file_path or not excel_file_path.exists()):
         st.error("Excel file not found or invalid path")
         return False
     
     try:
         # Read Excel file content
-        with open(excel_file_path, 'rb') as f:
-            excel_data = f.read()
+        if isinstance(excel_file_path, io.BytesIO):
+            excel_data = excel_file_path.getvalue()
+        elif in_memory:
+            excel_data = excel_file_path
+        else:
+            with open(excel_file_path, 'rb') as f:
+                excel_data = f.read()
         
         # Generate filename if not provided
         if not file_name:
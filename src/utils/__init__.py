@@ -59,7 +59,8 @@ from .helpers import (
     format_business_number,
     create_status_badge,
     export_session_to_url,
-    import_session_from_url
+    import_session_from_url,
+    compute_analysis_hash
 )
 
 __all__ = [
@@ -112,5 +113,6 @@ __all__ = [
     'format_business_number',
     'create_status_badge',
     'export_session_to_url',
-    'import_session_from_url'
+    'import_session_from_url',
+    'compute_analysis_hash'
 ]
\ No newline at end of file
@@ -11,6 +11,7 @@ Provides:
 
 import streamlit as st
 from typing import Any, Dict, List, Optional, Tuple
+import hashlib
 import json
 from datetime import datetime
 
@@ -304,4 +305,11 @@ def import_session_from_url(url_params: Dict[str, Any]) -> bool:
     """Import session state from URL parameters"""
     # This would decode URL parameters back into session state
     # Implementation would depend on specific URL encoding scheme
-    return True
\ No newline at end of file
+    return True
+
+def compute_analysis_hash(analysis_results: Dict[str, Any],
+                          ownership_flows: Optional[List[Dict[str, float]]] = None,
+                          rental_flows: Optional[List[Dict[str, float]]] = None) -> str:
+    """Stable hash of an analysis result, used to key caches of derived output"""
+    payload = json.dumps([analysis_results, ownership_flows, rental_flows], sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
@@ -0,0 +1,59 @@
+"""
+Shared Test Fixtures
+Market data and cache fixtures used by the data layer tests
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.cache_management import IntelligentCacheManager
+from src.shared.interfaces import MarketData
+
+
+def _market_data(location: str) -> MarketData:
+    return MarketData(
+        location=location,
+        zip_code=None,
+        median_rent_per_sqm=30.0,
+        rental_vacancy_rate=5.0,
+        rental_growth_rate=3.0,
+        median_property_price=500000.0,
+        property_appreciation_rate=4.0,
+        months_on_market=2.5,
+        current_mortgage_rates={'30_year_fixed': 6.8},
+        rate_trend='stable',
+        local_inflation_rate=3.0,
+        unemployment_rate=4.0,
+        population_growth_rate=1.0,
+        data_timestamp=datetime.now(),
+        data_sources=['test'],
+        confidence_score=0.9,
+        freshness_hours=0.0
+    )
+
+
+@pytest.fixture
+def market_data():
+    """Factory for fresh market data at a location"""
+    return _market_data
+
+
+@pytest.fixture
+def cache_path():
+    """Path of a persistent cache database in a temporary directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield os.path.join(temp_dir, 'cache.db')
+
+
+@pytest.fixture
+def cache_manager(cache_path):
+    return IntelligentCacheManager({
+        'persistent_cache_path': cache_path,
+        'memory_cache_size_mb': 1.0
+    })
@@ -0,0 +1,79 @@
+"""
+Import-Time Benchmarks
+Cold-start cost of the export and UI packages
+
+This module provides:
+- Checks that importing the export packages does not load the heavy
+  rendering libraries until an export or chart is first used
+- A cold-import benchmark, printed when run as a script:
+
+    python tests/performance_tests/test_import_time.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict, List
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY_MODULES = ['openpyxl', 'xlsxwriter', 'reportlab', 'plotly', 'kaleido', 'PIL', 'pandas', 'streamlit']
+
+BENCHMARK_IMPORTS = [
+    'src.export',
+    'src.export.export_queue',
+    'src.export.report_model',
+    'src.export.excel.excel_generator',
+    'src.export.pdf_integration',
+]
+
+
+def cold_import(module: str) -> Dict[str, object]:
+    """Import a module in a fresh interpreter; report time and heavy modules loaded"""
+    script = (
+        "import json, sys, time\n"
+        f"sys.path.insert(0, {project_root!r})\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(json.dumps({'seconds': elapsed, 'loaded': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=project_root
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestExportImportTime(unittest.TestCase):
+    """Heavy libraries load on first use, not at import"""
+
+    def assert_not_loaded(self, module: str, forbidden: List[str]):
+        loaded = cold_import(module)['loaded']
+        self.assertFalse(set(loaded) & set(forbidden), f"{module} loaded {loaded}")
+
+    def test_export_package_is_lightweight(self):
+        for module in ('src.export', 'src.export.excel', 'src.export.pdf'):
+            self.assert_not_loaded(module, HEAVY_MODULES)
+
+    def test_job_queue_and_report_model_are_lightweight(self):
+        self.assert_not_loaded('src.export.export_queue', HEAVY_MODULES)
+
+    def test_excel_generator_defers_chart_rendering(self):
+        self.assert_not_loaded('src.export.excel.excel_generator', ['plotly', 'kaleido', 'pandas', 'streamlit'])
+
+    def test_pdf_integration_defers_ui_and_raster_charts(self):
+        self.assert_not_loaded('src.export.pdf_integration', ['plotly', 'kaleido', 'pandas', 'streamlit'])
+
+
+def main():
+    print(f"{'module':<40} {'seconds':>8}  heavy modules loaded")
+    for module in BENCHMARK_IMPORTS:
+        result = cold_import(module)
+        print(f"{module:<40} {result['seconds']:>8.3f}  {', '.join(result['loaded']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
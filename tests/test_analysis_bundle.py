@@ -0,0 +1,121 @@
+"""
+Unit tests for the single-pass analysis bundle
+Tests that the NPV summary, cash flows and terminal values come from one computation
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from calculations import npv_analysis
+from calculations.npv_analysis import (
+    calculate_analysis_bundle,
+    calculate_npv_comparison,
+    calculate_ownership_cash_flows,
+    calculate_rental_cash_flows
+)
+from export.excel.data_formatting import ExcelFormatter
+
+
+ANALYSIS_PARAMS = {
+    'purchase_price': 1500000,
+    'down_payment_pct': 30,
+    'interest_rate': 6.5,
+    'loan_term': 20,
+    'transaction_costs': 75000,
+    'current_annual_rent': 120000,
+    'rent_increase_rate': 3.0,
+    'analysis_period': 25,
+    'cost_of_capital': 8.0,
+    'inflation_rate': 2.5,
+    'space_improvement_cost': 20000,
+    'subletting_potential': True,
+    'subletting_rate': 40,
+    'subletting_space_sqm': 200,
+    'ownership_property_size': 1200,
+    'current_space_needed': 800
+}
+
+
+@pytest.fixture
+def bundle():
+    return calculate_analysis_bundle(**ANALYSIS_PARAMS)
+
+
+class TestAnalysisBundle:
+    """Test suite for calculate_analysis_bundle"""
+
+    def test_summary_matches_npv_comparison(self, bundle):
+        """Bundle summary is the NPV comparison result"""
+        assert bundle['npv_analysis'] == calculate_npv_comparison(**ANALYSIS_PARAMS)
+
+    def test_flows_match_separate_calculations(self, bundle):
+        """Bundle flows equal the standalone cash flow functions"""
+        ownership_flows = calculate_ownership_cash_flows(
+            purchase_price=1500000, down_payment_pct=30, interest_rate=6.5, loan_term=20,
+            analysis_period=25, property_tax_rate=1.2, property_tax_escalation=2.0,
+            insurance_cost=5000, annual_maintenance=10000, inflation_rate=2.5,
+            transaction_costs=75000, current_space_needed=800, ownership_property_size=1200,
+            subletting_potential=True, subletting_rate=40, subletting_space_sqm=200
+        )
+        rental_flows = calculate_rental_cash_flows(
+            current_annual_rent=120000, rent_increase_rate=3.0, analysis_period=25,
+            current_space_needed=800, inflation_rate=2.5
+        )
+
+        assert bundle['ownership_flows'] == ownership_flows
+        assert bundle['rental_flows'] == rental_flows
+
+    def test_amortization_generated_once(self, monkeypatch):
+        """Ownership flows reuse the bundle's amortization schedule"""
+        calls = []
+        original = npv_analysis.generate_amortization_schedule
+
+        def counting_schedule(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(npv_analysis, 'generate_amortization_schedule', counting_schedule)
+        bundle = calculate_analysis_bundle(**ANALYSIS_PARAMS)
+
+        assert len(calls) == 1
+        assert len(bundle['amortization_schedule']) == 20
+        for flow, entry in zip(bundle['ownership_flows'], bundle['amortization_schedule']):
+            assert flow['mortgage_interest'] == entry['interest_portion']
+            assert flow['remaining_loan_balance'] == entry['ending_balance']
+
+    def test_terminal_breakdown(self, bundle):
+        """Terminal value breakdown uses the final loan balance from the flows"""
+        terminal = bundle['ownership_terminal']
+
+        assert terminal['remaining_loan_balance'] == bundle['ownership_flows'][-1]['remaining_loan_balance']
+        assert abs(
+            terminal['net_property_equity'] - (terminal['terminal_property_value'] - terminal['remaining_loan_balance'])
+        ) < 0.01
+        assert bundle['mortgage_info']['total_initial_investment'] == bundle['npv_analysis']['ownership_initial_investment']
+
+
+class TestBundleExport:
+    """Test suite for Excel tables built from the bundle"""
+
+    def test_mortgage_schedule_from_bundle(self, bundle):
+        """Mortgage schedule lists the bundle's annual schedule"""
+        table = asyncio.run(ExcelFormatter().format_mortgage_schedule(
+            bundle['npv_analysis'], bundle['amortization_schedule']
+        ))
+
+        assert table['headers'][0] == 'Year'
+        assert len(table['data']) == len(bundle['amortization_schedule']) + 3
+        assert table['data'][-1][3] == bundle['amortization_schedule'][-1]['cumulative_interest']
+
+    def test_terminal_value_from_bundle(self, bundle):
+        """Terminal value table totals to the bundle's net property equity"""
+        table = asyncio.run(ExcelFormatter().format_terminal_value(
+            bundle['npv_analysis'], bundle['ownership_terminal']
+        ))
+
+        assert table['data'][-1][1] == bundle['ownership_terminal']['net_property_equity']
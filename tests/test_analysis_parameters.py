@@ -0,0 +1,104 @@
+"""
+Analysis Parameter Tests
+Tests for memoized parameter assembly from session state
+"""
+
+import os
+import sys
+
+import pytest
+import streamlit as st
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components import session_management
+from components.session_management import ANALYSIS_PARAMS_CACHE_KEY, SessionManager, build_analysis_parameters
+from data import data_priority_manager
+from data.data_priority_manager import DataPriorityManager
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Session manager over a plain dict session state and a fresh priority manager"""
+    monkeypatch.setattr(st, 'session_state', {})
+    manager = DataPriorityManager()
+    manager.initialize_defaults()
+    monkeypatch.setattr(data_priority_manager, '_global_priority_manager', manager)
+
+    session_manager = SessionManager()
+    st.session_state.update({'purchase_price': 1000000, 'current_annual_rent': 60000})
+    return session_manager, manager
+
+
+class TestPriorityManagerVersion:
+    """Version only moves when a stored value changes"""
+
+    def test_unchanged_values_keep_version(self):
+        manager = DataPriorityManager()
+        manager.set_user_override('interest_rate', 6.5)
+        version = manager.version
+
+        manager.set_user_override('interest_rate', 6.5)
+        manager.bulk_update_from_session({'inputs': {'interest_rate': 6.5}})
+        assert manager.version == version
+
+        manager.set_user_override('interest_rate', 6.75)
+        assert manager.version == version + 1
+
+    def test_clear_and_reset_bump_version(self):
+        manager = DataPriorityManager()
+        manager.clear_user_overrides()
+        assert manager.version == 0
+
+        manager.set_user_override('interest_rate', 6.5)
+        version = manager.version
+        manager.reset_field_to_api('interest_rate')
+        assert manager.version == version + 1
+
+
+class TestAnalysisParameters:
+    """Parameters are rebuilt only when inputs or priority data change"""
+
+    def test_builder_maps_session_inputs(self):
+        manager = DataPriorityManager()
+        manager.set_user_override('interest_rate', 6.25)
+        inputs = {'purchase_price': 1000000, 'transaction_costs_percent': 4.0, 'rent_deductible': False}
+
+        params = build_analysis_parameters(inputs, manager)
+
+        assert params['interest_rate'] == 6.25
+        assert params['transaction_costs'] == 40000
+        assert params['rent_deductible'] is False
+        assert params['rent_increase_rate'] == 3.0
+
+    def test_cached_until_inputs_change(self, session, monkeypatch):
+        session_manager, manager = session
+        calls = []
+        original = session_management.build_analysis_parameters
+
+        def counting_builder(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(session_management, 'build_analysis_parameters', counting_builder)
+
+        first = session_manager.get_analysis_parameters()
+        second = session_manager.get_analysis_parameters()
+        assert len(calls) == 1
+        assert first == second
+        assert first is not st.session_state[ANALYSIS_PARAMS_CACHE_KEY]['params']
+
+        st.session_state['purchase_price'] = 1200000
+        assert session_manager.get_analysis_parameters()['purchase_price'] == 1200000
+        assert len(calls) == 2
+
+    def test_priority_change_rebuilds(self, session):
+        session_manager, manager = session
+        session_manager.get_analysis_parameters()
+        cached = st.session_state[ANALYSIS_PARAMS_CACHE_KEY]
+
+        manager.set_api_data('interest_rate_30_year', 6.1, 'test_api')
+        session_manager.get_analysis_parameters()
+        assert st.session_state[ANALYSIS_PARAMS_CACHE_KEY] is not cached
+        assert st.session_state[ANALYSIS_PARAMS_CACHE_KEY]['priority_version'] == manager.version
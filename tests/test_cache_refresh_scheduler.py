@@ -0,0 +1,111 @@
+"""
+Cache Refresh Scheduler Tests
+Tests for access-statistics-driven warmup and expiry-based proactive refresh
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.cache_refresh_scheduler import CacheRefreshScheduler
+
+
+@pytest.fixture
+def populate(cache_manager, market_data):
+    """Cache locations and read each the given number of times"""
+    def populate_cache(accesses):
+        async def scenario():
+            for location, count in accesses.items():
+                await cache_manager.update_cache(location, market_data(location))
+                for _ in range(count):
+                    await cache_manager.get_cached_data(location)
+
+        asyncio.run(scenario())
+
+    return populate_cache
+
+
+class TestPopularLocations:
+    """Popularity comes from recorded cache accesses"""
+
+    def test_ranked_by_access_count(self, cache_manager, populate):
+        populate({'Austin, TX': 1, 'Boston, MA': 3, 'Denver, CO': 0})
+
+        popular = asyncio.run(cache_manager.get_popular_locations())
+
+        # Memory cache hits are counted once flushed to the persistent statistics
+        assert [entry.location for entry in popular] == ['Boston, MA', 'Austin, TX', 'Denver, CO']
+        assert [entry.access_count for entry in popular] == [4, 2, 1]
+
+    def test_refresh_keeps_access_statistics(self, cache_manager, populate, market_data):
+        populate({'Boston, MA': 3})
+        asyncio.run(cache_manager.update_cache('Boston, MA', market_data('Boston, MA')))
+
+        popular = asyncio.run(cache_manager.get_popular_locations())
+        assert popular[0].access_count == 4
+
+    def test_unaccessed_seeds_and_internal_reads_ignored(self, cache_manager, market_data):
+        async def scenario():
+            await cache_manager.update_cache('Miami, FL', market_data('Miami, FL'), record_access=False)
+            await cache_manager.get_cached_data('Miami, FL', record_access=False)
+            await cache_manager.get_cached_data_many(['Miami, FL'], record_access=False)
+            return await cache_manager.get_popular_locations()
+
+        assert asyncio.run(scenario()) == []
+
+
+class TestCacheRefreshScheduler:
+    """Expiry-based scheduling with jitter and a concurrency budget"""
+
+    def _scheduler(self, cache_manager, refreshed, **config):
+        async def refresh(locations, max_concurrency):
+            refreshed.append((sorted(locations), max_concurrency))
+
+        config.setdefault('refresh_lead_hours', 1.0)
+        config.setdefault('jitter_minutes', 30.0)
+        return CacheRefreshScheduler(cache_manager, refresh, config, seed=7)
+
+    def test_due_before_expiry_with_jitter(self, cache_manager, populate):
+        locations = {f'City {i}, TX': 1 for i in range(20)}
+        populate(locations)
+        scheduler = self._scheduler(cache_manager, [])
+
+        now = datetime.now()
+        plan = asyncio.run(scheduler.plan(now))
+
+        assert sorted(location for _, location in plan) == sorted(locations)
+        expiry = now + timedelta(hours=24)
+        for due, _ in plan:
+            assert expiry - timedelta(hours=1, minutes=31) <= due <= expiry - timedelta(hours=1) + timedelta(seconds=5)
+        # Entries written together are spread out rather than refreshed at once
+        assert len({due for due, _ in plan}) == len(plan)
+
+    def test_run_once_refreshes_only_due_locations(self, cache_manager, populate):
+        populate({'Austin, TX': 2, 'Boston, MA': 1})
+        refreshed = []
+        scheduler = self._scheduler(cache_manager, refreshed, max_concurrent_refreshes=2)
+
+        now = datetime.now()
+        assert asyncio.run(scheduler.run_once(now)) == []
+        assert refreshed == []
+        assert scheduler.seconds_until_next(now) > 3600
+
+        later = now + timedelta(hours=23)
+        assert sorted(asyncio.run(scheduler.run_once(later))) == ['Austin, TX', 'Boston, MA']
+        assert refreshed == [(['Austin, TX', 'Boston, MA'], 2)]
+
+        # Refreshed locations leave the schedule until the next plan
+        assert asyncio.run(scheduler.run_once(later)) == []
+        assert scheduler.get_stats()['locations_refreshed'] == 2
+
+    def test_limits_to_most_popular(self, cache_manager, populate):
+        populate({'Austin, TX': 5, 'Boston, MA': 3, 'Denver, CO': 0})
+        scheduler = self._scheduler(cache_manager, [], max_locations=2)
+
+        plan = asyncio.run(scheduler.plan())
+        assert sorted(location for _, location in plan) == ['Austin, TX', 'Boston, MA']
@@ -0,0 +1,141 @@
+"""
+Chart Image Cache Tests
+Tests for content-addressed chart caching shared by Excel and PDF exports
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.chart_cache import ChartImageCache, chart_cache_key, get_chart_image_cache
+from src.export.chart_rendering import ChartRenderingService
+from src.export.excel.chart_embedding import ChartEmbedder
+from src.export.pdf.chart_renderer import PDFChartRenderer
+
+
+@pytest.fixture
+def cache_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / 'charts'
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'ownership_irr': 0.08,
+            'rental_irr': 0.06,
+            'recommendation': 'BUY'
+        },
+        'ownership_flows': {'annual_cash_flows': [-20000.0 + 500 * year for year in range(25)]},
+        'rental_flows': {'annual_cash_flows': [-24000.0 - 300 * year for year in range(25)]}
+    }
+
+
+class TestChartCacheKey:
+    """Keys cover the figure spec and every render setting"""
+
+    def test_key_changes_with_spec_and_settings(self):
+        figure = {'data': [{'type': 'bar', 'y': [1, 2]}], 'layout': {'title': {'text': 'NPV'}}}
+        key = chart_cache_key(figure, 800, 600)
+
+        assert chart_cache_key({'layout': figure['layout'], 'data': figure['data']}, 800, 600) == key
+        assert chart_cache_key({'data': [{'type': 'bar', 'y': [1, 3]}]}, 800, 600) != key
+        assert chart_cache_key(figure, 1600, 1200) != key
+        assert chart_cache_key(figure, 800, 600, format='jpeg') != key
+        assert chart_cache_key(figure, 800, 600, scale=2.0) != key
+
+
+class TestChartImageCache:
+    """Disk storage with byte-bounded LRU eviction"""
+
+    def test_evicts_least_recently_used_by_bytes(self, cache_dir):
+        cache = ChartImageCache(cache_dir, max_bytes=250)
+        cache.put('a', 'png', b'a' * 100)
+        cache.put('b', 'png', b'b' * 100)
+
+        # Reading 'a' makes 'b' the least recently used
+        assert cache.copy_to('a', 'png', cache_dir.parent / 'out.png')
+        cache.put('c', 'png', b'c' * 100)
+
+        assert not cache.copy_to('b', 'png', cache_dir.parent / 'out.png')
+        assert cache.copy_to('c', 'png', cache_dir.parent / 'out.png')
+        assert (cache_dir.parent / 'out.png').read_bytes() == b'c' * 100
+
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['total_bytes'] == 200
+        assert stats['evictions'] == 1
+        assert sorted(path.name for path in cache_dir.iterdir()) == ['a.png', 'c.png']
+
+    def test_index_survives_restart(self, cache_dir):
+        ChartImageCache(cache_dir).put('a', 'png', b'image')
+
+        cache = ChartImageCache(cache_dir)
+        assert cache.get_stats()['total_bytes'] == 5
+        assert cache.copy_to('a', 'png', cache_dir.parent / 'out.png')
+
+    def test_oversized_image_not_cached(self, cache_dir):
+        cache = ChartImageCache(cache_dir, max_bytes=10)
+        cache.put('a', 'png', b'a' * 11)
+        assert cache.get_stats()['entries'] == 0
+
+
+class TestCachedRendering:
+    """Excel and PDF exports share rendered images"""
+
+    def test_rerender_served_from_cache(self, cache_dir, export_data):
+        service = ChartRenderingService(max_workers=1, image_cache=ChartImageCache(cache_dir))
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                first = asyncio.run(ChartEmbedder(service).render_all_charts(
+                    export_data, resolution=30, output_dir=Path(temp_dir) / 'first'
+                ))
+                second = asyncio.run(ChartEmbedder(service).render_all_charts(
+                    export_data, resolution=30, output_dir=Path(temp_dir) / 'second'
+                ))
+
+                assert list(second) == list(first)
+                for name in first:
+                    assert second[name].read_bytes() == first[name].read_bytes()
+        finally:
+            service.shutdown()
+
+        stats = service.get_stats()['image_cache']
+        assert stats['misses'] == 5
+        assert stats['hits'] == 5
+
+    def test_switching_template_renders_only_new_charts(self, cache_dir, export_data):
+        service = ChartRenderingService(max_workers=1, image_cache=ChartImageCache(cache_dir))
+        renderer = PDFChartRenderer()
+        renderer.chart_embedder = ChartEmbedder(service)
+        try:
+            executive = asyncio.run(renderer.render_executive_summary_charts(export_data))
+            investor = asyncio.run(renderer.render_investor_presentation_charts(export_data))
+        finally:
+            service.shutdown()
+
+        assert sorted(executive) == ['financial_metrics', 'npv_comparison']
+        assert sorted(investor) == ['annual_cash_flows', 'npv_comparison', 'sensitivity_analysis']
+
+        # Only the NPV chart is common to both templates
+        stats = service.get_stats()['image_cache']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 4
+
+    def test_exporters_share_default_cache(self):
+        excel_service = ChartEmbedder().rendering_service
+        pdf_service = PDFChartRenderer().chart_embedder.rendering_service
+
+        assert excel_service is pdf_service
+        assert excel_service.image_cache is get_chart_image_cache()
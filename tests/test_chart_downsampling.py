@@ -0,0 +1,104 @@
+"""
+Chart Downsampling Tests
+Tests for LTTB line downsampling, pre-binned histograms and WebGL switching
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.charts.advanced_charts import create_monte_carlo_distribution_chart, create_roi_progression_chart
+from components.charts.downsampling import (
+    WEBGL_POINT_THRESHOLD,
+    binned_histogram_trace,
+    line_trace,
+    lttb_indices
+)
+
+
+class TestLTTB:
+    """Downsampling keeps endpoints and extremes"""
+
+    def test_small_series_unchanged(self):
+        assert lttb_indices([1, 2, 3], [4.0, 5.0, 6.0], 10).tolist() == [0, 1, 2]
+
+    def test_keeps_endpoints_and_peak(self):
+        x = np.arange(10000)
+        y = np.sin(x / 500.0)
+        y[4321] = 50.0
+
+        kept = lttb_indices(x, y, 200)
+
+        assert len(kept) == 200
+        assert kept[0] == 0 and kept[-1] == 9999
+        assert np.all(np.diff(kept) > 0)
+        assert 4321 in kept
+
+    def test_categorical_x(self):
+        x = [f"Year {year}" for year in range(100)]
+        kept = lttb_indices(x, list(range(100)), 10)
+        assert len(kept) == 10
+
+
+class TestTraces:
+    """Traces stay small and switch to WebGL for large series"""
+
+    def test_short_series_is_svg(self):
+        trace = line_trace(list(range(30)), list(range(30)), text=[str(i) for i in range(30)], mode='lines')
+        assert isinstance(trace, go.Scatter)
+        assert len(trace.x) == 30
+
+    def test_long_series_downsampled_with_text(self):
+        x = list(range(50000))
+        y = [float(i % 97) for i in x]
+        text = [f"point {i}" for i in x]
+
+        trace = line_trace(x, y, text=text, max_points=1500, mode='lines')
+
+        assert isinstance(trace, go.Scattergl)
+        assert len(trace.x) == len(trace.y) == len(trace.text) == 1500
+        assert all(trace.text[i] == f"point {trace.x[i]}" for i in range(0, 1500, 100))
+
+    def test_webgl_without_downsampling(self):
+        points = WEBGL_POINT_THRESHOLD + 1
+        trace = line_trace(list(range(points)), [0.0] * points, max_points=None)
+        assert isinstance(trace, go.Scattergl)
+        assert len(trace.x) == points
+
+    def test_binned_histogram(self):
+        values = np.random.default_rng(7).normal(0, 100000, 50000)
+        values[0] = np.nan
+
+        trace = binned_histogram_trace(values, bins=40)
+
+        assert len(trace.x) == 40
+        assert int(np.sum(trace.y)) == 49999
+
+
+class TestCharts:
+    """Chart payloads do not grow with the input size"""
+
+    def test_monte_carlo_payload_flat(self):
+        rng = np.random.default_rng(11)
+        small = create_monte_carlo_distribution_chart(rng.normal(0, 1e5, 1000).tolist(), {})
+        large = create_monte_carlo_distribution_chart(rng.normal(0, 1e5, 50000), {})
+
+        assert len(large.data[0].y) == 50
+        assert len(large.to_json()) < 2 * len(small.to_json())
+        assert json.loads(large.to_json())['data'][0]['type'] == 'bar'
+
+    def test_monte_carlo_empty(self):
+        fig = create_monte_carlo_distribution_chart([], {})
+        assert 'No Data' in fig.layout.title.text
+
+    def test_roi_progression_long_horizon(self):
+        flows = [{'year': year, 'net_cash_flow': -10000.0 + 3 * year} for year in range(1, 5001)]
+        fig = create_roi_progression_chart({'ownership_initial_investment': 250000.0}, flows)
+
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
+        assert all(len(trace.x) <= 2000 for trace in fig.data)
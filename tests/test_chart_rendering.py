@@ -0,0 +1,101 @@
+"""
+Chart Rendering Service Tests
+Tests for parallel export chart rendering on a warm renderer pool
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.chart_rendering import ChartRenderingService, ChartRenderJob
+from src.export.excel.chart_embedding import ChartEmbedder
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'ownership_irr': 0.08,
+            'rental_irr': 0.06,
+            'recommendation': 'BUY'
+        },
+        'ownership_flows': {'annual_cash_flows': [-20000.0 + 500 * year for year in range(25)]},
+        'rental_flows': {'annual_cash_flows': [-24000.0 - 300 * year for year in range(25)]}
+    }
+
+
+@pytest.fixture(scope='module')
+def rendering_service():
+    service = ChartRenderingService(max_workers=2)
+    yield service
+    service.shutdown()
+
+
+def _is_png(path: Path) -> bool:
+    return path.exists() and path.read_bytes()[:8] == PNG_SIGNATURE
+
+
+class TestChartRenderingService:
+    """Renderer pool rendering"""
+
+    def test_renders_all_charts_in_parallel(self, rendering_service, export_data):
+        embedder = ChartEmbedder(rendering_service)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            charts = asyncio.run(embedder.render_all_charts(export_data, resolution=30, output_dir=Path(temp_dir)))
+
+            assert list(charts) == [
+                'npv_comparison', 'annual_cash_flows', 'cumulative_cash_flows',
+                'financial_metrics', 'sensitivity_analysis'
+            ]
+            assert all(_is_png(path) for path in charts.values())
+
+        stats = rendering_service.get_stats()
+        assert stats['renderers_started'] == 2
+        assert stats['charts_rendered'] >= 5
+
+    def test_chart_subset(self, rendering_service, export_data):
+        embedder = ChartEmbedder(rendering_service)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            charts = asyncio.run(embedder.render_all_charts(
+                export_data, resolution=30, output_dir=Path(temp_dir),
+                chart_names=['npv_comparison', 'annual_cash_flows']
+            ))
+
+            assert list(charts) == ['npv_comparison', 'annual_cash_flows']
+            assert not (Path(temp_dir) / 'financial_metrics.png').exists()
+
+    def test_failed_chart_omitted(self, rendering_service):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jobs = [
+                ChartRenderJob('good', {'data': [{'type': 'bar', 'y': [1, 2]}]}, Path(temp_dir) / 'good.png', 200, 150),
+                ChartRenderJob('bad', {'data': []}, Path(temp_dir) / 'bad.png', 200, 150, format='bogus')
+            ]
+            charts = asyncio.run(rendering_service.render(jobs))
+
+            assert list(charts) == ['good']
+            assert _is_png(charts['good'])
+
+    def test_shared_renderer_fallback(self):
+        service = ChartRenderingService(use_pool=False)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            job = ChartRenderJob('chart', {'data': [{'type': 'scatter', 'y': [3, 1, 2]}]},
+                                 Path(temp_dir) / 'chart.png', 200, 150)
+            charts = asyncio.run(service.render([job]))
+
+            assert _is_png(charts['chart'])
+            assert not service.get_stats()['dedicated_renderers']
@@ -0,0 +1,179 @@
+"""
+Comparison Table Tests
+Tests for column-wise table construction, formatting and display table caching
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.charts.core_charts import format_currency
+from components.comparison import comparison_tables
+from components.comparison.comparison_tables import (
+    add_visual_indicators,
+    build_annual_costs_frame,
+    build_cash_flow_comparison_frame,
+    build_sensitivity_grid,
+    format_comparison_table,
+    format_currency_values,
+    get_cached_table,
+    style_sensitivity_grid
+)
+
+
+OWNERSHIP_FLOWS = [
+    {'year': 1, 'net_cash_flow': -52000.0, 'mortgage_payment': 40000.0, 'property_taxes': 6000.0,
+     'insurance': 2000.0, 'maintenance': 3000.0, 'property_management': 500.0, 'tax_benefits': 4000.0},
+    {'year': 2, 'net_cash_flow': -48000.0, 'mortgage_payment': 40000.0, 'property_taxes': 6200.0,
+     'insurance': 2100.0, 'maintenance': 3100.0, 'capex_reserve': 800.0},
+    {'year': 3, 'net_cash_flow': -47000.0}
+]
+RENTAL_FLOWS = [
+    {'year': 1, 'net_cash_flow': -50000.0},
+    {'year': 2, 'net_cash_flow': -51500.0},
+    {'year': 3, 'net_cash_flow': -47000.0}
+]
+
+
+def sensitivity_result(rows=3, columns=3):
+    """Formatted 2D sensitivity result with alternating signs"""
+    table_data = []
+    for i in range(rows):
+        row = {'y_label': f"{3.0 + i:.1f}%", 'y_change': f"({i - 1:+.1f}%)"}
+        for j in range(columns):
+            value = (i - j) * 1000.0
+            row[f'col_{j}'] = f"${value / 1000:,.0f}K"
+            row[f'col_{j}_raw'] = value
+        table_data.append(row)
+
+    return {
+        'table_data': table_data,
+        'x_headers': [f"{5.0 + j:.1f}%" for j in range(columns)],
+        'x_change_indicators': [f"({j - 1:+.1f}%)" for j in range(columns)],
+        'x_metric_display': 'Interest Rate',
+        'y_metric_display': 'Market Appreciation Rate',
+        'num_columns': columns,
+        'num_rows': rows
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_table_cache():
+    comparison_tables.clear_table_cache()
+    yield
+    comparison_tables.clear_table_cache()
+
+
+class TestTableConstruction:
+    """Tables are built column-wise from the flows"""
+
+    def test_annual_costs_frame(self):
+        df = build_annual_costs_frame(OWNERSHIP_FLOWS, RENTAL_FLOWS)
+
+        assert df['Year'].tolist() == [1, 2, 3]
+        assert df['Ownership Total'].tolist() == [52000.0, 48000.0, 47000.0]
+        assert df['Other Costs'].tolist() == [500.0, 800.0, 0.0]
+        assert df['Tax Benefits'].tolist() == [4000.0, 0.0, 0.0]
+        assert df['Annual Difference'].tolist() == [2000.0, -3500.0, 0.0]
+        assert len(build_annual_costs_frame(OWNERSHIP_FLOWS, RENTAL_FLOWS, max_years=2)) == 2
+
+    def test_cash_flow_present_values(self):
+        df = build_cash_flow_comparison_frame(OWNERSHIP_FLOWS, RENTAL_FLOWS, 0.08)
+
+        factors = 1.08 ** np.array([1, 2, 3])
+        pv_difference = (np.array([-52000.0, -48000.0, -47000.0]) - np.array([-50000.0, -51500.0, -47000.0])) / factors
+        np.testing.assert_allclose(df['PV Difference'], pv_difference)
+        np.testing.assert_allclose(df['Cumulative PV Difference'], np.cumsum(pv_difference))
+
+
+class TestFormatting:
+    """Vectorized formatting matches the scalar helpers"""
+
+    def test_currency_values_match_format_currency(self):
+        amounts = np.random.default_rng(3).normal(0, 2e6, 2000)
+        amounts[:4] = [0.0, 999.5, -999.5, 1_000_000.0]
+
+        assert format_currency_values(amounts).tolist() == [format_currency(amount) for amount in amounts]
+
+    def test_zero_and_missing_show_na(self):
+        df = pd.DataFrame({'Mortgage Payment': [0.0, np.nan, 1500.0], 'Year': [1, 2, 3]})
+        formatted = format_comparison_table(df)
+        assert formatted['Mortgage Payment'].tolist() == ['N/A', 'N/A', '$2K']
+
+    def test_indicators_parse_formatted_amounts(self):
+        df = pd.DataFrame({'Ownership': ['$150K', 'N/A', '-$2.5M', 'n.a.'], 'Rental': ['$100K', '$5', '$1.0M', '$3']})
+
+        enhanced = add_visual_indicators(df, ['Ownership', 'Rental'], better_when="lower")
+
+        assert enhanced['Ownership'].tolist() == ['🔴 $150K', '🟢 N/A', '🟢 -$2.5M', 'n.a.']
+        assert enhanced['Rental'].tolist() == ['🟢 $100K', '🔴 $5', '🔴 $1.0M', '$3']
+
+    def test_indicators_on_numeric_columns(self):
+        df = pd.DataFrame({'Ownership Total': [52000.0, 47000.0], 'Rental Total': [50000.0, 47000.0]})
+        enhanced = add_visual_indicators(df, ['Ownership Total', 'Rental Total'], better_when="lower")
+        assert enhanced['Ownership Total'].tolist() == ['🔴 52000.0', '🟡 47000.0']
+
+
+class TestSensitivityGrid:
+    """Sensitivity grid styles come from the raw NPV signs"""
+
+    def test_grid_and_styles(self):
+        display_df, styles = build_sensitivity_grid(sensitivity_result())
+
+        assert list(display_df.columns) == [
+            'Market Appreciation Rate', '5.0% (-1.0%)', '6.0% (+0.0%)', '7.0% (+1.0%)'
+        ]
+        assert display_df.iloc[0, 0] == '3.0% (-1.0%)'
+        assert styles.shape == display_df.shape
+        assert styles.iloc[0, 0] == ''
+        assert 'FADBD8' in styles.iloc[0, 2]
+        assert 'D5F4E6' in styles.iloc[2, 1]
+        assert 'background' not in styles.iloc[1, 2]
+
+    def test_large_grid_styler_renders(self):
+        styler = style_sensitivity_grid(sensitivity_result(rows=50, columns=50))
+        html = styler.to_html()
+        assert html.count('#D5F4E6') > 0 and html.count('#FADBD8') > 0
+
+
+class TestTableCache:
+    """Display tables are built once per analysis hash"""
+
+    def test_built_once(self):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return pd.DataFrame({'a': [1]})
+
+        first = get_cached_table('annual_costs', 'analysis-a', build)
+        assert get_cached_table('annual_costs', 'analysis-a', build) is first
+        get_cached_table('annual_costs', 'analysis-b', build)
+        assert len(builds) == 2
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(comparison_tables, 'TABLE_CACHE_MAX_ENTRIES', 2)
+        for analysis_hash in ('a', 'b', 'c'):
+            get_cached_table('annual_costs', analysis_hash, lambda: pd.DataFrame())
+        assert list(comparison_tables._table_cache) == [('annual_costs', 'b'), ('annual_costs', 'c')]
+
+    def test_sensitivity_frames_shared(self, monkeypatch):
+        calls = []
+        original = comparison_tables.build_sensitivity_grid
+
+        def counting_build(formatted_result):
+            calls.append(1)
+            return original(formatted_result)
+
+        monkeypatch.setattr(comparison_tables, 'build_sensitivity_grid', counting_build)
+        first = style_sensitivity_grid(sensitivity_result())
+        second = style_sensitivity_grid(sensitivity_result())
+
+        assert len(calls) == 1
+        assert first is not second
+        assert first.data is second.data
@@ -0,0 +1,102 @@
+"""
+Dashboard Fragment Tests
+Tests that dashboard figures are built once per analysis and survive reruns
+"""
+
+import os
+import sys
+
+import plotly.graph_objects as go
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.charts import figure_cache
+from components.charts.core_charts import create_npv_comparison_chart
+from components.charts.figure_cache import FigureCache
+from components import result_store
+from utils.helpers import compute_analysis_hash
+
+
+def dashboard_app():
+    """Render the chart sections for a fixed analysis"""
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
+
+    from calculations.npv_analysis import calculate_analysis_bundle
+    from components.dashboard.results_dashboard import render_chart_sections
+
+    bundle = calculate_analysis_bundle(
+        purchase_price=1000000, down_payment_pct=30, interest_rate=6.5, loan_term=20,
+        transaction_costs=50000, current_annual_rent=60000, rent_increase_rate=3.0,
+        analysis_period=25, cost_of_capital=8.0, current_space_needed=800,
+        ownership_property_size=1000, rental_property_size=800
+    )
+    render_chart_sections(bundle['npv_analysis'], bundle['ownership_flows'], bundle['rental_flows'])
+
+
+class TestFigureCache:
+    """Figures are built once per analysis and kept out of session state"""
+
+    def test_built_once_per_analysis(self, monkeypatch):
+        monkeypatch.setattr(st, 'session_state', {})
+        cache = FigureCache()
+        monkeypatch.setattr(figure_cache, '_figure_cache', cache)
+        results = {'ownership_npv': 125000.0, 'rental_npv': 85000.0, 'npv_difference': 40000.0}
+
+        create_npv_comparison_chart(results)
+        create_npv_comparison_chart(dict(results))
+        assert cache.get_stats()['misses'] == 1
+
+        create_npv_comparison_chart({**results, 'rental_npv': 90000.0})
+        assert cache.get_stats()['entries'] == 2
+        assert st.session_state == {}
+
+    def test_figures_kept_out_of_result_store(self, monkeypatch):
+        monkeypatch.setattr(figure_cache, '_figure_cache', FigureCache())
+        monkeypatch.setattr(result_store, '_result_store', None)
+
+        create_npv_comparison_chart({'ownership_npv': 1.0, 'rental_npv': 2.0, 'npv_difference': -1.0})
+        assert result_store._result_store is None
+
+    def test_analysis_hash_is_stable(self):
+        results = {'ownership_npv': 1.5, 'rental_npv': 2.0}
+        flows = [{'year': 1, 'net_cash_flow': -100.0}]
+
+        assert compute_analysis_hash(results, flows, flows) == compute_analysis_hash(dict(results), flows, flows)
+        assert compute_analysis_hash(results, flows, flows) != compute_analysis_hash({**results, 'rental_npv': 2.5}, flows, flows)
+
+
+class TestDashboardReruns:
+    """Sensitivity controls do not rebuild the core charts"""
+
+    def test_metric_selection_reuses_charts(self, monkeypatch):
+        cache = FigureCache()
+        monkeypatch.setattr(figure_cache, '_figure_cache', cache)
+
+        at = AppTest.from_function(dashboard_app, default_timeout=120).run()
+        assert not at.exception
+        builds = cache.get_stats()['misses']
+        assert builds > 0
+
+        at.selectbox(key="x_metric_selection").select_index(0).run()
+        assert not at.exception
+        assert cache.get_stats()['misses'] == builds
+
+    def test_charts_serialized_once(self, monkeypatch):
+        monkeypatch.setattr(figure_cache, '_figure_cache', FigureCache())
+        serialized = []
+        to_json = go.Figure.to_json
+        monkeypatch.setattr(go.Figure, 'to_json', lambda fig, *a, **kw: serialized.append(fig) or to_json(fig, *a, **kw))
+
+        at = AppTest.from_function(dashboard_app, default_timeout=120).run()
+        assert not at.exception
+        assert serialized
+
+        count = len(serialized)
+        at.selectbox(key="x_metric_selection").select_index(0).run()
+        assert not at.exception
+        assert len(serialized) == count
@@ -0,0 +1,110 @@
+"""
+Data Priority Manager Tests
+Tests for the resolved snapshot, change tracking and cached summary
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.data_priority_manager import DataPriorityManager
+
+
+@pytest.fixture
+def manager():
+    manager = DataPriorityManager()
+    manager.initialize_defaults()
+    return manager
+
+
+class TestResolution:
+    """Reads resolve User > API > Default from the snapshot"""
+
+    def test_priority_order(self, manager):
+        assert manager.get_value('interest_rate')['priority_level'] == 'default_data'
+
+        manager.set_api_data('interest_rate', 6.4, 'test_api', confidence=0.9)
+        assert manager.get_value('interest_rate')['priority_level'] == 'api_data'
+        assert manager.get_value('interest_rate')['confidence'] == 0.9
+
+        manager.set_user_override('interest_rate', 5.9)
+        assert manager.get_value_only('interest_rate') == 5.9
+
+        manager.reset_field_to_api('interest_rate')
+        assert manager.get_value_only('interest_rate') == 6.4
+
+        manager.clear_api_data()
+        assert manager.get_value_only('interest_rate') == 7.0
+
+    def test_missing_key_fallback(self, manager):
+        assert manager.get_value_only('unknown_rate', 1.5) == 1.5
+        assert manager.get_value('unknown_rate', 1.5)['priority_level'] == 'fallback'
+        with pytest.raises(ValueError):
+            manager.get_value('unknown_rate')
+
+    def test_returned_entries_are_copies(self, manager):
+        manager.get_value('inflation_rate')['value'] = 99.0
+        manager.get_data_summary()['inflation_rate']['active_value'] = 99.0
+
+        assert manager.get_value_only('inflation_rate') == 3.0
+        assert manager.get_data_summary()['inflation_rate']['active_value'] == 3.0
+
+    def test_resolved_values(self, manager):
+        manager.set_user_override('cost_of_capital', 9.5)
+        values = manager.get_resolved_values()
+
+        assert values['cost_of_capital'] == 9.5
+        assert values['rent_increase_rate'] == 3.0
+
+
+class TestChangeTracking:
+    """Only real changes are re-resolved and bump the version"""
+
+    def test_rerun_with_same_inputs_is_noop(self, manager):
+        session_data = {'inputs': {'interest_rate': 6.5, 'inflation_rate': 2.5}}
+        manager.bulk_update_from_session(session_data)
+        manager.get_value_only('interest_rate')
+        version = manager.version
+
+        manager.bulk_update_from_session(session_data)
+        assert manager.version == version
+        assert not manager._dirty_keys
+
+    def test_only_dirty_keys_resolved(self, manager, monkeypatch):
+        manager.get_data_summary()
+        resolved = []
+        original = manager._resolve
+
+        def counting_resolve(key):
+            resolved.append(key)
+            return original(key)
+
+        monkeypatch.setattr(manager, '_resolve', counting_resolve)
+        manager.set_api_data('inflation_rate', 2.8, 'test_api')
+        manager.get_value_only('inflation_rate')
+        manager.get_value_only('cost_of_capital')
+
+        assert resolved == ['inflation_rate']
+
+    def test_summary_cached_until_change(self, manager):
+        first = manager.get_data_summary()
+        assert manager._summary is not None
+        assert manager.get_data_summary() == first
+
+        manager.set_user_override('property_tax_rate', 0.9)
+        summary = manager.get_data_summary()
+        assert summary['property_tax_rate']['active_value'] == 0.9
+        assert summary['property_tax_rate']['has_user_override']
+        assert summary['property_tax_rate']['has_default']
+
+    def test_source_change_refreshes_without_version_bump(self, manager):
+        manager.set_api_data('inflation_rate', 2.8, 'first_api')
+        manager.get_value_only('inflation_rate')
+        version = manager.version
+
+        manager.set_api_data('inflation_rate', 2.8, 'second_api')
+        assert manager.version == version
+        assert manager.get_value('inflation_rate')['source'] == 'second_api'
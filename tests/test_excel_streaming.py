@@ -0,0 +1,127 @@
+"""
+Streaming Excel Workbook Tests
+Tests for bounded-memory Excel generation with shared styles
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.excel import excel_generator
+from src.export.excel.excel_generator import STREAMING_ROW_THRESHOLD, ExcelGenerator
+from src.export.excel.streaming_workbook import StreamingWorkbookWriter
+
+
+def _export_data(years: int):
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'npv_difference': 40000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'recommendation': 'BUY',
+            'confidence': 'High',
+            'analysis_period': years
+        },
+        'inputs': {
+            'purchase_price': 750000.0,
+            'current_annual_rent': 36000.0,
+            'analysis_period': years,
+            'cost_of_capital': 8.0
+        },
+        'ownership_flows': [
+            {
+                'year': i + 1,
+                'net_cash_flow': -45000 + i * 1000,
+                'mortgage_payment': 36000 + i * 100,
+                'property_taxes': 9000 + i * 180,
+                'insurance': 5000,
+                'maintenance': 15000 + i * 300
+            } for i in range(years)
+        ],
+        'rental_flows': [
+            {
+                'year': i + 1,
+                'net_cash_flow': -36000 - i * 1080,
+                'annual_rent': 36000 + i * 1080
+            } for i in range(years)
+        ]
+    }
+
+
+@pytest.fixture(scope='module')
+def excel_data():
+    generator = ExcelGenerator(temp_dir=Path(tempfile.mkdtemp()))
+    return asyncio.run(generator.prepare_data(_export_data(years=50)))
+
+
+def _generate(excel_data, streaming: bool) -> openpyxl.Workbook:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = ExcelGenerator(temp_dir=Path(temp_dir), streaming=streaming)
+        path = asyncio.run(generator.generate_workbook(excel_data, 'detailed'))
+        return openpyxl.load_workbook(path)
+
+
+class TestStreamingWorkbook:
+    """Streaming output matches the in-memory generator"""
+
+    def test_same_content_as_in_memory_workbook(self, excel_data):
+        expected = _generate(excel_data, streaming=False)
+        streamed = _generate(excel_data, streaming=True)
+
+        assert streamed.sheetnames == expected.sheetnames
+        for expected_ws, streamed_ws in zip(expected.worksheets, streamed.worksheets):
+            assert list(streamed_ws.iter_rows(values_only=True)) == list(expected_ws.iter_rows(values_only=True))
+            assert sorted(map(str, streamed_ws.merged_cells.ranges)) == sorted(map(str, expected_ws.merged_cells.ranges))
+
+    def test_styles_shared_across_cells(self, excel_data):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = StreamingWorkbookWriter(Path(temp_dir) / 'streamed.xlsx')
+            template_config = asyncio.run(ExcelGenerator(temp_dir=Path(temp_dir)).template_manager.get_template_config('detailed'))
+            writer.write(excel_data, template_config)
+
+            workbook = openpyxl.load_workbook(writer.output_path)
+            cell_count = sum(1 for ws in workbook.worksheets for row in ws.iter_rows() for cell in row if cell.value is not None)
+
+        # One format per distinct look, not per cell
+        assert cell_count > 1000
+        assert len(writer.styles) < 60
+
+    def test_column_widths_from_data(self, excel_data):
+        streamed = _generate(excel_data, streaming=True)
+        ws = streamed['Cash Flow Analysis']
+
+        assert ws.column_dimensions['A'].width == pytest.approx(25, abs=1)
+        # Detailed cash flow columns beyond F are sized from their longest value
+        longest = max(len(str(cell.value)) for cell in ws['H'] if cell.value is not None)
+        assert ws.column_dimensions['H'].width == pytest.approx(min(max(longest + 3, 12), 40), abs=1)
+        assert streamed['Input Assumptions'].column_dimensions['E'].width == pytest.approx(40, abs=1)
+
+
+class TestStreamingDefault:
+    """Generators left to choose stream large workbooks"""
+
+    @pytest.mark.parametrize('years, streamed', [(10, False), (STREAMING_ROW_THRESHOLD, True)])
+    def test_streams_above_row_threshold(self, monkeypatch, years, streamed):
+        writes = []
+        original = StreamingWorkbookWriter.write
+
+        def counting_write(self, *args, **kwargs):
+            writes.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(excel_generator.StreamingWorkbookWriter, 'write', counting_write)
+        generator = ExcelGenerator()
+        data = asyncio.run(generator.prepare_data(_export_data(years=years)))
+        buffer = asyncio.run(generator.generate_workbook_bytes(data, 'detailed'))
+
+        assert len(writes) == int(streamed)
+        assert 'Cash Flow Analysis' in openpyxl.load_workbook(buffer).sheetnames
@@ -0,0 +1,220 @@
+"""
+Export Job Queue Tests
+Tests for background report generation with request deduplication
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+from datetime import timedelta
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.export_queue import ExportJobQueue, ExportJobStatus, export_request_key
+from src.export.file_manager import FileManager
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'npv_difference': 40000.0,
+            'recommendation': 'BUY',
+            'confidence': 'High'
+        },
+        'inputs': {
+            'purchase_price': 750000.0,
+            'current_annual_rent': 36000.0,
+            'analysis_period': 10,
+            'cost_of_capital': 8.0
+        },
+        'ownership_flows': [{'year': i + 1, 'net_cash_flow': -45000 + i * 1000} for i in range(10)],
+        'rental_flows': [{'year': i + 1, 'net_cash_flow': -36000 - i * 1080} for i in range(10)],
+        'export_metadata': {'export_timestamp': '2025-01-01T00:00:00'}
+    }
+
+
+@pytest.fixture
+def file_manager():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield FileManager(Path(temp_dir))
+
+
+class RecordingGenerator:
+    """Counts calls and optionally blocks until released"""
+
+    def __init__(self, blocking: bool = False):
+        self.calls = []
+        self.release = threading.Event()
+        if not blocking:
+            self.release.set()
+
+    def __call__(self, export_data, template_type, **options):
+        self.calls.append((template_type, options))
+        self.release.wait(5)
+        return f"{template_type} report".encode()
+
+
+@pytest.fixture
+def generator():
+    return RecordingGenerator(blocking=True)
+
+
+@pytest.fixture
+def queue(file_manager, generator):
+    queue = ExportJobQueue(max_workers=2, file_manager=file_manager, generators={'excel': generator, 'pdf': generator})
+    yield queue
+    generator.release.set()
+    queue.shutdown()
+
+
+class TestExportRequestKey:
+    """Requests are identified by analysis, format and template"""
+
+    def test_key_ignores_export_metadata(self, export_data):
+        key = export_request_key(export_data, 'excel', 'detailed')
+
+        later = dict(export_data, export_metadata={'export_timestamp': '2025-06-01T12:00:00'})
+        assert export_request_key(later, 'excel', 'detailed') == key
+        assert export_request_key(export_data, 'pdf', 'detailed') != key
+        assert export_request_key(export_data, 'excel', 'executive') != key
+        assert export_request_key(export_data, 'excel', 'detailed', {'custom_config': {'a': 1}}) != key
+
+        changed = dict(export_data, analysis_results=dict(export_data['analysis_results'], ownership_npv=1.0))
+        assert export_request_key(changed, 'excel', 'detailed') != key
+
+    def test_session_analysis_hash_used_when_present(self, export_data):
+        first = dict(export_data, export_metadata={'analysis_hash': 'abc'})
+        second = dict(export_data, inputs={'recomputed': True}, export_metadata={'analysis_hash': 'abc'})
+        assert export_request_key(first, 'excel', 'detailed') == export_request_key(second, 'excel', 'detailed')
+
+
+class TestExportJobQueue:
+    """Jobs run in the background and identical requests share work"""
+
+    def test_duplicate_requests_share_running_job(self, queue, generator, export_data):
+        first = queue.submit(export_data, 'excel', 'detailed')
+        second = queue.submit(export_data, 'excel', 'detailed')
+
+        assert second is first
+        assert not first.is_done
+
+        generator.release.set()
+        assert first.wait(5)
+        assert first.status == ExportJobStatus.COMPLETED
+        assert len(generator.calls) == 1
+        assert queue.get_stats()['deduplicated'] == 1
+
+    def test_finished_report_reused(self, queue, generator, file_manager, export_data):
+        generator.release.set()
+        job = queue.submit(export_data, 'pdf', 'executive')
+        job.wait(5)
+
+        export_file = queue.get_file(job)
+        assert export_file.path.parent == file_manager.base_dir
+        assert export_file.path.read_bytes() == b"executive report"
+        assert file_manager.get_file(job.file_id) is export_file
+
+        assert queue.submit(export_data, 'pdf', 'executive') is job
+        assert len(generator.calls) == 1
+        assert queue.get_stats()['reused'] == 1
+
+    def test_different_templates_run_separately(self, queue, generator, export_data):
+        generator.release.set()
+        executive = queue.submit(export_data, 'pdf', 'executive')
+        investor = queue.submit(export_data, 'pdf', 'investor', {'custom_config': {'color_scheme': 'investor'}})
+
+        assert executive.job_id != investor.job_id
+        assert executive.wait(5) and investor.wait(5)
+        assert sorted(generator.calls, key=lambda call: call[0]) == [
+            ('executive', {}),
+            ('investor', {'custom_config': {'color_scheme': 'investor'}})
+        ]
+
+    def test_failed_job_retried_on_next_request(self, file_manager, export_data):
+        attempts = []
+
+        def flaky(export_data, template_type):
+            attempts.append(template_type)
+            if len(attempts) == 1:
+                raise RuntimeError("renderer crashed")
+            return b"report"
+
+        queue = ExportJobQueue(max_workers=1, file_manager=file_manager, generators={'excel': flaky})
+        try:
+            failed = queue.submit(export_data, 'excel', 'detailed')
+            failed.wait(5)
+            assert failed.status == ExportJobStatus.FAILED
+            assert failed.error == "renderer crashed"
+
+            retried = queue.submit(export_data, 'excel', 'detailed')
+            retried.wait(5)
+            assert retried is not failed
+            assert retried.status == ExportJobStatus.COMPLETED
+        finally:
+            queue.shutdown()
+
+        assert queue.get_stats()['failed'] == 1
+
+    def test_expired_report_regenerated(self, file_manager, export_data):
+        generator = RecordingGenerator()
+        queue = ExportJobQueue(
+            max_workers=1, file_manager=file_manager, generators={'excel': generator}, artifact_ttl=timedelta(0)
+        )
+        try:
+            queue.submit(export_data, 'excel', 'detailed').wait(5)
+            queue.submit(export_data, 'excel', 'detailed').wait(5)
+        finally:
+            queue.shutdown()
+
+        assert len(generator.calls) == 2
+        assert len(list(file_manager.base_dir.glob('*.xlsx'))) == 1
+
+    def test_report_served_from_memory(self, queue, generator, export_data):
+        generator.release.set()
+        job = queue.submit(export_data, 'pdf', 'executive')
+        job.wait(5)
+
+        queue.get_file(job).path.unlink()
+        assert queue.get_file(job) is not None
+        assert job.content == b"executive report"
+
+    def test_expired_jobs_pruned(self, file_manager, export_data):
+        queue = ExportJobQueue(
+            max_workers=1, file_manager=file_manager, generators={'excel': RecordingGenerator(), 'pdf': RecordingGenerator()},
+            artifact_ttl=timedelta(0)
+        )
+        try:
+            job = queue.submit(export_data, 'excel', 'detailed')
+            job.wait(5)
+            assert queue.get_file(job) is None
+            assert job.content is None
+
+            queue.submit(export_data, 'pdf', 'detailed').wait(5)
+            assert queue.get_job(job.job_id) is None
+        finally:
+            queue.shutdown()
+
+    def test_unknown_format_rejected(self, queue, export_data):
+        with pytest.raises(ValueError):
+            queue.submit(export_data, 'docx', 'detailed')
+
+    def test_default_excel_generator(self, file_manager, export_data):
+        queue = ExportJobQueue(max_workers=1, file_manager=file_manager)
+        try:
+            job = queue.submit(export_data, 'excel', 'detailed')
+            job.wait(60)
+        finally:
+            queue.shutdown()
+
+        assert job.status == ExportJobStatus.COMPLETED, job.error
+        workbook = openpyxl.load_workbook(io.BytesIO(queue.get_file(job).path.read_bytes()))
+        assert 'Executive Summary' in workbook.sheetnames
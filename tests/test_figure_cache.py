@@ -0,0 +1,135 @@
+"""
+Figure Cache Tests
+Tests for memoized chart construction and one-time JSON serialization
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.charts import figure_cache
+from components.charts.core_charts import create_cash_flow_timeline_chart, create_npv_comparison_chart
+from components.charts.figure_cache import FigureCache, figure_cache_key, get_figure_json, memoize_figure
+
+
+ANALYSIS_RESULTS = {
+    'ownership_npv': -250000.0,
+    'rental_npv': -310000.0,
+    'npv_difference': 60000.0,
+    'recommendation': 'BUY',
+    'confidence': 'High'
+}
+
+OWNERSHIP_FLOWS = [{'year': year, 'net_cash_flow': -50000.0 + 1000 * year} for year in range(1, 6)]
+RENTAL_FLOWS = [{'year': year, 'net_cash_flow': -45000.0 - 1500 * year} for year in range(1, 6)]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = FigureCache(max_entries=3)
+    monkeypatch.setattr(figure_cache, '_figure_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def counting_chart():
+    calls = []
+
+    @memoize_figure
+    def create_test_chart(values, title='Test'):
+        calls.append(title)
+        return go.Figure(go.Bar(y=list(values)), layout={'title': title})
+
+    create_test_chart.calls = calls
+    return create_test_chart
+
+
+class TestMemoization:
+    """Each distinct chart input is built once"""
+
+    def test_same_input_builds_once(self, cache, counting_chart):
+        first = counting_chart([1, 2, 3])
+        second = counting_chart([1, 2, 3])
+
+        assert counting_chart.calls == ['Test']
+        assert first == second
+        assert first is not second
+        assert cache.get_stats()['hits'] == 1
+
+    def test_display_options_are_part_of_key(self, cache, counting_chart):
+        counting_chart([1, 2, 3])
+        counting_chart([1, 2, 3], title='Other')
+        counting_chart([1, 2, 4])
+
+        assert len(counting_chart.calls) == 3
+
+    def test_returned_figures_are_independent(self, cache, counting_chart):
+        counting_chart([1, 2, 3]).update_layout(title='Changed')
+        assert counting_chart([1, 2, 3]).layout.title.text == 'Test'
+
+    def test_bounded_lru(self, cache, counting_chart):
+        for values in ([1], [2], [3]):
+            counting_chart(values)
+        counting_chart([1])
+        counting_chart([4])
+
+        assert cache.get_stats()['entries'] == 3
+        assert cache.evictions == 1
+        counting_chart([1])
+        counting_chart([2])
+        assert counting_chart.calls.count('Test') == 5
+
+    def test_numpy_arguments_hash_by_value(self):
+        values = np.arange(5000)
+        changed = values.copy()
+        changed[2500] = -1
+
+        assert figure_cache_key('chart', values) == figure_cache_key('chart', values.copy())
+        assert figure_cache_key('chart', values) != figure_cache_key('chart', changed)
+
+
+class TestSerialization:
+    """Figures are serialized to JSON once and shared"""
+
+    def test_json_serialized_once(self, cache, counting_chart, monkeypatch):
+        serializations = []
+        original = go.Figure.to_json
+
+        def counting_to_json(self, *args, **kwargs):
+            serializations.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(go.Figure, 'to_json', counting_to_json)
+        first = get_figure_json(counting_chart, [1, 2, 3])
+        second = get_figure_json(counting_chart, [1, 2, 3])
+
+        assert first == second
+        assert len(serializations) == 1
+        assert counting_chart.calls == ['Test']
+        assert json.loads(first)['data'][0]['type'] == 'bar'
+
+    def test_json_shares_entry_with_figure(self, cache, counting_chart):
+        counting_chart([1, 2, 3])
+        get_figure_json(counting_chart, [1, 2, 3])
+        assert counting_chart.calls == ['Test']
+
+
+class TestChartFunctions:
+    """Core chart functions are memoized"""
+
+    def test_core_charts_cached(self, cache):
+        npv_chart = create_npv_comparison_chart(ANALYSIS_RESULTS, show_confidence=True)
+        assert create_npv_comparison_chart(ANALYSIS_RESULTS, show_confidence=True) == npv_chart
+
+        create_cash_flow_timeline_chart(OWNERSHIP_FLOWS, RENTAL_FLOWS)
+        create_cash_flow_timeline_chart(OWNERSHIP_FLOWS, RENTAL_FLOWS)
+
+        assert cache.get_stats()['misses'] == 2
+        assert cache.get_stats()['hits'] == 2
+        assert create_npv_comparison_chart.__wrapped__(ANALYSIS_RESULTS, show_confidence=True) == npv_chart
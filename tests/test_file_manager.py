@@ -0,0 +1,171 @@
+"""
+File Manager Tests
+Tests for the persistent export file registry, quota and sweeper
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.file_manager import BYTES_PER_MB, ExportFile, FileManager
+
+
+@pytest.fixture
+def export_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def write_export(directory: Path, name: str, size_bytes: int = 1024, expires_in: timedelta = timedelta(hours=1),
+                 format: str = "excel") -> ExportFile:
+    path = directory / name
+    path.write_bytes(b"x" * size_bytes)
+    generation_time = datetime.now()
+    return ExportFile(
+        path=path,
+        format=format,
+        template="detailed",
+        size_mb=size_bytes / BYTES_PER_MB,
+        generation_time=generation_time,
+        expires_at=generation_time + expires_in
+    )
+
+
+class TestRegistry:
+    """Files are tracked under unique IDs in a persistent registry"""
+
+    def test_generated_ids_are_unique(self, export_dir):
+        manager = FileManager(export_dir)
+        generation_time = datetime.now()
+
+        ids = set()
+        for index in range(20):
+            export_file = write_export(export_dir, f"report_{index}.xlsx")
+            export_file.generation_time = generation_time
+            ids.add(manager.register_file(export_file))
+
+        assert len(ids) == 20
+        assert len(manager.list_files()) == 20
+
+    def test_records_survive_restart(self, export_dir):
+        manager = FileManager(export_dir)
+        file_id = manager.register_file(write_export(export_dir, "report.xlsx"))
+        manager.mark_downloaded(file_id)
+
+        restarted = FileManager(export_dir)
+        export_file = restarted.get_file(file_id)
+        assert export_file.path == export_dir / "report.xlsx"
+        assert export_file.download_count == 1
+        assert restarted.get_storage_stats()['total_files'] == 1
+
+    def test_list_files_excludes_expired_and_filters_format(self, export_dir):
+        manager = FileManager(export_dir)
+        manager.register_file(write_export(export_dir, "current.xlsx"))
+        manager.register_file(write_export(export_dir, "report.pdf", format="pdf"))
+        manager.register_file(write_export(export_dir, "old.xlsx", expires_in=timedelta(seconds=-1)))
+
+        assert [f.filename for f in manager.list_files()] == ["current.xlsx", "report.pdf"]
+        assert [f.filename for f in manager.list_files("pdf")] == ["report.pdf"]
+
+    def test_cleanup_removes_file_and_record(self, export_dir):
+        manager = FileManager(export_dir)
+        file_id = manager.register_file(write_export(export_dir, "report.xlsx"))
+
+        assert manager.cleanup_file(file_id)
+        assert not (export_dir / "report.xlsx").exists()
+        assert manager.get_file(file_id) is None
+        assert not manager.cleanup_file(file_id)
+
+    def test_removal_seen_by_other_managers(self, export_dir):
+        first = FileManager(export_dir)
+        second = FileManager(export_dir)
+        file_id = first.register_file(write_export(export_dir, "report.xlsx"))
+        assert second.get_file(file_id) is not None
+
+        first.cleanup_file(file_id)
+        second.sweep()
+        assert second.get_file(file_id) is None
+
+    def test_lookups_batch_access_times(self, export_dir, monkeypatch):
+        manager = FileManager(export_dir)
+        file_id = manager.register_file(write_export(export_dir, "report.xlsx"))
+
+        connections = []
+        original = manager._get_connection
+        monkeypatch.setattr(manager, '_get_connection', lambda: connections.append(1) or original())
+        for _ in range(5):
+            assert manager.get_file(file_id) is not None
+        assert connections == []
+
+        accessed = manager._pending_access[file_id]
+        monkeypatch.undo()
+        manager.sweep()
+        with manager._get_connection() as conn:
+            row = conn.execute("SELECT last_accessed FROM export_files WHERE file_id = ?", (file_id,)).fetchone()
+        assert row['last_accessed'] == accessed
+
+
+class TestQuota:
+    """Least recently used files are evicted past the size quota"""
+
+    def test_lru_eviction(self, export_dir):
+        manager = FileManager(export_dir, max_total_mb=3 * 1024 / BYTES_PER_MB)
+        oldest = manager.register_file(write_export(export_dir, "a.xlsx"))
+        time.sleep(0.01)
+        middle = manager.register_file(write_export(export_dir, "b.xlsx"))
+        time.sleep(0.01)
+        newest = manager.register_file(write_export(export_dir, "c.xlsx"))
+        time.sleep(0.01)
+
+        # Reading the oldest file makes the middle one least recently used
+        manager.get_file(oldest)
+        time.sleep(0.01)
+        latest = manager.register_file(write_export(export_dir, "d.xlsx"))
+
+        assert manager.get_file(middle) is None
+        assert not (export_dir / "b.xlsx").exists()
+        assert all(manager.get_file(file_id) for file_id in (oldest, newest, latest))
+        assert manager.get_storage_stats()['evicted_files'] == 1
+
+    def test_new_file_kept_even_if_over_quota(self, export_dir):
+        manager = FileManager(export_dir, max_total_mb=1024 / BYTES_PER_MB)
+        file_id = manager.register_file(write_export(export_dir, "large.xlsx", size_bytes=4096))
+        assert manager.get_file(file_id) is not None
+
+
+class TestSweeper:
+    """Expired and missing files are removed in the background"""
+
+    def test_sweep(self, export_dir):
+        manager = FileManager(export_dir)
+        manager.register_file(write_export(export_dir, "expired.xlsx", expires_in=timedelta(seconds=-1)))
+        missing = manager.register_file(write_export(export_dir, "missing.xlsx"))
+        kept = manager.register_file(write_export(export_dir, "kept.xlsx"))
+        (export_dir / "missing.xlsx").unlink()
+
+        assert manager.sweep() == {'expired': 1, 'missing': 1, 'evicted': 0}
+        assert not (export_dir / "expired.xlsx").exists()
+        assert manager.get_file(missing) is None
+        assert manager.get_file(kept) is not None
+
+    def test_background_sweeper(self, export_dir):
+        manager = FileManager(export_dir)
+        manager.register_file(write_export(export_dir, "expired.xlsx", expires_in=timedelta(seconds=-1)))
+
+        manager.start_sweeper(interval_seconds=0.05)
+        try:
+            deadline = time.time() + 5
+            while (export_dir / "expired.xlsx").exists() and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            manager.stop_sweeper()
+
+        assert not (export_dir / "expired.xlsx").exists()
+        assert manager.sweep_count >= 1
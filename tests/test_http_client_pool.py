@@ -0,0 +1,177 @@
+"""
+HTTP Client Pool Tests
+Exercises the shared provider HTTP pool against a local stub HTTP server
+"""
+
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.http_client_pool import HTTPClientPool
+from src.data.interest_rate_feeds import InterestRateFeeds
+from src.data.international_api_feeds import BrazilCentralBankAPI
+
+
+class StubServer:
+    """Local HTTP server recording which client connections served each request"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.client_ports = []
+        self.active = 0
+        self.max_active = 0
+
+        self.app = web.Application()
+        self.app.router.add_get('/fred/series/observations', self._fred)
+        self.app.router.add_get('/bcb/{series}/dados/ultimos/1', self._bcb)
+        self.runner = None
+        self.base_url = None
+
+    async def start(self):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f'http://127.0.0.1:{port}'
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def _track(self, request):
+        self.client_ports.append(request.transport.get_extra_info('peername')[1])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+    async def _fred(self, request):
+        await self._track(request)
+        values = {'MORTGAGE30US': '6.5', 'MORTGAGE15US': '5.9'}
+        return web.json_response({'observations': [{'value': values[request.query['series_id']]}]})
+
+    async def _bcb(self, request):
+        await self._track(request)
+        return web.json_response([{'valor': '10.5', 'data': '01/01/2025'}])
+
+
+def _rate_feeds(server: StubServer, pool: HTTPClientPool) -> InterestRateFeeds:
+    return InterestRateFeeds({
+        'fred_api_key': 'test-key',
+        'fred_base_url': f'{server.base_url}/fred',
+        'fred_series': {'30_year_fixed': 'MORTGAGE30US', '15_year_fixed': 'MORTGAGE15US'},
+        'timeout': 5
+    }, http_pool=pool)
+
+
+class TestHTTPClientPool:
+    """Providers share pooled keep-alive connections"""
+
+    def test_providers_share_pooled_connections(self):
+        async def scenario():
+            server = StubServer()
+            await server.start()
+            pool = HTTPClientPool({'connection_limit_per_host': 4})
+            try:
+                rate_feeds = _rate_feeds(server, pool)
+                brazil_api = BrazilCentralBankAPI(http_pool=pool)
+                brazil_api.base_url = f'{server.base_url}/bcb/bcdata.sgs'
+
+                for _ in range(3):
+                    rates = await rate_feeds._fetch_from_fred(rate_feeds.rate_sources['fred'],
+                                                              ['30_year_fixed', '15_year_fixed'])
+                    selic = await brazil_api.get_latest_selic_rate()
+
+                return rates, selic, server.client_ports, pool.get_stats()
+            finally:
+                await pool.close()
+                await server.stop()
+
+        rates, selic, client_ports, stats = asyncio.run(scenario())
+
+        assert rates == {'30_year_fixed': 6.5, '15_year_fixed': 5.9}
+        assert selic == 10.5
+        assert len(client_ports) == 9
+        # Sequential requests from both providers reuse a single keep-alive connection
+        assert len(set(client_ports)) == 1
+        assert stats['sessions_created'] == 1
+        assert stats['requests_made'] == 9
+
+    def test_per_host_concurrency_cap(self):
+        async def scenario():
+            server = StubServer(delay=0.05)
+            await server.start()
+            pool = HTTPClientPool({'host_concurrency': {'127.0.0.1': 2}})
+            try:
+                brazil_api = BrazilCentralBankAPI(http_pool=pool)
+                brazil_api.base_url = f'{server.base_url}/bcb/bcdata.sgs'
+                await asyncio.gather(*[brazil_api.get_latest_selic_rate() for _ in range(8)])
+                return server.max_active
+            finally:
+                await pool.close()
+                await server.stop()
+
+        assert asyncio.run(scenario()) == 2
+
+    def test_session_recreated_per_event_loop(self):
+        pool = HTTPClientPool()
+
+        async def session_id():
+            return id(await pool.get_session())
+
+        async def same_loop_twice():
+            return await session_id(), await session_id()
+
+        first, second = asyncio.run(same_loop_twice())
+        assert first == second
+
+        asyncio.run(session_id())
+        assert pool.get_stats()['sessions_created'] == 2
+        assert pool.get_stats()['open_sessions'] == 1
+
+    def test_close_allows_reuse(self):
+        pool = HTTPClientPool()
+
+        async def scenario():
+            session = await pool.get_session()
+            await pool.close()
+            assert session.closed
+            reopened = await pool.get_session()
+            await pool.close()
+            return reopened is not session
+
+        assert asyncio.run(scenario())
+
+    def test_sessions_of_closed_loops_are_closed(self):
+        pool = HTTPClientPool()
+
+        async def get_session():
+            return await pool.get_session()
+
+        async def get_and_close():
+            await pool.get_session()
+            await pool.close()
+
+        abandoned = asyncio.run(get_session())
+        assert not abandoned.closed
+
+        asyncio.run(get_and_close())
+        assert abandoned.closed
+
+    def test_provider_close_closes_loop_session(self):
+        pool = HTTPClientPool()
+
+        async def one_shot():
+            brazil_api = BrazilCentralBankAPI(http_pool=pool)
+            session = await pool.get_session()
+            await brazil_api.close()
+            return session
+
+        assert asyncio.run(one_shot()).closed
+        assert pool.get_stats()['open_sessions'] == 0
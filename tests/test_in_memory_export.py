@@ -0,0 +1,117 @@
+"""
+In-Memory Export Tests
+Tests for generating Excel and PDF downloads without temporary files
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.chart_cache import ChartImageCache
+from src.export.chart_rendering import ChartRenderingService
+from src.export.excel.chart_embedding import ChartEmbedder
+from src.export.excel.excel_generator import ExcelGenerator
+from src.export.pdf_integration import PDFExportManager
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'npv_difference': 40000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'ownership_irr': 0.08,
+            'rental_irr': 0.06,
+            'recommendation': 'BUY',
+            'confidence': 'High'
+        },
+        'inputs': {
+            'purchase_price': 750000.0,
+            'current_annual_rent': 36000.0,
+            'analysis_period': 10,
+            'cost_of_capital': 8.0
+        },
+        'ownership_flows': [
+            {'year': i + 1, 'net_cash_flow': -45000 + i * 1000, 'mortgage_payment': 36000} for i in range(10)
+        ],
+        'rental_flows': [
+            {'year': i + 1, 'net_cash_flow': -36000 - i * 1080, 'annual_rent': 36000 + i * 1080} for i in range(10)
+        ]
+    }
+
+
+@pytest.fixture
+def rendering_service():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = ChartRenderingService(max_workers=1, image_cache=ChartImageCache(Path(temp_dir) / 'charts'))
+        yield service
+        service.shutdown()
+
+
+@pytest.fixture
+def no_temp_files(monkeypatch):
+    """Fail the test if anything asks for a temporary file or directory"""
+    def forbidden(*args, **kwargs):
+        raise AssertionError("temporary file requested during in-memory export")
+
+    monkeypatch.setattr(tempfile, 'mkdtemp', forbidden)
+    monkeypatch.setattr(tempfile, 'mktemp', forbidden)
+
+
+class TestInMemoryCharts:
+    """Charts rendered straight to bytes"""
+
+    def test_render_images_returns_png_bytes(self, export_data, rendering_service, no_temp_files):
+        images = asyncio.run(ChartEmbedder(rendering_service).render_all_chart_images(
+            export_data, resolution=30, chart_names=['npv_comparison', 'annual_cash_flows']
+        ))
+
+        assert sorted(images) == ['annual_cash_flows', 'npv_comparison']
+        assert all(image.startswith(PNG_SIGNATURE) for image in images.values())
+
+        # Second request is served from the image cache
+        asyncio.run(ChartEmbedder(rendering_service).render_all_chart_images(
+            export_data, resolution=30, chart_names=['npv_comparison']
+        ))
+        assert rendering_service.get_stats()['image_cache']['hits'] == 1
+
+
+class TestInMemoryReports:
+    """Excel and PDF reports written into buffers"""
+
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_excel_workbook_bytes(self, export_data, streaming, no_temp_files):
+        generator = ExcelGenerator()
+        excel_data = asyncio.run(generator.prepare_data(export_data))
+        buffer = asyncio.run(generator.generate_workbook_bytes(excel_data, 'detailed', streaming=streaming))
+
+        assert isinstance(buffer, io.BytesIO)
+        assert buffer.tell() == 0
+        workbook = openpyxl.load_workbook(buffer)
+        assert 'Cash Flow Analysis' in workbook.sheetnames
+
+    def test_pdf_report_in_memory(self, export_data, rendering_service, no_temp_files):
+        manager = PDFExportManager()
+        manager.chart_renderer.chart_embedder = ChartEmbedder(rendering_service)
+
+        buffer, info = asyncio.run(manager.generate_pdf_report(export_data, 'executive', in_memory=True))
+
+        assert isinstance(buffer, io.BytesIO)
+        assert buffer.getvalue().startswith(b'%PDF')
+        assert info['success']
+        assert info['charts_rendered'] == 2
+        assert info['file_size'] == len(buffer.getvalue())
@@ -0,0 +1,49 @@
+"""
+Lazy Tab Tests
+Tests that only the open tab's content is rendered
+"""
+
+import os
+import sys
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components import layout
+
+
+def tabs_app():
+    """Three tabs writing their name when rendered"""
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
+
+    import streamlit as st
+    from components.layout import render_lazy_tabs
+
+    rendered = render_lazy_tabs({
+        "Inputs": lambda: st.markdown("inputs tab"),
+        "Results": lambda: st.markdown("results tab"),
+        "Help": lambda: st.markdown("help tab")
+    }, key="main_tab")
+    st.markdown(f"rendered {rendered}")
+
+
+def rendered_markdown(at):
+    return [element.value for element in at.markdown]
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_only_open_tab_rendered(monkeypatch, native):
+    monkeypatch.setattr(layout, '_NATIVE_LAZY_TABS', native)
+
+    at = AppTest.from_function(tabs_app, default_timeout=60).run()
+    assert not at.exception
+    assert rendered_markdown(at) == ["inputs tab", "rendered Inputs"]
+
+    at.session_state['main_tab'] = "Help"
+    at.run()
+    assert not at.exception
+    assert rendered_markdown(at) == ["help tab", "rendered Help"]
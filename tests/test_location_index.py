@@ -0,0 +1,105 @@
+"""
+Location Index Tests
+Tests for location normalization and indexed fuzzy cache lookups
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.location_index import LocationIndex, normalize_location
+from src.data.cache_management import IntelligentCacheManager
+
+
+class TestNormalizeLocation:
+    """Canonical location forms"""
+
+    @pytest.mark.parametrize('location', [
+        'NYC', 'New York, NY', 'new york city', 'New York, New York, USA', 'new york'
+    ])
+    def test_new_york_variants(self, location):
+        assert normalize_location(location) == 'new york, ny'
+
+    def test_state_names_and_abbreviations(self):
+        assert normalize_location('Portland, Oregon') == 'portland, or'
+        assert normalize_location('Austin TX') == 'austin, tx'
+
+    def test_substring_aliases_not_applied(self):
+        # "la" inside "dallas" must not expand to "los angeles"
+        assert normalize_location('Dallas, TX') == 'dallas, tx'
+        assert normalize_location('LA') == 'los angeles, ca'
+
+    def test_international_locations(self):
+        assert normalize_location('London') == 'london, uk'
+        assert normalize_location('London, England') == 'london, uk'
+        assert normalize_location('Toronto, CA') == 'toronto, canada'
+        assert normalize_location('Toronto, ON, Canada') == 'toronto, canada'
+
+
+class TestLocationIndex:
+    """Fuzzy matching against indexed locations"""
+
+    def test_best_match(self):
+        index = LocationIndex()
+        index.update(['New York, NY', 'Seattle, WA', 'Kansas City, MO'])
+
+        assert index.best_match('NYC') == 'new york, ny'
+        assert index.best_match('greater seattle area') == 'seattle, wa'
+        assert index.best_match('Seatle') == 'seattle, wa'
+        assert index.best_match('Boise, ID') is None
+
+    @pytest.mark.parametrize('query', [
+        'Portland, ME', 'Kansas City, KS', 'Springfield, MO', 'Newark, DE', 'San Jose, Costa Rica'
+    ])
+    def test_region_must_match(self, query):
+        index = LocationIndex()
+        index.update(['Portland, OR', 'Kansas City, MO', 'Springfield, IL', 'Newark, NJ', 'San Jose, CA'])
+
+        assert index.best_match(query) is None
+
+    def test_fuzzy_city_within_region(self):
+        index = LocationIndex()
+        index.update(['Portland, OR', 'Portland, ME', 'Seattle, WA'])
+
+        assert index.best_match('Portlnd, ME') == 'portland, me'
+        assert index.best_match('Portlnd, Oregon') == 'portland, or'
+        assert index.best_match('Seatle, WA') == 'seattle, wa'
+
+    def test_discard(self):
+        index = LocationIndex()
+        index.add('Seattle, WA')
+        index.discard('seattle')
+
+        assert len(index) == 0
+        assert index.best_match('Seattle') is None
+
+
+class TestCacheManagerLookup:
+    """Cache lookups resolve location aliases to one entry"""
+
+    def test_aliases_share_cache_entry(self, cache_manager, market_data):
+        asyncio.run(cache_manager.update_cache('New York, NY', market_data('New York, NY')))
+
+        for alias in ('NYC', 'new york city', 'New York, New York'):
+            cached = asyncio.run(cache_manager.get_cached_data(alias))
+            assert cached is not None
+            assert cached.location == 'New York, NY'
+
+    def test_fuzzy_lookup(self, cache_manager, market_data):
+        asyncio.run(cache_manager.update_cache('Seattle, WA', market_data('Seattle, WA')))
+
+        assert asyncio.run(cache_manager.get_cached_data('Seattle metro')) is None
+        cached = asyncio.run(cache_manager.find_similar_cached_data('Seattle metro'))
+        assert cached is not None and cached.location == 'Seattle, WA'
+
+    def test_index_rebuilt_from_persistent_cache(self, cache_manager, market_data):
+        asyncio.run(cache_manager.update_cache('Austin, TX', market_data('Austin, TX')))
+
+        reopened = IntelligentCacheManager({
+            'persistent_cache_path': str(cache_manager.persistent_cache.db_path)
+        })
+        assert 'austin tx' in reopened.location_index
@@ -0,0 +1,156 @@
+"""
+Memory Cache Tests
+Tests for O(1) eviction, serialized size accounting and bounded latency sampling
+"""
+
+import asyncio
+import os
+import pickle
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.cache_management import CacheEntry, LatencyReservoir, MemoryCache
+
+
+def _entry(key: str, payload_bytes: int = 1000, created_at: datetime = None) -> CacheEntry:
+    now = created_at or datetime.now()
+    return CacheEntry(
+        key=key,
+        data=b'x' * payload_bytes,
+        created_at=now,
+        last_accessed=now,
+        access_count=1,
+        expiry_time=None,
+        size_bytes=1,  # Deliberately wrong; the cache measures real size
+        source='test',
+        quality_score=1.0
+    )
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestSizeAccounting:
+    """Entry sizes come from the serialized payload"""
+
+    def test_size_measured_from_payload(self):
+        cache = MemoryCache(max_size_mb=1.0)
+        entry = _entry('a', payload_bytes=5000)
+        _run(cache.set('a', entry))
+
+        assert entry.size_bytes == len(pickle.dumps(entry.data, protocol=pickle.HIGHEST_PROTOCOL))
+        assert cache.current_size == entry.size_bytes
+
+    def test_oversized_entry_not_cached(self):
+        cache = MemoryCache(max_size_mb=0.001)
+        _run(cache.set('small', _entry('small', payload_bytes=100)))
+        _run(cache.set('huge', _entry('huge', payload_bytes=10000)))
+
+        assert 'huge' not in cache.cache
+        assert 'small' in cache.cache
+
+    def test_replacing_entry_updates_size(self):
+        cache = MemoryCache(max_size_mb=1.0)
+        _run(cache.set('a', _entry('a', payload_bytes=5000)))
+        _run(cache.set('a', _entry('a', payload_bytes=100)))
+
+        assert cache.current_size == cache.cache['a'].size_bytes
+        assert len(cache.cache) == 1
+
+
+class TestEviction:
+    """LRU and LFU eviction order"""
+
+    def _small_cache(self, policy: str) -> MemoryCache:
+        cache = MemoryCache(max_size_mb=1.0, eviction_policy=policy)
+        entry_size = MemoryCache._measure_size(b'x' * 1000)
+        cache.max_size_bytes = entry_size * 3
+        return cache
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = self._small_cache('lru')
+        for key in ('a', 'b', 'c'):
+            _run(cache.set(key, _entry(key)))
+
+        _run(cache.get('a'))
+        _run(cache.set('d', _entry('d')))
+
+        assert set(cache.cache) == {'a', 'c', 'd'}
+        assert cache.eviction_count == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = self._small_cache('lfu')
+        for key in ('a', 'b', 'c'):
+            _run(cache.set(key, _entry(key)))
+
+        for _ in range(3):
+            _run(cache.get('a'))
+        _run(cache.get('b'))
+        _run(cache.get('c'))
+        _run(cache.get('c'))
+        _run(cache.set('d', _entry('d')))
+
+        assert set(cache.cache) == {'a', 'c', 'd'}
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            MemoryCache(eviction_policy='fifo')
+
+    def test_hits_scale_with_many_entries(self):
+        cache = MemoryCache(max_size_mb=100.0)
+        keys = [f'key-{i}' for i in range(20000)]
+
+        async def hit_all():
+            for key in keys:
+                await cache.set(key, _entry(key, payload_bytes=10))
+
+            start = time.perf_counter()
+            for key in keys:
+                await cache.get(key)
+            return time.perf_counter() - start
+
+        # List-based LRU made each hit O(n); 20k hits now take well under a second
+        assert _run(hit_all()) < 1.0
+
+
+class TestStats:
+    """Constant-time stats and bounded latency samples"""
+
+    def test_oldest_and_newest_entries(self):
+        cache = MemoryCache()
+        base = datetime(2024, 1, 1)
+        for offset, key in enumerate(('a', 'b', 'c')):
+            _run(cache.set(key, _entry(key, created_at=base + timedelta(hours=offset))))
+
+        stats = _run(cache.get_stats())
+        assert stats['oldest_entry'] == base
+        assert stats['newest_entry'] == base + timedelta(hours=2)
+
+        _run(cache.delete('a'))
+        _run(cache.delete('c'))
+        stats = _run(cache.get_stats())
+        assert stats['oldest_entry'] == stats['newest_entry'] == base + timedelta(hours=1)
+
+    def test_latency_samples_bounded(self):
+        cache = MemoryCache(latency_sample_size=64)
+        for i in range(1000):
+            _run(cache.get(f'missing-{i}'))
+
+        stats = _run(cache.get_stats())
+        assert len(cache.response_times.samples) == 64
+        assert stats['miss_count'] == 1000
+        assert stats['p50_response_time_ms'] <= stats['p95_response_time_ms'] <= stats['p99_response_time_ms']
+
+    def test_reservoir_percentiles(self):
+        reservoir = LatencyReservoir(capacity=1000, seed=1)
+        for value in range(1, 101):
+            reservoir.add(float(value))
+
+        assert reservoir.mean == pytest.approx(50.5)
+        assert reservoir.percentiles() == {'p50': 50.0, 'p95': 95.0, 'p99': 99.0}
@@ -0,0 +1,109 @@
+"""
+Portfolio Workbook Tests
+Tests for exporting many site analyses into one workbook
+"""
+
+import asyncio
+import io
+import os
+import sys
+import time
+
+import openpyxl
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.excel.excel_generator import ExcelGenerator
+from src.export.excel.portfolio_workbook import (
+    SUMMARY_SHEET_NAME, PortfolioWorkbookWriter, sheet_name_for
+)
+
+
+def site_export_data(index: int):
+    npv_difference = 40000.0 - index * 1000
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0 + index,
+            'rental_npv': 85000.0,
+            'npv_difference': npv_difference,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'recommendation': 'MARGINAL' if abs(npv_difference) <= 2000 else 'BUY' if npv_difference > 0 else 'RENT',
+            'confidence': 'High',
+            'analysis_period': 10
+        },
+        'ownership_flows': [{'year': i + 1, 'net_cash_flow': -45000 + i * 1000} for i in range(10)],
+        'rental_flows': [{'year': i + 1, 'net_cash_flow': -36000 - i * 1080} for i in range(10)]
+    }
+
+
+@pytest.fixture
+def sites():
+    return [(f"Warehouse {i}", site_export_data(i)) for i in range(100)]
+
+
+class TestSheetNames:
+    """Site names become valid, unique worksheet names"""
+
+    def test_invalid_characters_and_length(self):
+        used = set()
+        assert sheet_name_for("Plant: Lyon/North [A]", used) == "Plant LyonNorth A"
+        long_name = "Distribution Centre Rotterdam Harbour East"
+        first = sheet_name_for(long_name, used)
+        second = sheet_name_for(long_name, used)
+
+        assert first == long_name[:31]
+        assert second == long_name[:27] + " (2)"
+        assert len(second) == 31
+        assert sheet_name_for("", used) == "Site"
+
+    def test_case_insensitive_duplicates(self):
+        used = {SUMMARY_SHEET_NAME.lower()}
+        assert sheet_name_for("portfolio summary", used) == "portfolio summary (2)"
+        assert sheet_name_for("Depot", used) == "Depot"
+        assert sheet_name_for("DEPOT", used) == "DEPOT (2)"
+
+
+class TestPortfolioWorkbook:
+    """Summary sheet plus one linked sheet per site"""
+
+    def test_hundred_sites(self, sites):
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        writer = PortfolioWorkbookWriter(buffer)
+        writer.write_portfolio(sites)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 30
+        # Site sheets share formats rather than creating their own
+        assert len(writer.styles) < 40
+
+        workbook = openpyxl.load_workbook(io.BytesIO(buffer.getvalue()))
+        assert workbook.sheetnames == [SUMMARY_SHEET_NAME] + [name for name, _ in sites]
+
+        summary = workbook[SUMMARY_SHEET_NAME]
+        names = [row[0] for row in summary.iter_rows(min_row=5, values_only=True)]
+        assert names == [name for name, _ in sites] + ['PORTFOLIO TOTAL']
+        assert summary['A5'].hyperlink.location == "'Warehouse 0'!A1"
+
+        total_row = summary.max_row
+        assert summary.cell(total_row, 4).value == pytest.approx(sum(125000.0 + i for i in range(100)))
+        assert summary.cell(total_row, 2).value == "38 BUY / 5 MARGINAL / 57 RENT"
+
+        site_sheet = workbook['Warehouse 7']
+        values = [row for row in site_sheet.iter_rows(values_only=True) if row and row[0] == 'TOTAL']
+        assert len(values) == 1
+
+    def test_empty_portfolio_rejected(self):
+        with pytest.raises(ValueError):
+            PortfolioWorkbookWriter(io.BytesIO()).write_portfolio([])
+
+    def test_generator_writes_portfolio_file(self, sites):
+        generator = ExcelGenerator()
+        try:
+            path = asyncio.run(generator.generate_portfolio_workbook(sites[:3]))
+            assert path.name.startswith('real_estate_portfolio_')
+            assert len(openpyxl.load_workbook(path).sheetnames) == 4
+        finally:
+            generator.cleanup()
@@ -0,0 +1,118 @@
+"""
+Rate Refresh Service Tests
+Tests for out-of-band interest rate refresh and snapshot reads
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data import rate_refresh_service
+from src.data.data_priority_manager import DataPriorityManager
+from src.data.rate_refresh_service import RateRefreshService
+
+
+class FakeRateFeeds:
+    """Rate feed returning scripted results and recording the loops it ran on"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+        self.loops = set()
+
+    async def get_current_rates(self, rate_types):
+        self.calls += 1
+        self.loops.add(asyncio.get_running_loop())
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return {rate_type: result[rate_type] for rate_type in rate_types if rate_type in result}
+
+
+RATES = {'30_year_fixed': 6.5, '15_year_fixed': 5.9, 'federal_funds_rate': 4.3}
+
+
+class TestRefresh:
+    """Snapshots are published by each refresh"""
+
+    def test_snapshot_empty_before_first_refresh(self):
+        service = RateRefreshService(FakeRateFeeds([RATES]))
+        snapshot = service.get_snapshot()
+
+        assert snapshot.is_empty
+        assert snapshot.age_seconds() is None
+        assert service.get_rates() == {}
+
+    def test_refresh_publishes_rates(self):
+        service = RateRefreshService(FakeRateFeeds([RATES]))
+        snapshot = asyncio.run(service.refresh())
+
+        assert snapshot.rates == RATES
+        assert snapshot.error is None
+        assert service.get_rates() == RATES
+        assert service.wait_for_first_refresh(0)
+
+    def test_failed_refresh_keeps_previous_rates(self):
+        service = RateRefreshService(FakeRateFeeds([RATES, RuntimeError("timeout")]))
+        first = asyncio.run(service.refresh())
+        second = asyncio.run(service.refresh())
+
+        assert second.rates == RATES
+        assert second.fetched_at == first.fetched_at
+        assert second.error == "timeout"
+        assert service.failure_count == 1
+
+
+class TestBackgroundLoop:
+    """One long-lived loop refreshes on a schedule"""
+
+    def test_scheduled_refreshes_share_one_loop(self):
+        feeds = FakeRateFeeds([RATES])
+        service = RateRefreshService(feeds, refresh_interval_seconds=0.02)
+        service.start()
+        try:
+            assert service.wait_for_first_refresh(5)
+            deadline = time.time() + 5
+            while feeds.calls < 3 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            service.stop()
+
+        assert feeds.calls >= 3
+        assert len(feeds.loops) == 1
+        assert not service.is_running
+
+    def test_refresh_now_wakes_loop(self):
+        feeds = FakeRateFeeds([RATES])
+        service = RateRefreshService(feeds, refresh_interval_seconds=3600)
+        service.start()
+        try:
+            assert service.wait_for_first_refresh(5)
+            service.refresh_now()
+            deadline = time.time() + 5
+            while feeds.calls < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            service.stop()
+
+        assert feeds.calls == 2
+
+
+class TestPriorityManager:
+    """Analysis applies the snapshot without fetching"""
+
+    def test_apply_api_rates_reads_snapshot(self, monkeypatch):
+        service = RateRefreshService(FakeRateFeeds([RATES]))
+        asyncio.run(service.refresh())
+        monkeypatch.setattr(rate_refresh_service, '_rate_refresh_service', service)
+
+        manager = DataPriorityManager()
+        manager.set_user_override('interest_rate_15_year', 7.25)
+        manager.apply_api_rates()
+
+        assert manager.get_value_only('interest_rate_30_year') == 6.5
+        assert manager.get_value_only('interest_rate_15_year') == 7.25
+        assert service.refresh_count == 1
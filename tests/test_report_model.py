@@ -0,0 +1,156 @@
+"""
+Report Model Tests
+Tests for the prepared dataset shared by Excel, PDF and CSV exports
+"""
+
+import asyncio
+import csv
+import io
+import os
+import sys
+
+import openpyxl
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.csv_export import write_csv_report
+from src.export.excel.excel_generator import ExcelGenerator
+from src.export.report_model import (
+    ReportModelCache, build_report_model, extract_cash_flows, generate_all_formats, get_report_model_cache
+)
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': 125000.0,
+            'rental_npv': 85000.0,
+            'npv_difference': 40000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'recommendation': 'BUY',
+            'confidence': 'High'
+        },
+        'inputs': {
+            'purchase_price': 750000.0,
+            'current_annual_rent': 36000.0,
+            'analysis_period': 10,
+            'cost_of_capital': 8.0
+        },
+        'ownership_flows': [{'year': i + 1, 'net_cash_flow': -45000 + i * 1000} for i in range(10)],
+        'rental_flows': [{'year': i + 1, 'net_cash_flow': -36000 - i * 1080} for i in range(8)],
+        'export_metadata': {'export_timestamp': '2025-01-01T00:00:00'}
+    }
+
+
+@pytest.fixture
+def prepare_calls(monkeypatch):
+    """Count Excel table preparations"""
+    calls = []
+    original = ExcelGenerator.prepare_data
+
+    async def counting_prepare(self, export_data):
+        calls.append(export_data)
+        return await original(self, export_data)
+
+    monkeypatch.setattr(ExcelGenerator, 'prepare_data', counting_prepare)
+    return calls
+
+
+class TestCashFlowExtraction:
+    """One normalizer for every cash flow format"""
+
+    def test_list_and_dict_formats(self):
+        assert extract_cash_flows([{'net_cash_flow': 5}, {'year': 2}, 3]) == [5.0, 0.0, 3.0]
+        assert extract_cash_flows({'annual_cash_flows': [1, -2]}) == [1.0, -2.0]
+        assert extract_cash_flows({'annual_cash_flows': 7}) == [7.0]
+        assert extract_cash_flows({'other': []}) == []
+        assert extract_cash_flows(None) == []
+
+
+class TestReportModel:
+    """Normalized content built once per analysis"""
+
+    def test_comparison_rows_pad_shorter_scenario(self, export_data):
+        model = build_report_model(export_data)
+
+        assert len(model.comparison_rows) == 10
+        assert model.comparison_rows[0] == [1, -45000.0, -36000.0, -9000.0, -9000.0]
+        # Rental flows end after year 8
+        assert model.comparison_rows[9][2] == 0.0
+        assert model.comparison_rows[-1][4] == pytest.approx(sum(row[3] for row in model.comparison_rows))
+        assert model.summary_metrics['recommendation'] == 'BUY'
+
+    def test_normalized_export_data_keeps_other_sections(self, export_data):
+        normalized = build_report_model(export_data).normalized_export_data
+
+        assert normalized['ownership_flows'] == {'annual_cash_flows': extract_cash_flows(export_data['ownership_flows'])}
+        assert normalized['analysis_results'] is export_data['analysis_results']
+
+    def test_cache_reuses_model_for_same_analysis(self, export_data):
+        cache = ReportModelCache(max_models=1)
+        model = cache.get(export_data)
+
+        later_export = dict(export_data, export_metadata={'export_timestamp': '2025-06-01T00:00:00'})
+        assert cache.get(later_export) is model
+
+        cache.get(dict(export_data, analysis_results={'recommendation': 'RENT'}))
+        assert cache.get(export_data) is not model
+        assert cache.get_stats() == {'models': 1, 'max_models': 1, 'hits': 1, 'misses': 3}
+
+    def test_excel_tables_prepared_once(self, export_data, prepare_calls):
+        model = build_report_model(export_data)
+
+        async def concurrent_requests():
+            return await asyncio.gather(model.excel_data(), model.excel_data())
+
+        first, second = asyncio.run(concurrent_requests())
+        assert first is second
+        assert len(prepare_calls) == 1
+        assert 'cash_flows' in first['formatted_tables']
+
+    def test_cancelled_request_releases_lock(self, export_data, monkeypatch):
+        model = build_report_model(export_data)
+        original = ExcelGenerator.prepare_data
+
+        async def slow_prepare(self, data):
+            await asyncio.sleep(0.2)
+            return await original(self, data)
+
+        monkeypatch.setattr(ExcelGenerator, 'prepare_data', slow_prepare)
+
+        async def cancelled_then_retried():
+            request = asyncio.ensure_future(model.excel_data())
+            await asyncio.sleep(0.05)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+            return await asyncio.wait_for(model.excel_data(), timeout=10)
+
+        assert 'cash_flows' in asyncio.run(cancelled_then_retried())['formatted_tables']
+        assert not model._excel_lock.locked()
+
+
+class TestMultiFormatExport:
+    """Download-all builds every format from one model"""
+
+    def test_csv_report(self, export_data):
+        rows = list(csv.reader(io.StringIO(write_csv_report(build_report_model(export_data)).decode('utf-8'))))
+
+        assert rows[0] == ['Metric', 'Value']
+        assert ['Recommendation', 'BUY'] in rows
+        header = rows.index(['Year', 'Ownership Cash Flow', 'Rental Cash Flow', 'Annual Difference', 'Cumulative Difference'])
+        assert rows[header + 1] == ['1', '-45000.0', '-36000.0', '-9000.0', '-9000.0']
+        assert len(rows) - header - 1 == 10
+
+    def test_all_formats_share_one_preparation(self, export_data, prepare_calls):
+        get_report_model_cache().clear()
+        reports = asyncio.run(generate_all_formats(export_data))
+
+        assert sorted(reports) == ['csv', 'excel', 'pdf']
+        assert reports['pdf'].startswith(b'%PDF')
+        assert 'Cash Flow Analysis' in openpyxl.load_workbook(io.BytesIO(reports['excel'])).sheetnames
+        assert len(prepare_calls) == 1
+        assert get_report_model_cache().get_stats()['hits'] >= 1
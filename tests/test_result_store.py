@@ -0,0 +1,136 @@
+"""
+Result Store Tests
+Tests for the shared analysis result store and session result handles
+"""
+
+import os
+import sys
+
+import pytest
+import streamlit as st
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components import result_store
+from components.result_store import ResultStore
+from components.session_management import ANALYSIS_HANDLE_KEY, SessionManager
+
+
+def analysis_bundle(npv_difference=60000.0):
+    """Minimal analysis bundle"""
+    return {
+        'npv_analysis': {'npv_difference': npv_difference, 'recommendation': 'BUY'},
+        'ownership_flows': [{'year': year, 'net_cash_flow': -50000.0} for year in range(1, 26)],
+        'rental_flows': [{'year': year, 'net_cash_flow': -45000.0} for year in range(1, 26)]
+    }
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = ResultStore(max_entries=3)
+    monkeypatch.setattr(result_store, '_result_store', store)
+    return store
+
+
+@pytest.fixture
+def session(monkeypatch, store):
+    monkeypatch.setattr(st, 'session_state', {})
+    return SessionManager()
+
+
+class TestResultStore:
+    """Results are stored once per content and bounded"""
+
+    def test_identical_results_share_one_copy(self, store):
+        first = analysis_bundle()
+        handle = store.put(first)
+
+        assert store.put(analysis_bundle()) == handle
+        assert store.get(handle) is first
+        assert store.get_stats()['entries'] == 1
+
+    def test_bounded_lru(self, store):
+        handles = [store.put(analysis_bundle(value)) for value in (1.0, 2.0, 3.0)]
+        store.get(handles[0])
+        store.put(analysis_bundle(4.0))
+
+        assert store.get(handles[1]) is None
+        assert store.get(handles[0]) is not None
+        assert store.evictions == 1
+
+    def test_bounded_by_size(self):
+        bundle_size = result_store.measure_size(analysis_bundle())
+        store = ResultStore(max_entries=10, max_bytes=int(bundle_size * 2.5))
+        handles = [store.put(analysis_bundle(value)) for value in (1.0, 2.0, 3.0)]
+
+        assert store.get(handles[0]) is None
+        assert store.get(handles[2]) is not None
+        assert store.get_stats()['entries'] == 2
+        assert store.get_stats()['bytes'] <= store.max_bytes
+
+        store.discard(handles[2])
+        assert store.get_stats()['bytes'] == result_store.measure_size(analysis_bundle(2.0))
+
+    def test_oversized_result_still_stored(self):
+        store = ResultStore(max_bytes=1)
+        handle = store.put(analysis_bundle())
+        assert store.get(handle) is not None
+
+    def test_derived_results_do_not_evict_bundles(self, store, monkeypatch):
+        monkeypatch.setattr(result_store, '_derived_result_store', ResultStore(max_entries=1))
+        handle = store.put(analysis_bundle())
+        for value in range(5):
+            result_store.get_derived_result_store().put({'raw_result': value})
+
+        assert store.get(handle) is not None
+        assert store.evictions == 0
+
+    def test_get_or_build(self, store):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {'figure': len(builds)}
+
+        first = store.get_or_build('analysis:chart', build)
+        assert store.get_or_build('analysis:chart', build) is first
+        assert len(builds) == 1
+
+
+class TestSessionHandles:
+    """Session state holds a handle, not the results"""
+
+    def test_session_keeps_handle_only(self, session, store):
+        bundle = analysis_bundle()
+        handle = session.store_analysis_bundle(bundle)
+
+        assert st.session_state[ANALYSIS_HANDLE_KEY] == handle
+        assert all(value is not bundle and value != bundle['ownership_flows'] for value in st.session_state.values())
+        assert session.get_analysis_bundle() is bundle
+        assert session.get_analysis_data() == (bundle['npv_analysis'], bundle['ownership_flows'], bundle['rental_flows'])
+        assert session.has_analysis_results()
+
+    def test_sessions_share_identical_analysis(self, session, store, monkeypatch):
+        handle = session.store_analysis_bundle(analysis_bundle())
+
+        monkeypatch.setattr(st, 'session_state', {})
+        other_session = SessionManager()
+        assert other_session.store_analysis_bundle(analysis_bundle()) == handle
+        assert store.get_stats()['entries'] == 1
+
+    def test_evicted_results_read_as_missing(self, session, store):
+        handle = session.store_analysis_bundle(analysis_bundle())
+        store.discard(handle)
+
+        assert session.get_analysis_data() is None
+        assert not session.has_analysis_results()
+        assert ANALYSIS_HANDLE_KEY not in st.session_state
+
+    def test_clear_analysis_results(self, session, store):
+        session.store_analysis_bundle(analysis_bundle())
+        st.session_state['using_demo_data'] = True
+
+        session.clear_analysis_results()
+
+        assert not session.has_analysis_results()
+        assert 'using_demo_data' not in st.session_state
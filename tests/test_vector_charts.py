@@ -0,0 +1,100 @@
+"""
+Vector Chart Tests
+Tests for native ReportLab charts in PDF reports
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.export.pdf.vector_charts import VectorChartBuilder, format_currency_axis
+from src.export.pdf_integration import PDFExportManager
+
+
+@pytest.fixture
+def export_data():
+    return {
+        'analysis_results': {
+            'ownership_npv': -125000.0,
+            'rental_npv': 85000.0,
+            'npv_difference': -210000.0,
+            'ownership_initial_investment': 150000.0,
+            'rental_initial_investment': 5000.0,
+            'ownership_irr': 0.07,
+            'recommendation': 'RENT',
+            'confidence': 'High'
+        },
+        'inputs': {
+            'purchase_price': 750000.0,
+            'current_annual_rent': 36000.0,
+            'analysis_period': 10,
+            'cost_of_capital': 8.0
+        },
+        'ownership_flows': [{'year': i + 1, 'net_cash_flow': -45000 + i * 1000} for i in range(10)],
+        'rental_flows': [{'year': i + 1, 'net_cash_flow': -36000 - i * 1080} for i in range(10)]
+    }
+
+
+class TestVectorChartBuilder:
+    """Charts are drawn from the analysis data at layout size"""
+
+    def test_template_chart_selection(self, export_data):
+        builder = VectorChartBuilder()
+
+        assert sorted(builder.build_template_charts(export_data, 'executive')) == ['financial_metrics', 'npv_comparison']
+        assert sorted(builder.build_template_charts(export_data, 'detailed')) == [
+            'annual_cash_flows', 'cumulative_cash_flows', 'financial_metrics', 'npv_comparison'
+        ]
+        with pytest.raises(ValueError):
+            builder.build_template_charts(export_data, 'brochure')
+
+    def test_drawing_matches_requested_size(self, export_data):
+        charts = VectorChartBuilder().build_charts(export_data)
+
+        for chart in charts.values():
+            drawing = chart.to_drawing(400, 250)
+            assert (drawing.width, drawing.height) == (400, 250)
+
+    def test_cash_flow_charts_need_both_scenarios(self, export_data):
+        charts = VectorChartBuilder().build_charts(dict(export_data, rental_flows=[]))
+        assert 'annual_cash_flows' not in charts
+        assert 'npv_comparison' in charts
+
+    def test_currency_axis_labels(self):
+        assert format_currency_axis(0) == "$0"
+        assert format_currency_axis(-50000) == "-$50K"
+        assert format_currency_axis(1250000) == "$1.2M"
+
+
+class TestVectorPDFReports:
+    """Vector chart style skips image rendering entirely"""
+
+    def test_vector_report_renders_no_images(self, export_data, monkeypatch):
+        manager = PDFExportManager()
+
+        async def no_raster(*args, **kwargs):
+            raise AssertionError("raster chart rendering should be skipped")
+
+        monkeypatch.setattr(manager.chart_renderer, 'render_template_chart_images', no_raster)
+
+        buffer, info = asyncio.run(manager.generate_pdf_report(
+            export_data, 'detailed', custom_config={'chart_style': 'vector'}, in_memory=True
+        ))
+        pdf = buffer.getvalue()
+
+        assert pdf.startswith(b'%PDF')
+        assert info['chart_style'] == 'vector'
+        assert info['charts_rendered'] == 4
+        assert b'/Subtype /Image' not in pdf
+
+    def test_custom_config_does_not_leak(self, export_data):
+        manager = PDFExportManager()
+        asyncio.run(manager.generate_pdf_report(
+            export_data, 'executive', custom_config={'chart_style': 'vector'}, in_memory=True
+        ))
+
+        assert manager.template_configs['executive'].chart_style == 'raster'